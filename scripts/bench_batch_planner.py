@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Benchmark batch upsert planning against per-entity decisions.
+
+Builds a synthetic Gramps tree (with the person index) and a projection in
+which a share of the planned entities already has a fingerprint mapping,
+then plans a batch of persons, events and sources with
+``decide_upsert_batch`` and with the per-entity ``decide_upsert_*``
+functions that ``plan batch`` used before. The per-entity path runs on a
+sample and is extrapolated. Decisions are compared on that sample.
+
+Usage:
+    python scripts/bench_batch_planner.py --tree 100000 --entities 50000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from gps_agents.gramps.client import GrampsClient
+from gps_agents.gramps.models import Event, EventType, GrampsDate, Name, Person, Place, Source
+from gps_agents.idempotency.decision import (
+    decide_upsert_batch,
+    decide_upsert_event,
+    decide_upsert_person,
+    decide_upsert_source,
+)
+from gps_agents.idempotency.fingerprint import fingerprint_person
+from gps_agents.projections.sqlite_projection import SQLiteProjection
+
+GIVEN = ["John", "Mary", "William", "Sarah", "George", "Martha", "James", "Ellen", "Thomas", "Ann", "Bill", "Polly"]
+# Syllables for surnames such as "Harwood" or "Blackmore": about 8,000 names
+# whose Soundex and Metaphone buckets overlap as real surnames do
+HEADS = ["Ash", "Black", "Brad", "Brook", "Cal", "Carr", "Dal", "Dun", "Ed", "Fair", "Fen", "Gar", "Hal", "Har",
+         "Hol", "Kings", "Lang", "Mar", "Mid", "Nor", "Pem", "Rad", "Red", "Sal", "Stan", "Thorn", "Wal", "Whit"]
+MIDS = ["", "a", "e", "i", "en", "er", "in", "on"]
+TAILS = ["by", "den", "ford", "ham", "ley", "more", "ridge", "ston", "ton", "well", "wick", "wood", "worth", "cott",
+         "field", "gate", "hurst", "land", "mere", "shaw", "stead", "thwaite", "ville", "win", "borne", "croft",
+         "dale", "house", "mount", "ard", "ell", "ock", "ing", "son", "man"]
+TOWNS = ["Boston", "Salem", "York", "Bristol", "Dover", "Exeter", "Lincoln", "Albany"]
+SINGLE = {"person": decide_upsert_person, "event": decide_upsert_event, "source": decide_upsert_source}
+
+
+def random_person(rng: random.Random) -> Person:
+    surname = f"{rng.choice(HEADS)}{rng.choice(MIDS)}{rng.choice(TAILS)}"
+    born = rng.randint(1780, 1920)
+    return Person(
+        names=[Name(given=rng.choice(GIVEN), surname=surname)],
+        sex=rng.choice("MFU"),
+        birth=Event(event_type=EventType.BIRTH, date=GrampsDate(year=born), place=Place(name=rng.choice(TOWNS))),
+        death=Event(
+            event_type=EventType.DEATH,
+            date=GrampsDate(year=born + rng.randint(1, 90)),
+            place=Place(name=rng.choice(TOWNS)),
+        ),
+    )
+
+
+def reimport(person: Person, rng: random.Random) -> Person:
+    """A copy of a tree member, sometimes missing the death record."""
+    copy = person.model_copy(update={"gramps_id": None})
+    if rng.random() < 0.3:
+        copy.death = None
+    return copy
+
+
+def build(tmp: Path, tree: int, entities: int, rng: random.Random) -> tuple[GrampsClient, SQLiteProjection, list]:
+    db = tmp / "sqlite.db"
+    conn = sqlite3.connect(db)
+    conn.execute("CREATE TABLE person (handle TEXT PRIMARY KEY, gramps_id TEXT, blob_data BLOB)")
+    conn.close()
+    client = GrampsClient(db)
+    client.connect(db)
+    people = [random_person(rng) for _ in range(tree)]
+    with client.bulk_writer() as writer:
+        for person in people:
+            writer.add_person(person)
+
+    projection = SQLiteProjection(tmp / "projection.db")
+    items: list = []
+    known = []
+    for i in range(entities):
+        kind = rng.choices(["person", "event", "source"], weights=[6, 3, 1])[0]
+        if kind == "person":
+            # Re-imports of tree members (some already fingerprinted) and new people
+            person = reimport(rng.choice(people), rng) if rng.random() < 0.5 else random_person(rng)
+            if rng.random() < 0.3:
+                known.append(("person", fingerprint_person(person).value, f"H{i}"))
+            items.append(("person", person))
+        elif kind == "event":
+            items.append(("event", Event(event_type=EventType.CENSUS, date=GrampsDate(year=rng.randint(1790, 1950)))))
+        else:
+            items.append(("source", Source(title=f"Register {rng.randrange(5_000)}")))
+    projection.save_fingerprints(known)
+    return client, projection, items
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tree", type=int, default=100_000, help="persons already in Gramps")
+    parser.add_argument("--entities", type=int, default=50_000, help="entities to plan")
+    parser.add_argument("--sample", type=int, default=300, help="entities planned one at a time")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    with tempfile.TemporaryDirectory() as tmp:
+        client, projection, items = build(Path(tmp), args.tree, args.entities, rng)
+        print(f"tree of {args.tree:,} persons, {len(items):,} entities to plan")
+
+        start = time.perf_counter()
+        batch = decide_upsert_batch(client, projection, items)
+        elapsed = time.perf_counter() - start
+        actions = {a: sum(d.action == a for d in batch) for a in ("reuse", "merge", "review", "create")}
+        print(f"  batch      {elapsed:8.2f}s  {len(items) / elapsed:>10,.0f} entities/s  {actions}")
+
+        sample = rng.sample(range(len(items)), min(args.sample, len(items)))
+        start = time.perf_counter()
+        single = [SINGLE[items[i][0]](client, projection, items[i][1]) for i in sample]
+        elapsed = time.perf_counter() - start
+        rate = len(sample) / elapsed
+        print(
+            f"  per-entity {elapsed:8.2f}s  {rate:>10,.0f} entities/s"
+            f"  (~{len(items) / rate:,.0f}s for all {len(items):,})"
+        )
+        same = sum(s == batch[i] for s, i in zip(single, sample, strict=True))
+        print(f"  identical decisions on sample: {same}/{len(sample)}")
+
+
+if __name__ == "__main__":
+    main()
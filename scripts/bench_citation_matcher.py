@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Benchmark fuzzy citation matching used by hallucination_firewall.
+
+Builds ~20 KB census-style transcripts with OCR-like character confusions,
+then times ``check_citation_exists`` for citations that are present (with
+noise) and absent. The legacy matcher (a full two-row DP at every window
+offset) is reproduced for comparison and run on a shorter page by default,
+since it needs billions of Python steps on a full page.
+
+Usage:
+    python scripts/bench_citation_matcher.py --page-kb 20 --citation-len 200
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from gps_agents.genealogy_crawler.llm.wrapper import check_citation_exists
+
+OCR_CONFUSIONS = {"m": "rn", "0": "O", "1": "l", "e": "c", "h": "b", "5": "S"}
+GIVEN = ["john", "mary", "william", "sarah", "george", "martha", "james", "ellen"]
+SURNAMES = ["smith", "jones", "brown", "durham", "vincent", "tregeagle", "miller"]
+PLACES = ["ohio", "kentucky", "england", "ireland", "virginia", "california"]
+
+
+def census_page(rng: random.Random, size: int) -> str:
+    rows = []
+    while sum(len(r) + 1 for r in rows) < size:
+        rows.append(
+            f"{rng.randint(1, 300)} {rng.choice(GIVEN)} {rng.choice(SURNAMES)} "
+            f"{rng.choice(['head', 'wife', 'son', 'daughter'])} {rng.choice('mf')} "
+            f"{rng.randint(1, 80)} {rng.choice(PLACES)} {rng.choice(['farmer', 'laborer', 'at home'])}"
+        )
+    return " ".join(rows)
+
+
+def ocr_noise(text: str, rng: random.Random, rate: float) -> str:
+    return "".join(OCR_CONFUSIONS.get(ch, ch) if rng.random() < rate else ch for ch in text)
+
+
+def legacy_check(citation: str, source: str, threshold: float = 0.85) -> bool:
+    c = " ".join(citation.lower().split())
+    s = " ".join(source.lower().split())
+    if c in s:
+        return True
+    m = len(c)
+    best = 0.0
+    for i in range(len(s) - m + 1):
+        w = s[i:i + m]
+        prev = list(range(m + 1))
+        for a in range(1, m + 1):
+            cur = [a] + [0] * m
+            for b in range(1, m + 1):
+                cur[b] = min(cur[b - 1] + 1, prev[b] + 1, prev[b - 1] + (c[a - 1] != w[b - 1]))
+            prev = cur
+        best = max(best, 1.0 - prev[m] / m)
+        if best >= 0.95:
+            break
+    return best >= threshold
+
+
+def time_calls(fn, cases) -> tuple[float, int]:
+    start = time.perf_counter()
+    hits = sum(bool(fn(citation, page)) for citation, page in cases)
+    return (time.perf_counter() - start) / len(cases), hits
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--page-kb", type=int, default=20)
+    parser.add_argument("--citation-len", type=int, default=200)
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--noise", type=float, default=0.04)
+    parser.add_argument("--legacy-page-kb", type=float, default=1.0)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+
+    def cases(page_bytes: int) -> list[tuple[str, str]]:
+        out = []
+        for _ in range(args.pages):
+            page = census_page(rng, page_bytes)
+            start = rng.randrange(len(page) - args.citation_len)
+            present = ocr_noise(page[start:start + args.citation_len], rng, args.noise)
+            absent = census_page(rng, args.citation_len)[: args.citation_len]
+            out += [(present, page), (absent, page)]
+        return out
+
+    full = cases(args.page_kb * 1024)
+    per_call, hits = time_calls(lambda c, p: check_citation_exists(c, p, fuzzy=True), full)
+    print(f"bit-parallel  page={args.page_kb} KB  {per_call * 1000:9.2f} ms/citation  matched {hits}/{len(full)}")
+
+    if args.legacy_page_kb:
+        small = cases(int(args.legacy_page_kb * 1024))
+        new_ms, new_hits = time_calls(lambda c, p: check_citation_exists(c, p, fuzzy=True), small)
+        old_ms, old_hits = time_calls(legacy_check, small)
+        print(f"bit-parallel  page={args.legacy_page_kb} KB  {new_ms * 1000:9.2f} ms/citation  matched {new_hits}/{len(small)}")
+        print(f"legacy DP     page={args.legacy_page_kb} KB  {old_ms * 1000:9.2f} ms/citation  matched {old_hits}/{len(small)}")
+
+
+if __name__ == "__main__":
+    main()
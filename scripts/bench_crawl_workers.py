@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Benchmark run_crawl_person throughput (persons/minute) by worker count.
+
+Sources are replaced with in-process stubs that sleep to simulate network
+latency, and whose census results return both parents of each person, so the
+frontier grows as a binary ancestor tree. Note that a single worker keeps the
+legacy 0.5 s pause between persons; with more workers the per-source limits in
+``net.GUARDS`` are the only throttle.
+
+Usage:
+    python scripts/bench_crawl_workers.py --persons 120 --workers 1 4 16
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+from gps_agents.crawl import engine
+from gps_agents.crawl.engine import CrawlConfig, SeedPerson
+from gps_agents.models.search import RawRecord
+from gps_agents.sources.router import UnifiedSearchResult
+
+
+class StubRouter:
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+
+    async def search(self, query, region=None):
+        await asyncio.sleep(self.latency)
+        rec = RawRecord(source="nara1950", record_id=query.given_name or "", record_type="census")
+        return UnifiedSearchResult(query=query, results=[rec], sources_searched=["nara1950"])
+
+
+class StubCensus:
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+
+    async def search_census(self, surname, given_name, state=None, county=None, year=None):
+        await asyncio.sleep(self.latency)
+        members = [
+            {"name": f"{given_name}f {surname}", "age": "40", "relationship": "father"},
+            {"name": f"{given_name}m {surname}", "age": "38", "relationship": "mother"},
+        ]
+        return [
+            RawRecord.model_construct(
+                source="accessgenealogy",
+                record_id=f"{given_name}-{year}",
+                record_type="census",
+                extracted_fields={"household_members": members},
+            )
+        ]
+
+
+async def run_once(workers: int, persons: int, latency: float) -> float:
+    engine._build_router = lambda cfg: (StubRouter(latency), StubCensus(latency), StubCensus(latency))
+    cfg = CrawlConfig(
+        max_iterations=persons,
+        max_generations=32,
+        checkpoint_every=10_000,
+        tree_out="tree.json",
+        use_existing_profile=False,
+        use_census_tree_builder=False,
+        workers=workers,
+    )
+    start = time.perf_counter()
+    summary = await engine.run_crawl_person(SeedPerson(given="P", surname="Smith"), cfg)
+    elapsed = time.perf_counter() - start
+    return summary["iterations"] / elapsed * 60
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--persons", type=int, default=120)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--latency", type=float, default=0.05, help="Stub latency per call (s)")
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore", message="Pydantic serializer warnings")
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        Path("data").mkdir()
+        for workers in args.workers:
+            rate = asyncio.run(run_once(workers, args.persons, args.latency))
+            print(f"workers={workers:>3}  {rate:10,.0f} persons/min")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Benchmark CrawlerStorage.save_state checkpoints: incremental vs full rewrite.
+
+Grows a session to ``--persons`` persons (each with a source record, an audit
+log entry and a frontier item), checkpoints it, then times checkpoints after
+``--changes`` person updates and queue pops/pushes. The previous full save
+(every person, source record and audit entry, one transaction per row) is
+reproduced on the same state for comparison, along with ``load_state``.
+
+Usage:
+    python scripts/bench_crawler_checkpoints.py --persons 20000 --changes 100
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from gps_agents.genealogy_crawler.models import (
+    AuditActionType,
+    CrawlerState,
+    FrontierItem,
+    Person,
+    SourceRecord,
+    SourceTier,
+)
+from gps_agents.genealogy_crawler.storage import CrawlerStorage
+
+
+def legacy_save(storage: CrawlerStorage, state: CrawlerState) -> None:
+    """The previous save_state body: one transaction per row, everything."""
+    for person in state.persons.values():
+        storage.save_person(person)
+    for record in state.source_records.values():
+        storage.save_source_record(record)
+    for log in state.audit_log:
+        storage.save_audit_log(log)
+
+
+def grow(state: CrawlerState, n: int) -> None:
+    for i in range(n):
+        person = Person(canonical_name=f"Person {i}", surname=f"S{i % 500}")
+        state.add_person(person)
+        record = SourceRecord(url=f"https://example.org/{i}", source_name="ex", source_tier=SourceTier.TIER_0)
+        state.source_records[str(record.id)] = record
+        state.log_audit(AuditActionType.CREATE, person.id, "person", "bench")
+        state.add_to_frontier(FrontierItem(query_string=f"query {i}", priority=(i % 10) / 10))
+
+
+def change(state: CrawlerState, k: int, offset: int) -> None:
+    persons = list(state.persons.values())
+    for i in range(k):
+        person = persons[(offset + i * 37) % len(persons)]
+        person.confidence = 0.9
+        state.touch_person(person)
+        state.pop_frontier()
+        state.add_to_frontier(FrontierItem(query_string=f"followup {offset + i}"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--persons", type=int, default=20_000)
+    parser.add_argument("--changes", type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = CrawlerStorage(Path(tmp) / "crawler.db")
+        state = CrawlerState()
+        grow(state, args.persons)
+
+        start = time.perf_counter()
+        storage.save_state(state)
+        print(f"first checkpoint    {args.persons:>8,} persons   {time.perf_counter() - start:8.3f}s")
+
+        runs = 5
+        start = time.perf_counter()
+        for run in range(runs):
+            change(state, args.changes, run * args.changes)
+            storage.save_state(state)
+        elapsed = (time.perf_counter() - start) / runs
+        print(f"incremental         {args.changes:>8,} changes   {elapsed * 1e3:8.1f} ms/checkpoint")
+
+        legacy = CrawlerStorage(Path(tmp) / "legacy.db")
+        start = time.perf_counter()
+        legacy_save(legacy, state)
+        print(f"legacy full save    {args.persons:>8,} persons   {time.perf_counter() - start:8.3f}s")
+
+        start = time.perf_counter()
+        loaded = storage.load_state(state.session_id)
+        print(
+            f"load_state          {len(loaded.persons):>8,} persons   {time.perf_counter() - start:8.3f}s"
+            f"  ({len(loaded.frontier_queue):,} frontier items)"
+        )
+
+
+if __name__ == "__main__":
+    main()
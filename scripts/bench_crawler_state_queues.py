@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Benchmark CrawlerState queue add/pop cycles: heap vs sort-on-insert list.
+
+Prefills the frontier to ``--depth`` items, then runs add/pop cycles through
+``CrawlerState.add_to_frontier``/``pop_frontier`` (which include the novelty
+check). The previous list implementation (append, full sort, ``pop(0)``) is
+reproduced for comparison on fewer cycles, since each insert re-sorts the
+whole queue.
+
+Usage:
+    python scripts/bench_crawler_state_queues.py --cycles 100000 --depth 10000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from gps_agents.genealogy_crawler.models import CrawlerState, FrontierItem
+
+
+class LegacyQueue:
+    """The previous CrawlerState frontier: a list re-sorted on every insert."""
+
+    def __init__(self) -> None:
+        self.items: list[FrontierItem] = []
+
+    def add(self, item: FrontierItem) -> None:
+        self.items.append(item)
+        self.items.sort(key=lambda x: x.priority, reverse=True)
+
+    def pop(self) -> FrontierItem | None:
+        return self.items.pop(0) if self.items else None
+
+
+def make_items(n: int, offset: int, rng: random.Random) -> list[FrontierItem]:
+    return [
+        FrontierItem(query_string=f"query {offset + i}", priority=round(rng.random(), 2))
+        for i in range(n)
+    ]
+
+
+def time_cycles(add, pop, items: list[FrontierItem]) -> float:
+    start = time.perf_counter()
+    for item in items:
+        add(item)
+        pop()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cycles", type=int, default=100_000)
+    parser.add_argument("--depth", type=int, default=10_000)
+    parser.add_argument("--legacy-cycles", type=int, default=2_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    prefill = make_items(args.depth, 0, rng)
+    cycle_items = make_items(args.cycles, args.depth, rng)
+
+    state = CrawlerState()
+    for item in prefill:
+        state.add_to_frontier(item)
+    elapsed = time_cycles(state.add_to_frontier, state.pop_frontier, cycle_items)
+    print(
+        f"heap    depth={args.depth:>7,}  {args.cycles:>8,} cycles  {elapsed:7.2f}s"
+        f"  ({elapsed / args.cycles * 1e6:8.1f} us/cycle)"
+    )
+
+    if args.legacy_cycles:
+        legacy = LegacyQueue()
+        # Same resulting list as adding one at a time, without n full sorts
+        legacy.items = sorted(prefill, key=lambda x: x.priority, reverse=True)
+        n = min(args.legacy_cycles, args.cycles)
+        elapsed = time_cycles(legacy.add, legacy.pop, cycle_items[:n])
+        print(
+            f"legacy  depth={args.depth:>7,}  {n:>8,} cycles  {elapsed:7.2f}s"
+            f"  ({elapsed / n * 1e6:8.1f} us/cycle)"
+        )
+
+
+if __name__ == "__main__":
+    main()
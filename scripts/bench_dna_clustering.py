@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Benchmark DNA match clustering: union-find vs the previous cluster scan.
+
+Generates a synthetic kit whose matches descend from one ancestral line per
+100 matches. Each match lists up to 20 shared matches from its own line, plus a rare
+(0.2%) link to another line. Times ``cluster_dna_matches`` (union-find
+over a ``MatchMatrix``), Leeds colour clustering with CSV matrix export, and
+streaming the same kit back from provider-style CSV files. The previous
+implementation (scan every cluster per match, then filter the match list per
+cluster) is reproduced for comparison and checked for identical clusters.
+
+Usage:
+    python scripts/bench_dna_clustering.py --sizes 1000 10000 50000
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from gps_agents.dna import DNAMatch, cluster_dna_matches
+from gps_agents.dna.clustering import MatchMatrix, load_match_csv
+
+
+def legacy_cluster(matches: list[DNAMatch], threshold_cm: float = 30.0) -> list[list[DNAMatch]]:
+    """The previous cluster_dna_matches body."""
+    significant = [m for m in matches if m.shared_cm >= threshold_cm]
+    clusters: list[set[str]] = []
+    for match in significant:
+        shared = set(match.shared_matches)
+        shared.add(match.match_name)
+        overlapping = [i for i, cluster in enumerate(clusters) if cluster & shared]
+        if not overlapping:
+            clusters.append(shared)
+        elif len(overlapping) == 1:
+            clusters[overlapping[0]].update(shared)
+        else:
+            merged = set().union(*(clusters[i] for i in overlapping), shared)
+            for i in sorted(overlapping, reverse=True):
+                clusters.pop(i)
+            clusters.append(merged)
+    result = []
+    for names in clusters:
+        members = [m for m in significant if m.match_name in names]
+        if members:
+            result.append(sorted(members, key=lambda m: m.shared_cm, reverse=True))
+    return result
+
+
+def synthetic_kit(n: int, lines: int, rng: random.Random) -> list[DNAMatch]:
+    names = [f"match{i:06d}" for i in range(n)]
+    line_of = [rng.randrange(lines) for _ in range(n)]
+    by_line: dict[int, list[str]] = {}
+    for name, line in zip(names, line_of, strict=True):
+        by_line.setdefault(line, []).append(name)
+    matches = []
+    for name, line in zip(names, line_of, strict=True):
+        cm = min(3400.0, 8 + rng.expovariate(1 / 40))
+        relatives = by_line[line]
+        shared = rng.sample(relatives, min(20, len(relatives)))
+        if rng.random() < 0.002:
+            shared.append(rng.choice(names))
+        matches.append(DNAMatch(
+            match_name=name, shared_cm=round(cm, 1), shared_segments=max(1, int(cm // 12)),
+            largest_segment_cm=round(cm / 3, 1), shared_matches=[s for s in shared if s != name],
+        ))
+    return matches
+
+
+def write_csvs(matches: list[DNAMatch], directory: Path) -> tuple[Path, Path]:
+    match_path, icw_path = directory / "matches.csv", directory / "icw.csv"
+    with match_path.open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Name", "Total cM shared", "Shared segments", "Largest segment (cM)"])
+        writer.writerows((m.match_name, m.shared_cm, m.shared_segments, m.largest_segment_cm) for m in matches)
+    with icw_path.open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["matchname", "icwname"])
+        writer.writerows((m.match_name, s) for m in matches for s in m.shared_matches)
+    return match_path, icw_path
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--legacy-max", type=int, default=50_000)
+    args = parser.parse_args()
+
+    for n in args.sizes:
+        rng = random.Random(n)
+        matches = synthetic_kit(n, lines=max(4, n // 100), rng=rng)
+        clusters, elapsed = timed(lambda: cluster_dna_matches(matches))
+        line = f"{n:>7,} matches  union-find {elapsed * 1e3:9.1f} ms ({len(clusters):,} clusters)"
+        if n <= args.legacy_max:
+            legacy, legacy_elapsed = timed(lambda: legacy_cluster(matches))
+            same = sorted(sorted(m.match_name for m in c) for c in clusters) == sorted(
+                sorted(m.match_name for m in c) for c in legacy
+            )
+            line += f"  legacy {legacy_elapsed * 1e3:10.1f} ms  same clusters: {same}"
+        print(line)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            matrix, build = timed(lambda: MatchMatrix.from_matches(matches))
+            leeds, leeds_elapsed = timed(lambda: matrix.leeds_clusters())
+            _, export = timed(lambda: leeds.write_csv(Path(tmp) / "leeds.csv"))
+            match_path, icw_path = write_csvs(matches, Path(tmp))
+            loaded, ingest = timed(lambda: load_match_csv(match_path, icw_path))
+            print(
+                f"{'':>16}  build {build * 1e3:8.1f} ms  leeds {leeds_elapsed * 1e3:8.1f} ms"
+                f" ({leeds.colors.shape[0]:,} x {leeds.colors.shape[1]:,})  export {export * 1e3:7.1f} ms"
+                f"  csv ingest {ingest * 1e3:8.1f} ms ({len(loaded):,} rows)"
+            )
+
+
+if __name__ == "__main__":
+    main()
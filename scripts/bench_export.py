@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""Benchmark single-pass multi-format export against the per-format exporters.
+
+Builds a synthetic ledger of ``--people`` people (birth, death and occupation
+facts with a source citation each, spouse pairs and parent/child links), then
+exports GEDCOM, GraphML, Markdown and JSON two ways, each in a fresh process:
+
+- legacy: the previous exporters, one full ``iter_all_facts`` scan per format,
+  each building its whole document (line lists, an ElementTree, a dict of
+  dataclasses holding Fact objects) before writing
+- engine: one ``export_many`` call, one scan, streaming writers
+
+Reports wall time and peak RSS (``ru_maxrss``) of each child process, plus the
+RSS growth over the process baseline after imports and opening the ledger.
+The legacy JSON/GraphML/Markdown code read ``fact.confidence`` and
+``source.title``, which do not exist on the models; the copies here use
+``confidence_score`` and the repository name so they can run at all.
+
+Usage:
+    python scripts/bench_export.py --people 20000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from datetime import UTC, datetime
+from pathlib import Path
+
+from gps_agents.export import export_many
+from gps_agents.export.graphml import GraphEdge, GraphNode, _build_graphml, _sanitize_id
+from gps_agents.export.json_export import _extract_date, _extract_place, _parse_person_key
+from gps_agents.ledger.fact_ledger import FactLedger
+from gps_agents.models.fact import Fact, FactStatus
+from gps_agents.models.provenance import Provenance, ProvenanceSource
+from gps_agents.models.source import SourceCitation
+
+FORMATS = (".ged", ".graphml", ".md", ".json")
+SURNAMES = ["Smith", "Jones", "Durham", "Archer", "Sorrell", "Baker", "Hill", "Ward"]
+
+
+def build_ledger(path: Path, people: int) -> int:
+    provenance = Provenance(created_by=ProvenanceSource.RESEARCH_AGENT)
+    ledger = FactLedger(str(path), enforce_privacy=False)
+    count = 0
+    batch: list[Fact] = []
+    for i in range(people):
+        key = f"Person{i} {SURNAMES[i % len(SURNAMES)]}|{1800 + i % 120}|Ohio"
+        source = SourceCitation(repository="FamilySearch", record_id=f"REC-{i}", url=f"https://example.org/{i}")
+        for fact_type, statement in (
+            ("birth", f"Birth on {1 + i % 28} Jan {1800 + i % 120} in Columbus"),
+            ("death", f"Death on {1 + i % 28} Mar {1870 + i % 120} in Dayton"),
+            ("occupation", "Farmer"),
+        ):
+            batch.append(Fact(
+                statement=statement, person_id=key, fact_type=fact_type, sources=[source],
+                status=FactStatus.ACCEPTED, provenance=provenance,
+            ))
+        if i % 2:
+            spouse = f"Person{i - 1} {SURNAMES[(i - 1) % len(SURNAMES)]}|{1800 + (i - 1) % 120}|Ohio"
+            batch.append(Fact(
+                statement="Married", fact_type="relationship", relation_kind="spouse_of",
+                relation_subject=key, relation_object=spouse, sources=[source],
+                status=FactStatus.ACCEPTED, provenance=provenance,
+            ))
+        if i >= 10:
+            parent = f"Person{i // 2} {SURNAMES[(i // 2) % len(SURNAMES)]}|{1800 + (i // 2) % 120}|Ohio"
+            batch.append(Fact(
+                statement="Parent", fact_type="relationship", relation_kind="parent_of",
+                relation_subject=parent, relation_object=key,
+                status=FactStatus.ACCEPTED, provenance=provenance,
+            ))
+        if len(batch) >= 5000:
+            count += len(ledger.append_many(batch, skip_privacy_check=True))
+            batch = []
+    count += len(ledger.append_many(batch, skip_privacy_check=True))
+    ledger.close()
+    return count
+
+
+# =============================================================================
+# Previous per-format exporters (one ledger scan each)
+# =============================================================================
+
+
+def _sources(fact: Fact) -> list[dict]:
+    return [{"id": s.record_id, "url": s.url, "title": s.repository} for s in fact.sources]
+
+
+def legacy_gedcom(ledger_dir: Path, out_file: Path) -> None:
+    from gps_agents.export.gedcom import _name_from_person_key, _parse_event_from_fact
+
+    individuals: dict[str, dict] = {}
+    families: dict[tuple[str, str], dict] = {}
+    fam_by_id: dict[str, dict] = {}
+    by_id: dict[str, dict] = {}
+
+    def ensure_indi(name: str) -> str:
+        if name not in individuals:
+            indi = {"id": f"@I{len(individuals) + 1}@", "name": name, "events": [], "fams": set(), "famc": set()}
+            individuals[name] = by_id[indi["id"]] = indi
+        return individuals[name]["id"]
+
+    def ensure_family(a: str, b: str | None = None) -> dict:
+        key = tuple(sorted([a, b])) if b and a != b else (a, a)
+        if key not in families:
+            fam = {"id": f"@F{len(families) + 1}@", "husb": key[0], "wife": key[1] if key[1] != key[0] else None, "chil": set()}
+            families[key] = fam_by_id[fam["id"]] = fam
+        return families[key]
+
+    tags = {"birth": "BIRT", "death": "DEAT", "burial": "BURI"}
+    for fact in FactLedger(str(ledger_dir)).iter_all_facts(FactStatus.ACCEPTED):
+        fact_type = (fact.fact_type or "").lower()
+        if fact_type == "relationship":
+            a, b = (fact.relation_subject or "").strip(), (fact.relation_object or "").strip()
+            if a and b:
+                ia, ib = ensure_indi(a), ensure_indi(b)
+                kind = (fact.relation_kind or "").lower()
+                if kind == "spouse_of":
+                    fam = ensure_family(ia, ib)
+                    by_id[ia]["fams"].add(fam["id"])
+                    by_id[ib]["fams"].add(fam["id"])
+                elif kind == "parent_of":
+                    fam = ensure_family(ia)
+                    fam["chil"].add(ib)
+                    by_id[ib]["famc"].add(fam["id"])
+        elif fact.person_id:
+            name = _name_from_person_key(fact.person_id)
+            ensure_indi(name)
+            if fact_type in tags:
+                date, place = _parse_event_from_fact(fact)
+                individuals[name]["events"].append((tags[fact_type], date, place))
+
+    lines = ["0 HEAD", "1 SOUR gps-genealogy-agents", "1 GEDC", "2 VERS 5.5", "2 FORM LINEAGE-LINKED", "1 CHAR UTF-8"]
+    for indi in individuals.values():
+        lines += [f"0 {indi['id']} INDI", f"1 NAME {indi['name']}"]
+        for tag, date, _place in indi["events"]:
+            lines.append(f"1 {tag}")
+            if date:
+                lines.append(f"2 DATE {date}")
+        lines += [f"1 FAMS {f}" for f in indi["fams"]] + [f"1 FAMC {f}" for f in indi["famc"]]
+    for fam in families.values():
+        lines.append(f"0 {fam['id']} FAM")
+        lines.append(f"1 HUSB {fam['husb']}")
+        if fam["wife"]:
+            lines.append(f"1 WIFE {fam['wife']}")
+        lines += [f"1 CHIL {c}" for c in fam["chil"]]
+    lines.append("0 TRLR")
+    out_file.write_text("\n".join(lines), encoding="utf-8")
+
+
+def legacy_json(ledger_dir: Path, out_file: Path) -> None:
+    persons: dict[str, dict] = {}
+    relationships: list[dict] = []
+
+    def ensure(key: str) -> dict:
+        if key not in persons:
+            name, given, surname = _parse_person_key(key)
+            persons[key] = {
+                "id": f"P{len(persons) + 1}", "name": name, "given_name": given, "surname": surname,
+                "birth_date": None, "birth_place": None, "death_date": None, "death_place": None,
+                "occupation": None, "notes": [], "sources": [], "facts": [],
+            }
+        return persons[key]
+
+    for fact in FactLedger(str(ledger_dir)).iter_all_facts(FactStatus.ACCEPTED):
+        fact_type = (fact.fact_type or "").lower()
+        if fact_type == "relationship":
+            a, b = (fact.relation_subject or "").strip(), (fact.relation_object or "").strip()
+            if a and b:
+                relationships.append({
+                    "type": (fact.relation_kind or "").lower(), "subject_id": ensure(a)["id"],
+                    "object_id": ensure(b)["id"], "date": None, "place": None,
+                    "confidence": fact.confidence_score, "sources": _sources(fact),
+                })
+        elif fact.person_id:
+            person = ensure(fact.person_id)
+            person["facts"].append({
+                "id": str(fact.fact_id), "type": fact.fact_type, "statement": fact.statement,
+                "person_id": fact.person_id, "relation_subject": None, "relation_object": None,
+                "relation_kind": None, "confidence": fact.confidence_score, "sources": _sources(fact),
+                "created_at": fact.created_at.isoformat(),
+            })
+            if fact_type in ("birth", "death"):
+                person[f"{fact_type}_date"] = _extract_date(fact.statement)
+                person[f"{fact_type}_place"] = _extract_place(fact.statement)
+            elif fact_type == "occupation":
+                person["occupation"] = fact.statement
+            person["sources"].extend(_sources(fact))
+
+    export = {
+        "metadata": {"generator": "gps-genealogy-agents", "export_date": datetime.now(UTC).isoformat()},
+        "persons": list(persons.values()),
+        "relationships": relationships,
+        "unlinked_facts": [],
+    }
+    with open(out_file, "w", encoding="utf-8") as f:
+        json.dump(export, f, indent=2, ensure_ascii=False)
+
+
+def legacy_markdown(ledger_dir: Path, out_file: Path) -> None:
+    persons: dict[str, dict] = {}
+
+    def ensure(key: str) -> dict:
+        if key not in persons:
+            name, _given, surname = _parse_person_key(key)
+            persons[key] = {"name": name, "surname": surname, "facts": [], "parents": [], "spouses": [], "children": []}
+        return persons[key]
+
+    for fact in FactLedger(str(ledger_dir)).iter_all_facts(FactStatus.ACCEPTED):
+        fact_type = (fact.fact_type or "").lower()
+        if fact_type == "relationship":
+            a, b = (fact.relation_subject or "").strip(), (fact.relation_object or "").strip()
+            if a and b:
+                kind = (fact.relation_kind or "").lower()
+                if kind == "parent_of":
+                    ensure(a)["children"].append(b)
+                    ensure(b)["parents"].append(a)
+                elif kind == "spouse_of":
+                    ensure(a)["spouses"].append(b)
+                    ensure(b)["spouses"].append(a)
+        elif fact.person_id:
+            ensure(fact.person_id)["facts"].append(fact)
+
+    lines = ["# Family Tree", "", "## Individuals", ""]
+    by_surname: dict[str, list[dict]] = {}
+    for person in persons.values():
+        by_surname.setdefault(person["surname"] or "Unknown", []).append(person)
+    for surname in sorted(by_surname):
+        lines += [f"### {surname}", ""]
+        for person in sorted(by_surname[surname], key=lambda p: p["name"]):
+            lines += [f"#### {person['name']}", ""]
+            for label, key in (("Parents", "parents"), ("Spouse(s)", "spouses"), ("Children", "children")):
+                if person[key]:
+                    lines += [f"**{label}**:", *(f"- {k}" for k in person[key]), ""]
+            lines += ["**Facts**:", ""]
+            for fact in person["facts"]:
+                lines.append(f"- **{(fact.fact_type or '').title()}**: {fact.statement}")
+                lines += [f"  - Source: [{s.repository}]({s.url})" for s in fact.sources if s.url]
+            lines.append("")
+    out_file.write_text("\n".join(lines), encoding="utf-8")
+
+
+def legacy_graphml(ledger_dir: Path, out_file: Path) -> None:
+    nodes: dict[str, GraphNode] = {}
+    edges: list[GraphEdge] = []
+
+    def ensure(key: str) -> str:
+        node_id = _sanitize_id(key)
+        if node_id not in nodes:
+            name, given, surname = _parse_person_key(key)
+            nodes[node_id] = GraphNode(node_id, name, "person", {"given_name": given or "", "surname": surname or "", "full_key": key})
+        return node_id
+
+    for fact in FactLedger(str(ledger_dir)).iter_all_facts(FactStatus.ACCEPTED):
+        fact_type = (fact.fact_type or "").lower()
+        weight = {"weight": str(fact.confidence_score)}
+        if fact_type == "relationship":
+            a, b = (fact.relation_subject or "").strip(), (fact.relation_object or "").strip()
+            if a and b:
+                ia, ib = ensure(a), ensure(b)
+                if fact.relation_kind == "spouse_of":
+                    key = sorted([ia, ib])
+                    fam_id = f"fam_{key[0]}_{key[1]}"
+                    nodes.setdefault(fam_id, GraphNode(fam_id, "Family", "family", {}))
+                    edges.append(GraphEdge(ia, fam_id, "spouse", "spouse", weight))
+                    edges.append(GraphEdge(ib, fam_id, "spouse", "spouse", weight))
+                else:
+                    edges.append(GraphEdge(ia, ib, "parent_of", "parent", weight))
+        elif fact.person_id:
+            node_id = ensure(fact.person_id)
+            if fact_type in ("birth", "death", "burial", "occupation"):
+                nodes[node_id].attributes[fact_type] = fact.statement
+
+    tree = ET.ElementTree(_build_graphml(nodes, edges, True))
+    ET.indent(tree, space="  ")
+    tree.write(out_file, encoding="utf-8", xml_declaration=True)
+
+
+LEGACY = {".ged": legacy_gedcom, ".graphml": legacy_graphml, ".md": legacy_markdown, ".json": legacy_json}
+
+
+# =============================================================================
+# Driver
+# =============================================================================
+
+
+def child(mode: str, ledger_dir: Path, out_dir: Path) -> None:
+    logging.basicConfig(level=logging.ERROR)
+    FactLedger(str(ledger_dir)).close()  # imports and index load count toward the baseline
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    outputs = [out_dir / f"tree{suffix}" for suffix in FORMATS]
+    start = time.perf_counter()
+    if mode == "legacy":
+        for out in outputs:
+            LEGACY[out.suffix](ledger_dir, out)
+    else:
+        export_many(ledger_dir, outputs)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    sizes = {out.suffix: out.stat().st_size for out in outputs}
+    print(json.dumps({"elapsed": elapsed, "baseline_kib": baseline, "peak_kib": peak, "sizes": sizes}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--people", type=int, default=20_000)
+    parser.add_argument("--child", choices=("legacy", "engine"), help=argparse.SUPPRESS)
+    parser.add_argument("--ledger", type=Path, help=argparse.SUPPRESS)
+    parser.add_argument("--out", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.ledger, args.out)
+        return
+
+    logging.basicConfig(level=logging.ERROR)
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger_dir = Path(tmp) / "ledger"
+        start = time.perf_counter()
+        facts = build_ledger(ledger_dir, args.people)
+        print(f"ledger: {args.people:,} people, {facts:,} facts ({time.perf_counter() - start:.1f}s to build)")
+        print(f"formats: {' '.join(FORMATS)}")
+
+        for mode in ("legacy", "engine"):
+            out_dir = Path(tmp) / mode
+            out_dir.mkdir()
+            result = json.loads(subprocess.run(
+                [sys.executable, __file__, "--child", mode, "--ledger", str(ledger_dir), "--out", str(out_dir)],
+                check=True, capture_output=True, text=True,
+            ).stdout)
+            growth = (result["peak_kib"] - result["baseline_kib"]) / 1024
+            output_mib = sum(result["sizes"].values()) / 2**20
+            print(
+                f"  {mode:<7} {result['elapsed']:7.2f}s  peak RSS {result['peak_kib'] / 1024:7.1f} MiB"
+                f"  (+{growth:6.1f} MiB over baseline)  output {output_mib:.1f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
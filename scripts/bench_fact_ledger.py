@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Benchmark the FactLedger file fallback: append, get, iterate, cold open.
+
+Compares the segmented store against the previous single-file fallback
+(``facts.jsonl`` plus a JSON offset index rewritten on every append), which
+is reproduced here as ``LegacyJsonlLedger``. Cold open is measured on the
+raw SegmentStore with small synthetic payloads so that large stores build
+quickly; pass ``--cold-open-facts 10000000`` for the 10M-fact figure.
+
+Usage:
+    python scripts/bench_fact_ledger.py --facts 20000 --cold-open-facts 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+from gps_agents.ledger.fact_ledger import FactLedger
+from gps_agents.ledger.segment_store import SegmentStore
+from gps_agents.models.fact import Fact
+from gps_agents.models.provenance import Provenance, ProvenanceSource
+
+
+class LegacyJsonlLedger:
+    """The previous fallback: JSONL data file plus a JSON index rewritten per append."""
+
+    def __init__(self, root: Path) -> None:
+        self.path = root / "facts.jsonl"
+        self.index_path = root / "index.json"
+        self.index: dict[str, dict[int, int]] = {}
+        if self.index_path.exists():
+            raw = json.loads(self.index_path.read_text())
+            self.index = {k: {int(v): o for v, o in d.items()} for k, d in raw.items()}
+
+    def append(self, fact: Fact) -> None:
+        value = fact.model_dump_json()
+        with open(self.path, "a") as f:
+            offset = f.tell()
+            f.write(json.dumps({"key": fact.ledger_key(), "value": json.loads(value)}) + "\n")
+        self.index.setdefault(str(fact.fact_id), {})[fact.version] = offset
+        self.index_path.write_text(json.dumps(self.index))
+
+    def get(self, fact_id: uuid.UUID) -> Fact | None:
+        versions = self.index.get(str(fact_id))
+        if not versions:
+            return None
+        with open(self.path) as f:
+            f.seek(versions[max(versions)])
+            return Fact.model_validate(json.loads(f.readline())["value"])
+
+    def iter_all_facts(self):
+        for fact_id in self.index:
+            yield self.get(uuid.UUID(fact_id))
+
+
+def make_facts(n: int) -> list[Fact]:
+    provenance = Provenance(created_by=ProvenanceSource.RESEARCH_AGENT)
+    return [Fact(statement=f"Person {i} born {1800 + i % 100}", provenance=provenance) for i in range(n)]
+
+
+def rate(label: str, count: int, elapsed: float) -> None:
+    print(f"  {label:<10} {count:>10,} ops  {elapsed:8.2f}s  ({count / elapsed:>10,.0f} ops/s)")
+
+
+def run(label: str, ledger, facts: list[Fact], sample: list[uuid.UUID]) -> None:
+    print(label)
+    start = time.perf_counter()
+    for fact in facts:
+        ledger.append(fact)
+    rate("append", len(facts), time.perf_counter() - start)
+    start = time.perf_counter()
+    for fact_id in sample:
+        ledger.get(fact_id)
+    rate("get", len(sample), time.perf_counter() - start)
+    start = time.perf_counter()
+    n = sum(1 for _ in ledger.iter_all_facts())
+    rate("iterate", n, time.perf_counter() - start)
+
+
+def cold_open(n: int) -> None:
+    payload = b'{"statement": "' + b"x" * 200 + b'"}'
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SegmentStore(tmp)
+        start = time.perf_counter()
+        batch = []
+        for _ in range(n):
+            batch.append((uuid.UUID(int=rng.getrandbits(128)), 1, payload))
+            if len(batch) == 10_000:
+                store.append_many(batch)
+                batch = []
+        store.append_many(batch)
+        store.close()
+        print(f"segment store with {n:,} facts built and closed in {time.perf_counter() - start:.1f}s")
+
+        start = time.perf_counter()
+        store = SegmentStore(tmp)
+        opened = time.perf_counter() - start
+        probe = uuid.UUID(int=random.Random(0).getrandbits(128))
+        start = time.perf_counter()
+        assert store.get(probe, 1) == payload
+        print(f"  cold open {opened * 1000:8.1f} ms   first get {(time.perf_counter() - start) * 1000:6.2f} ms")
+        store.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--facts", type=int, default=20_000)
+    parser.add_argument("--gets", type=int, default=20_000)
+    parser.add_argument("--cold-open-facts", type=int, default=1_000_000)
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+
+    facts = make_facts(args.facts)
+    rng = random.Random(1)
+    sample = [rng.choice(facts).fact_id for _ in range(args.gets)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = FactLedger(tmp, enforce_privacy=False)
+        run("segmented fallback", ledger, facts, sample)
+        ledger.close()
+    if not args.skip_legacy:
+        with tempfile.TemporaryDirectory() as tmp:
+            run("legacy jsonl fallback", LegacyJsonlLedger(Path(tmp)), facts, sample)
+    if args.cold_open_facts:
+        cold_open(args.cold_open_facts)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Benchmark the FrontierQueue fallback (heap + WAL) against the old list store.
+
+The old fallback re-sorted a Python list on every push, used ``list.pop(0)``
+and rewrote ``frontier.jsonl`` after each operation. It is reproduced here as
+``LegacyListFrontier`` so both can be timed on the same items. The legacy
+store is quadratic, so it runs on a much smaller item count by default.
+
+Usage:
+    python scripts/bench_frontier_queue.py --items 1000000 --legacy-items 2000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from gps_agents.genealogy_crawler.frontier import CrawlItem, CrawlPriority, FrontierQueue
+
+PRIORITIES = list(CrawlPriority)
+
+
+class LegacyListFrontier:
+    """Minimal copy of the pre-WAL fallback: sorted list + full file rewrite."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path / "frontier.jsonl"
+        self.queue: list[tuple[bytes, CrawlItem]] = []
+        self.processing: dict[str, CrawlItem] = {}
+
+    def _key(self, item: CrawlItem) -> bytes:
+        ts = int(item.created_at.timestamp() * 1_000_000)
+        return f"q:{item.priority:02d}:{ts:016d}:{item.item_id}".encode()
+
+    def _save(self) -> None:
+        with open(self.path, "w") as f:
+            for _, item in self.queue:
+                f.write(json.dumps({"item": item.to_dict(), "status": "pending"}) + "\n")
+            for item in self.processing.values():
+                f.write(json.dumps({"item": item.to_dict(), "status": "processing"}) + "\n")
+
+    def push(self, item: CrawlItem) -> None:
+        self.queue.append((self._key(item), item))
+        self.queue.sort(key=lambda x: x[0])
+        self._save()
+
+    def pop(self) -> CrawlItem:
+        _, item = self.queue.pop(0)
+        self.processing[str(item.item_id)] = item
+        self._save()
+        return item
+
+
+def make_items(n: int) -> list[CrawlItem]:
+    base = datetime(2024, 1, 1, tzinfo=UTC)
+    return [
+        CrawlItem(
+            url=f"https://example.com/record/{i}",
+            adapter_id="bench",
+            priority=PRIORITIES[i % len(PRIORITIES)],
+            created_at=base + timedelta(microseconds=i),
+        )
+        for i in range(n)
+    ]
+
+
+def run(store, items: list[CrawlItem]) -> tuple[float, float]:
+    start = time.perf_counter()
+    for item in items:
+        store.push(item)
+    push_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(len(items)):
+        store.pop()
+    pop_s = time.perf_counter() - start
+    return push_s, pop_s
+
+
+def report(label: str, n: int, push_s: float, pop_s: float) -> None:
+    print(
+        f"{label:<10} n={n:>9,}  push {push_s:8.2f}s ({n / push_s:>10,.0f}/s)"
+        f"  pop {pop_s:8.2f}s ({n / pop_s:>10,.0f}/s)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=1_000_000)
+    parser.add_argument("--legacy-items", type=int, default=2_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = FrontierQueue(Path(tmp) / "heap")
+        if not queue._use_fallback:
+            print("RocksDB is installed; timing the RocksDB store instead of the fallback")
+        push_s, pop_s = run(queue, make_items(args.items))
+        queue.close()
+        report("heap+wal", args.items, push_s, pop_s)
+
+        if args.legacy_items:
+            legacy_dir = Path(tmp) / "legacy"
+            legacy_dir.mkdir()
+            push_s, pop_s = run(LegacyListFrontier(legacy_dir), make_items(args.legacy_items))
+            report("legacy", args.legacy_items, push_s, pop_s)
+
+
+if __name__ == "__main__":
+    main()
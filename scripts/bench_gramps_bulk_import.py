@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Benchmark bulk Gramps imports against per-row inserts.
+
+Generates a GEDCOM-like synthetic tree: couples with two children, a birth
+event and a citation for every person, a family per couple and one shared
+source. Writes it into an empty Gramps database (with the person index)
+through ``GrampsClient.bulk_writer`` and through the previous per-row path,
+which allocates each Gramps ID with a ``MAX(...)`` scan of the table and
+commits every row, and reports rows/sec. The per-row path is quadratic, so
+by default it only runs up to ``--legacy-max`` persons.
+
+Usage:
+    python scripts/bench_gramps_bulk_import.py --persons 10000 100000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from uuid_utils import uuid7
+
+from gps_agents.gramps.client import GrampsClient
+from gps_agents.gramps.models import (
+    Citation,
+    Event,
+    EventType,
+    Family,
+    GrampsDate,
+    Name,
+    Person,
+    Source,
+)
+
+TABLES = ("person", "family", "event", "source", "citation")
+GIVEN = ["John", "Mary", "William", "Sarah", "George", "Martha", "James", "Ellen", "Thomas", "Ann"]
+
+
+def make_db(path: Path) -> None:
+    conn = sqlite3.connect(path)
+    for table in TABLES:
+        conn.execute(f"CREATE TABLE {table} (handle TEXT PRIMARY KEY, gramps_id TEXT, blob_data BLOB)")
+    conn.commit()
+    conn.close()
+
+
+def make_tree(persons: int, rng: random.Random) -> list[tuple[Person, Person, list[Person]]]:
+    """Couples with two children each, about ``persons`` people in all."""
+    def person(surname: str, sex: str, year: int) -> Person:
+        return Person(
+            names=[Name(given=rng.choice(GIVEN), surname=surname)],
+            sex=sex,
+            birth=Event(event_type=EventType.BIRTH, date=GrampsDate(year=year)),
+        )
+
+    units = []
+    for _ in range(persons // 4):
+        surname = f"{rng.choice('BCDFGHKLMNPRSTVW')}{rng.choice('aeiou')}{rng.randrange(20_000):05d}"
+        year = rng.randint(1780, 1900)
+        units.append((
+            person(surname, "M", year),
+            person(rng.choice(["Smith", "Jones", "Brown"]), "F", year + rng.randint(-3, 5)),
+            [person(surname, rng.choice("MF"), year + rng.randint(20, 35)) for _ in range(2)],
+        ))
+    return units
+
+
+def bulk_import(client: GrampsClient, units: list) -> int:
+    with client.bulk_writer() as writer:
+        source = writer.add_source(Source(title="Synthetic census"))
+        for father, mother, children in units:
+            family = writer.new_handle()
+            for member in (father, mother):
+                member.family_ids = [family]
+            for child in children:
+                child.parent_family_ids = [family]
+            handles = [writer.add_person(p) for p in (father, mother, *children)]
+            for p in (father, mother, *children):
+                writer.add_event(p.birth)
+                writer.add_citation(Citation(source_id=source, page=p.display_name))
+            writer.add_family(Family(husband_id=handles[0], wife_id=handles[1], child_ids=handles[2:]), family)
+    return sum(writer.counts.values())
+
+
+def legacy_insert(client: GrampsClient, table: str, prefix: str, build, record) -> str:
+    """One row the previous way: MAX(...) ID scan, own transaction."""
+    # Full uuid7 hex: the 20-character prefix add_person uses repeats within
+    # a millisecond, which a tight loop like this one hits
+    handle = uuid7().hex
+    gramps_id = f"{prefix}{client._get_next_id(table)}"
+    data = build(record, handle, gramps_id)
+    blob = client._serialize_blob(data)
+    with client.session():
+        client._conn.execute(
+            f"INSERT INTO {table} (handle, gramps_id, blob_data) VALUES (?, ?, ?)",
+            (handle, gramps_id, blob),
+        )
+        if table == "person" and client._person_index:
+            client._person_index.add(handle, len(blob), client._person_from_gramps(handle, data))
+    return handle
+
+
+def legacy_import(client: GrampsClient, units: list) -> int:
+    rows = 1
+    source = legacy_insert(client, "source", "S", client._source_data, Source(title="Synthetic census"))
+    for father, mother, children in units:
+        members = (father, mother, *children)
+        handles = [legacy_insert(client, "person", "I", client._person_data, p) for p in members]
+        for p in members:
+            legacy_insert(client, "event", "E", client._event_data, p.birth)
+            legacy_insert(client, "citation", "C", client._citation_data, Citation(source_id=source, page=p.display_name))
+        family = Family(husband_id=handles[0], wife_id=handles[1], child_ids=handles[2:])
+        legacy_insert(client, "family", "F", client._family_data, family)
+        rows += 3 * len(members) + 1
+    return rows
+
+
+def run(label: str, load, persons: int, rng_seed: int) -> None:
+    units = make_tree(persons, random.Random(rng_seed))
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Path(tmp) / "sqlite.db"
+        make_db(db)
+        client = GrampsClient(db)
+        client.connect(db)
+        start = time.perf_counter()
+        rows = load(client, units)
+        elapsed = time.perf_counter() - start
+        client.close()
+    people = len(units) * 4
+    print(
+        f"  {label:<8} {people:>8,} persons {rows:>9,} rows {elapsed:8.2f}s"
+        f" {rows / elapsed:>10,.0f} rows/s {people / elapsed:>9,.0f} persons/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--persons", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--legacy-max", type=int, default=10_000, help="largest tree for the per-row path")
+    args = parser.parse_args()
+
+    for persons in args.persons:
+        run("bulk", bulk_import, persons, 7)
+        if persons <= args.legacy_max:
+            run("per-row", legacy_import, persons, 7)
+
+
+if __name__ == "__main__":
+    main()
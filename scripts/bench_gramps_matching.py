@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Benchmark Gramps duplicate detection with and without the person index.
+
+Builds a synthetic tree (JSON person blobs, as written by GrampsClient) and
+plants spelling variants of probe persons (Smith/Smyth, Jonson/Johnson...).
+Times ``PersonMatcher.find_matches`` on the indexed client, on a client with
+``person_index=False`` (full scan, same recall) and with the previous
+candidate generation (surname substring scan plus a Soundex pass over the
+first 100 people), and reports how many planted variants each one finds.
+Thompson/Thomson differ in both Soundex and Metaphone, so those probes are
+missed by every variant.
+
+Usage:
+    python scripts/bench_gramps_matching.py --persons 250000 --probes 50
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from gps_agents.gramps.client import GrampsClient
+from gps_agents.gramps.merge import PersonMatcher
+from gps_agents.gramps.models import Event, EventType, GrampsDate, Name, Person
+
+GIVEN = ["John", "Mary", "William", "Sarah", "George", "Martha", "James", "Ellen", "Thomas", "Ann"]
+VARIANTS = {"Smith": "Smyth", "Johnson": "Jonson", "Thompson": "Thomson", "Miller": "Millar", "Davis": "Davies"}
+
+
+def build_db(path: Path, n: int, rng: random.Random) -> None:
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE person (handle TEXT PRIMARY KEY, gramps_id TEXT, blob_data BLOB)")
+    rows = []
+    for i in range(n):
+        # Long tail of surnames, so that each probe has few true candidates
+        surname = f"{rng.choice('BCDFGHKLMNPRSTVW')}{rng.choice('aeiou')}{rng.randrange(20_000):05d}"
+        data = {
+            "gramps_id": f"I{i}",
+            "primary_name": {"first_name": rng.choice(GIVEN), "surname_list": [{"surname": surname}]},
+            "birth": {"date": {"year": rng.randint(1780, 1920)}},
+        }
+        rows.append((f"h{i:09d}", f"I{i}", json.dumps(data).encode()))
+    conn.executemany("INSERT INTO person VALUES (?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+
+
+def plant(path: Path, probes: int, rng: random.Random) -> list[Person]:
+    """Insert one spelling variant per probe at a random position; return the probes."""
+    conn = sqlite3.connect(path)
+    people = []
+    for i in range(probes):
+        surname, variant = rng.choice(list(VARIANTS.items()))
+        given, year = rng.choice(GIVEN), rng.randint(1800, 1900)
+        data = {
+            "gramps_id": f"DUP{i}",
+            "primary_name": {"first_name": given, "surname_list": [{"surname": variant}]},
+            "birth": {"date": {"year": year}},
+        }
+        conn.execute("INSERT INTO person VALUES (?, ?, ?)", (f"h{rng.randrange(10**9):09d}x", f"DUP{i}", json.dumps(data).encode()))
+        people.append(Person(
+            names=[Name(given=given, surname=surname)],
+            birth=Event(event_type=EventType.BIRTH, date=GrampsDate(year=year)),
+        ))
+    conn.commit()
+    conn.close()
+    return people
+
+
+def legacy_find_matches(matcher: PersonMatcher, person: Person, threshold: float = 50.0) -> list:
+    """The previous find_matches candidate generation."""
+    candidates = matcher.client.find_persons(surname=person.primary_name.surname, limit=100)
+    soundex = matcher._soundex(person.primary_name.surname)
+    for candidate in matcher.client.find_persons(limit=100):
+        if candidate.primary_name and matcher._soundex(candidate.primary_name.surname) == soundex and candidate not in candidates:
+            candidates.append(candidate)
+    results = [r for c in candidates if (r := matcher._score_match(person, c)).match_score >= threshold]
+    return sorted(results, key=lambda r: r.match_score, reverse=True)[:5]
+
+
+def candidate_recall(client: GrampsClient, probes: list[Person]) -> int:
+    return sum(
+        any(c.gramps_id == f"DUP{i}" for c in client.find_match_candidates(p.primary_name.surname, birth_year=p.birth.date.year))
+        for i, p in enumerate(probes)
+    )
+
+
+def run(label: str, find, probes: list[Person]) -> None:
+    start = time.perf_counter()
+    found = 0
+    for i, person in enumerate(probes):
+        found += any(r.matched_person and r.matched_person.gramps_id == f"DUP{i}" for r in find(person))
+    per_probe = (time.perf_counter() - start) / len(probes)
+    print(f"  {label:<22} {per_probe * 1000:10.2f} ms/lookup   found {found}/{len(probes)} planted duplicates")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--persons", type=int, default=250_000)
+    parser.add_argument("--probes", type=int, default=50)
+    parser.add_argument("--scan-probes", type=int, default=5, help="probes for the slow full-scan variants")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Path(tmp) / "sqlite.db"
+        build_db(db, args.persons, rng)
+        probes = plant(db, args.probes, rng)
+        print(f"tree of {args.persons + args.probes:,} persons")
+
+        start = time.perf_counter()
+        indexed = GrampsClient(db)
+        indexed.connect(db)
+        print(f"  index build on first connect {time.perf_counter() - start:8.2f}s")
+        indexed.close()
+        start = time.perf_counter()
+        indexed.connect(db)
+        print(f"  reconnect (sync check)       {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+        scan = GrampsClient(db, person_index=False)
+        scan.connect(db)
+        print(f"  candidate recall (indexed)   {candidate_recall(indexed, probes)}/{len(probes)}")
+        run("indexed", PersonMatcher(indexed).find_matches, probes)
+        few = probes[: args.scan_probes]
+        run("full scan (no index)", PersonMatcher(scan).find_matches, few)
+        legacy = PersonMatcher(scan)
+        run("legacy first-100", lambda p: legacy_find_matches(legacy, p), few)
+
+
+if __name__ == "__main__":
+    main()
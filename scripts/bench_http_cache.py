@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Benchmark the shared HTTP response cache on a repeated crawl.
+
+A local stub server plays a genealogy site: ``--pages`` distinct search and
+record pages of realistic HTML, each served with an ETag after ``--latency``
+ms. The same crawl is run three times through ``shared_client(source=...)``:
+
+- cold: empty cache, every page is downloaded and stored
+- warm: within the TTL, pages are served from the cache
+- stale: entries expired, pages are revalidated with conditional GETs (304)
+
+For each pass it reports wall time, requests that reached the server and
+body bytes saved, then the on-disk size of the store against the raw bytes.
+
+Usage:
+    python scripts/bench_http_cache.py --pages 300
+    python scripts/bench_http_cache.py --pages 1000 --latency 80 --concurrency 8
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from gps_agents import net
+from gps_agents.http_cache import ZSTD_AVAILABLE, CacheConfig, ResponseStore
+
+SURNAMES = ["Smith", "Durham", "Johnson", "Mueller", "O'Brien", "Larsson", "Kowalski", "Cohen"]
+
+
+def render_page(index: int) -> bytes:
+    rng = random.Random(index)
+    rows = "".join(
+        f"<tr><td><a href='/memorial/{rng.randint(1, 10**8)}'>{rng.choice(SURNAMES)}, John</a></td>"
+        f"<td>{rng.randint(1800, 1950)}</td><td>{rng.choice(SURNAMES)} Cemetery, Ohio</td></tr>"
+        for _ in range(40)
+    )
+    return f"<html><head><title>Results {index}</title></head><body><table>{rows}</table></body></html>".encode()
+
+
+class SiteHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    wbufsize = 1 << 16
+    latency = 0.05
+    hits = 0
+
+    def do_GET(self) -> None:
+        SiteHandler.hits += 1
+        time.sleep(self.latency)
+        index = int(self.path.rsplit("/", 1)[-1])
+        etag = f'"p{index}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = render_page(index)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+async def crawl(base: str, pages: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+    async with net.shared_client("benchsite", timeout=30) as client:
+
+        async def fetch(i: int) -> None:
+            async with semaphore:
+                (await client.get(f"{base}/page/{i}")).raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(fetch(i) for i in range(pages)))
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--latency", type=float, default=50, help="server latency per request in ms")
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    SiteHandler.latency = args.latency / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SiteHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    print(f"{args.pages} pages, {args.latency:.0f} ms latency, codec {'zstd' if ZSTD_AVAILABLE else 'zlib'}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ResponseStore(CacheConfig(path=Path(tmp) / "responses.db", default_ttl=3600))
+        net.CACHE = store
+        for label in ("cold", "warm", "stale"):
+            if label == "stale":
+                store._connect().execute("UPDATE entries SET expires_at = 0")
+            SiteHandler.hits = 0
+            saved_before = store.stats_for("benchsite").bytes_saved
+            elapsed = asyncio.run(crawl(base, args.pages, args.concurrency))
+            saved = store.stats_for("benchsite").bytes_saved - saved_before
+            print(
+                f"{label:<6} {elapsed:7.2f}s  {SiteHandler.hits:>5} server requests"
+                f"  {saved / 2**20:7.2f} MiB saved"
+            )
+        raw = sum(len(render_page(i)) for i in range(args.pages))
+        bodies = store.total_bytes()
+        store.close()
+        db = sum(p.stat().st_size for p in Path(tmp).iterdir())
+        print(
+            f"store: {bodies / 2**20:.2f} MiB bodies, {db / 2**20:.2f} MiB on disk"
+            f" for {raw / 2**20:.2f} MiB of pages; hit rate {store.stats['benchsite'].hit_rate:.2f}"
+        )
+
+    server.shutdown()
+    server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Benchmark per-call httpx clients against the shared connection pool.
+
+Starts a local keep-alive HTTP/1.1 stub server and issues ``--requests``
+requests ``--concurrency`` at a time, first the way sources used to (a fresh
+``httpx.AsyncClient`` per call, so every request pays a TCP connect) and then
+through ``shared_client``. Reports requests/sec, connections accepted by the
+server, and the pool's reuse rate from ``report_pool_status``.
+
+Against real HTTPS hosts the gap is larger still, since every fresh client
+also pays a TLS handshake.
+
+Usage:
+    python scripts/bench_http_pool.py --requests 200
+    python scripts/bench_http_pool.py --requests 1000 --concurrency 8
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+from gps_agents.net import TRANSPORT, report_pool_status, shared_client
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    wbufsize = 1 << 16
+    connections = 0
+
+    def setup(self) -> None:
+        super().setup()
+        StubHandler.connections += 1
+
+    def do_GET(self) -> None:
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+async def run(make_client, url: str, requests: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with semaphore, make_client(timeout=10) as client:
+            (await client.get(url)).raise_for_status()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return time.perf_counter() - start
+
+
+async def bench(url: str, requests: int, concurrency: int) -> None:
+    for label, make_client in (("fresh clients", httpx.AsyncClient), ("shared pool", shared_client)):
+        StubHandler.connections = 0
+        elapsed = await run(make_client, url, requests, concurrency)
+        print(
+            f"{label:<14} {requests / elapsed:8.0f} req/s  {elapsed:6.2f}s"
+            f"  {StubHandler.connections:>5} connections"
+        )
+    for origin, status in report_pool_status().items():
+        print(f"{origin}: {status}")
+    await TRANSPORT.aclose_pools()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=1)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        asyncio.run(bench(f"http://127.0.0.1:{server.server_port}/", args.requests, args.concurrency))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
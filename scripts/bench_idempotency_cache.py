@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Benchmark IdempotencyCache put/get throughput at large entry counts.
+
+Fills the cache to ``--entries`` and keeps inserting past capacity so every
+put evicts, then times hit and miss lookups. ``--persistent`` also measures
+the append-only JSONL log (including background compaction) and reload time.
+
+Usage:
+    python scripts/bench_idempotency_cache.py --entries 1000000 --persistent
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from gps_agents.genealogy_crawler.llm import (
+    ContentFingerprint,
+    IdempotencyCache,
+    PersistentIdempotencyCache,
+)
+
+ROLES = ["planner", "verifier", "resolver", "conflict_analyst"]
+
+
+class Output(BaseModel):
+    given_name: str
+    confidence: float
+
+
+def fingerprint(n: int) -> ContentFingerprint:
+    return ContentFingerprint(kind=f"llm_{ROLES[n % len(ROLES)]}", value=f"{n:016x}".ljust(64, "0"))
+
+
+def rate(label: str, count: int, elapsed: float) -> None:
+    print(f"{label:<28} {count:>10,} ops  {elapsed:7.2f}s  ({count / elapsed:>12,.0f} ops/s)")
+
+
+def run(cache: IdempotencyCache, entries: int, overflow: int) -> None:
+    output = Output(given_name="John", confidence=0.9)
+    start = time.perf_counter()
+    for n in range(entries + overflow):
+        cache.put(fingerprint(n), output, ROLES[n % len(ROLES)], str(n))
+    rate("put (with eviction)", entries + overflow, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for n in range(overflow, entries + overflow):
+        cache.get(fingerprint(n))
+    rate("get (hit)", entries, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for n in range(overflow):
+        cache.get(fingerprint(n))
+    rate("get (miss)", overflow, time.perf_counter() - start)
+
+    for role, stats in sorted(cache.stats_by_role.items()):
+        print(f"  {role:<18} hits={stats.hits:,} misses={stats.misses:,} evictions={stats.evictions:,}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=1_000_000)
+    parser.add_argument("--overflow", type=int, default=100_000)
+    parser.add_argument("--persistent", action="store_true")
+    args = parser.parse_args()
+
+    print("in-memory")
+    run(IdempotencyCache(max_size=args.entries), args.entries, args.overflow)
+
+    if args.persistent:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "cache.jsonl"
+            print("persistent")
+            cache = PersistentIdempotencyCache(path, max_size=args.entries)
+            run(cache, args.entries, args.overflow)
+            start = time.perf_counter()
+            cache.close()
+            print(f"close (compact)              {time.perf_counter() - start:7.2f}s")
+            start = time.perf_counter()
+            reopened = PersistentIdempotencyCache(path, max_size=args.entries)
+            print(f"reload {len(reopened.cache):,} entries      {time.perf_counter() - start:7.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Benchmark FactLedger.append_many and group commit: facts/sec by batch size.
+
+Appends the same facts with ``append_many`` at each batch size (a batch of 1
+is the per-fact ``append`` path), with the privacy engine enabled and a
+SQLiteProjection wired in, as in the crawler. Group commit is measured with
+concurrent threads each calling ``append``. ``--sync`` fsyncs every batch,
+which is where sharing a flush between appenders pays off most.
+
+Usage:
+    python scripts/bench_ledger_append_many.py --facts 20000 --batch-sizes 1 100 10000 --threads 8
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from gps_agents.ledger.fact_ledger import FactLedger
+from gps_agents.models.fact import Fact
+from gps_agents.models.provenance import Provenance, ProvenanceSource
+from gps_agents.projections.sqlite_projection import SQLiteProjection, wire_ledger_to_projection
+
+
+def make_facts(n: int) -> list[Fact]:
+    provenance = Provenance(created_by=ProvenanceSource.WEB_SCRAPING)
+    return [
+        Fact(
+            statement=f"Person {i} listed in roll with number {i}",
+            provenance=provenance,
+            fact_type="roll_listing",
+            person_id=f"person-{i // 50}",
+        )
+        for i in range(n)
+    ]
+
+
+def open_ledger(root: Path, args: argparse.Namespace, **kwargs) -> tuple[FactLedger, SQLiteProjection | None]:
+    ledger = FactLedger(root / "ledger", sync=args.sync, **kwargs)
+    projection = None
+    if not args.no_projection:
+        # Single pooled writer, so concurrent appenders queue instead of hitting SQLITE_BUSY
+        projection = SQLiteProjection(root / "projection.db", reader_pool_size=2)
+        wire_ledger_to_projection(ledger, projection)
+    return ledger, projection
+
+
+def report(label: str, n: int, elapsed: float) -> None:
+    print(f"  {label:<24} {n:>8,} facts  {elapsed:8.2f}s  ({n / elapsed:>10,.0f} facts/s)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--facts", type=int, default=20_000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 100, 10_000])
+    parser.add_argument("--threads", type=int, nargs="+", default=[8])
+    parser.add_argument("--sync", action="store_true", help="fsync once per batch")
+    parser.add_argument("--no-projection", action="store_true")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+
+    facts = make_facts(args.facts)
+    print(f"sync={args.sync}  projection={not args.no_projection}")
+    for size in args.batch_sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            ledger, projection = open_ledger(Path(tmp), args)
+            start = time.perf_counter()
+            for i in range(0, len(facts), size):
+                ledger.append_many(facts[i:i + size])
+            report(f"append_many batch={size}", len(facts), time.perf_counter() - start)
+            ledger.close()
+            if projection:
+                projection.close()
+
+    for threads in args.threads:
+        for group_commit in (False, True):
+            with tempfile.TemporaryDirectory() as tmp:
+                ledger, projection = open_ledger(Path(tmp), args, group_commit=group_commit)
+                start = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=threads) as pool:
+                    list(pool.map(ledger.append, facts, chunksize=64))
+                label = f"{threads} threads {'group commit' if group_commit else 'append'}"
+                report(label, len(facts), time.perf_counter() - start)
+                ledger.close()
+                if projection:
+                    projection.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Benchmark SplinkEntityResolver._build_clusters on synthetic Splink output.
+
+Generates census-like records, a cluster assignment (~3 records per cluster)
+and pairwise predictions, then times cluster assembly. Splink itself is not
+required; the frames mimic ``predict()`` and ``cluster_pairwise_predictions``.
+
+Usage:
+    python scripts/bench_linkage_clusters.py --rows 10000 100000 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import time
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from gps_agents.genealogy_crawler.linkage import SplinkEntityResolver
+
+
+def make_frames(n_predictions: int, seed: int = 0) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    rng = np.random.default_rng(seed)
+    n_records = max(3, n_predictions // 2)
+    ids = np.array([str(uuid.UUID(int=int(x))) for x in rng.integers(0, 2**63, n_records)])
+    original = pd.DataFrame({
+        "id": ids,
+        "given_name": rng.choice(["John", "Mary", "William", "Sarah"], n_records),
+        "surname": rng.choice(["Durham", "Smith", "Vincent", "Jones"], n_records),
+        "birth_year": rng.integers(1840, 1900, n_records),
+    })
+    clusters = original.copy()
+    clusters.insert(0, "cluster_id", np.arange(n_records) // 3)
+
+    # Mostly within-cluster pairs, some cross-cluster review candidates
+    left = rng.integers(0, n_records, n_predictions)
+    right = np.where(
+        rng.random(n_predictions) < 0.9,
+        np.minimum(left - left % 3 + rng.integers(0, 3, n_predictions), n_records - 1),
+        rng.integers(0, n_records, n_predictions),
+    )
+    predictions = pd.DataFrame({
+        "id_l": ids[left],
+        "id_r": ids[right],
+        "match_probability": np.where(right // 3 == left // 3, rng.uniform(0.85, 1.0, n_predictions), rng.uniform(0.5, 0.85, n_predictions)),
+    })
+    return original, predictions, clusters
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    resolver = SplinkEntityResolver(threshold=0.85, review_threshold=0.5)
+    for n in args.rows:
+        original, predictions, clusters_df = make_frames(n)
+        start = time.perf_counter()
+        clusters, review = resolver._build_clusters(original, predictions, clusters_df)
+        elapsed = time.perf_counter() - start
+        print(
+            f"predictions={n:>9,}  clusters={len(clusters):>8,}  review={len(review):>7,}"
+            f"  {elapsed:8.2f}s  ({n / elapsed:,.0f} predictions/s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
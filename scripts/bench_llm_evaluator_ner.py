@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Benchmark batched spaCy NER in LLMRelevanceEvaluator.
+
+Scores synthetic search hits (short census/obituary snippets, a share of
+them repeated as the same record comes back from several sources) with
+rule-based scoring only, and reports records/sec for:
+
+  per-record  ``evaluate`` in a loop with the full spaCy pipeline and no
+              entity cache, as before
+  batched     ``evaluate_many``: NER components only, ``nlp.pipe`` batches,
+              entities cached by text hash, worker processes per
+              ``--n-process`` (default: the evaluator's choice)
+
+``--model`` defaults to en_core_web_sm. Where it is not installed, an
+untrained stand-in with the same components (tok2vec, tagger, parser, ner)
+is built, which costs about what the real pipeline does per token.
+
+Usage:
+    python scripts/bench_llm_evaluator_ner.py --records 1000 50000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import spacy
+
+from gps_agents.models.search import RawRecord
+from gps_agents.research.evaluator import PersonProfile
+from gps_agents.research.llm_evaluator import LLMRelevanceEvaluator
+
+GIVEN = ["John", "Mary", "William", "Sarah", "George", "Martha", "James", "Ellen", "Archer", "Fannie"]
+SURNAMES = ["Durham", "Smith", "Jones", "Brown", "Taylor", "Miller", "Davis", "Wilson", "Moore", "Clark"]
+PLACES = ["Boston, Massachusetts", "Nashville, Tennessee", "Woodland, California", "Salem, Oregon"]
+TEMPLATES = [
+    "{given} {surname} was born in {year} in {place}.",
+    "{given} {surname}, aged {age}, resided in {place} with wife {spouse} in the {census} census.",
+    "Died {day} March {death} at {place}: {given} {surname}, son of {father} {surname}.",
+]
+
+
+def make_records(n: int, rng: random.Random, repeat: float = 0.2) -> list[RawRecord]:
+    records: list[RawRecord] = []
+    for i in range(n):
+        if records and rng.random() < repeat:
+            text = rng.choice(records).raw_data["text"]
+        else:
+            year = rng.randint(1820, 1880)
+            text = rng.choice(TEMPLATES).format(
+                given=rng.choice(GIVEN), surname=rng.choice(SURNAMES), year=year, place=rng.choice(PLACES),
+                age=rng.randint(20, 70), spouse=f"{rng.choice(GIVEN)} {rng.choice(SURNAMES)}",
+                census=rng.choice([1850, 1860, 1870, 1880]), day=rng.randint(1, 28),
+                death=year + rng.randint(30, 80), father=rng.choice(GIVEN),
+            )
+        records.append(RawRecord(
+            source=rng.choice(["FamilySearch", "FindAGrave", "WikiTree"]),
+            record_id=f"r{i}",
+            record_type="census",
+            extracted_fields={"surname": rng.choice(SURNAMES)},
+            raw_data={"text": text},
+        ))
+    return records
+
+
+def stand_in_model(path: Path) -> Path:
+    """Untrained pipeline shaped like en_core_web_sm."""
+    nlp = spacy.blank("en")
+    labels = {
+        "tagger": ["NN", "NNP", "VB", "IN"],
+        "parser": ["ROOT", "nsubj", "dobj", "prep"],
+        "ner": ["PERSON", "DATE", "GPE", "LOC", "ORG"],
+    }
+    nlp.add_pipe("tok2vec")
+    for name, names in labels.items():
+        pipe = nlp.add_pipe(name)
+        for label in names:
+            pipe.add_label(label)
+    nlp.initialize()
+    nlp.to_disk(path)
+    return path
+
+
+def evaluator(model: str | Path, cache_dir: Path, **kwargs) -> LLMRelevanceEvaluator:
+    profile = PersonProfile(
+        surname="Durham", given_name="Archer", birth_year=1844, death_year=1920,
+        birth_place="Tennessee", residence_places=["Tennessee", "California"],
+    )
+    return LLMRelevanceEvaluator(
+        profile, use_llm=False, use_cache=False, cache_dir=cache_dir, spacy_model=model, **kwargs
+    )
+
+
+def per_record(model: str | Path, cache_dir: Path, records: list[RawRecord]) -> float:
+    """The previous path: nlp(text) per record, every component enabled."""
+    ev = evaluator(model, cache_dir, ner_cache_size=0)
+    for name in list(ev._nlp.disabled):
+        ev._nlp.enable_pipe(name)
+    start = time.perf_counter()
+    for record in records:
+        ev.evaluate(record)
+    return time.perf_counter() - start
+
+
+def batched(model: str | Path, cache_dir: Path, records: list[RawRecord], n_process: int | None) -> float:
+    ev = evaluator(model, cache_dir)
+    start = time.perf_counter()
+    ev.evaluate_many(records, n_process=n_process)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, nargs="+", default=[1_000, 50_000])
+    parser.add_argument("--model", default="en_core_web_sm", help="spaCy package or path")
+    parser.add_argument("--n-process", type=int, default=None, help="spaCy worker processes")
+    parser.add_argument("--legacy-max", type=int, default=5_000, help="largest run of the per-record path")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        model: str | Path = args.model
+        try:
+            spacy.load(model)
+        except OSError:
+            model = stand_in_model(Path(tmp) / "model")
+            print(f"{args.model} not installed; using an untrained stand-in pipeline")
+        for n in args.records:
+            records = make_records(n, random.Random(7))
+            elapsed = batched(model, Path(tmp), records, args.n_process)
+            print(f"  batched    {n:>8,} records {elapsed:8.2f}s {n / elapsed:>10,.0f} records/s")
+            if n <= args.legacy_max:
+                elapsed = per_record(model, Path(tmp), records)
+                print(f"  per-record {n:>8,} records {elapsed:8.2f}s {n / elapsed:>10,.0f} records/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Benchmark NoveltyGuard near-duplicate detection and replay a crawl log.
+
+Prefills a ``QueryLSH`` index with ``--size`` synthetic person queries and
+times ``find_similar`` lookups against it. It then replays a crawl log and
+counts the source requests skipped by exact-match novelty checks (the previous
+``NoveltyGuard``) and by the fuzzy index. The log is either the
+``query_history`` table of a ``CrawlerStorage`` database (``--db``) or a
+synthetic log in which the planner rephrases some person queries
+("John Smith 1880 Ohio" / "Smith, John b. 1880 OH").
+
+Usage:
+    python scripts/bench_novelty_guard.py --size 1000000 --lookups 5000
+    python scripts/bench_novelty_guard.py --size 0 --db crawler.sqlite
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import resource
+import sqlite3
+import time
+
+from gps_agents.genealogy_crawler.novelty import QueryLSH
+
+GIVEN = ["John", "Mary", "William", "Sarah", "George", "Martha", "James", "Ellen", "Thomas", "Ann"]
+STATES = [("Ohio", "OH"), ("Virginia", "VA"), ("Tennessee", "TN"), ("Kentucky", "KY"), ("Texas", "TX")]
+
+
+def surname(rng: random.Random) -> str:
+    syllables = ["ar", "ber", "dal", "en", "har", "kin", "mor", "ness", "ott", "ri", "son", "tell", "wick"]
+    return "".join(rng.choice(syllables) for _ in range(rng.randint(2, 3))).capitalize()
+
+
+def person_queries(rng: random.Random) -> list[str]:
+    """Queries a crawl issues for one person, some of them rephrased repeats."""
+    given, family = rng.choice(GIVEN), surname(rng)
+    year = rng.randint(1800, 1920)
+    state, abbr = rng.choice(STATES)
+    queries = [f"{given} {family} {year} {state}"]
+    rephrasings = [
+        f"{family}, {given} b. {year} {abbr}",
+        f"{given} {family} born {year} {state}",
+        f"{given.lower()} {family.lower()} {year} {abbr}",
+    ]
+    queries += rng.sample(rephrasings, rng.randint(0, 2))
+    queries.append(f"{given} {family} death {state}")
+    queries.append(f"{family} family {state} census {year + 10 - year % 10}")
+    return queries
+
+
+def synthetic_log(persons: int, rng: random.Random) -> list[tuple[str, int]]:
+    log = []
+    for _ in range(persons):
+        tier = rng.randint(0, 1)
+        log += [(query, tier) for query in person_queries(rng)]
+    return log
+
+
+def storage_log(path: str) -> list[tuple[str, int]]:
+    conn = sqlite3.connect(path)
+    rows = conn.execute("SELECT query_string, source_tier FROM query_history ORDER BY executed_at")
+    log = [(query, tier) for query, tier in rows]
+    conn.close()
+    return log
+
+
+def replay(log: list[tuple[str, int]]) -> tuple[int, int]:
+    """Return (exact-match skips, exact + fuzzy skips) for a crawl log."""
+    exact: set[tuple[str, int]] = set()
+    index = QueryLSH()
+    exact_skips = fuzzy_skips = 0
+    for query, tier in log:
+        key = (query.lower().strip(), tier)
+        if key in exact:
+            exact_skips += 1
+            fuzzy_skips += 1
+            continue
+        exact.add(key)
+        if index.find_similar(query, tier) is not None:
+            fuzzy_skips += 1
+        else:
+            index.add(query, tier)
+    return exact_skips, fuzzy_skips
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--lookups", type=int, default=5_000)
+    parser.add_argument("--persons", type=int, default=20_000)
+    parser.add_argument("--db", help="CrawlerStorage database whose query_history to replay")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    if args.size:
+        index = QueryLSH(capacity=args.size)
+        start = time.perf_counter()
+        for _ in range(args.size):
+            index.add(person_queries(rng)[0], rng.randint(0, 2))
+        build = time.perf_counter() - start
+        probes = [person_queries(rng)[0] for _ in range(args.lookups)]
+        start = time.perf_counter()
+        for query in probes:
+            index.find_similar(query, 0)
+        lookup = time.perf_counter() - start
+        size = len(index.to_bytes())
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        print(
+            f"index   {args.size:>9,} queries  build {build:6.1f}s  lookup"
+            f" {lookup / args.lookups * 1e6:7.1f} us  persisted {size / 2**20:6.1f} MiB"
+            f"  peak RSS {rss:6.0f} MiB"
+        )
+
+    log = storage_log(args.db) if args.db else synthetic_log(args.persons, rng)
+    exact_skips, fuzzy_skips = replay(log)
+    print(
+        f"replay  {len(log):>9,} queries  exact-match skips {exact_skips:,}"
+        f"  with fuzzy index {fuzzy_skips:,}  requests saved {fuzzy_skips - exact_skips:,}"
+        f" ({(fuzzy_skips - exact_skips) / max(len(log), 1):.1%})"
+    )
+
+
+if __name__ == "__main__":
+    main()
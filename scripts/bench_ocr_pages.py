@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Benchmark KrakenOCRAgent.recognize_document throughput across worker counts.
+
+Writes a ``--pages`` frame multi-page TIFF of synthetic census sheets and runs
+``recognize_document`` on it in-process (``workers=0``, the previous
+page-at-a-time path) and with a process pool of each ``--workers`` size. A
+heartbeat task measures the longest event-loop stall, i.e. how long the rest
+of the crawler would be blocked.
+
+Without Kraken the mock engine is used. Since it does no real work, it is
+given ``--cost`` median-filter passes per page so its CPU profile resembles
+segmentation + recognition. ``--kraken`` runs the real models instead.
+
+Usage:
+    python scripts/bench_ocr_pages.py --pages 120 --workers 1,2,4,8
+    python scripts/bench_ocr_pages.py --pages 60 --kraken
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from PIL import Image, ImageDraw, ImageFilter
+
+from gps_agents.genealogy_crawler.ocr import DocumentType, KrakenOCRAgent, RecognizedPage
+
+
+class CostlyMockAgent(KrakenOCRAgent):
+    """Mock engine that burns CPU per page like a real recognizer would."""
+
+    def __init__(self, cost: int, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.cost = cost
+
+    def _recognize_with_kraken(self, image: Image.Image, document_type: DocumentType) -> RecognizedPage:
+        work = image.convert("L")
+        for _ in range(self.cost):
+            work = work.filter(ImageFilter.MedianFilter(5))
+        return self._mock_page(image, document_type)
+
+
+def write_roll(path: Path, pages: int, size: tuple[int, int]) -> None:
+    rng = random.Random(0)
+    frames = []
+    for _ in range(pages):
+        frame = Image.new("L", size, color=235)
+        draw = ImageDraw.Draw(frame)
+        for y in range(60, size[1] - 40, 36):
+            draw.line([(40, y), (size[0] - 40, y)], fill=120)
+            x = 50
+            while x < size[0] - 120:
+                width = rng.randint(30, 110)
+                draw.rectangle([x, y - 22, x + width, y - 6], fill=rng.randint(20, 80))
+                x += width + rng.randint(12, 40)
+        frames.append(frame)
+    frames[0].save(path, save_all=True, append_images=frames[1:], compression="tiff_deflate")
+
+
+async def run(agent: KrakenOCRAgent, roll: Path) -> tuple[float, float, int]:
+    """Return (wall seconds, longest loop stall in ms, pages)."""
+    stall = 0.0
+    done = False
+    last_tick = time.perf_counter()
+
+    async def heartbeat() -> None:
+        nonlocal stall, last_tick
+        while True:
+            now = time.perf_counter()
+            stall = max(stall, now - last_tick)
+            last_tick = now
+            if done:
+                return
+            await asyncio.sleep(0.01)
+
+    beat = asyncio.create_task(heartbeat())
+    start = time.perf_counter()
+    result = await agent.recognize_document(roll)
+    elapsed = time.perf_counter() - start
+    done = True
+    await beat
+    return elapsed, max(stall - 0.01, 0.0) * 1000, len(result.data)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=120)
+    parser.add_argument("--workers", default=f"1,2,4,{os.cpu_count()}")
+    parser.add_argument("--cost", type=int, default=3, help="median-filter passes per mock page")
+    parser.add_argument("--size", default="1700x2200", help="page size in pixels")
+    parser.add_argument("--kraken", action="store_true", help="use real Kraken models")
+    args = parser.parse_args()
+
+    size = tuple(int(v) for v in args.size.split("x"))
+    counts = [0] + sorted({int(w) for w in args.workers.split(",")})
+    print(f"{os.cpu_count()} CPUs, {args.pages} pages of {size[0]}x{size[1]}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        roll = Path(tmp) / "roll.tif"
+        write_roll(roll, args.pages, size)
+        for workers in counts:
+            if args.kraken:
+                agent = KrakenOCRAgent(workers=workers)
+            else:
+                agent = CostlyMockAgent(args.cost, workers=workers)
+            try:
+                elapsed, stall, pages = asyncio.run(run(agent, roll))
+            finally:
+                agent.close()
+            label = "in-process" if workers == 0 else f"{workers} workers"
+            print(
+                f"{label:<12} {pages:>5} pages  {elapsed:7.2f}s  {pages / elapsed * 60:8.0f} pages/min"
+                f"  max loop stall {stall:8.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Benchmark PreprocessingPipeline throughput and binarization quality.
+
+Renders a synthetic census sheet of ``--size`` pixels with the usual
+microfilm damage: ink fading across the page, water stains, sensor noise,
+speckles and a dark film border. It times the previous pipeline
+(median filter, contrast, fixed 128 threshold via ``Image.point``) against the
+array-based one for each binarization method, with and without tiling, and
+reports megapixels/sec, peak NumPy memory (tracemalloc; Pillow's own buffers
+are not traced), and the F-measure of the ink mask against the undamaged page. A second, rotated copy measures deskew error.
+
+No OCR engine is installed in CI, so binarization F-measure stands in for
+recognition quality. With ``--kraken`` the mean word confidence of
+``KrakenOCRAgent`` on each preprocessed page is reported as well.
+
+Usage:
+    python scripts/bench_ocr_preprocessing.py --size 6000x4000
+    python scripts/bench_ocr_preprocessing.py --size 3000x2000 --kraken
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageEnhance, ImageFilter, ImageFont
+
+from gps_agents.genealogy_crawler.ocr import KrakenOCRAgent, PreprocessingPipeline
+from gps_agents.genealogy_crawler.ocr.preprocessing import estimate_skew
+
+WORDS = [
+    "Smith", "John", "Head", "Wife", "Daughter", "Son", "farmer", "Ohio", "Virginia",
+    "Ireland", "laborer", "keeping", "house", "single", "married", "widowed", "24", "1880",
+]
+
+
+def legacy_process(image: Image.Image) -> Image.Image:
+    """The previous PreprocessingPipeline.process body with binarize=True."""
+    result = image.copy()
+    if result.mode != "L":
+        result = result.convert("L")
+    result = result.filter(ImageFilter.MedianFilter(size=3))
+    result = ImageEnhance.Contrast(result).enhance(1.5)
+    threshold = 128
+    return result.point(lambda x: 255 if x > threshold else 0, "1")
+
+
+def render(size: tuple[int, int], seed: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    """Return (degraded grayscale page, ground-truth ink mask)."""
+    rng = np.random.default_rng(seed)
+    width, height = size
+    clean = Image.new("L", size, color=255)
+    draw = ImageDraw.Draw(clean)
+    line_height = max(24, height // 110)
+    font = ImageFont.load_default(size=int(line_height * 0.7))
+    for y in range(line_height * 2, height - line_height * 2, line_height):
+        text = " ".join(rng.choice(WORDS, size=width // (line_height * 3)))
+        draw.text((line_height * 2, y), text, fill=0, font=font)
+    truth = np.asarray(clean) < 128
+
+    # Paper darkens towards the right and under a few water stains; ink
+    # contrast against the local paper fades from 130 to 35 levels.
+    cols = np.linspace(0.0, 1.0, width, dtype=np.float32)[None, :]
+    rows = np.linspace(0.0, 1.0, height, dtype=np.float32)[:, None]
+    paper = np.broadcast_to(235 - 25 * cols, (height, width)).copy()
+    for cx, cy, radius in rng.uniform(0.15, 0.85, size=(4, 3)):
+        paper -= 90 * np.exp(-((cols - cx) ** 2 + (rows - cy) ** 2 * 0.44) / (0.02 * radius))
+    contrast = 130 - 95 * cols
+    page = paper - truth * contrast + rng.normal(0, 8, (height, width)).astype(np.float32)
+    speckles = rng.random((height, width)) < 0.002
+    page[speckles] = 40
+    border = max(8, width // 80)
+    page[:, :border] = 15
+    return np.clip(page, 0, 255).astype(np.uint8), truth
+
+
+def f_measure(ink: np.ndarray, truth: np.ndarray) -> float:
+    hits = np.count_nonzero(ink & truth)
+    precision = hits / max(np.count_nonzero(ink), 1)
+    recall = hits / max(np.count_nonzero(truth), 1)
+    return 2 * precision * recall / max(precision + recall, 1e-9)
+
+
+def timed(func, image: Image.Image) -> tuple[Image.Image, float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(image)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak / 2**20
+
+
+def mean_word_confidence(image: Image.Image) -> float:
+    result = asyncio.run(KrakenOCRAgent().recognize_page(image.convert("L")))
+    words = [w.confidence for r in result.data.regions for line in r.lines for w in line.words]
+    return sum(words) / len(words) if words else 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", default="6000x4000", help="page size in pixels")
+    parser.add_argument("--tile", type=int, default=2048)
+    parser.add_argument("--kraken", action="store_true", help="report Kraken word confidence")
+    args = parser.parse_args()
+
+    width, height = (int(v) for v in args.size.split("x"))
+    page, truth = render((width, height))
+    image = Image.fromarray(page)
+    megapixels = width * height / 1e6
+    print(f"page {width}x{height} ({megapixels:.1f} MP)")
+
+    configs = [("legacy fixed-128", legacy_process)]
+    for method in ("otsu", "sauvola"):
+        for tile in (None, args.tile):
+            pipeline = PreprocessingPipeline(
+                deskew=False, remove_borders=True, binarize=True,
+                binarize_method=method, tile_size=tile,
+            )
+            label = f"{method}{' tiled' if tile else ''}"
+            configs.append((label, pipeline.apply))
+
+    for label, func in configs:
+        result, elapsed, peak = timed(func, image)
+        ink = ~np.asarray(result, dtype=bool)
+        line = (
+            f"{label:<18} {megapixels / elapsed:7.1f} MP/s  peak {peak:7.0f} MiB"
+            f"  F-measure {f_measure(ink, truth):.3f}"
+        )
+        if args.kraken:
+            line += f"  word confidence {mean_word_confidence(result):.3f}"
+        print(line)
+
+    skewed = image.rotate(2.7, resample=Image.Resampling.BICUBIC, fillcolor=255)
+    start = time.perf_counter()
+    angle = estimate_skew(np.asarray(skewed))
+    print(f"deskew             estimated {angle:+.2f} deg for +2.70 in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Benchmark SQLiteProjection point-lookup latency with and without pooling.
+
+Loads ``--facts`` synthetic facts and fingerprints, then times ``--lookups``
+calls each of ``get_fact`` and ``get_gramps_handle_by_fingerprint`` with a
+connection per call (the previous behaviour), per-thread pooled connections,
+and the writer + read-only reader pool.
+
+Usage:
+    python scripts/bench_projection_lookups.py --lookups 100000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from gps_agents.models.fact import Fact
+from gps_agents.models.provenance import Provenance, ProvenanceSource
+from gps_agents.projections.sqlite_projection import SQLiteProjection
+
+
+def timed(fn, args: list) -> list[float]:
+    samples = []
+    for arg in args:
+        start = time.perf_counter()
+        fn(arg)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def report(label: str, samples: list[float]) -> None:
+    samples.sort()
+    p99 = samples[int(len(samples) * 0.99)]
+    print(
+        f"{label:<62} mean {statistics.fmean(samples) * 1e6:8.1f} us"
+        f"  p99 {p99 * 1e6:8.1f} us  total {sum(samples):6.2f}s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--facts", type=int, default=10_000)
+    parser.add_argument("--lookups", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "proj.sqlite"
+        loader = SQLiteProjection(path)
+        provenance = Provenance(created_by=ProvenanceSource.RESEARCH_AGENT)
+        facts = [Fact(statement=f"Person {i} born 1850", provenance=provenance) for i in range(args.facts)]
+
+        class Ledger:
+            def iter_all_facts(self):
+                return iter(facts)
+
+        loader.rebuild_from_ledger(Ledger())
+        with loader.transaction() as conn:
+            conn.executemany(
+                "INSERT INTO fingerprint_index VALUES (?, 'person', ?)",
+                [(f"fp{i}", f"H{i}") for i in range(args.facts)],
+            )
+        loader.close()
+
+        fact_ids = [rng.choice(facts).fact_id for _ in range(args.lookups)]
+        fingerprints = [f"fp{rng.randrange(args.facts)}" for _ in range(args.lookups)]
+        configs = [
+            ("connection per call", {"pooled": False}),
+            ("per-thread pooled", {}),
+            ("writer + 4 read-only readers", {"reader_pool_size": 4}),
+        ]
+        for label, kwargs in configs:
+            proj = SQLiteProjection(path, **kwargs)
+            report(f"{label}: get_fact", timed(proj.get_fact, fact_ids))
+            report(f"{label}: get_gramps_handle_by_fingerprint", timed(proj.get_gramps_handle_by_fingerprint, fingerprints))
+            proj.close()
+
+
+if __name__ == "__main__":
+    main()
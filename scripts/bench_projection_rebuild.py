@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Benchmark SQLiteProjection.rebuild_from_ledger throughput (facts/sec).
+
+The ledger is replaced by an in-memory iterator of synthetic facts so the
+numbers reflect projection writes only. The legacy path (one ``upsert_fact``
+call, connection and commit per fact) is timed on a smaller sample.
+
+Usage:
+    python scripts/bench_projection_rebuild.py --facts 1000000 --legacy-facts 10000
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from gps_agents.models.fact import Fact
+from gps_agents.models.provenance import Provenance, ProvenanceSource
+from gps_agents.models.source import SourceCitation
+from gps_agents.projections.sqlite_projection import SQLiteProjection
+
+
+class SyntheticLedger:
+    def __init__(self, n: int) -> None:
+        self.n = n
+        self.provenance = Provenance(created_by=ProvenanceSource.RESEARCH_AGENT)
+
+    def iter_all_facts(self):
+        for i in range(self.n):
+            yield Fact(
+                statement=f"Person {i} born {1800 + i % 100} in Ohio",
+                provenance=self.provenance,
+                sources=[SourceCitation(repository="FamilySearch", record_id=f"R{i}")],
+                confidence_score=(i % 10) / 10,
+                person_id=f"P{i % 5000}",
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--facts", type=int, default=100_000)
+    parser.add_argument("--legacy-facts", type=int, default=5_000)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Fact construction and serialization cost, for reference
+        start = time.perf_counter()
+        for fact in SyntheticLedger(args.facts).iter_all_facts():
+            fact.model_dump_json()
+        gen = time.perf_counter() - start
+        print(f"generate+serialize only  {args.facts:>9,} facts  {args.facts / gen:>10,.0f} facts/s")
+
+        for label, sync_off in (("bulk", False), ("bulk synchronous=OFF", True)):
+            proj = SQLiteProjection(Path(tmp) / f"bulk-{sync_off}.sqlite")
+
+            def report(count: int) -> None:
+                if count % (args.batch_size * 20) == 0:
+                    print(f"  ... {count:,} facts")
+
+            start = time.perf_counter()
+            n = proj.rebuild_from_ledger(
+                SyntheticLedger(args.facts),
+                batch_size=args.batch_size,
+                synchronous_off=sync_off,
+                progress=report,
+            )
+            elapsed = time.perf_counter() - start
+            print(f"{label:<24} {n:>9,} facts  {n / elapsed:>10,.0f} facts/s")
+
+        if args.legacy_facts:
+            proj = SQLiteProjection(Path(tmp) / "legacy.sqlite")
+            start = time.perf_counter()
+            for fact in SyntheticLedger(args.legacy_facts).iter_all_facts():
+                proj.upsert_fact(fact)
+            elapsed = time.perf_counter() - start
+            print(f"{'legacy per-fact upsert':<24} {args.legacy_facts:>9,} facts  {args.legacy_facts / elapsed:>10,.0f} facts/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Benchmark SQLiteProjection.search_statements latency (FTS5 vs LIKE scan).
+
+Facts are inserted with raw SQL (one shared ``full_json`` payload) so large
+projections build quickly; the FTS indexes are then rebuilt in one pass.
+Surnames follow a long tail (a few common names, many rare ones) as in real
+transcriptions. "Tregeagle" is rare (~0.02% of facts) and "Smith" common
+(~10%): rare terms force the LIKE scan through the whole table, while common
+terms make FTS5 score every match. Each query is run ``--repeat`` times and
+the median latency reported.
+
+Usage:
+    python scripts/bench_projection_search.py --facts 100000 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+from gps_agents.models.fact import Fact
+from gps_agents.models.provenance import Provenance, ProvenanceSource
+from gps_agents.projections.sqlite_projection import SQLiteProjection
+
+GIVEN = ["John", "Mary", "William", "Sarah", "George", "Martha", "James", "Ellen", "Archibald", "Hannah"]
+COMMON_SURNAMES = ["Smith", "Jones", "Brown"]
+SYLLABLES = ["an", "ber", "cal", "dor", "eth", "fen", "gar", "hol", "ing", "jes", "kel", "lan", "mor", "nix", "ost", "pen", "quin", "ros", "sel", "tor", "ull", "ver", "wick", "yar"]
+PLACES = ["Ohio", "Kentucky", "Cornwall", "Ireland", "Virginia", "California", "Kent", "Yorkshire"]
+EVENTS = ["born", "died", "married", "baptised", "buried", "enumerated"]
+
+QUERIES = [
+    ("rare word", "tregeagle", {}),
+    ("two words", "hannah tregeagle", {}),
+    ("prefix", "tregea*", {}),
+    ("phrase", '"tregeagle baptised"', {}),
+    ("trigram (OCR)", "Tregeagie", {"trigram": True}),
+    ("common word", "smith", {}),
+]
+
+
+def surname(rng: random.Random) -> str:
+    roll = rng.random()
+    if roll < 0.0002:
+        return "Tregeagle"
+    if roll < 0.3:
+        return rng.choice(COMMON_SURNAMES)
+    return "".join(rng.choice(SYLLABLES) for _ in range(3)).capitalize()
+
+
+def build(path: Path, n: int, rng: random.Random) -> SQLiteProjection:
+    proj = SQLiteProjection(path, fts_trigram=True)
+    full_json = Fact(statement="x", provenance=Provenance(created_by=ProvenanceSource.RESEARCH_AGENT)).model_dump_json()
+    rows = (
+        (
+            str(uuid.UUID(int=rng.getrandbits(128))),
+            1,
+            f"{rng.choice(GIVEN)} {surname(rng)} {rng.choice(EVENTS)} {rng.randint(1750, 1950)} in {rng.choice(PLACES)}",
+            "proposed",
+            rng.random(),
+            "2024-01-01T00:00:00+00:00",
+            "2024-01-01T00:00:00+00:00",
+            full_json,
+        )
+        for _ in range(n)
+    )
+    with proj._get_conn() as conn:
+        conn.execute("DROP TRIGGER IF EXISTS facts_fts_ai")
+        conn.execute("DROP TRIGGER IF EXISTS facts_fts_trigram_ai")
+        conn.executemany(
+            "INSERT INTO facts (fact_id, version, statement, status, confidence_score, created_at, updated_at, full_json)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        conn.execute("INSERT INTO facts_fts(facts_fts) VALUES ('rebuild')")
+        conn.execute("INSERT INTO facts_fts_trigram(facts_fts_trigram) VALUES ('rebuild')")
+        conn.commit()
+    proj.close()
+    return SQLiteProjection(path, fts_trigram=True)
+
+
+def median_ms(fn, repeat: int) -> tuple[float, int]:
+    samples, found = [], 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        found = len(fn())
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000, found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--facts", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args()
+
+    for n in args.facts:
+        with tempfile.TemporaryDirectory() as tmp:
+            start = time.perf_counter()
+            proj = build(Path(tmp) / "proj.sqlite", n, random.Random(0))
+            print(f"facts={n:,}  (built in {time.perf_counter() - start:.1f}s)")
+            for term in ("Tregeagle", "Smith"):
+                ms, found = median_ms(lambda term=term: proj._search_statements_like(term, args.limit), args.repeat)
+                print(f"  {'LIKE scan ' + term:<22} {ms:9.2f} ms  {found} results")
+            for label, term, kwargs in QUERIES:
+                ms, found = median_ms(
+                    lambda term=term, kwargs=kwargs: proj.search_statements(term, args.limit, **kwargs),
+                    args.repeat,
+                )
+                print(f"  {label:<22} {ms:9.2f} ms  {found} results")
+            proj.close()
+
+
+if __name__ == "__main__":
+    main()
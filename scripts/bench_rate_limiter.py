@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Benchmark the token-bucket rate limiter against the previous limiter.
+
+Reproduces the old sliding-window ``AsyncRateLimiter`` (an ``asyncio.Lock``
+held across its sleeps, with the call list rebuilt on every acquire) and
+``BaseSource._make_request``'s 50-200 ms random pre-request sleep, then
+measures three things against ``TokenBucketLimiter``:
+
+- overhead: cost per uncontended acquire at a high configured rate
+- burst: ``--tasks`` concurrent callers on one source, reporting wall time,
+  p50/p95 queueing delay and out-of-order grants
+- sequential: ``--calls`` back-to-back requests to a source whose rate
+  budget is not the bottleneck, including the old jitter sleep
+
+Usage:
+    python scripts/bench_rate_limiter.py
+    python scripts/bench_rate_limiter.py --tasks 500 --rate 100
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import random
+import statistics
+import time
+
+from gps_agents.net import RateLimitConfig, TokenBucketLimiter
+
+
+class LegacyRateLimiter:
+    """The previous net.AsyncRateLimiter."""
+
+    def __init__(self, cfg: RateLimitConfig) -> None:
+        self.cfg = cfg
+        self._lock = asyncio.Lock()
+        self._calls: list[float] = []
+        self._last_call = 0.0
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            sleep_needed = max(0.0, self.cfg.min_interval - (now - self._last_call))
+            if sleep_needed > 0:
+                await asyncio.sleep(sleep_needed)
+                now = time.monotonic()
+            cutoff = now - self.cfg.window_seconds
+            self._calls = [t for t in self._calls if t >= cutoff]
+            if len(self._calls) >= self.cfg.max_calls:
+                wait_for = self._calls[0] + self.cfg.window_seconds - now
+                if wait_for > 0:
+                    await asyncio.sleep(wait_for)
+                    now = time.monotonic()
+                    cutoff = now - self.cfg.window_seconds
+                    self._calls = [t for t in self._calls if t >= cutoff]
+            self._calls.append(time.monotonic())
+            self._last_call = time.monotonic()
+
+
+LIMITERS = (("legacy", LegacyRateLimiter), ("token bucket", TokenBucketLimiter))
+
+
+async def overhead(cls: type, n: int) -> float:
+    limiter = cls(RateLimitConfig(max_calls=10**6, window_seconds=1.0))
+    start = time.perf_counter()
+    for _ in range(n):
+        await limiter.acquire()
+    return (time.perf_counter() - start) / n * 1e6
+
+
+async def burst(cls: type, tasks: int, rate: float) -> tuple[float, float, float, int]:
+    limiter = cls(RateLimitConfig(max_calls=int(rate), window_seconds=1.0))
+    delays: list[float] = []
+    order: list[int] = []
+
+    async def call(i: int) -> None:
+        start = time.monotonic()
+        await limiter.acquire()
+        delays.append((time.monotonic() - start) * 1000)
+        order.append(i)
+
+    start = time.monotonic()
+    await asyncio.gather(*(call(i) for i in range(tasks)))
+    elapsed = time.monotonic() - start
+    inversions = sum(1 for a, b in itertools.pairwise(order) if b < a)
+    q = statistics.quantiles(delays, n=20)
+    return elapsed, q[9], q[18], inversions
+
+
+async def sequential(cls: type, calls: int, jitter: bool) -> float:
+    limiter = cls(RateLimitConfig(max_calls=100, window_seconds=1.0))
+    start = time.monotonic()
+    for _ in range(calls):
+        await limiter.acquire()
+        if jitter:
+            await asyncio.sleep(random.uniform(0.05, 0.2))
+        await asyncio.sleep(0.02)  # the request itself
+    return time.monotonic() - start
+
+
+async def bench(args: argparse.Namespace) -> None:
+    print(f"overhead ({args.acquires} uncontended acquires)")
+    for label, cls in LIMITERS:
+        print(f"  {label:<13} {await overhead(cls, args.acquires):8.2f} us/acquire")
+
+    print(f"burst ({args.tasks} tasks, {args.rate:.0f} calls/s)")
+    for label, cls in LIMITERS:
+        elapsed, p50, p95, inversions = await burst(cls, args.tasks, args.rate)
+        print(
+            f"  {label:<13} {elapsed:6.2f}s  wait p50 {p50:7.1f} ms  p95 {p95:7.1f} ms"
+            f"  {inversions} out-of-order grants"
+        )
+
+    print(f"sequential ({args.calls} calls, 20 ms each)")
+    legacy = await sequential(LegacyRateLimiter, args.calls, jitter=True)
+    new = await sequential(TokenBucketLimiter, args.calls, jitter=False)
+    print(f"  {'legacy+jitter':<13} {legacy:6.2f}s\n  {'token bucket':<13} {new:6.2f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--acquires", type=int, default=20_000)
+    parser.add_argument("--tasks", type=int, default=300)
+    parser.add_argument("--rate", type=float, default=100)
+    parser.add_argument("--calls", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(bench(args))
+
+
+if __name__ == "__main__":
+    main()
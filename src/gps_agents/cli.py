@@ -472,10 +472,7 @@ def plan_batch(
 
     from gps_agents.projections.sqlite_projection import SQLiteProjection
     from gps_agents.gramps.client import GrampsClient
-    from gps_agents.idempotency.decision import (
-        decide_upsert_person, decide_upsert_event, decide_upsert_source,
-        decide_upsert_place, decide_upsert_citation, decide_upsert_relationship,
-    )
+    from gps_agents.idempotency.decision import decide_upsert_batch
     from gps_agents.gramps.models import (
         Person as GPerson, Name as GName, Event as GEvent, EventType as GEventType,
         GrampsDate, Source as GSource, Place as GPlace, Citation as GCitation,
@@ -485,26 +482,27 @@ def plan_batch(
     proj = SQLiteProjection(str(cfg["data_dir"] / "projection.db"))
     gc = GrampsClient(cfg["data_dir"])  # not connecting
 
-    decisions = []
+    items = []
     for item in data:
         et = item.get("entity")
         if et == "person":
-            p = GPerson(names=[GName(given=item.get("given",""), surname=item.get("surname",""))])
-            decisions.append(decide_upsert_person(gc, proj, p).__dict__)
+            items.append((et, GPerson(names=[GName(given=item.get("given",""), surname=item.get("surname",""))])))
         elif et == "event":
-            ev = GEvent(event_type=GEventType(item.get("type","other")), date=GrampsDate(year=item.get("year")))
-            decisions.append(decide_upsert_event(gc, proj, ev).__dict__)
+            items.append((et, GEvent(event_type=GEventType(item.get("type","other")), date=GrampsDate(year=item.get("year")))))
         elif et == "source":
-            s = GSource(title=item.get("title",""))
-            decisions.append(decide_upsert_source(gc, proj, s).__dict__)
+            items.append((et, GSource(title=item.get("title",""))))
         elif et == "place":
-            pl = GPlace(name=item.get("name",""), city=item.get("city"), state=item.get("state"), country=item.get("country"))
-            decisions.append(decide_upsert_place(gc, proj, pl).__dict__)
+            items.append((et, GPlace(name=item.get("name",""), city=item.get("city"), state=item.get("state"), country=item.get("country"))))
         elif et == "citation":
-            cit = GCitation(source_id=item.get("source_id",""), page=item.get("page"), date=GrampsDate(year=item.get("year")))
-            decisions.append(decide_upsert_citation(gc, proj, cit).__dict__)
+            items.append((et, GCitation(source_id=item.get("source_id",""), page=item.get("page"), date=GrampsDate(year=item.get("year")))))
         elif et == "relationship":
-            decisions.append(decide_upsert_relationship(gc, proj, item.get("kind",""), item.get("a",""), item.get("b",""), item.get("context")).__dict__)
+            items.append((et, (item.get("kind",""), item.get("a",""), item.get("b",""), item.get("context"))))
+    # One fingerprint query and one match pool for the whole batch; unset
+    # optional fields are omitted (the output schema types them as strings)
+    decisions = [
+        {k: v for k, v in dec.__dict__.items() if v is not None}
+        for dec in decide_upsert_batch(gc, proj, items)
+    ]
     # Validate output
     schema_out = _json.loads(Path("schemas/planner_output.schema.json").read_text())
     try:
@@ -1183,11 +1181,15 @@ def sources_health() -> None:
     table.add_column("Source")
     table.add_column("Circuit")
     table.add_column("Rate")
+    table.add_column("Queue wait p50/p95/max (ms)")
+    table.add_column("429s")
     for k, v in sorted(status.items()):
         circ = "open" if v.get("circuit_open") else "ok"
         rate = v.get("rate") or {}
         rate_str = f"{rate.get('max_calls','?')}/{rate.get('window_seconds','?')}s min {rate.get('min_interval','?')}s"
-        table.add_row(k, circ, rate_str)
+        delay = v.get("queue_delay_ms") or {}
+        delay_str = f"{delay.get('p50', 0):g}/{delay.get('p95', 0):g}/{delay.get('max', 0):g}" if delay else "-"
+        table.add_row(k, circ, rate_str, delay_str, str(rate.get("penalties", 0)))
     console.print(table)
 
 
@@ -1366,6 +1368,7 @@ def crawl_person(
     use_existing_profile: bool = typer.Option(True, "--use-existing-profile/--no-use-existing-profile", help="Load family from existing profile.json"),
     require_gps_approval: bool = typer.Option(False, "--require-gps-approval/--no-require-gps-approval", help="Require GPS critic approval before expanding family"),
     use_census_tree_builder: bool = typer.Option(True, "--use-census-tree-builder/--no-use-census-tree-builder", help="Use CensusTreeBuilder to generate search queue"),
+    workers: int = typer.Option(1, "--workers", help="Concurrent crawl workers sharing the frontier"),
     verbose: bool = typer.Option(False, "--verbose", "-v"),
     run_id: str | None = typer.Option(None, "--run-id"),
 ) -> None:
@@ -1395,6 +1398,7 @@ def crawl_person(
             use_existing_profile=use_existing_profile,
             require_gps_approval=require_gps_approval,
             use_census_tree_builder=use_census_tree_builder,
+            workers=workers,
         )
 
         with Progress(
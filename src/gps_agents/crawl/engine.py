@@ -65,6 +65,9 @@ class CrawlConfig:
     use_existing_profile: bool = True  # Load family members from existing profile.json
     require_gps_approval: bool = False  # If False, expand family without LLM approval gate
     use_census_tree_builder: bool = True  # Use CensusTreeBuilder to generate search queue
+    # Concurrency: N async workers share the frontier; with >1 worker the per-source
+    # limits in net.GUARDS are the only throttle (no fixed sleep between persons)
+    workers: int = 1
 
 
 async def run_crawl_person(seed: SeedPerson, cfg: CrawlConfig, kernel_config: Any | None = None) -> dict[str, Any]:
@@ -72,79 +75,23 @@ async def run_crawl_person(seed: SeedPerson, cfg: CrawlConfig, kernel_config: An
 
     Phase 1: search open sources (AccessGenealogy, WikiTree) repeatedly with
     widening query parameters and persist checkpoints.
+
+    With ``cfg.workers > 1`` that many async workers share the frontier, visited
+    set and coverage counters, so one rate-limited source no longer stalls the
+    whole crawl.
     """
     start = time.time()
     iters = 0
 
-    # Router with open sources only for Phase 1
-    router = SearchRouter(RouterConfig(parallel=True, max_results_per_source=50))
-    access_gen = AccessGenealogySource()
-    usgenweb = USGenWebSource()
-    router.register_source(access_gen)
-    router.register_source(usgenweb)
-    router.register_source(WikiTreeSource())
-    router.register_source(Nara1950Source())
-    router.register_source(Nara1940Source())
-    router.register_source(FindAGraveSource())
-    router.register_source(FreeBMDSource())
-
-    # Add FamilySearch if configured (requires FAMILYSEARCH_ACCESS_TOKEN env var)
-    fs_source = FamilySearchSource()
-    if fs_source.is_configured():
-        router.register_source(fs_source)
-        if cfg.verbose:
-            print("FamilySearch source enabled")
-
-    # Cemetery and burial sources
-    router.register_source(BillionGravesSource())
-
-    # Vital records sources
-    router.register_source(CaliforniaVitalsSource())
-
-    # Free census sources (1940, 1950 fully indexed, others browsable)
-    router.register_source(FreeCensusSource())
-
-    # UK census (FreeCEN volunteer transcriptions)
-    router.register_source(FreeCENSource())
-
-    # Resource directories
-    router.register_source(CyndisListSource())
-
-    # Obituary sources
-    router.register_source(LegacyObituariesSource())
-    router.register_source(NewspaperObituariesSource())
-
-    # Jewish genealogy
-    router.register_source(JewishGenSource())
-    router.register_source(YadVashemSource())
-
-    # African American genealogy
-    router.register_source(AfricanAmericanGenealogySource())
-    router.register_source(FreedmansBureauSource())
-    router.register_source(SlaveSchedulesSource())
-
-    # Library and archive sources
-    router.register_source(LibraryOfCongressSource())
-    router.register_source(ChroniclingAmericaSource())
-    router.register_source(NYPLSource())
-
-    # Immigration records
-    router.register_source(ImmigrationRecordsSource())
-
-    if cfg.verbose:
-        print("Census sources enabled: AccessGenealogy, USGenWeb, FreeCensus, FreeCEN")
-        print("Vital records: California Death/Birth Index")
-        print("Cemetery sources: FindAGrave, BillionGraves")
-        print("Obituaries: Legacy.com, Chronicling America")
-        print("Special collections: JewishGen, Afrigeneas, Freedmen's Bureau")
-        print("Archives: Library of Congress, NYPL")
+    router, access_gen, usgenweb = _build_router(cfg)
 
     # Ensure output directory
     out_path = Path(cfg.tree_out)
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Simple state
-    aggregated: list[dict[str, Any]] = []
+    # Simple state. Records are kept per person and flattened in (generation, person key)
+    # order at checkpoint time, so the tree file does not depend on worker scheduling.
+    records_by_person: dict[str, tuple[int, list[dict[str, Any]]]] = {}
     coverage: dict[str, Any] = {
         "sources": set(),
         "count": 0,
@@ -242,13 +189,24 @@ async def run_crawl_person(seed: SeedPerson, cfg: CrawlConfig, kernel_config: An
             if cfg.verbose:
                 print(f"Warning: CensusTreeBuilder error: {e}")
 
-    while frontier and iters < cfg.max_iterations and (time.time() - start) < cfg.max_duration_seconds:
-        cur, gen = frontier.popleft()
-        key = _person_key(cur.given, cur.surname, cur.birth_year, cur.birth_place)
-        if key in visited:
-            continue
-        visited.add(key)
-        iters += 1
+    # Worker pool state: workers idle on frontier_changed while others may still enqueue
+    frontier_changed = asyncio.Event()
+    active = 0
+    n_workers = max(1, cfg.workers)
+
+    def _enqueue(person: SeedPerson, person_gen: int) -> None:
+        frontier.append((person, person_gen))
+        frontier_changed.set()
+
+    def _checkpoint() -> None:
+        ordered = sorted(records_by_person.items(), key=lambda kv: (kv[1][0], kv[0]))
+        records = [rec for _, (_, person_recs) in ordered for rec in person_recs]
+        coverage["count"] = len(records)
+        _write_tree_checkpoint(out_path, seed, records, coverage)
+
+    async def _process_person(cur: SeedPerson, gen: int, key: str) -> None:
+        person_records: list[dict[str, Any]] = []
+        records_by_person[key] = (gen, person_records)
         # Expand search window every 100 iters if needed (placeholder)
         query = SearchQuery(
             given_name=cur.given,
@@ -309,7 +267,7 @@ async def run_crawl_person(seed: SeedPerson, cfg: CrawlConfig, kernel_config: An
                     year=year,
                 )
                 for rec in ag_census:
-                    aggregated.append(rec.model_dump(mode="json"))
+                    person_records.append(rec.model_dump(mode="json"))
                     coverage["secondary_count"] += 1
                     coverage["sources"].add("accessgenealogy")
                     if cfg.verbose and rec.extracted_fields.get("household_members"):
@@ -328,7 +286,7 @@ async def run_crawl_person(seed: SeedPerson, cfg: CrawlConfig, kernel_config: An
                     year=year,
                 )
                 for rec in ugw_census:
-                    aggregated.append(rec.model_dump(mode="json"))
+                    person_records.append(rec.model_dump(mode="json"))
                     coverage["secondary_count"] += 1
                     coverage["sources"].add("usgenweb")
                     if cfg.verbose and rec.extracted_fields.get("household_members"):
@@ -338,9 +296,9 @@ async def run_crawl_person(seed: SeedPerson, cfg: CrawlConfig, kernel_config: An
                 if cfg.verbose:
                     print(f"  USGenWeb census {year} search error: {e}")
 
-        # Process all aggregated census records and extract household members for frontier
+        # Process this person's census records and extract household members for frontier
         if cfg.expand_family and gen < cfg.max_generations:
-            for rec_dict in aggregated[-20:]:  # Check recent records
+            for rec_dict in person_records[-20:]:  # Check recent records
                 if rec_dict.get("record_type") != "census":
                     continue
                 extracted = rec_dict.get("extracted_fields", {})
@@ -365,13 +323,13 @@ async def run_crawl_person(seed: SeedPerson, cfg: CrawlConfig, kernel_config: An
                     member_key = _person_key(given, surname, byear, None)
                     if member_key not in visited:
                         member_seed = SeedPerson(given=given, surname=surname, birth_year=byear)
-                        frontier.append((member_seed, new_gen))
+                        _enqueue(member_seed, new_gen)
                         if cfg.verbose:
                             print(f"    Added census household member: {given} {surname} ({rel or 'unknown'}, gen {new_gen})")
 
         # Aggregate and classify
         for rec in unified.results:
-            aggregated.append(rec.model_dump(mode="json"))
+            person_records.append(rec.model_dump(mode="json"))
             cat = _classify_record(rec)
             if cat == "primary":
                 coverage["primary_count"] += 1
@@ -381,7 +339,6 @@ async def run_crawl_person(seed: SeedPerson, cfg: CrawlConfig, kernel_config: An
                 coverage["authored_count"] += 1
         for s in unified.sources_searched:
             coverage["sources"].add(s)
-        coverage["count"] = len(aggregated)
 
         # Early stop condition on seed only (primary + secondary; no dependency on authored trees)
         if cur is seed and cfg.until_gps and coverage["primary_count"] >= 1 and coverage["secondary_count"] >= 1:
@@ -397,6 +354,7 @@ async def run_crawl_person(seed: SeedPerson, cfg: CrawlConfig, kernel_config: An
                     people = await fetch_parse_people_table(rec.url)
                 except Exception:
                     people = []
+                roll_facts = []
                 for p in people[:50]:
                     if not p.name:
                         continue
@@ -422,7 +380,10 @@ async def run_crawl_person(seed: SeedPerson, cfg: CrawlConfig, kernel_config: An
                         confidence_score=0.6 if p.roll_number else 0.5,
                         status=FactStatus.PROPOSED,
                     )
-                    ledger.append(fact)
+                    roll_facts.append(fact)
+                # One ledger batch per table rather than one write per row
+                ledger.append_many(roll_facts)
+                for fact in roll_facts:
                     try:
                         await _evaluate_and_promote_fact(fact, ledger, kernel_config)
                     except Exception:
@@ -632,25 +593,61 @@ async def run_crawl_person(seed: SeedPerson, cfg: CrawlConfig, kernel_config: An
                                 child = SeedPerson(given=given, surname=surname)
                                 child_key = _person_key(given, surname, None, None)
                                 if child_key not in visited:
-                                    frontier.append((child, gen + 1))
+                                    _enqueue(child, gen + 1)
 
                     await _relate_and_maybe_enqueue(fam.get("parents", []), "parent")
                     await _relate_and_maybe_enqueue(fam.get("spouses", []), "spouse")
                     await _relate_and_maybe_enqueue(fam.get("children", []), "child")
 
-        # Checkpoint
-        if iters % cfg.checkpoint_every == 0:
-            _write_tree_checkpoint(out_path, seed, aggregated, coverage)
+    async def _worker() -> None:
+        nonlocal iters, active
+        while iters < cfg.max_iterations and (time.time() - start) < cfg.max_duration_seconds:
+            if not frontier:
+                if active == 0:
+                    return
+                # Another worker may still enqueue relatives; wait for it
+                frontier_changed.clear()
+                await frontier_changed.wait()
+                continue
+            cur, gen = frontier.popleft()
+            key = _person_key(cur.given, cur.surname, cur.birth_year, cur.birth_place)
+            if key in visited:
+                continue
+            visited.add(key)
+            iters += 1
+            current_iter = iters
+            active += 1
+            try:
+                await _process_person(cur, gen, key)
+            finally:
+                active -= 1
+                frontier_changed.set()
+
+            # Checkpoint
+            if current_iter % cfg.checkpoint_every == 0:
+                _checkpoint()
 
-        # Minimal backoff to respect sites
-        await asyncio.sleep(0.5)
+            if n_workers == 1:
+                # Minimal backoff to respect sites
+                await asyncio.sleep(0.5)
+
+    from gps_agents.http_cache import report_cache_status
+    from gps_agents.net import TRANSPORT, report_pool_status
+
+    try:
+        async with asyncio.TaskGroup() as tg:
+            for _ in range(n_workers):
+                tg.create_task(_worker())
+    finally:
+        # Sources share keep-alive pools for the whole crawl; release the sockets
+        await TRANSPORT.aclose_pools()
 
     # Final write
-    _write_tree_checkpoint(out_path, seed, aggregated, coverage)
+    _checkpoint()
     return {
         "iterations": iters,
         "duration_sec": int(time.time() - start),
-        "records": len(aggregated),
+        "records": coverage["count"],
         "sources": sorted(list(coverage["sources"])),
         "coverage": {
             "primary": coverage.get("primary_count", 0),
@@ -658,10 +655,84 @@ async def run_crawl_person(seed: SeedPerson, cfg: CrawlConfig, kernel_config: An
             "authored": coverage.get("authored_count", 0),
         },
         "tree_file": str(out_path),
+        "connection_pools": report_pool_status(),
+        "response_cache": report_cache_status(),
         "stopped_on_gps": bool(cfg.until_gps and coverage.get("primary_count", 0) >= 1 and coverage.get("secondary_count", 0) >= 1),
     }
 
 
+def _build_router(cfg: CrawlConfig) -> tuple[SearchRouter, AccessGenealogySource, USGenWebSource]:
+    """Register the open sources used by the crawl.
+
+    Returns the router plus the AccessGenealogy and USGenWeb sources, which the
+    crawl also queries directly for census household transcriptions.
+    """
+    # Router with open sources only for Phase 1
+    router = SearchRouter(RouterConfig(parallel=True, max_results_per_source=50))
+    access_gen = AccessGenealogySource()
+    usgenweb = USGenWebSource()
+    router.register_source(access_gen)
+    router.register_source(usgenweb)
+    router.register_source(WikiTreeSource())
+    router.register_source(Nara1950Source())
+    router.register_source(Nara1940Source())
+    router.register_source(FindAGraveSource())
+    router.register_source(FreeBMDSource())
+
+    # Add FamilySearch if configured (requires FAMILYSEARCH_ACCESS_TOKEN env var)
+    fs_source = FamilySearchSource()
+    if fs_source.is_configured():
+        router.register_source(fs_source)
+        if cfg.verbose:
+            print("FamilySearch source enabled")
+
+    # Cemetery and burial sources
+    router.register_source(BillionGravesSource())
+
+    # Vital records sources
+    router.register_source(CaliforniaVitalsSource())
+
+    # Free census sources (1940, 1950 fully indexed, others browsable)
+    router.register_source(FreeCensusSource())
+
+    # UK census (FreeCEN volunteer transcriptions)
+    router.register_source(FreeCENSource())
+
+    # Resource directories
+    router.register_source(CyndisListSource())
+
+    # Obituary sources
+    router.register_source(LegacyObituariesSource())
+    router.register_source(NewspaperObituariesSource())
+
+    # Jewish genealogy
+    router.register_source(JewishGenSource())
+    router.register_source(YadVashemSource())
+
+    # African American genealogy
+    router.register_source(AfricanAmericanGenealogySource())
+    router.register_source(FreedmansBureauSource())
+    router.register_source(SlaveSchedulesSource())
+
+    # Library and archive sources
+    router.register_source(LibraryOfCongressSource())
+    router.register_source(ChroniclingAmericaSource())
+    router.register_source(NYPLSource())
+
+    # Immigration records
+    router.register_source(ImmigrationRecordsSource())
+
+    if cfg.verbose:
+        print("Census sources enabled: AccessGenealogy, USGenWeb, FreeCensus, FreeCEN")
+        print("Vital records: California Death/Birth Index")
+        print("Cemetery sources: FindAGrave, BillionGraves")
+        print("Obituaries: Legacy.com, Chronicling America")
+        print("Special collections: JewishGen, Afrigeneas, Freedmen's Bureau")
+        print("Archives: Library of Congress, NYPL")
+
+    return router, access_gen, usgenweb
+
+
 def _write_tree_checkpoint(path: Path, seed: SeedPerson, records: list[dict[str, Any]], cov: dict[str, Any]) -> None:
     payload = {
         "seed": seed.__dict__,
@@ -678,10 +749,8 @@ def _write_tree_checkpoint(path: Path, seed: SeedPerson, records: list[dict[str,
 
     # Also emit GEDCOM and Mermaid alongside the tree.json
     try:
-        from gps_agents.export.gedcom import export_gedcom
-        from gps_agents.export.mermaid import export_mermaid
-        export_gedcom(Path("data/ledger"), path.with_suffix(".ged"))
-        export_mermaid(Path("data/ledger"), path.with_suffix(".mmd"))
+        from gps_agents.export import export_many
+        export_many(Path("data/ledger"), [path.with_suffix(".ged"), path.with_suffix(".mmd")])
     except Exception:
         pass
 
@@ -5,7 +5,7 @@ This module provides:
 - Haplogroup interpretation
 - Ethnicity estimate parsing
 - Shared segment analysis
-- DNA match clustering
+- DNA match clustering (see ``gps_agents.dna.clustering``)
 
 IMPORTANT: DNA results are PROBABILISTIC and should not override documentary evidence.
 All interpretations include appropriate caveats and confidence intervals.
@@ -316,69 +316,35 @@ def cluster_dna_matches(
     """Cluster DNA matches by shared matches (Leeds Method).
 
     The Leeds Method groups DNA matches who share DNA with each other,
-    helping identify distinct ancestral lines.
+    helping identify distinct ancestral lines. Matches at or above the
+    threshold are linked to everyone in their shared-match lists, and each
+    connected group is one cluster. See ``gps_agents.dna.clustering`` for
+    colour clusters, matrix export and CSV ingestion.
 
     Args:
         matches: List of DNA matches
         threshold_cm: Minimum cM for clustering
 
     Returns:
-        List of clusters (each cluster = list of related matches)
+        List of clusters (each cluster = list of related matches), in order
+        of each cluster's first match in ``matches``
     """
+    from .clustering import MatchMatrix
+
     # Filter matches above threshold
     significant = [m for m in matches if m.shared_cm >= threshold_cm]
 
     if not significant:
         return []
 
-    # Build adjacency based on shared matches
-    clusters: list[set[str]] = []
-    match_to_cluster: dict[str, int] = {}
+    matrix = MatchMatrix.from_matches(significant)
+    roots = matrix.components()
 
+    clusters: dict[int, list[DNAMatch]] = {}
     for match in significant:
-        shared = set(match.shared_matches)
-        shared.add(match.match_name)
-
-        # Find existing clusters that overlap
-        overlapping = []
-        for i, cluster in enumerate(clusters):
-            if cluster & shared:
-                overlapping.append(i)
-
-        if not overlapping:
-            # New cluster
-            new_cluster = shared
-            clusters.append(new_cluster)
-            for name in new_cluster:
-                match_to_cluster[name] = len(clusters) - 1
-        elif len(overlapping) == 1:
-            # Add to existing cluster
-            clusters[overlapping[0]].update(shared)
-            for name in shared:
-                match_to_cluster[name] = overlapping[0]
-        else:
-            # Merge clusters
-            merged = set()
-            for i in overlapping:
-                merged.update(clusters[i])
-            merged.update(shared)
-
-            # Remove old clusters (in reverse order)
-            for i in sorted(overlapping, reverse=True):
-                clusters.pop(i)
-
-            clusters.append(merged)
-            for name in merged:
-                match_to_cluster[name] = len(clusters) - 1
-
-    # Convert back to DNAMatch objects
-    result: list[list[DNAMatch]] = []
-    for cluster_names in clusters:
-        cluster_matches = [m for m in significant if m.match_name in cluster_names]
-        if cluster_matches:
-            result.append(sorted(cluster_matches, key=lambda m: m.shared_cm, reverse=True))
-
-    return result
+        clusters.setdefault(int(roots[matrix.index[match.match_name]]), []).append(match)
+
+    return [sorted(cluster, key=lambda m: m.shared_cm, reverse=True) for cluster in clusters.values()]
 
 
 __all__ = [
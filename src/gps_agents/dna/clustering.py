@@ -0,0 +1,382 @@
+"""Shared-match clustering for large DNA match lists.
+
+A kit's matches are held column-wise in a ``MatchMatrix``:
+- cM, segment count and largest-segment vectors as NumPy arrays
+- a sparse shared-match adjacency in CSR form
+
+Names seen only in someone's shared-match list still become nodes.
+
+Two groupings are provided:
+- ``MatchMatrix.components``: connected components of the shared-match graph,
+  found with a vectorized union-find. This is what ``cluster_dna_matches``
+  returns.
+- ``MatchMatrix.leeds_clusters``: Leeds Method colour clusters over matches
+  in the 2nd-3rd cousin range. A match that shares with two colours gets
+  both, which usually marks where two ancestral lines meet.
+
+Provider CSV downloads are read a row at a time with ``iter_match_csv`` and
+``iter_shared_match_csv``.
+
+IMPORTANT: clusters suggest shared ancestral lines; they do not identify the
+common ancestor and must be confirmed with documentary evidence.
+"""
+from __future__ import annotations
+
+import csv
+from array import array
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, TYPE_CHECKING
+
+import numpy as np
+
+from . import DNAMatch, DNATestProvider
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+# Leeds Method default window: roughly 2nd to 3rd cousins
+LEEDS_MIN_CM = 90.0
+LEEDS_MAX_CM = 400.0
+
+# 23andMe reports percent shared; its genome is about 7,440 cM (autosomes + X)
+_TWENTYTHREE_CM_PER_PERCENT = 74.4
+
+# Header aliases (lower-cased) used by provider and DNAGedcom exports
+_NAME_COLUMNS = ("name", "match name", "matchname", "display name", "full name", "username")
+_CM_COLUMNS = (
+    "sharedcentimorgans", "shared cm", "total cm", "total cm shared", "shared dna",
+    "centimorgans", "cm",
+)
+_PERCENT_COLUMNS = ("percent dna shared", "% dna shared")
+_SEGMENT_COLUMNS = ("sharedsegments", "shared segments", "# segments shared", "segments", "number of segments")
+_LARGEST_COLUMNS = ("largest segment (cm)", "longest block", "largest segment", "longestsegment")
+_RELATIONSHIP_COLUMNS = ("predicted relationship", "relationship range", "estimated relationship", "predicted")
+_PAIR_COLUMNS = (("matchname", "icwname"), ("match name", "shared match name"), ("match", "shared match"))
+
+
+@dataclass
+class LeedsMatrix:
+    """Leeds colour-cluster matrix: one row per match, one column per colour."""
+
+    names: list[str]
+    shared_cm: np.ndarray
+    colors: np.ndarray  # bool, rows x colours
+
+    def write_csv(self, path: Path | str) -> None:
+        """Write the matrix as CSV, marking each match's colours with "X"."""
+        with Path(path).open("w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["match_name", "shared_cm", *(f"cluster_{i + 1}" for i in range(self.colors.shape[1]))])
+            for name, cm, row in zip(self.names, self.shared_cm, self.colors, strict=True):
+                writer.writerow([name, f"{cm:.1f}", *("X" if c else "" for c in row)])
+
+
+class MatchMatrix:
+    """Column-oriented DNA match list with a sparse shared-match adjacency."""
+
+    def __init__(self) -> None:
+        self.names: list[str] = []
+        self.index: dict[str, int] = {}
+        self.providers: list[DNATestProvider] = []
+        # Growable columns; NumPy copies are made on demand
+        self._cm = array("d")
+        self._segments = array("i")
+        self._largest = array("d")
+        self._is_match = bytearray()
+        self._src = array("i")
+        self._dst = array("i")
+        self._csr: tuple[np.ndarray, np.ndarray] | None = None
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def _node(self, name: str) -> int:
+        i = self.index.get(name)
+        if i is None:
+            i = self.index[name] = len(self.names)
+            self.names.append(name)
+            self.providers.append(DNATestProvider.UNKNOWN)
+            self._cm.append(0.0)
+            self._segments.append(0)
+            self._largest.append(0.0)
+            self._is_match.append(0)
+        return i
+
+    def add(self, match: DNAMatch) -> int:
+        """Add (or update) a match and its shared-match links; return its row."""
+        i = self._node(match.match_name)
+        self._cm[i] = match.shared_cm
+        self._segments[i] = match.shared_segments
+        self._largest[i] = match.largest_segment_cm
+        self.providers[i] = match.provider
+        self._is_match[i] = 1
+        self.add_shared((match.match_name, other) for other in match.shared_matches)
+        return i
+
+    def add_shared(self, pairs: Iterable[tuple[str, str]]) -> None:
+        """Add shared-match links, e.g. from ``iter_shared_match_csv``."""
+        for a, b in pairs:
+            i, j = self._node(a), self._node(b)
+            if i != j:
+                self._src.append(i)
+                self._dst.append(j)
+        self._csr = None
+
+    @classmethod
+    def from_matches(cls, matches: Iterable[DNAMatch]) -> MatchMatrix:
+        """Build a matrix from DNAMatch objects."""
+        matrix = cls()
+        for match in matches:
+            matrix.add(match)
+        return matrix
+
+    # ------------------------------------------------------------------
+    # Vectors
+    # ------------------------------------------------------------------
+
+    @property
+    def shared_cm(self) -> np.ndarray:
+        """Shared cM per row (0 for names only seen as shared matches)."""
+        return np.array(self._cm, dtype=np.float64)
+
+    @property
+    def shared_segments(self) -> np.ndarray:
+        """Shared segment count per row."""
+        return np.array(self._segments, dtype=np.int32)
+
+    @property
+    def largest_segment_cm(self) -> np.ndarray:
+        """Largest shared segment (cM) per row."""
+        return np.array(self._largest, dtype=np.float64)
+
+    @property
+    def is_match(self) -> np.ndarray:
+        """True for rows added as matches rather than only named in shared lists."""
+        return np.array(self._is_match, dtype=np.bool_)
+
+    def edges(self) -> tuple[np.ndarray, np.ndarray]:
+        """Directed shared-match links as (source rows, target rows)."""
+        return np.array(self._src, dtype=np.int32), np.array(self._dst, dtype=np.int32)
+
+    def adjacency(self) -> tuple[np.ndarray, np.ndarray]:
+        """Symmetric, de-duplicated adjacency in CSR form: (indptr, indices)."""
+        if self._csr is None:
+            src, dst = self.edges()
+            n = len(self)
+            keys = np.concatenate([src, dst]).astype(np.int64) * n + np.concatenate([dst, src])
+            keys.sort()
+            keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+            rows, cols = np.divmod(keys, n)
+            indptr = np.zeros(n + 1, dtype=np.int64)
+            np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+            self._csr = indptr, cols.astype(np.int32)
+        return self._csr
+
+    def neighbors(self, row: int) -> np.ndarray:
+        """Rows sharing a match link with ``row``."""
+        indptr, indices = self.adjacency()
+        return indices[indptr[row]:indptr[row + 1]]
+
+    def to_match(self, row: int) -> DNAMatch:
+        """Rebuild the DNAMatch for a row."""
+        return DNAMatch(
+            match_name=self.names[row],
+            shared_cm=float(self._cm[row]),
+            shared_segments=int(self._segments[row]),
+            largest_segment_cm=float(self._largest[row]),
+            provider=self.providers[row],
+            shared_matches=[self.names[j] for j in self.neighbors(row)],
+        )
+
+    # ------------------------------------------------------------------
+    # Clustering
+    # ------------------------------------------------------------------
+
+    def components(self, src: np.ndarray | None = None, dst: np.ndarray | None = None) -> np.ndarray:
+        """Union-find over shared-match links; returns a root label per row.
+
+        Each round hooks every root that still has a cross-component link
+        onto the smallest root it links to, then compresses paths by pointer
+        jumping, all as array operations. Hooks always point to a smaller
+        root, so no cycles form and a few rounds suffice.
+        """
+        if src is None or dst is None:
+            src, dst = self.edges()
+        parent = np.arange(len(self), dtype=np.int32)
+        u, v = src, dst
+        while len(u):
+            ru, rv = parent[u], parent[v]
+            cross = ru != rv
+            ru, rv = ru[cross], rv[cross]
+            if not len(ru):
+                break
+            hi, lo = np.maximum(ru, rv), np.minimum(ru, rv)
+            np.minimum.at(parent, hi, lo)
+            while True:
+                grand = parent[parent]
+                if np.array_equal(grand, parent):
+                    break
+                parent = grand
+            u, v = u[cross], v[cross]
+        return parent
+
+    def leeds_clusters(
+        self,
+        min_cm: float = LEEDS_MIN_CM,
+        max_cm: float = LEEDS_MAX_CM,
+    ) -> LeedsMatrix:
+        """Leeds Method colour clusters over matches between ``min_cm`` and ``max_cm``.
+
+        Matches in the window are taken by descending cM. The first one not
+        yet coloured starts a new colour, which also goes to every in-window
+        shared match of it, including matches that already have a colour.
+        """
+        cm = self.shared_cm
+        in_window = self.is_match & (cm >= min_cm) & (cm <= max_cm)
+        rows = np.flatnonzero(in_window)
+        rows = rows[np.argsort(-cm[rows], kind="stable")]
+        indptr, indices = self.adjacency()
+
+        colors: list[np.ndarray] = []  # colour -> rows
+        first_color = np.full(len(self), -1, dtype=np.int32)
+        for row in rows.tolist():
+            if first_color[row] >= 0:
+                continue
+            neighbors = indices[indptr[row]:indptr[row + 1]]
+            members = np.append(neighbors[in_window[neighbors]], row)
+            colors.append(members)
+            first_color[members[first_color[members] < 0]] = len(colors) - 1
+
+        # Rows grouped by first colour, highest cM first within a colour
+        order = rows[np.lexsort((-cm[rows], first_color[rows]))]
+        position = np.full(len(self), -1, dtype=np.int64)
+        position[order] = np.arange(len(order))
+        matrix = np.zeros((len(order), len(colors)), dtype=np.bool_)
+        for color, members in enumerate(colors):
+            matrix[position[members], color] = True
+        return LeedsMatrix(names=[self.names[i] for i in order], shared_cm=cm[order], colors=matrix)
+
+
+# =============================================================================
+# Provider CSV ingestion
+# =============================================================================
+
+
+@contextmanager
+def _open_csv(source: Path | str | IO[str]) -> Iterator[IO[str]]:
+    if isinstance(source, (str, Path)):
+        with Path(source).open(newline="", encoding="utf-8-sig") as f:
+            yield f
+    else:
+        yield source
+
+
+def _column(fields: list[str], aliases: Iterable[str]) -> str | None:
+    lowered = {f.strip().lower(): f for f in fields}
+    for alias in aliases:
+        if alias in lowered:
+            return lowered[alias]
+    return None
+
+
+def _number(value: str | None) -> float:
+    if not value:
+        return 0.0
+    try:
+        return float(value.lower().replace(",", "").replace("%", "").replace("cm", "").strip())
+    except ValueError:
+        return 0.0
+
+
+def iter_match_csv(
+    source: Path | str | IO[str],
+    provider: DNATestProvider = DNATestProvider.UNKNOWN,
+) -> Iterator[DNAMatch]:
+    """Stream DNAMatch rows from a provider or DNAGedcom match-list CSV.
+
+    Columns are found by header name (Ancestry/DNAGedcom, MyHeritage,
+    FamilyTreeDNA and 23andMe spellings). 23andMe's percent shared is
+    converted to cM. Rows without a name are skipped.
+
+    Raises:
+        ValueError: If no name or shared-DNA column is found
+    """
+    with _open_csv(source) as f:
+        reader = csv.DictReader(f)
+        fields = reader.fieldnames or []
+        name_col = _column(fields, _NAME_COLUMNS)
+        cm_col = _column(fields, _CM_COLUMNS)
+        percent_col = _column(fields, _PERCENT_COLUMNS) if cm_col is None else None
+        if name_col is None or (cm_col is None and percent_col is None):
+            raise ValueError(f"Unrecognized DNA match CSV header: {fields}")
+        segments_col = _column(fields, _SEGMENT_COLUMNS)
+        largest_col = _column(fields, _LARGEST_COLUMNS)
+        relationship_col = _column(fields, _RELATIONSHIP_COLUMNS)
+        for row in reader:
+            name = (row.get(name_col) or "").strip()
+            if not name:
+                continue
+            if cm_col is not None:
+                cm = _number(row.get(cm_col))
+            else:
+                cm = _number(row.get(percent_col)) * _TWENTYTHREE_CM_PER_PERCENT
+            yield DNAMatch(
+                match_name=name,
+                shared_cm=cm,
+                shared_segments=int(_number(row.get(segments_col))) if segments_col else 0,
+                largest_segment_cm=_number(row.get(largest_col)) if largest_col else 0.0,
+                provider=provider,
+                predicted_relationship=(row.get(relationship_col) or None) if relationship_col else None,
+            )
+
+
+def iter_shared_match_csv(source: Path | str | IO[str]) -> Iterator[tuple[str, str]]:
+    """Stream (match, shared match) name pairs from an in-common-with CSV.
+
+    Raises:
+        ValueError: If the header has no recognizable pair of name columns
+    """
+    with _open_csv(source) as f:
+        reader = csv.DictReader(f)
+        fields = reader.fieldnames or []
+        for a_alias, b_alias in _PAIR_COLUMNS:
+            a_col, b_col = _column(fields, (a_alias,)), _column(fields, (b_alias,))
+            if a_col and b_col:
+                break
+        else:
+            raise ValueError(f"Unrecognized shared-match CSV header: {fields}")
+        for row in reader:
+            a, b = (row.get(a_col) or "").strip(), (row.get(b_col) or "").strip()
+            if a and b:
+                yield a, b
+
+
+def load_match_csv(
+    matches: Path | str | IO[str],
+    shared: Path | str | IO[str] | None = None,
+    provider: DNATestProvider = DNATestProvider.UNKNOWN,
+) -> MatchMatrix:
+    """Build a MatchMatrix from a match-list CSV and optional shared-match CSV."""
+    matrix = MatchMatrix()
+    for match in iter_match_csv(matches, provider):
+        matrix.add(match)
+    if shared is not None:
+        matrix.add_shared(iter_shared_match_csv(shared))
+    return matrix
+
+
+__all__ = [
+    "LEEDS_MAX_CM",
+    "LEEDS_MIN_CM",
+    "LeedsMatrix",
+    "MatchMatrix",
+    "iter_match_csv",
+    "iter_shared_match_csv",
+    "load_match_csv",
+]
@@ -7,9 +7,20 @@ Supported formats:
 - GraphML: Network visualization (Gephi, yEd, Cytoscape)
 - PDF: Printable documents (requires weasyprint)
 - Mermaid: Diagram markup for GitHub/GitLab
+
+GEDCOM, JSON, Markdown, GraphML and Mermaid are written by streaming writers
+over one shared FamilyModel (see ``engine``), so several of them can be
+produced from a single ledger pass with ``export_many``.
 """
 from __future__ import annotations
 
+from gps_agents.export.engine import (
+    ExportWriter,
+    FamilyModel,
+    WRITERS,
+    export_many,
+    register_writer,
+)
 from gps_agents.export.gedcom import export_gedcom, GedcomIndividual, GedcomFamily, GedcomEvent
 from gps_agents.export.json_export import (
     export_json,
@@ -37,6 +48,12 @@ from gps_agents.export.pdf import (
 from gps_agents.export.mermaid import export_mermaid
 
 __all__ = [
+    # Export engine
+    "ExportWriter",
+    "FamilyModel",
+    "WRITERS",
+    "export_many",
+    "register_writer",
     # GEDCOM export
     "export_gedcom",
     "GedcomIndividual",
@@ -76,6 +93,7 @@ EXPORT_FORMATS = {
     ".graphml": export_graphml,
     ".pdf": export_pdf,
     ".html": export_pdf,  # PDF falls back to HTML
+    ".mmd": export_mermaid,
 }
 
 
@@ -84,23 +102,55 @@ def export_by_format(ledger_dir, out_file, **kwargs):
 
     Args:
         ledger_dir: Path to fact ledger
-        out_file: Output file path (extension determines format)
-        **kwargs: Format-specific options
+        out_file: Output file path (extension determines format), or a list
+            of paths to export together. Formats with a streaming writer
+            share a single ledger pass.
+        **kwargs: Format-specific options; with several outputs each format
+            receives the options it accepts
 
     Returns:
-        Path to created file
+        Path to created file, or a list of paths when given a list
 
     Raises:
         ValueError: If format not supported
     """
+    import inspect
+    import os
     from pathlib import Path
 
-    out_path = Path(out_file)
-    suffix = out_path.suffix.lower()
+    from gps_agents.export.engine import writer_for
+
+    single = isinstance(out_file, (str, os.PathLike))
+    out_paths = [Path(out_file)] if single else [Path(p) for p in out_file]
+
+    for out_path in out_paths:
+        suffix = out_path.suffix.lower()
+        if suffix not in EXPORT_FORMATS:
+            supported = ", ".join(EXPORT_FORMATS.keys())
+            raise ValueError(f"Unsupported format '{suffix}'. Supported: {supported}")
+
+    if single:
+        export_func = EXPORT_FORMATS[out_paths[0].suffix.lower()]
+        return export_func(Path(ledger_dir), out_paths[0], **kwargs)
 
-    if suffix not in EXPORT_FORMATS:
-        supported = ", ".join(EXPORT_FORMATS.keys())
-        raise ValueError(f"Unsupported format '{suffix}'. Supported: {supported}")
+    streamed = [p for p in out_paths if writer_for(p)]
+    streamed_options = set().union(*(writer_for(p).option_names() for p in streamed))
+    other_options = {
+        p: set(inspect.signature(EXPORT_FORMATS[p.suffix.lower()]).parameters) - {"ledger_dir", "out_file"}
+        for p in out_paths
+        if not writer_for(p)
+    }
+    unknown = sorted(set(kwargs) - streamed_options.union(*other_options.values()))
+    if unknown:
+        raise TypeError(f"Unexpected export option(s): {', '.join(unknown)}")
 
-    export_func = EXPORT_FORMATS[suffix]
-    return export_func(Path(ledger_dir), out_path, **kwargs)
+    results: dict[Path, Path] = {}
+    if streamed:
+        options = {k: v for k, v in kwargs.items() if k in streamed_options}
+        results.update(zip(streamed, export_many(Path(ledger_dir), streamed, **options), strict=True))
+    for out_path, names in other_options.items():
+        export_func = EXPORT_FORMATS[out_path.suffix.lower()]
+        results[out_path] = export_func(
+            Path(ledger_dir), out_path, **{k: v for k, v in kwargs.items() if k in names}
+        )
+    return [results[p] for p in out_paths]
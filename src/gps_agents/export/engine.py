@@ -0,0 +1,371 @@
+"""Single-pass, multi-format export engine.
+
+Every ledger exporter needs the same view of the tree: the people named by
+ACCEPTED facts, the facts attached to each of them and the relationships
+between them. ``FamilyModel`` builds that view once, in a single scan of the
+fact ledger (or of a ``SQLiteProjection``), keeping only the fields the
+writers read. Format writers then stream the model to disk, so exporting
+GEDCOM, GraphML, Markdown and JSON together costs one ledger pass instead of
+four, and no writer holds a second copy of the tree or of its output.
+
+Writers register themselves for file suffixes with ``register_writer``; the
+format modules in this package define one each.
+
+Example:
+    export_many("data/ledger", ["tree.ged", "tree.graphml", "tree.json"])
+"""
+from __future__ import annotations
+
+import inspect
+import json
+import os
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar, TextIO
+
+from gps_agents.models.fact import Fact, FactStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from gps_agents.projections.sqlite_projection import SQLiteProjection
+
+
+_intern = sys.intern
+
+
+def parse_person_key(person_key: str) -> tuple[str, str | None, str | None]:
+    """Parse a person key into name components.
+
+    Format: "Given Surname|YEAR|PLACE"
+
+    Returns:
+        Tuple of (full_name, given_name, surname)
+    """
+    name_part = person_key.split("|")[0].strip()
+    if not name_part:
+        return "Unknown", None, None
+
+    name_parts = name_part.split()
+    if len(name_parts) == 1:
+        return name_part, name_part, None
+    return name_part, " ".join(name_parts[:-1]), name_parts[-1]
+
+
+# =============================================================================
+# Shared family model
+# =============================================================================
+
+
+@dataclass(slots=True)
+class SourceRef:
+    """The parts of a SourceCitation that exports print."""
+
+    repository: str
+    record_id: str
+    url: str | None = None
+
+    @property
+    def title(self) -> str:
+        return f"{self.repository} {self.record_id}".strip()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"id": self.record_id, "repository": self.repository, "url": self.url, "title": self.title}
+
+
+@dataclass(slots=True)
+class FactRecord:
+    """Compact copy of a Fact: only the fields exports use."""
+
+    fact_id: str
+    fact_type: str | None
+    statement: str
+    person_id: str | None = None
+    relation_kind: str | None = None
+    relation_subject: str | None = None
+    relation_object: str | None = None
+    confidence: float = 0.5
+    created_at: str | None = None
+    sources: tuple[SourceRef, ...] = ()
+    accepted: bool = True
+
+    @classmethod
+    def from_fact(cls, fact: Fact) -> FactRecord:
+        return cls(
+            fact_id=str(fact.fact_id),
+            fact_type=_intern(fact.fact_type) if fact.fact_type else fact.fact_type,
+            statement=fact.statement,
+            person_id=fact.person_id,
+            relation_kind=fact.relation_kind,
+            relation_subject=fact.relation_subject,
+            relation_object=fact.relation_object,
+            confidence=fact.confidence_score,
+            created_at=fact.created_at.isoformat() if fact.created_at else None,
+            sources=tuple(SourceRef(_intern(s.repository), s.record_id, s.url) for s in fact.sources),
+            accepted=fact.status == FactStatus.ACCEPTED,
+        )
+
+    @property
+    def kind(self) -> str:
+        """Lower-cased fact type."""
+        return (self.fact_type or "").lower()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.fact_id,
+            "type": self.fact_type,
+            "statement": self.statement,
+            "person_id": self.person_id,
+            "relation_subject": self.relation_subject,
+            "relation_object": self.relation_object,
+            "relation_kind": self.relation_kind,
+            "confidence": self.confidence,
+            "sources": [s.as_dict() for s in self.sources],
+            "created_at": self.created_at,
+        }
+
+
+@dataclass(slots=True)
+class PersonRecord:
+    """A person referenced by the ledger, keyed by person_id or relation name."""
+
+    key: str
+    name: str
+    given_name: str | None
+    surname: str | None
+    # Seen as a fact's person_id ("Given Surname|YEAR|PLACE") rather than only
+    # as a relationship endpoint; GEDCOM derives display names differently.
+    from_facts: bool = False
+    accepted: bool = False
+    facts: list[FactRecord] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class RelationRecord:
+    """A relationship fact between two people."""
+
+    kind: str
+    subject: PersonRecord
+    object: PersonRecord
+    fact: FactRecord
+
+
+class FamilyModel:
+    """People, relationships and unlinked facts from one ledger scan.
+
+    Only ACCEPTED facts are collected unless ``include_rejected`` is set, in
+    which case REJECTED facts are kept too and flagged ``accepted=False``;
+    writers that export accepted data only skip them via ``iter_persons`` and
+    ``iter_relations``.
+    """
+
+    def __init__(self, include_rejected: bool = False) -> None:
+        self.include_rejected = include_rejected
+        self.persons: dict[str, PersonRecord] = {}
+        self.relations: list[RelationRecord] = []
+        self.unlinked: list[FactRecord] = []
+
+    @property
+    def statuses(self) -> tuple[FactStatus, ...]:
+        if self.include_rejected:
+            return (FactStatus.ACCEPTED, FactStatus.REJECTED)
+        return (FactStatus.ACCEPTED,)
+
+    # -------------------------------------------------------------------------
+    # Building
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def from_ledger(cls, ledger_dir: Path | str, include_rejected: bool = False) -> FamilyModel:
+        """Build the model from a single ``iter_all_facts`` pass."""
+        from gps_agents.ledger.fact_ledger import FactLedger
+
+        model = cls(include_rejected)
+        statuses = model.statuses
+        ledger = FactLedger(str(ledger_dir))
+        for fact in ledger.iter_all_facts():
+            if fact.status in statuses:
+                model.add(FactRecord.from_fact(fact))
+        return model
+
+    @classmethod
+    def from_projection(cls, projection: SQLiteProjection, include_rejected: bool = False) -> FamilyModel:
+        """Build the model from a SQLite projection without validating Facts.
+
+        Reads the indexed columns directly and pulls the relation fields out
+        of ``full_json`` in SQL, in the same fact_id order as the ledger.
+        """
+        model = cls(include_rejected)
+        statuses = [s.value for s in model.statuses]
+        placeholders = ",".join("?" * len(statuses))
+        query = f"""
+            SELECT fact_id, fact_type, statement, person_id, confidence_score,
+                   created_at, status, sources_json,
+                   json_extract(full_json, '$.relation_kind'),
+                   json_extract(full_json, '$.relation_subject'),
+                   json_extract(full_json, '$.relation_object')
+            FROM facts WHERE status IN ({placeholders})
+            ORDER BY fact_id
+        """
+        with projection._read_conn() as conn:  # noqa: SLF001
+            for row in conn.execute(query, statuses):
+                (fact_id, fact_type, statement, person_id, confidence, created_at,
+                 status, sources_json, relation_kind, relation_subject, relation_object) = tuple(row)
+                sources = json.loads(sources_json).get("sources", []) if sources_json else []
+                model.add(FactRecord(
+                    fact_id=fact_id,
+                    fact_type=_intern(fact_type) if fact_type else fact_type,
+                    statement=statement,
+                    person_id=person_id,
+                    relation_kind=relation_kind,
+                    relation_subject=relation_subject,
+                    relation_object=relation_object,
+                    confidence=confidence,
+                    created_at=created_at,
+                    sources=tuple(
+                        SourceRef(_intern(s["repository"]), s["record_id"], s.get("url")) for s in sources
+                    ),
+                    accepted=status == FactStatus.ACCEPTED.value,
+                ))
+        return model
+
+    def person(self, key: str, *, from_facts: bool = False, accepted: bool = True) -> PersonRecord:
+        """Return the person for ``key``, creating it on first reference."""
+        person = self.persons.get(key)
+        if person is None:
+            key = _intern(key)
+            full_name, given, surname = parse_person_key(key)
+            person = self.persons[key] = PersonRecord(key, full_name, given, surname)
+        person.from_facts |= from_facts
+        person.accepted |= accepted
+        return person
+
+    def add(self, record: FactRecord) -> None:
+        """Attach one fact to the model."""
+        if record.kind == "relationship":
+            subject = (record.relation_subject or "").strip()
+            obj = (record.relation_object or "").strip()
+            a = self.person(subject, accepted=record.accepted) if subject else None
+            b = self.person(obj, accepted=record.accepted) if obj else None
+            if a is not None and b is not None:
+                kind = _intern((record.relation_kind or "").lower())
+                self.relations.append(RelationRecord(kind, a, b, record))
+        elif record.person_id:
+            self.person(record.person_id, from_facts=True, accepted=record.accepted).facts.append(record)
+        else:
+            self.unlinked.append(record)
+
+    # -------------------------------------------------------------------------
+    # Reading
+    # -------------------------------------------------------------------------
+
+    def iter_persons(self, include_rejected: bool = False) -> Iterator[PersonRecord]:
+        """People in first-seen order; by default only those with accepted facts."""
+        for person in self.persons.values():
+            if person.accepted or include_rejected:
+                yield person
+
+    def iter_relations(self, include_rejected: bool = False) -> Iterator[RelationRecord]:
+        for relation in self.relations:
+            if relation.fact.accepted or include_rejected:
+                yield relation
+
+    @staticmethod
+    def iter_facts(person: PersonRecord, include_rejected: bool = False) -> Iterator[FactRecord]:
+        for fact in person.facts:
+            if fact.accepted or include_rejected:
+                yield fact
+
+
+# =============================================================================
+# Writers
+# =============================================================================
+
+
+class ExportWriter:
+    """Streams a FamilyModel to an open text file.
+
+    Subclasses take their format options as keyword arguments to
+    ``__init__``; ``export_many`` passes each writer only the options its
+    signature names.
+    """
+
+    suffixes: ClassVar[tuple[str, ...]] = ()
+
+    def write(self, model: FamilyModel, fh: TextIO) -> None:
+        raise NotImplementedError
+
+    @classmethod
+    def option_names(cls) -> frozenset[str]:
+        params = inspect.signature(cls.__init__).parameters
+        return frozenset(name for name in params if name != "self")
+
+
+WRITERS: dict[str, type[ExportWriter]] = {}
+
+
+def register_writer(*suffixes: str) -> Callable[[type[ExportWriter]], type[ExportWriter]]:
+    """Class decorator registering a writer for the given file suffixes."""
+
+    def decorator(cls: type[ExportWriter]) -> type[ExportWriter]:
+        cls.suffixes = suffixes
+        for suffix in suffixes:
+            WRITERS[suffix] = cls
+        return cls
+
+    return decorator
+
+
+def writer_for(out_file: Path | str) -> type[ExportWriter] | None:
+    """Writer class registered for a path's suffix, if any."""
+    return WRITERS.get(Path(out_file).suffix.lower())
+
+
+def export_many(
+    source: Path | str | SQLiteProjection,
+    out_files: Iterable[Path | str],
+    **options: Any,
+) -> list[Path]:
+    """Export to several formats from one pass over the facts.
+
+    Args:
+        source: Fact ledger directory, or a SQLiteProjection to read instead
+        out_files: Output paths; each suffix selects a registered writer
+        **options: Format options (``include_sources``, ``pretty``,
+            ``title``, ...). Each writer receives the ones it accepts.
+
+    Returns:
+        Paths of the created files, in the order given
+
+    Raises:
+        ValueError: If a suffix has no registered writer
+        TypeError: If an option is accepted by none of the selected writers
+    """
+    paths = [Path(p) for p in out_files]
+    writer_classes = []
+    for path in paths:
+        cls = writer_for(path)
+        if cls is None:
+            supported = ", ".join(WRITERS)
+            raise ValueError(f"Unsupported format '{path.suffix.lower()}'. Supported: {supported}")
+        writer_classes.append(cls)
+
+    accepted = frozenset().union(*(cls.option_names() for cls in writer_classes))
+    unknown = sorted(set(options) - accepted)
+    if unknown:
+        raise TypeError(f"Unexpected export option(s): {', '.join(unknown)}")
+
+    include_rejected = bool(options.get("include_rejected", False))
+    if isinstance(source, (str, os.PathLike)):
+        model = FamilyModel.from_ledger(source, include_rejected)
+    else:
+        model = FamilyModel.from_projection(source, include_rejected)
+
+    for path, cls in zip(paths, writer_classes, strict=True):
+        names = cls.option_names()
+        writer = cls(**{k: v for k, v in options.items() if k in names})
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8", newline="\n") as fh:
+            writer.write(model, fh)
+    return paths
@@ -3,9 +3,13 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from pathlib import Path
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, TextIO
 
-from gps_agents.ledger.fact_ledger import FactLedger
-from gps_agents.models.fact import Fact, FactStatus
+from gps_agents.export.engine import ExportWriter, FamilyModel, export_many, register_writer
+
+if TYPE_CHECKING:
+    from gps_agents.export.engine import FactRecord
+    from gps_agents.models.fact import Fact
 
 
 @dataclass
@@ -47,7 +51,7 @@ def _name_from_person_key(person_key: str) -> str:
     return f"{given} /{surname}/"
 
 
-def _parse_event_from_fact(fact: Fact) -> tuple[str | None, str | None]:
+def _parse_event_from_fact(fact: Fact | FactRecord) -> tuple[str | None, str | None]:
     stmt = fact.statement
     date = None
     place = None
@@ -59,6 +63,114 @@ def _parse_event_from_fact(fact: Fact) -> tuple[str | None, str | None]:
     return date, place
 
 
+EVENT_TAG_MAP = {"birth": "BIRT", "death": "DEAT", "burial": "BURI"}
+
+
+@register_writer(".ged", ".gedcom")
+class GedcomWriter(ExportWriter):
+    """Streams a FamilyModel as a minimal GEDCOM 5.5 file.
+
+    Note:
+        - Individuals come from person_id keys and relation subjects/objects;
+          both are merged on their GEDCOM display name
+        - Families come from parent_of/child_of/spouse_of facts
+        - Events: BIRT, DEAT, BURI attached to individuals when detected in statements
+    """
+
+    def __init__(self, root_filter: str = "") -> None:
+        self.root_filter = root_filter  # not yet implemented
+
+    def build(self, model: FamilyModel) -> tuple[list[GedcomIndividual], list[GedcomFamily]]:
+        """Assign INDI/FAM ids; only the small family index is kept besides the model."""
+        individuals: dict[str, GedcomIndividual] = {}  # display_name -> GedcomIndividual
+        by_key: dict[str, GedcomIndividual] = {}  # person key -> GedcomIndividual
+        families: dict[tuple[str, str], GedcomFamily] = {}  # (sorted spouse ids) -> GedcomFamily
+
+        for person in model.iter_persons():
+            name = _name_from_person_key(person.key) if person.from_facts else person.key
+            indi = individuals.get(name)
+            if indi is None:
+                indi = individuals[name] = GedcomIndividual(indi_id=f"@I{len(individuals) + 1}@", name=name)
+            by_key[person.key] = indi
+            for fact in model.iter_facts(person):
+                tag = EVENT_TAG_MAP.get(fact.kind)
+                if tag:
+                    date, place = _parse_event_from_fact(fact)
+                    indi.events.append(GedcomEvent(tag=tag, date=date, place=place))
+
+        def _ensure_family(spouse1_id: str, spouse2_id: str | None = None) -> GedcomFamily:
+            # Create a consistent key (sorted for spouse pairs, single for single-parent)
+            if spouse2_id and spouse1_id != spouse2_id:
+                key = tuple(sorted([spouse1_id, spouse2_id]))
+            else:
+                key = (spouse1_id, spouse1_id)
+            fam = families.get(key)
+            if fam is None:
+                fam = families[key] = GedcomFamily(fam_id=f"@F{len(families) + 1}@", husb_id=key[0])
+                if key[1] != key[0]:
+                    fam.wife_id = key[1]
+            return fam
+
+        for rel in model.iter_relations():
+            a, b = by_key[rel.subject.key], by_key[rel.object.key]
+            if rel.kind == "spouse_of":
+                fam = _ensure_family(a.indi_id, b.indi_id)
+                a.fams_ids.add(fam.fam_id)
+                b.fams_ids.add(fam.fam_id)
+            elif rel.kind == "parent_of":
+                # Parent is 'a', child is 'b'
+                fam = _ensure_family(a.indi_id)
+                fam.child_ids.add(b.indi_id)
+                b.famc_ids.add(fam.fam_id)
+            elif rel.kind == "child_of":
+                # Child is 'a', parent is 'b'
+                fam = _ensure_family(b.indi_id)
+                fam.child_ids.add(a.indi_id)
+                a.famc_ids.add(fam.fam_id)
+
+        return list(individuals.values()), list(families.values())
+
+    def write(self, model: FamilyModel, fh: TextIO) -> None:
+        individuals, families = self.build(model)
+
+        fh.write(
+            "0 HEAD\n"
+            "1 SOUR gps-genealogy-agents\n"
+            f"1 DATE {datetime.now(UTC).strftime('%d %b %Y').upper()}\n"
+            "1 GEDC\n"
+            "2 VERS 5.5\n"
+            "2 FORM LINEAGE-LINKED\n"
+            "1 CHAR UTF-8\n"
+        )
+
+        for indi in individuals:
+            lines = [f"0 {indi.indi_id} INDI", f"1 NAME {indi.name}"]
+            for event in indi.events:
+                lines.append(f"1 {event.tag}")
+                if event.date:
+                    lines.append(f"2 DATE {event.date}")
+                if event.place:
+                    lines.append(f"2 PLAC {event.place}")
+            lines.extend(f"1 FAMS {fam_id}" for fam_id in sorted(indi.fams_ids, key=_xref_order))
+            lines.extend(f"1 FAMC {fam_id}" for fam_id in sorted(indi.famc_ids, key=_xref_order))
+            fh.write("\n".join(lines) + "\n")
+
+        for fam in families:
+            lines = [f"0 {fam.fam_id} FAM"]
+            if fam.husb_id:
+                lines.append(f"1 HUSB {fam.husb_id}")
+            if fam.wife_id:
+                lines.append(f"1 WIFE {fam.wife_id}")
+            lines.extend(f"1 CHIL {child_id}" for child_id in sorted(fam.child_ids, key=_xref_order))
+            fh.write("\n".join(lines) + "\n")
+
+        fh.write("0 TRLR\n")
+
+
+def _xref_order(xref: str) -> int:
+    return int(xref[2:-1])
+
+
 def export_gedcom(ledger_dir: Path, out_file: Path, root_filter: str = "") -> Path:
     """Export ACCEPTED facts and relationships to a minimal GEDCOM 5.5 file.
 
@@ -70,148 +182,7 @@ def export_gedcom(ledger_dir: Path, out_file: Path, root_filter: str = "") -> Pa
     Returns:
         Path to the created GEDCOM file
 
-    Note:
-        - Individuals created from person_id keys and from relation subjects/objects
-        - Families created from parent_of/child_of/spouse_of facts
-        - Events: BIRT, DEAT, BURI attached to individuals when detected in statements
+    See ``GedcomWriter``; use ``export_many`` to write GEDCOM alongside
+    other formats from the same ledger pass.
     """
-    ledger = FactLedger(str(ledger_dir))
-
-    # Build data structures in memory first
-    individuals: dict[str, GedcomIndividual] = {}  # display_name -> GedcomIndividual
-    families: dict[tuple[str, str], GedcomFamily] = {}  # (sorted spouse ids) -> GedcomFamily
-    fam_id_to_family: dict[str, GedcomFamily] = {}  # fam_id -> GedcomFamily (reverse lookup)
-    name_to_id: dict[str, str] = {}  # display_name -> indi_id
-    id_to_indi: dict[str, GedcomIndividual] = {}  # indi_id -> GedcomIndividual (reverse lookup)
-
-    def _ensure_indi(display_name: str) -> str:
-        if display_name not in name_to_id:
-            indi_id = f"@I{len(name_to_id) + 1}@"
-            name_to_id[display_name] = indi_id
-            indi = GedcomIndividual(indi_id=indi_id, name=display_name)
-            individuals[display_name] = indi
-            id_to_indi[indi_id] = indi  # Populate reverse lookup
-        return name_to_id[display_name]
-
-    def _ensure_family(spouse1_id: str, spouse2_id: str | None = None) -> str:
-        # Create a consistent key (sorted for spouse pairs, single for single-parent)
-        if spouse2_id and spouse1_id != spouse2_id:
-            key = tuple(sorted([spouse1_id, spouse2_id]))
-        else:
-            key = (spouse1_id, spouse1_id)
-
-        if key not in families:
-            fam_id = f"@F{len(families) + 1}@"
-            fam = GedcomFamily(fam_id=fam_id)
-            families[key] = fam
-            fam_id_to_family[fam_id] = fam  # Populate reverse lookup
-            # Set spouses
-            if spouse2_id and spouse1_id != spouse2_id:
-                fam.husb_id = key[0]
-                fam.wife_id = key[1]
-            else:
-                fam.husb_id = spouse1_id
-        return families[key].fam_id
-
-    # Single-pass processing: create individuals, families, and events in one iteration
-    # Map fact types to GEDCOM tags for event processing
-    EVENT_TAG_MAP = {"birth": "BIRT", "death": "DEAT", "burial": "BURI"}
-
-    for fact in ledger.iter_all_facts(FactStatus.ACCEPTED):
-        fact_type = (fact.fact_type or "").lower()
-
-        if fact_type == "relationship":
-            # Process relationship: create individuals and families
-            a = (fact.relation_subject or "").strip()
-            b = (fact.relation_object or "").strip()
-
-            # Ensure both individuals exist
-            if a:
-                _ensure_indi(a)
-            if b:
-                _ensure_indi(b)
-
-            # Create family relationships if both parties present
-            if a and b:
-                ia = name_to_id[a]
-                ib = name_to_id[b]
-                kind = (fact.relation_kind or "").lower()
-
-                if kind == "spouse_of":
-                    fam_id = _ensure_family(ia, ib)
-                    # Add FAMS pointers to both spouses (O(1) set operations)
-                    id_to_indi[ia].fams_ids.add(fam_id)
-                    id_to_indi[ib].fams_ids.add(fam_id)
-
-                elif kind == "parent_of":
-                    # Parent is 'a', child is 'b' (O(1) set operations)
-                    fam_id = _ensure_family(ia)
-                    fam_id_to_family[fam_id].child_ids.add(ib)
-                    id_to_indi[ib].famc_ids.add(fam_id)
-
-                elif kind == "child_of":
-                    # Child is 'a', parent is 'b' (O(1) set operations)
-                    fam_id = _ensure_family(ib)
-                    fam_id_to_family[fam_id].child_ids.add(ia)
-                    id_to_indi[ia].famc_ids.add(fam_id)
-
-        elif fact.person_id:
-            # Process person fact: create individual and attach events
-            nm = _name_from_person_key(fact.person_id)
-            _ensure_indi(nm)
-
-            # Check if this fact type maps to a GEDCOM event tag
-            tag = EVENT_TAG_MAP.get(fact_type)
-            if tag:
-                date, place = _parse_event_from_fact(fact)
-                individuals[nm].events.append(GedcomEvent(tag=tag, date=date, place=place))
-
-    # Now emit the GEDCOM file
-    lines: list[str] = []
-
-    # Header
-    lines.append("0 HEAD")
-    lines.append("1 SOUR gps-genealogy-agents")
-    lines.append(f"1 DATE {datetime.now(UTC).strftime('%d %b %Y').upper()}")
-    lines.append("1 GEDC")
-    lines.append("2 VERS 5.5")
-    lines.append("2 FORM LINEAGE-LINKED")
-    lines.append("1 CHAR UTF-8")
-
-    # Emit INDI records
-    for name, indi in individuals.items():
-        lines.append(f"0 {indi.indi_id} INDI")
-        lines.append(f"1 NAME {indi.name}")
-
-        # Emit events nested under INDI
-        for event in indi.events:
-            lines.append(f"1 {event.tag}")
-            if event.date:
-                lines.append(f"2 DATE {event.date}")
-            if event.place:
-                lines.append(f"2 PLAC {event.place}")
-
-        # Emit FAMS pointers (families where this person is a spouse)
-        for fam_id in indi.fams_ids:
-            lines.append(f"1 FAMS {fam_id}")
-
-        # Emit FAMC pointers (families where this person is a child)
-        for fam_id in indi.famc_ids:
-            lines.append(f"1 FAMC {fam_id}")
-
-    # Emit FAM records
-    for key, fam in families.items():
-        lines.append(f"0 {fam.fam_id} FAM")
-        if fam.husb_id:
-            lines.append(f"1 HUSB {fam.husb_id}")
-        if fam.wife_id:
-            lines.append(f"1 WIFE {fam.wife_id}")
-        for child_id in fam.child_ids:
-            lines.append(f"1 CHIL {child_id}")
-
-    # Trailer
-    lines.append("0 TRLR")
-
-    out_file.parent.mkdir(parents=True, exist_ok=True)
-    out_file.write_text("\n".join(lines), encoding="utf-8")
-    return out_file
+    return export_many(ledger_dir, [out_file], root_filter=root_filter)[0]
@@ -19,10 +19,18 @@ import xml.etree.ElementTree as ET
 from datetime import UTC, datetime
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, TextIO
+from xml.sax.saxutils import escape
 
-from gps_agents.ledger.fact_ledger import FactLedger
-from gps_agents.models.fact import FactStatus
+from gps_agents.export.engine import (
+    ExportWriter,
+    FamilyModel,
+    PersonRecord,
+    RelationRecord,
+    export_many,
+    parse_person_key,
+    register_writer,
+)
 
 
 @dataclass
@@ -48,19 +56,7 @@ class GraphEdge:
 
 def _parse_person_key(person_key: str) -> tuple[str, str | None, str | None]:
     """Parse person_id key into name components."""
-    parts = person_key.split("|")
-    name_part = parts[0].strip() if parts else ""
-
-    if not name_part:
-        return "Unknown", None, None
-
-    name_parts = name_part.split()
-    if len(name_parts) == 1:
-        return name_part, name_part, None
-    else:
-        given = " ".join(name_parts[:-1])
-        surname = name_parts[-1]
-        return name_part, given, surname
+    return parse_person_key(person_key)
 
 
 def _sanitize_id(s: str) -> str:
@@ -73,6 +69,154 @@ def _sanitize_id(s: str) -> str:
     return sanitized or "unknown"
 
 
+GRAPHML_NS = "http://graphml.graphdrawing.org/xmlns"
+
+# (id, for, attr.name, attr.type)
+GRAPHML_KEYS = (
+    ("label", "node", "label", "string"),
+    ("node_type", "node", "node_type", "string"),
+    ("given_name", "node", "given_name", "string"),
+    ("surname", "node", "surname", "string"),
+    ("full_key", "node", "full_key", "string"),
+    ("birth", "node", "birth", "string"),
+    ("death", "node", "death", "string"),
+    ("burial", "node", "burial", "string"),
+    ("occupation", "node", "occupation", "string"),
+    ("event_type", "node", "event_type", "string"),
+    ("statement", "node", "statement", "string"),
+    ("edge_type", "edge", "edge_type", "string"),
+    ("edge_label", "edge", "label", "string"),
+)
+WEIGHT_KEY = ("weight", "edge", "weight", "double")
+
+NODE_FACT_TYPES = ("birth", "death", "burial", "occupation")
+EVENT_FACT_TYPES = ("birth", "death", "burial", "marriage")
+
+
+@register_writer(".graphml")
+class GraphMLWriter(ExportWriter):
+    """Streams a FamilyModel as GraphML.
+
+    Person nodes are written straight from the model; family and event nodes
+    and all edges are produced on the fly, so no XML tree is built.
+    """
+
+    def __init__(self, include_families: bool = True, include_events: bool = False, edge_weights: bool = True) -> None:
+        self.include_families = include_families
+        self.include_events = include_events
+        self.edge_weights = edge_weights
+
+    def write(self, model: FamilyModel, fh: TextIO) -> None:
+        # Distinct keys can sanitize to the same node id; such people share a node.
+        nodes: dict[str, list[PersonRecord]] = {}
+        for person in model.iter_persons():
+            nodes.setdefault(_sanitize_id(person.key), []).append(person)
+
+        fh.write("<?xml version='1.0' encoding='utf-8'?>\n")
+        fh.write(
+            f'<graphml xmlns="{GRAPHML_NS}" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+            f'xsi:schemaLocation="{GRAPHML_NS} {GRAPHML_NS}/1.0/graphml.xsd">\n'
+        )
+        fh.write(f"  <!--Generated by gps-genealogy-agents on {datetime.now(UTC).isoformat()}-->\n")
+        keys = GRAPHML_KEYS + ((WEIGHT_KEY,) if self.edge_weights else ())
+        fh.writelines(
+            f'  <key id="{key_id}" for="{domain}" attr.name="{name}" attr.type="{attr_type}" />\n'
+            for key_id, domain, name, attr_type in keys
+        )
+        fh.write('  <graph id="family_tree" edgedefault="directed">\n')
+
+        edge_count = 0
+
+        def edge(source: str, target: str, edge_type: str, label: str, weight: float | None = None) -> None:
+            nonlocal edge_count
+            data = {"edge_type": edge_type, "edge_label": label}
+            if self.edge_weights and weight is not None:
+                data["weight"] = str(weight)
+            _write_element(fh, "edge", {"id": f"e{edge_count}", "source": source, "target": target}, data)
+            edge_count += 1
+
+        written = set(nodes)
+        events: list[tuple[str, str, str]] = []  # (person node, event node, event type)
+        for node_id, people in nodes.items():
+            person = people[0]
+            attributes = {
+                "label": person.name,
+                "node_type": "person",
+                "given_name": person.given_name or "",
+                "surname": person.surname or "",
+                "full_key": person.key,
+            }
+            for other in people:
+                for fact in model.iter_facts(other):
+                    if fact.kind in NODE_FACT_TYPES:
+                        attributes[fact.kind] = fact.statement
+            _write_element(fh, "node", {"id": node_id}, attributes)
+
+            if self.include_events:
+                for other in people:
+                    for fact in model.iter_facts(other):
+                        kind = fact.kind
+                        event_id = f"event_{node_id}_{kind}"
+                        if kind in EVENT_FACT_TYPES and event_id not in written:
+                            written.add(event_id)
+                            _write_element(fh, "node", {"id": event_id}, {
+                                "label": f"{kind.title()}: {fact.statement[:30]}...",
+                                "node_type": "event",
+                                "event_type": kind,
+                                "statement": fact.statement,
+                            })
+                            events.append((node_id, event_id, kind))
+
+        relations = list(model.iter_relations())
+        if self.include_families:
+            for rel in relations:
+                if rel.kind == "spouse_of":
+                    fam_id = _family_id(rel)
+                    if fam_id not in written:
+                        written.add(fam_id)
+                        _write_element(fh, "node", {"id": fam_id}, {"label": "Family", "node_type": "family"})
+
+        for person_node, event_id, kind in events:
+            edge(person_node, event_id, "has_event", kind)
+
+        for rel in relations:
+            subject_id, object_id = _sanitize_id(rel.subject.key), _sanitize_id(rel.object.key)
+            weight = rel.fact.confidence
+            if self.include_families and rel.kind in ("parent_of", "spouse_of", "child_of"):
+                if rel.kind == "spouse_of":
+                    # Both spouses connect to the family node
+                    fam_id = _family_id(rel)
+                    edge(subject_id, fam_id, "spouse", "spouse", weight)
+                    edge(object_id, fam_id, "spouse", "spouse", weight)
+                elif rel.kind == "parent_of":
+                    edge(subject_id, object_id, "parent_of", "parent", weight)
+                else:
+                    # Child -> parent is reversed
+                    edge(object_id, subject_id, "parent_of", "parent", weight)
+            else:
+                edge(subject_id, object_id, rel.kind, rel.kind.replace("_", " "), weight)
+
+        fh.write("  </graph>\n</graphml>\n")
+
+
+def _family_id(rel: RelationRecord) -> str:
+    key = sorted([_sanitize_id(rel.subject.key), _sanitize_id(rel.object.key)])
+    return f"fam_{key[0]}_{key[1]}"
+
+
+def _write_element(fh: TextIO, tag: str, attrs: dict[str, str], data: dict[str, str]) -> None:
+    """Write one node/edge element with its non-empty <data> children.
+
+    Attribute values are ids from ``_sanitize_id`` and need no quoting.
+    """
+    attr_text = " ".join(f'{name}="{value}"' for name, value in attrs.items())
+    fh.write(f"    <{tag} {attr_text}>\n")
+    for key, value in data.items():
+        if value:
+            fh.write(f'      <data key="{key}">{escape(value)}</data>\n')
+    fh.write(f"    </{tag}>\n")
+
+
 def export_graphml(
     ledger_dir: Path,
     out_file: Path,
@@ -92,150 +236,13 @@ def export_graphml(
     Returns:
         Path to the created GraphML file
     """
-    ledger = FactLedger(str(ledger_dir))
-
-    nodes: dict[str, GraphNode] = {}
-    edges: list[GraphEdge] = []
-
-    def _ensure_person_node(person_key: str) -> str:
-        """Ensure person node exists and return ID."""
-        node_id = _sanitize_id(person_key)
-        if node_id not in nodes:
-            full_name, given, surname = _parse_person_key(person_key)
-            nodes[node_id] = GraphNode(
-                id=node_id,
-                label=full_name,
-                node_type="person",
-                attributes={
-                    "given_name": given or "",
-                    "surname": surname or "",
-                    "full_key": person_key,
-                },
-            )
-        return node_id
-
-    family_counter = 0
-
-    def _ensure_family_node(spouse1_id: str, spouse2_id: str | None = None) -> str:
-        """Create family node for spouse grouping."""
-        nonlocal family_counter
-
-        # Create unique family key
-        if spouse2_id:
-            key = tuple(sorted([spouse1_id, spouse2_id]))
-            fam_id = f"fam_{key[0]}_{key[1]}"
-        else:
-            fam_id = f"fam_{spouse1_id}_{family_counter}"
-            family_counter += 1
-
-        if fam_id not in nodes:
-            nodes[fam_id] = GraphNode(
-                id=fam_id,
-                label="Family",
-                node_type="family",
-                attributes={},
-            )
-
-        return fam_id
-
-    # Process all accepted facts
-    for fact in ledger.iter_all_facts(FactStatus.ACCEPTED):
-        fact_type = (fact.fact_type or "").lower()
-
-        if fact_type == "relationship":
-            subject = (fact.relation_subject or "").strip()
-            obj = (fact.relation_object or "").strip()
-            kind = (fact.relation_kind or "").lower()
-
-            if subject and obj:
-                subject_id = _ensure_person_node(subject)
-                object_id = _ensure_person_node(obj)
-
-                if include_families and kind in ("parent_of", "spouse_of", "child_of"):
-                    # Create family node for complex relationships
-                    if kind == "spouse_of":
-                        fam_id = _ensure_family_node(subject_id, object_id)
-                        # Both spouses connect to family
-                        edges.append(GraphEdge(
-                            source=subject_id,
-                            target=fam_id,
-                            edge_type="spouse",
-                            label="spouse",
-                            attributes={"weight": str(fact.confidence or 1.0)} if edge_weights else {},
-                        ))
-                        edges.append(GraphEdge(
-                            source=object_id,
-                            target=fam_id,
-                            edge_type="spouse",
-                            label="spouse",
-                            attributes={"weight": str(fact.confidence or 1.0)} if edge_weights else {},
-                        ))
-                    elif kind == "parent_of":
-                        # Direct parent -> child edge
-                        edges.append(GraphEdge(
-                            source=subject_id,
-                            target=object_id,
-                            edge_type="parent_of",
-                            label="parent",
-                            attributes={"weight": str(fact.confidence or 1.0)} if edge_weights else {},
-                        ))
-                    elif kind == "child_of":
-                        # Child -> parent is reversed
-                        edges.append(GraphEdge(
-                            source=object_id,
-                            target=subject_id,
-                            edge_type="parent_of",
-                            label="parent",
-                            attributes={"weight": str(fact.confidence or 1.0)} if edge_weights else {},
-                        ))
-                else:
-                    # Simple direct edge
-                    edges.append(GraphEdge(
-                        source=subject_id,
-                        target=object_id,
-                        edge_type=kind,
-                        label=kind.replace("_", " "),
-                        attributes={"weight": str(fact.confidence or 1.0)} if edge_weights else {},
-                    ))
-
-        elif fact.person_id:
-            person_id = _ensure_person_node(fact.person_id)
-
-            # Add fact data to node attributes
-            if fact_type in ("birth", "death", "burial", "occupation"):
-                nodes[person_id].attributes[fact_type] = fact.statement
-
-            if include_events and fact_type in ("birth", "death", "burial", "marriage"):
-                # Create event node
-                event_id = f"event_{person_id}_{fact_type}"
-                if event_id not in nodes:
-                    nodes[event_id] = GraphNode(
-                        id=event_id,
-                        label=f"{fact_type.title()}: {fact.statement[:30]}...",
-                        node_type="event",
-                        attributes={
-                            "event_type": fact_type,
-                            "statement": fact.statement,
-                        },
-                    )
-                    # Connect person to event
-                    edges.append(GraphEdge(
-                        source=person_id,
-                        target=event_id,
-                        edge_type="has_event",
-                        label=fact_type,
-                    ))
-
-    # Build GraphML XML
-    graphml = _build_graphml(nodes, edges, edge_weights)
-
-    out_file.parent.mkdir(parents=True, exist_ok=True)
-
-    tree = ET.ElementTree(graphml)
-    ET.indent(tree, space="  ")
-    tree.write(out_file, encoding="utf-8", xml_declaration=True)
-
-    return out_file
+    return export_many(
+        ledger_dir,
+        [out_file],
+        include_families=include_families,
+        include_events=include_events,
+        edge_weights=edge_weights,
+    )[0]
 
 
 def _build_graphml(
@@ -245,7 +252,7 @@ def _build_graphml(
 ) -> ET.Element:
     """Build GraphML XML structure."""
     # Namespace
-    ns = "http://graphml.graphdrawing.org/xmlns"
+    ns = GRAPHML_NS
     nsmap = {
         "xmlns": ns,
         "xmlns:xsi": "http://www.w3.org/2001/XMLSchema-instance",
@@ -259,63 +266,13 @@ def _build_graphml(
     root.append(comment)
 
     # Define keys (attribute definitions)
-    # Node attributes
-    ET.SubElement(root, "key", {
-        "id": "label",
-        "for": "node",
-        "attr.name": "label",
-        "attr.type": "string",
-    })
-    ET.SubElement(root, "key", {
-        "id": "node_type",
-        "for": "node",
-        "attr.name": "node_type",
-        "attr.type": "string",
-    })
-    ET.SubElement(root, "key", {
-        "id": "given_name",
-        "for": "node",
-        "attr.name": "given_name",
-        "attr.type": "string",
-    })
-    ET.SubElement(root, "key", {
-        "id": "surname",
-        "for": "node",
-        "attr.name": "surname",
-        "attr.type": "string",
-    })
-    ET.SubElement(root, "key", {
-        "id": "birth",
-        "for": "node",
-        "attr.name": "birth",
-        "attr.type": "string",
-    })
-    ET.SubElement(root, "key", {
-        "id": "death",
-        "for": "node",
-        "attr.name": "death",
-        "attr.type": "string",
-    })
-
-    # Edge attributes
-    ET.SubElement(root, "key", {
-        "id": "edge_type",
-        "for": "edge",
-        "attr.name": "edge_type",
-        "attr.type": "string",
-    })
-    ET.SubElement(root, "key", {
-        "id": "edge_label",
-        "for": "edge",
-        "attr.name": "label",
-        "attr.type": "string",
-    })
-    if include_weights:
+    keys = GRAPHML_KEYS + ((WEIGHT_KEY,) if include_weights else ())
+    for key_id, domain, name, attr_type in keys:
         ET.SubElement(root, "key", {
-            "id": "weight",
-            "for": "edge",
-            "attr.name": "weight",
-            "attr.type": "double",
+            "id": key_id,
+            "for": domain,
+            "attr.name": name,
+            "attr.type": attr_type,
         })
 
     # Create graph element
@@ -8,14 +8,25 @@ Exports facts and relationships to a structured JSON format that can be:
 """
 from __future__ import annotations
 
+import functools
 import json
 from datetime import UTC, datetime
 from pathlib import Path
-from dataclasses import dataclass, field, asdict
-from typing import Any
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, TextIO
 
-from gps_agents.ledger.fact_ledger import FactLedger
-from gps_agents.models.fact import Fact, FactStatus
+from gps_agents.export.engine import (
+    ExportWriter,
+    FactRecord,
+    FamilyModel,
+    PersonRecord,
+    export_many,
+    parse_person_key,
+    register_writer,
+)
+
+if TYPE_CHECKING:
+    from gps_agents.models.fact import Fact
 
 
 @dataclass
@@ -67,38 +78,122 @@ def _parse_person_key(person_key: str) -> tuple[str, str | None, str | None]:
     Returns:
         Tuple of (full_name, given_name, surname)
     """
-    parts = person_key.split("|")
-    name_part = parts[0].strip() if parts else ""
+    return parse_person_key(person_key)
 
-    if not name_part:
-        return "Unknown", None, None
 
-    name_parts = name_part.split()
-    if len(name_parts) == 1:
-        return name_part, name_part, None
-    else:
-        given = " ".join(name_parts[:-1])
-        surname = name_parts[-1]
-        return name_part, given, surname
+def _fact_to_dict(fact: Fact | FactRecord) -> dict[str, Any]:
+    """Convert a Fact to a dictionary."""
+    if not isinstance(fact, FactRecord):
+        fact = FactRecord.from_fact(fact)
+    return fact.as_dict()
 
 
-def _fact_to_dict(fact: Fact) -> dict[str, Any]:
-    """Convert a Fact to a dictionary."""
-    return {
-        "id": fact.fact_id,
-        "type": fact.fact_type,
-        "statement": fact.statement,
-        "person_id": fact.person_id,
-        "relation_subject": fact.relation_subject,
-        "relation_object": fact.relation_object,
-        "relation_kind": fact.relation_kind,
-        "confidence": fact.confidence,
-        "sources": [
-            {"id": s.source_id, "url": s.url, "title": s.title}
-            for s in (fact.sources or [])
-        ],
-        "created_at": fact.created_at.isoformat() if fact.created_at else None,
-    }
+@register_writer(".json")
+class JsonWriter(ExportWriter):
+    """Streams a FamilyModel as JSON, one person/relationship at a time.
+
+    The output is byte-for-byte what ``json.dump`` of the whole
+    ``FamilyTreeExport`` would produce, without building it in memory.
+    """
+
+    def __init__(self, include_sources: bool = True, include_rejected: bool = False, pretty: bool = True) -> None:
+        self.include_sources = include_sources
+        self.include_rejected = include_rejected
+        self.pretty = pretty
+
+    def write(self, model: FamilyModel, fh: TextIO) -> None:
+        person_ids: dict[str, str] = {}
+        for person in model.iter_persons(self.include_rejected):
+            person_ids[person.key] = f"P{len(person_ids) + 1}"
+        relations = list(model.iter_relations(self.include_rejected))
+
+        metadata = {
+            "generator": "gps-genealogy-agents",
+            "version": "0.2.0",
+            "export_date": datetime.now(UTC).isoformat(),
+            "total_persons": len(person_ids),
+            "total_relationships": len(relations),
+            "include_rejected": self.include_rejected,
+        }
+        persons = (
+            self._person(model, person, person_ids[person.key])
+            for person in model.iter_persons(self.include_rejected)
+        )
+        # vars() rather than asdict(): the nested values are already plain
+        # dicts and lists, so asdict's recursive deep copy is pure overhead.
+        relationships = (
+            vars(RelationshipExport(
+                type=rel.kind,
+                subject_id=person_ids[rel.subject.key],
+                object_id=person_ids[rel.object.key],
+                confidence=rel.fact.confidence,
+                sources=[s.as_dict() for s in rel.fact.sources] if self.include_sources else [],
+            ))
+            for rel in relations
+        )
+        unlinked = (
+            fact.as_dict() for fact in model.unlinked if fact.accepted or self.include_rejected
+        )
+        _stream_object(fh, [
+            ("metadata", metadata),
+            ("persons", persons),
+            ("relationships", relationships),
+            ("unlinked_facts", unlinked),
+        ], self.pretty)
+
+    def _person(self, model: FamilyModel, person: PersonRecord, person_id: str) -> dict[str, Any]:
+        export = PersonExport(
+            id=person_id,
+            name=person.name,
+            given_name=person.given_name,
+            surname=person.surname,
+        )
+        for fact in model.iter_facts(person, self.include_rejected):
+            export.facts.append(fact.as_dict())
+            kind = fact.kind
+            if kind == "birth":
+                export.birth_date = _extract_date(fact.statement)
+                export.birth_place = _extract_place(fact.statement)
+            elif kind == "death":
+                export.death_date = _extract_date(fact.statement)
+                export.death_place = _extract_place(fact.statement)
+            elif kind == "occupation":
+                export.occupation = fact.statement
+            if self.include_sources:
+                export.sources.extend(s.as_dict() for s in fact.sources)
+        return vars(export)
+
+
+def _stream_object(fh: TextIO, members: list[tuple[str, Any]], pretty: bool) -> None:
+    """Write a top-level JSON object whose iterator members are streamed.
+
+    Matches ``json.dump(obj, indent=2 if pretty else None, ensure_ascii=False)``.
+    """
+    dumps = functools.partial(json.dumps, ensure_ascii=False, indent=2 if pretty else None)
+    # JSON strings never contain raw newlines, so re-indenting nested
+    # values is a plain replace.
+    member_sep, item_sep = (",\n  ", ",\n    ") if pretty else (", ", ", ")
+    fh.write("{\n  " if pretty else "{")
+    for i, (key, value) in enumerate(members):
+        if i:
+            fh.write(member_sep)
+        fh.write(f"{json.dumps(key)}: ")
+        if isinstance(value, dict):
+            fh.write(dumps(value).replace("\n", "\n  ") if pretty else dumps(value))
+            continue
+        empty = True
+        for item in value:
+            if empty:
+                fh.write("[\n    " if pretty else "[")
+                empty = False
+            else:
+                fh.write(item_sep)
+            fh.write(dumps(item).replace("\n", "\n    ") if pretty else dumps(item))
+        if empty:
+            fh.write("[]")
+        else:
+            fh.write("\n  ]" if pretty else "]")
+    fh.write("\n}" if pretty else "}")
 
 
 def export_json(
@@ -120,120 +215,13 @@ def export_json(
     Returns:
         Path to the created JSON file
     """
-    ledger = FactLedger(str(ledger_dir))
-
-    persons: dict[str, PersonExport] = {}
-    relationships: list[RelationshipExport] = []
-    unlinked_facts: list[dict[str, Any]] = []
-
-    def _ensure_person(person_key: str) -> str:
-        """Ensure person exists in export and return ID."""
-        if person_key not in persons:
-            full_name, given, surname = _parse_person_key(person_key)
-            person_id = f"P{len(persons) + 1}"
-            persons[person_key] = PersonExport(
-                id=person_id,
-                name=full_name,
-                given_name=given,
-                surname=surname,
-            )
-        return persons[person_key].id
-
-    # Process all accepted facts
-    statuses = [FactStatus.ACCEPTED]
-    if include_rejected:
-        statuses.append(FactStatus.REJECTED)
-
-    for status in statuses:
-        for fact in ledger.iter_all_facts(status):
-            fact_type = (fact.fact_type or "").lower()
-
-            if fact_type == "relationship":
-                # Process relationship
-                subject = (fact.relation_subject or "").strip()
-                obj = (fact.relation_object or "").strip()
-                kind = (fact.relation_kind or "").lower()
-
-                if subject and obj:
-                    subject_id = _ensure_person(subject)
-                    object_id = _ensure_person(obj)
-
-                    rel = RelationshipExport(
-                        type=kind,
-                        subject_id=subject_id,
-                        object_id=object_id,
-                        confidence=fact.confidence or 1.0,
-                    )
-                    if include_sources and fact.sources:
-                        rel.sources = [
-                            {"id": s.source_id, "url": s.url, "title": s.title}
-                            for s in fact.sources
-                        ]
-                    relationships.append(rel)
-
-            elif fact.person_id:
-                # Person fact
-                person_key = fact.person_id
-                _ensure_person(person_key)
-                person = persons[person_key]
-
-                # Add fact data
-                person.facts.append(_fact_to_dict(fact))
-
-                # Extract specific fact types
-                if fact_type == "birth":
-                    person.birth_date = _extract_date(fact.statement)
-                    person.birth_place = _extract_place(fact.statement)
-                elif fact_type == "death":
-                    person.death_date = _extract_date(fact.statement)
-                    person.death_place = _extract_place(fact.statement)
-                elif fact_type == "occupation":
-                    person.occupation = fact.statement
-
-                if include_sources and fact.sources:
-                    for src in fact.sources:
-                        person.sources.append({
-                            "id": src.source_id,
-                            "url": src.url,
-                            "title": src.title,
-                        })
-
-            else:
-                # Unlinked fact
-                unlinked_facts.append(_fact_to_dict(fact))
-
-    # Build export structure
-    export = FamilyTreeExport(
-        metadata={
-            "generator": "gps-genealogy-agents",
-            "version": "0.2.0",
-            "export_date": datetime.now(UTC).isoformat(),
-            "total_persons": len(persons),
-            "total_relationships": len(relationships),
-            "include_rejected": include_rejected,
-        },
-        persons=list(persons.values()),
-        relationships=relationships,
-        unlinked_facts=unlinked_facts,
-    )
-
-    # Convert to JSON
-    export_dict = {
-        "metadata": export.metadata,
-        "persons": [asdict(p) for p in export.persons],
-        "relationships": [asdict(r) for r in export.relationships],
-        "unlinked_facts": export.unlinked_facts,
-    }
-
-    out_file.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(out_file, "w", encoding="utf-8") as f:
-        if pretty:
-            json.dump(export_dict, f, indent=2, ensure_ascii=False)
-        else:
-            json.dump(export_dict, f, ensure_ascii=False)
-
-    return out_file
+    return export_many(
+        ledger_dir,
+        [out_file],
+        include_sources=include_sources,
+        include_rejected=include_rejected,
+        pretty=pretty,
+    )[0]
 
 
 def _extract_date(statement: str) -> str | None:
@@ -12,10 +12,20 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any, TextIO
 
-from gps_agents.ledger.fact_ledger import FactLedger
-from gps_agents.models.fact import Fact, FactStatus
+from gps_agents.export.engine import (
+    ExportWriter,
+    FamilyModel,
+    PersonRecord,
+    export_many,
+    parse_person_key,
+    register_writer,
+)
+
+if TYPE_CHECKING:
+    from gps_agents.export.engine import FactRecord
+    from gps_agents.models.fact import Fact
 
 
 @dataclass
@@ -26,7 +36,7 @@ class MarkdownPerson:
     name: str
     given_name: str | None = None
     surname: str | None = None
-    facts: list[Fact] = field(default_factory=list)
+    facts: list[Fact | FactRecord] = field(default_factory=list)
     parents: list[str] = field(default_factory=list)
     spouses: list[str] = field(default_factory=list)
     children: list[str] = field(default_factory=list)
@@ -34,19 +44,7 @@ class MarkdownPerson:
 
 def _parse_person_key(person_key: str) -> tuple[str, str | None, str | None]:
     """Parse person_id key into name components."""
-    parts = person_key.split("|")
-    name_part = parts[0].strip() if parts else ""
-
-    if not name_part:
-        return "Unknown", None, None
-
-    name_parts = name_part.split()
-    if len(name_parts) == 1:
-        return name_part, name_part, None
-    else:
-        given = " ".join(name_parts[:-1])
-        surname = name_parts[-1]
-        return name_part, given, surname
+    return parse_person_key(person_key)
 
 
 def _format_date(date_str: str | None) -> str:
@@ -56,7 +54,7 @@ def _format_date(date_str: str | None) -> str:
     return date_str
 
 
-def _fact_to_markdown(fact: Fact) -> str:
+def _fact_to_markdown(fact: Fact | FactRecord) -> str:
     """Convert a fact to Markdown text."""
     lines = []
     fact_type = (fact.fact_type or "").title()
@@ -72,6 +70,115 @@ def _fact_to_markdown(fact: Fact) -> str:
     return "\n".join(lines)
 
 
+@register_writer(".md", ".markdown")
+class MarkdownWriter(ExportWriter):
+    """Streams a FamilyModel as a Markdown document, one person at a time."""
+
+    def __init__(
+        self,
+        title: str = "Family Tree",
+        include_sources: bool = True,
+        include_table_of_contents: bool = True,
+        group_by_surname: bool = True,
+    ) -> None:
+        self.title = title
+        self.include_sources = include_sources
+        self.include_table_of_contents = include_table_of_contents
+        self.group_by_surname = group_by_surname
+
+    def write(self, model: FamilyModel, fh: TextIO) -> None:
+        # key -> (parents, spouses, children)
+        links: dict[str, tuple[list[str], list[str], list[str]]] = {}
+
+        def _links(key: str) -> tuple[list[str], list[str], list[str]]:
+            if key not in links:
+                links[key] = ([], [], [])
+            return links[key]
+
+        for rel in model.iter_relations():
+            subject, obj = rel.subject.key, rel.object.key
+            if rel.kind == "parent_of":
+                _links(subject)[2].append(obj)
+                _links(obj)[0].append(subject)
+            elif rel.kind == "child_of":
+                _links(subject)[0].append(obj)
+                _links(obj)[2].append(subject)
+            elif rel.kind == "spouse_of":
+                if obj not in _links(subject)[1]:
+                    links[subject][1].append(obj)
+                if subject not in _links(obj)[1]:
+                    links[obj][1].append(subject)
+
+        persons = list(model.iter_persons())
+        surnames = {p.surname for p in persons if p.surname}
+
+        def emit(lines: list[str]) -> None:
+            fh.write("\n".join(lines) + "\n")
+
+        # Header and statistics
+        emit([
+            f"# {self.title}",
+            "",
+            f"*Generated by gps-genealogy-agents on {datetime.now(UTC).strftime('%Y-%m-%d')}*",
+            "",
+            "## Summary",
+            "",
+            f"- **Total Individuals**: {len(persons)}",
+            f"- **Distinct Surnames**: {len(surnames)}",
+            "",
+        ])
+
+        # Table of Contents
+        if self.include_table_of_contents:
+            lines = ["## Table of Contents", ""]
+            if self.group_by_surname:
+                for surname in sorted(surnames):
+                    safe_anchor = surname.lower().replace(" ", "-")
+                    lines.append(f"- [{surname}](#{safe_anchor})")
+            else:
+                for person in sorted(persons, key=lambda p: p.name):
+                    safe_anchor = person.name.lower().replace(" ", "-").replace("/", "")
+                    lines.append(f"- [{person.name}](#{safe_anchor})")
+            lines.append("")
+            emit(lines)
+
+        # Person entries
+        emit(["## Individuals", ""])
+
+        def emit_person(person: PersonRecord) -> None:
+            parents, spouses, children = links.get(person.key, ([], [], []))
+            entry = MarkdownPerson(
+                key=person.key,
+                name=person.name,
+                given_name=person.given_name,
+                surname=person.surname,
+                facts=list(model.iter_facts(person)),
+                parents=parents,
+                spouses=spouses,
+                children=children,
+            )
+            emit([*_person_to_markdown(entry, self.include_sources), ""])
+
+        if self.group_by_surname:
+            by_surname: dict[str, list[PersonRecord]] = {}
+            for person in persons:
+                by_surname.setdefault(person.surname or "Unknown", []).append(person)
+
+            for surname in sorted(by_surname):
+                emit([f"### {surname}", ""])
+                for person in sorted(by_surname[surname], key=lambda p: p.name):
+                    emit_person(person)
+        else:
+            for person in sorted(persons, key=lambda p: p.name):
+                emit_person(person)
+
+        # Footer
+        fh.write(
+            "---\n\n"
+            "*This document was generated using [GPS Genealogy Agents](https://github.com/thomasvincent/gps-genealogy-agents)*\n"
+        )
+
+
 def export_markdown(
     ledger_dir: Path,
     out_file: Path,
@@ -93,120 +200,14 @@ def export_markdown(
     Returns:
         Path to the created Markdown file
     """
-    ledger = FactLedger(str(ledger_dir))
-
-    persons: dict[str, MarkdownPerson] = {}
-
-    def _ensure_person(person_key: str) -> MarkdownPerson:
-        """Ensure person exists and return it."""
-        if person_key not in persons:
-            full_name, given, surname = _parse_person_key(person_key)
-            persons[person_key] = MarkdownPerson(
-                key=person_key,
-                name=full_name,
-                given_name=given,
-                surname=surname,
-            )
-        return persons[person_key]
-
-    # Process all accepted facts
-    for fact in ledger.iter_all_facts(FactStatus.ACCEPTED):
-        fact_type = (fact.fact_type or "").lower()
-
-        if fact_type == "relationship":
-            subject = (fact.relation_subject or "").strip()
-            obj = (fact.relation_object or "").strip()
-            kind = (fact.relation_kind or "").lower()
-
-            if subject and obj:
-                subject_person = _ensure_person(subject)
-                obj_person = _ensure_person(obj)
-
-                if kind == "parent_of":
-                    subject_person.children.append(obj)
-                    obj_person.parents.append(subject)
-                elif kind == "child_of":
-                    subject_person.parents.append(obj)
-                    obj_person.children.append(subject)
-                elif kind == "spouse_of":
-                    if obj not in subject_person.spouses:
-                        subject_person.spouses.append(obj)
-                    if subject not in obj_person.spouses:
-                        obj_person.spouses.append(subject)
-
-        elif fact.person_id:
-            person = _ensure_person(fact.person_id)
-            person.facts.append(fact)
-
-    # Generate Markdown
-    lines: list[str] = []
-
-    # Header
-    lines.append(f"# {title}")
-    lines.append("")
-    lines.append(f"*Generated by gps-genealogy-agents on {datetime.now(UTC).strftime('%Y-%m-%d')}*")
-    lines.append("")
-
-    # Statistics
-    lines.append("## Summary")
-    lines.append("")
-    lines.append(f"- **Total Individuals**: {len(persons)}")
-
-    surnames = set(p.surname for p in persons.values() if p.surname)
-    lines.append(f"- **Distinct Surnames**: {len(surnames)}")
-    lines.append("")
-
-    # Table of Contents
-    if include_table_of_contents:
-        lines.append("## Table of Contents")
-        lines.append("")
-
-        if group_by_surname:
-            for surname in sorted(surnames):
-                safe_anchor = surname.lower().replace(" ", "-")
-                lines.append(f"- [{surname}](#{safe_anchor})")
-        else:
-            for person in sorted(persons.values(), key=lambda p: p.name):
-                safe_anchor = person.name.lower().replace(" ", "-").replace("/", "")
-                lines.append(f"- [{person.name}](#{safe_anchor})")
-
-        lines.append("")
-
-    # Person entries
-    lines.append("## Individuals")
-    lines.append("")
-
-    if group_by_surname:
-        # Group by surname
-        by_surname: dict[str, list[MarkdownPerson]] = {}
-        for person in persons.values():
-            surname = person.surname or "Unknown"
-            if surname not in by_surname:
-                by_surname[surname] = []
-            by_surname[surname].append(person)
-
-        for surname in sorted(by_surname.keys()):
-            lines.append(f"### {surname}")
-            lines.append("")
-
-            for person in sorted(by_surname[surname], key=lambda p: p.name):
-                lines.extend(_person_to_markdown(person, include_sources))
-                lines.append("")
-
-    else:
-        # Alphabetical order
-        for person in sorted(persons.values(), key=lambda p: p.name):
-            lines.extend(_person_to_markdown(person, include_sources))
-            lines.append("")
-
-    # Footer
-    lines.append("---")
-    lines.append("")
-    lines.append("*This document was generated using [GPS Genealogy Agents](https://github.com/thomasvincent/gps-genealogy-agents)*")
-
-    out_file.parent.mkdir(parents=True, exist_ok=True)
-    out_file.write_text("\n".join(lines), encoding="utf-8")
-    return out_file
+    return export_many(
+        ledger_dir,
+        [out_file],
+        title=title,
+        include_sources=include_sources,
+        include_table_of_contents=include_table_of_contents,
+        group_by_surname=group_by_surname,
+    )[0]
 
 
 def _person_to_markdown(person: MarkdownPerson, include_sources: bool) -> list[str]:
@@ -3,9 +3,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, List, Dict, Optional
 
-import httpx
 from bs4 import BeautifulSoup
 
+from ..net import shared_client
+
 
 @dataclass
 class PersonRow:
@@ -23,7 +24,7 @@ async def fetch_parse_people_table(url: str) -> List[PersonRow]:
     Heuristics: map common headers to canonical fields (name, age, roll_number, tribe, household).
     Returns a list of PersonRow entries; may be empty if no table detected.
     """
-    async with httpx.AsyncClient(timeout=45.0) as client:
+    async with shared_client(timeout=45.0) as client:
         resp = await client.get(url)
         resp.raise_for_status()
         soup = BeautifulSoup(resp.text, "html.parser")
@@ -2,16 +2,17 @@ from __future__ import annotations
 
 from typing import Dict, Optional
 
-import httpx
 from bs4 import BeautifulSoup
 
+from ..net import shared_client
+
 
 async def fetch_parse_memorial(url: str) -> Dict[str, Optional[str]]:
     """Fetch a Find A Grave memorial and parse a few structured fields.
 
     Best-effort: name, birth_date, death_date, cemetery_name, cemetery_location.
     """
-    async with httpx.AsyncClient(timeout=45.0) as client:
+    async with shared_client(timeout=45.0) as client:
         resp = await client.get(url)
         resp.raise_for_status()
         soup = BeautifulSoup(resp.text, "html.parser")
@@ -19,6 +19,7 @@ import httpx
 import yaml
 from pydantic import BaseModel, Field
 
+from ...net import shared_client
 from ..models_v2 import (
     EvidenceClass,
     EvidenceClaim,
@@ -262,7 +263,7 @@ class SourceAdapter(ABC):
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create the HTTP client."""
         if self._client is None:
-            self._client = httpx.AsyncClient(
+            self._client = shared_client(
                 headers={"User-Agent": self.config.compliance.user_agent},
                 timeout=30.0,
                 follow_redirects=True,
@@ -16,6 +16,7 @@ from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from pydantic import BaseModel
 
+from ...net import shared_client
 from .models import (
     CensusMemberRole,
     ExtractionConfidence,
@@ -368,9 +369,7 @@ class CensusHouseholdExtractor(StructuredExtractor[StructuredCensusHousehold]):
             return await self._fetch_with_firecrawl(url, provenance)
 
         # Fallback to direct HTTP fetch
-        import httpx
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with shared_client(timeout=30.0) as client:
             response = await client.get(url)
             response.raise_for_status()
             html = response.text
@@ -383,11 +382,9 @@ class CensusHouseholdExtractor(StructuredExtractor[StructuredCensusHousehold]):
         provenance: ExtractionProvenance,
     ) -> str:
         """Fetch URL using Firecrawl API for Markdown conversion."""
-        import httpx
-
         provenance.extractor_type = ExtractorType.FIRECRAWL
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
+        async with shared_client(timeout=60.0) as client:
             response = await client.post(
                 "https://api.firecrawl.dev/v0/scrape",
                 headers={"Authorization": f"Bearer {self.firecrawl_api_key}"},
@@ -2,11 +2,20 @@
 
 Uses RocksDB's lexicographic key ordering to implement a priority queue
 with deduplication and persistence.
+
+When RocksDB is not installed the queue falls back to an in-memory binary
+heap ordered by the same queue keys. State changes are appended to a
+write-ahead log (``frontier.wal``) and periodically compacted into a
+snapshot (``frontier.jsonl``), so every operation costs O(log n) CPU and a
+constant-size write.
 """
 from __future__ import annotations
 
+import contextlib
 import hashlib
+import heapq
 import json
+import os
 import struct
 import time
 from dataclasses import dataclass, field
@@ -129,6 +138,11 @@ class FrontierQueue:
     - Item keys: "item:{item_id}"
 
     Lower priority numbers are processed first due to lexicographic ordering.
+
+    Without RocksDB, pending items live in a heap of ``(queue_key, item_id)``
+    tuples and every transition is appended to ``frontier.wal``. The log is
+    folded into the ``frontier.jsonl`` snapshot once it outgrows the live
+    state, keeping recovery time proportional to the queue size.
     """
 
     # Key prefixes for different data types
@@ -139,20 +153,30 @@ class FrontierQueue:
     COMPLETED_PREFIX = b"done:"
     FAILED_PREFIX = b"fail:"
 
-    def __init__(self, db_path: str | Path) -> None:
+    # Minimum WAL length before the fallback compacts it into a snapshot
+    COMPACT_MIN_ENTRIES = 10_000
+
+    def __init__(self, db_path: str | Path, compact_min_entries: int | None = None) -> None:
         """Initialize the frontier queue.
 
         Args:
             db_path: Path to RocksDB database directory
+            compact_min_entries: Override for the fallback WAL compaction floor
         """
         self.db_path = Path(db_path)
         self.db_path.mkdir(parents=True, exist_ok=True)
 
         if rocksdb is None:
-            # Fallback to in-memory + file-based storage
+            # Fallback to in-memory heap + append-only WAL
             self._use_fallback = True
             self._fallback_path = self.db_path / "frontier.jsonl"
-            self._queue: list[tuple[bytes, CrawlItem]] = []
+            self._wal_path = self.db_path / "frontier.wal"
+            self._wal_file: Any = None
+            self._wal_entries = 0
+            self._compact_min_entries = (
+                compact_min_entries if compact_min_entries is not None else self.COMPACT_MIN_ENTRIES
+            )
+            self._heap: list[tuple[bytes, str]] = []
             self._seen: set[str] = set()
             self._items: dict[str, CrawlItem] = {}
             self._processing: dict[str, CrawlItem] = {}
@@ -167,49 +191,113 @@ class FrontierQueue:
             self.db = rocksdb.DB(str(self.db_path / "frontier.db"), opts)
 
     def _load_fallback(self) -> None:
-        """Load state from fallback file storage."""
-        if not self._fallback_path.exists():
-            return
+        """Load state from the snapshot, then replay the write-ahead log."""
+        for path in (self._fallback_path, self._wal_path):
+            if not path.exists():
+                continue
+            try:
+                with open(path) as f:
+                    for line in f:
+                        try:
+                            self._apply_fallback_entry(json.loads(line.strip()))
+                        except (json.JSONDecodeError, KeyError, ValueError):
+                            continue
+                        if path == self._wal_path:
+                            self._wal_entries += 1
+            except OSError:
+                continue
 
-        try:
-            with open(self._fallback_path) as f:
-                for line in f:
-                    try:
-                        entry = json.loads(line.strip())
-                        item = CrawlItem.from_dict(entry["item"])
-                        status = entry.get("status", "pending")
-
-                        if status == "pending":
-                            key = self._make_queue_key(item)
-                            self._queue.append((key, item))
-                            self._items[str(item.item_id)] = item
-                        elif status == "processing":
-                            self._processing[str(item.item_id)] = item
-                        elif status == "completed":
-                            self._completed[str(item.item_id)] = item
-                        elif status == "failed":
-                            self._failed[str(item.item_id)] = item
-
-                        self._seen.add(item.content_hash)
-                    except (json.JSONDecodeError, KeyError):
-                        continue
+        # Rebuild the heap in one O(n) pass instead of pushing during replay
+        self._heap = [
+            (self._make_queue_key(item), item_id) for item_id, item in self._items.items()
+        ]
+        heapq.heapify(self._heap)
+
+    def _apply_fallback_entry(self, entry: dict[str, Any]) -> None:
+        """Apply one snapshot/WAL entry to the in-memory state.
+
+        Entries carry either a full ``item`` (new or modified items) or just
+        an ``item_id`` (a status move for an item already known).
+        """
+        status = entry.get("status", "pending")
+        if "item" in entry:
+            item = CrawlItem.from_dict(entry["item"])
+            item_id = str(item.item_id)
+            self._discard_fallback_item(item_id)
+            self._seen.add(item.content_hash)
+        else:
+            item_id = entry["item_id"]
+            found = self._discard_fallback_item(item_id)
+            if found is None:
+                return
+            item = found
+
+        self._fallback_bucket(status)[item_id] = item
+
+    def _discard_fallback_item(self, item_id: str) -> CrawlItem | None:
+        """Remove an item from whichever fallback state holds it."""
+        for bucket in (self._items, self._processing, self._completed, self._failed):
+            item = bucket.pop(item_id, None)
+            if item is not None:
+                return item
+        return None
+
+    def _fallback_bucket(self, status: str) -> dict[str, CrawlItem]:
+        """Map a persisted status name to its in-memory container."""
+        return {
+            "pending": self._items,
+            "processing": self._processing,
+            "completed": self._completed,
+            "failed": self._failed,
+        }[status]
+
+    def _log_fallback(self, status: str, item: CrawlItem | None = None, item_id: str | None = None) -> None:
+        """Append a state transition to the WAL, compacting when it grows too long."""
+        entry: dict[str, Any] = {"status": status}
+        if item is not None:
+            entry["item"] = item.to_dict()
+        else:
+            entry["item_id"] = item_id
 
-            # Sort queue by key for priority ordering
-            self._queue.sort(key=lambda x: x[0])
-        except OSError:
-            pass
-
-    def _save_fallback(self) -> None:
-        """Save state to fallback file storage."""
-        with open(self._fallback_path, "w") as f:
-            for _, item in self._queue:
-                f.write(json.dumps({"item": item.to_dict(), "status": "pending"}) + "\n")
-            for item in self._processing.values():
-                f.write(json.dumps({"item": item.to_dict(), "status": "processing"}) + "\n")
-            for item in self._completed.values():
-                f.write(json.dumps({"item": item.to_dict(), "status": "completed"}) + "\n")
-            for item in self._failed.values():
-                f.write(json.dumps({"item": item.to_dict(), "status": "failed"}) + "\n")
+        if self._wal_file is None:
+            self._wal_file = open(self._wal_path, "a")  # noqa: SIM115 - held open for appends
+        self._wal_file.write(json.dumps(entry) + "\n")
+        self._wal_file.flush()
+        self._wal_entries += 1
+
+        live = len(self._items) + len(self._processing) + len(self._completed) + len(self._failed)
+        if self._wal_entries >= max(self._compact_min_entries, live):
+            self.compact()
+
+    def compact(self) -> None:
+        """Fold the fallback WAL into a fresh snapshot and truncate it.
+
+        The snapshot is written to a temporary file and atomically renamed,
+        so a crash mid-compaction leaves the previous snapshot + WAL intact.
+        No-op when RocksDB is in use.
+        """
+        if not self._use_fallback:
+            return
+
+        tmp_path = self._fallback_path.with_suffix(".jsonl.tmp")
+        with open(tmp_path, "w") as f:
+            for status in ("pending", "processing", "completed", "failed"):
+                for item in self._fallback_bucket(status).values():
+                    f.write(json.dumps({"item": item.to_dict(), "status": status}) + "\n")
+        os.replace(tmp_path, self._fallback_path)
+
+        if self._wal_file is not None:
+            self._wal_file.close()
+            self._wal_file = None
+        with contextlib.suppress(FileNotFoundError):
+            self._wal_path.unlink()
+        self._wal_entries = 0
+
+    def _heap_push(self, item: CrawlItem) -> None:
+        """Queue a pending item on the fallback heap."""
+        item_id = str(item.item_id)
+        self._items[item_id] = item
+        heapq.heappush(self._heap, (self._make_queue_key(item), item_id))
 
     def _make_queue_key(self, item: CrawlItem) -> bytes:
         """Create a queue key for lexicographic ordering.
@@ -247,10 +335,8 @@ class FrontierQueue:
         item_data = json.dumps(item.to_dict()).encode()
 
         if self._use_fallback:
-            self._queue.append((queue_key, item))
-            self._queue.sort(key=lambda x: x[0])
-            self._items[str(item.item_id)] = item
-            self._save_fallback()
+            self._heap_push(item)
+            self._log_fallback("pending", item=item)
         else:
             # Store item data
             self.db.put(self.ITEM_PREFIX + str(item.item_id).encode(), item_data)
@@ -307,13 +393,13 @@ class FrontierQueue:
             The next item to process, or None if queue is empty
         """
         if self._use_fallback:
-            if not self._queue:
+            if not self._heap:
                 return None
 
-            queue_key, item = self._queue.pop(0)
-            del self._items[str(item.item_id)]
-            self._processing[str(item.item_id)] = item
-            self._save_fallback()
+            _, item_id = heapq.heappop(self._heap)
+            item = self._items.pop(item_id)
+            self._processing[item_id] = item
+            self._log_fallback("processing", item_id=item_id)
             return item
 
         # Find first queue key
@@ -357,8 +443,8 @@ class FrontierQueue:
         items = []
 
         if self._use_fallback:
-            for _, item in self._queue[:count]:
-                items.append(item)
+            for _, item_id in heapq.nsmallest(count, self._heap):
+                items.append(self._items[item_id])
         else:
             it = self.db.iteritems()
             it.seek(self.QUEUE_PREFIX)
@@ -392,7 +478,7 @@ class FrontierQueue:
                 return False
             item = self._processing.pop(item_id_str)
             self._completed[item_id_str] = item
-            self._save_fallback()
+            self._log_fallback("completed", item_id=item_id_str)
             return True
 
         # Move from processing to completed
@@ -429,14 +515,12 @@ class FrontierQueue:
             if requeue and item.retry_count < item.max_retries:
                 # Requeue with lower priority (move to next priority level)
                 item.priority = self._demote_priority(item.priority)
-                queue_key = self._make_queue_key(item)
-                self._queue.append((queue_key, item))
-                self._queue.sort(key=lambda x: x[0])
-                self._items[item_id_str] = item
+                self._heap_push(item)
+                self._log_fallback("pending", item=item)
             else:
                 self._failed[item_id_str] = item
+                self._log_fallback("failed", item=item)
 
-            self._save_fallback()
             return True
 
         # Get item from processing
@@ -509,7 +593,7 @@ class FrontierQueue:
     def __len__(self) -> int:
         """Get the number of pending items in the queue."""
         if self._use_fallback:
-            return len(self._queue)
+            return len(self._heap)
 
         count = 0
         it = self.db.iterkeys()
@@ -531,14 +615,14 @@ class FrontierQueue:
         stats = FrontierStats()
 
         if self._use_fallback:
-            stats.pending_items = len(self._queue)
+            stats.pending_items = len(self._heap)
             stats.completed_items = len(self._completed)
             stats.failed_items = len(self._failed)
             stats.total_items = stats.pending_items + len(self._processing) + stats.completed_items + stats.failed_items
             stats.unique_urls = len(self._seen)
 
             # Count by priority
-            for _, item in self._queue:
+            for item in self._items.values():
                 priority_name = item.priority.name
                 stats.items_by_priority[priority_name] = stats.items_by_priority.get(priority_name, 0) + 1
 
@@ -612,16 +696,12 @@ class FrontierQueue:
                 item = self._processing.pop(item_id)
                 item.retry_count += 1
                 if item.retry_count < item.max_retries:
-                    queue_key = self._make_queue_key(item)
-                    self._queue.append((queue_key, item))
-                    self._items[item_id] = item
+                    self._heap_push(item)
+                    self._log_fallback("pending", item=item)
                     recovered += 1
                 else:
                     self._failed[item_id] = item
-
-            if stalled:
-                self._queue.sort(key=lambda x: x[0])
-                self._save_fallback()
+                    self._log_fallback("failed", item=item)
         else:
             batch = rocksdb.WriteBatch()
             stalled_items = []
@@ -661,14 +741,19 @@ class FrontierQueue:
     def clear(self) -> None:
         """Clear all data from the queue (use with caution)."""
         if self._use_fallback:
-            self._queue.clear()
+            self._heap.clear()
             self._seen.clear()
             self._items.clear()
             self._processing.clear()
             self._completed.clear()
             self._failed.clear()
-            if self._fallback_path.exists():
-                self._fallback_path.unlink()
+            if self._wal_file is not None:
+                self._wal_file.close()
+                self._wal_file = None
+            self._wal_entries = 0
+            for path in (self._fallback_path, self._wal_path):
+                if path.exists():
+                    path.unlink()
         else:
             # Delete all keys
             batch = rocksdb.WriteBatch()
@@ -683,6 +768,6 @@ class FrontierQueue:
     def close(self) -> None:
         """Close the database connection."""
         if self._use_fallback:
-            self._save_fallback()
+            self.compact()
         else:
             del self.db
@@ -281,72 +281,122 @@ class SplinkEntityResolver:
         predictions_df: "pd.DataFrame",
         clusters_df: "pd.DataFrame",
     ) -> tuple[list[EntityCluster], list[MatchCandidate]]:
-        """Build EntityCluster objects from Splink output."""
+        """Build EntityCluster objects from Splink output.
+
+        Predictions are attributed to clusters with one id -> cluster_id map
+        and a single grouping pass, rather than filtering every prediction per
+        cluster. A prediction whose two records land in different clusters is
+        listed under both, in original prediction order.
+        """
+        import numpy as np
+        import pandas as pd
+
         clusters = []
         needs_review = []
+        uuid_cache: dict[Any, UUID] = {}
+
+        def _uuid(value: Any) -> UUID:
+            cached = uuid_cache.get(value)
+            if cached is None:
+                cached = uuid_cache[value] = UUID(str(value))
+            return cached
 
         # Group by cluster ID
         if "cluster_id" not in clusters_df.columns:
             # Single-record clusters (no matches)
-            for _, row in original_df.iterrows():
+            for row in original_df.to_dict("records"):
                 cluster = EntityCluster(
-                    canonical_id=UUID(str(row["id"])),
+                    canonical_id=_uuid(row["id"]),
                     canonical_name=self._get_canonical_name(row),
-                    member_ids=[UUID(str(row["id"]))],
+                    member_ids=[_uuid(row["id"])],
                     internal_cohesion=1.0,
                 )
                 clusters.append(cluster)
             return clusters, needs_review
 
-        # Build clusters from grouped data
-        grouped = clusters_df.groupby("cluster_id")
-        for cluster_id, group in grouped:
-            member_ids = [UUID(str(id_)) for id_ in group["id"].unique()]
+        # Attribute each prediction to the cluster(s) of its two records
+        id_to_cluster = clusters_df.drop_duplicates("id").set_index("id")["cluster_id"]
+        positions = np.arange(len(predictions_df))
+        attributed = pd.concat(
+            [
+                pd.DataFrame({"cluster_id": predictions_df["id_l"].map(id_to_cluster).to_numpy(), "pos": positions}),
+                pd.DataFrame({"cluster_id": predictions_df["id_r"].map(id_to_cluster).to_numpy(), "pos": positions}),
+            ],
+            ignore_index=True,
+        ).dropna(subset=["cluster_id"])
+        attributed = attributed.drop_duplicates().sort_values(["cluster_id", "pos"], kind="stable")
+        attributed_pos = attributed["pos"].to_numpy()
+        predictions_by_cluster = {
+            cluster_id: attributed_pos[idx]
+            for cluster_id, idx in attributed.groupby("cluster_id", sort=False).indices.items()
+        }
 
-            # Get canonical record (highest confidence or first)
-            canonical_row = group.iloc[0]
-            canonical_id = UUID(str(canonical_row["id"]))
+        # Vectorized confidence bucketing and decisions
+        if "match_probability" in predictions_df.columns:
+            probs = predictions_df["match_probability"].to_numpy(dtype=float)
+        else:
+            probs = np.full(len(predictions_df), 0.5)
+        confidence_codes = np.select(
+            [probs >= 0.95, probs >= 0.85, probs >= 0.70],
+            [0, 1, 2],
+            default=3,
+        )
+        confidence_levels = [
+            MatchConfidence.DEFINITE_MATCH,
+            MatchConfidence.PROBABLE_MATCH,
+            MatchConfidence.POSSIBLE_MATCH,
+            MatchConfidence.UNCERTAIN,
+        ]
+        is_merge = probs >= self.threshold
+        in_review_band = (probs >= self.review_threshold) & ~is_merge
+        ids_left = predictions_df["id_l"].to_numpy()
+        ids_right = predictions_df["id_r"].to_numpy()
+
+        records_by_id: dict[Any, dict[str, Any]] | None = None
 
-            # Get linkage decisions for this cluster
-            cluster_predictions = predictions_df[
-                (predictions_df["id_l"].isin(group["id"])) |
-                (predictions_df["id_r"].isin(group["id"]))
+        # Build clusters from grouped data
+        rows_by_cluster = clusters_df.groupby("cluster_id").indices
+        cluster_keys = sorted(rows_by_cluster)
+        member_id_values = clusters_df["id"].to_numpy()
+        # Get canonical record (highest confidence or first) for every cluster at once
+        canonical_rows = clusters_df.iloc[
+            [rows_by_cluster[key][0] for key in cluster_keys]
+        ].to_dict("records")
+
+        for cluster_id, canonical_row in zip(cluster_keys, canonical_rows, strict=True):
+            member_ids = [
+                _uuid(id_) for id_ in dict.fromkeys(member_id_values[rows_by_cluster[cluster_id]])
             ]
+            canonical_id = _uuid(canonical_row["id"])
+
+            # Get linkage decisions for this cluster
+            pred_positions = predictions_by_cluster.get(cluster_id, positions[:0])
 
             decisions = []
-            for _, pred_row in cluster_predictions.iterrows():
-                prob = pred_row.get("match_probability", 0.5)
-
-                # Determine confidence level
-                if prob >= 0.95:
-                    confidence = MatchConfidence.DEFINITE_MATCH
-                elif prob >= 0.85:
-                    confidence = MatchConfidence.PROBABLE_MATCH
-                elif prob >= 0.70:
-                    confidence = MatchConfidence.POSSIBLE_MATCH
-                else:
-                    confidence = MatchConfidence.UNCERTAIN
-
-                decision = LinkageDecision(
-                    record_id_left=UUID(str(pred_row["id_l"])),
-                    record_id_right=UUID(str(pred_row["id_r"])),
-                    decision=ClusterDecision.MERGE if prob >= self.threshold else ClusterDecision.NEEDS_REVIEW,
-                    probability=prob,
+            for pos in pred_positions:
+                confidence = confidence_levels[confidence_codes[pos]]
+                decisions.append(LinkageDecision(
+                    record_id_left=_uuid(ids_left[pos]),
+                    record_id_right=_uuid(ids_right[pos]),
+                    decision=ClusterDecision.MERGE if is_merge[pos] else ClusterDecision.NEEDS_REVIEW,
+                    probability=float(probs[pos]),
                     confidence=confidence,
-                )
-                decisions.append(decision)
+                ))
 
                 # Add to review queue if uncertain
-                if self.review_threshold <= prob < self.threshold:
-                    candidate = self._create_match_candidate(pred_row, original_df)
+                if in_review_band[pos]:
+                    if records_by_id is None:
+                        records_by_id = {
+                            row["id"]: row
+                            for row in original_df.drop_duplicates("id").to_dict("records")
+                        }
+                    pred_row = {"id_l": ids_left[pos], "id_r": ids_right[pos], "match_probability": probs[pos]}
+                    candidate = self._create_match_candidate(pred_row, records_by_id)
                     if candidate:
                         needs_review.append(candidate)
 
             # Calculate cluster cohesion
-            if cluster_predictions.empty:
-                cohesion = 1.0
-            else:
-                cohesion = cluster_predictions["match_probability"].mean()
+            cohesion = float(probs[pred_positions].mean()) if len(pred_positions) else 1.0
 
             cluster = EntityCluster(
                 cluster_id=UUID(str(cluster_id)) if isinstance(cluster_id, str) else uuid4(),
@@ -361,7 +411,7 @@ class SplinkEntityResolver:
 
         return clusters, needs_review
 
-    def _get_canonical_name(self, row: "pd.Series") -> str:
+    def _get_canonical_name(self, row: "pd.Series | dict[str, Any]") -> str:
         """Get canonical name from a record row."""
         given = row.get("given_name", "")
         surname = row.get("surname", "")
@@ -369,19 +419,24 @@ class SplinkEntityResolver:
 
     def _create_match_candidate(
         self,
-        pred_row: "pd.Series",
-        original_df: "pd.DataFrame",
+        pred_row: "pd.Series | dict[str, Any]",
+        records_by_id: dict[Any, dict[str, Any]],
     ) -> MatchCandidate | None:
-        """Create a MatchCandidate from prediction row."""
+        """Create a MatchCandidate from prediction row.
+
+        Args:
+            pred_row: Splink prediction row with ``id_l``/``id_r``
+            records_by_id: Original records keyed by their ``id`` value
+        """
         try:
             # Get original records
-            left_record = original_df[original_df["id"] == pred_row["id_l"]].iloc[0]
-            right_record = original_df[original_df["id"] == pred_row["id_r"]].iloc[0]
+            left_record = records_by_id[pred_row["id_l"]]
+            right_record = records_by_id[pred_row["id_r"]]
 
             # Build feature comparisons
             comparisons = []
             for col in ["surname", "given_name", "birth_year", "birth_place"]:
-                if col in left_record.index and col in right_record.index:
+                if col in left_record and col in right_record:
                     left_val = left_record[col]
                     right_val = right_record[col]
 
@@ -4,6 +4,7 @@ Provides type-safe, structured I/O wrappers for LLM roles with
 hallucination firewall validation and idempotency caching.
 """
 from .idempotency import (
+    CacheStats,
     ContentFingerprint,
     IdempotencyCache,
     LLMCache,
@@ -68,6 +69,7 @@ from .wrapper import (
 
 __all__ = [
     # Idempotency
+    "CacheStats",
     "ContentFingerprint",
     "IdempotencyCache",
     "LLMCache",
@@ -7,12 +7,16 @@ Integrates with the system-wide fingerprinting from gps_agents.idempotency.
 from __future__ import annotations
 
 import hashlib
+import heapq
 import json
 import logging
+import os
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import Generic, TypeVar
+from typing import Generic, TextIO, TypeVar
 
 from pydantic import BaseModel
 
@@ -47,35 +51,164 @@ class CachedResult(Generic[OutputT]):
         return datetime.now(UTC) - self.created_at > max_age
 
 
+@dataclass
+class CacheStats:
+    """Hit/miss/eviction counters for one LLM role."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Get hit rate for this role."""
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+
+# Approximate per-entry overhead (dict slot, CachedResult, datetime, strings)
+# added to the serialized output size when enforcing max_bytes.
+ENTRY_OVERHEAD_BYTES = 512
+
+
 @dataclass
 class IdempotencyCache:
     """In-memory cache for LLM results keyed by content fingerprint.
 
     This provides deduplication at the LLM call level to prevent
     re-processing the same content multiple times.
+
+    Entries are kept in least-recently-used order, so lookups, inserts and
+    evictions are O(1). Expiry is tracked in coarse TTL buckets (by
+    ``created_at``) so expired entries are dropped in bulk instead of only
+    when they happen to be looked up. Capacity may be bounded by entry
+    count (``max_size``), by approximate memory (``max_bytes``), or both.
     """
 
-    cache: dict[str, CachedResult] = field(default_factory=dict)
+    cache: OrderedDict[str, CachedResult] = field(default_factory=OrderedDict)
     max_age: timedelta = field(default_factory=lambda: timedelta(hours=24))
     max_size: int = 10000
+    max_bytes: int | None = None
+    ttl_buckets: int = 64
     hits: int = 0
     misses: int = 0
+    evictions: int = 0
+    stats_by_role: dict[str, CacheStats] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        entries = self.cache
+        self.cache = OrderedDict()
+        self._bytes = 0
+        self._buckets: dict[int, set[str]] = {}
+        self._bucket_heap: list[int] = []
+        for key, result in entries.items():
+            self._insert(key, result)
+
+    # ------------------------------------------------------------------
+    # TTL buckets
+    # ------------------------------------------------------------------
+
+    @property
+    def _bucket_width(self) -> float:
+        return max(self.max_age.total_seconds() / max(self.ttl_buckets, 1), 1e-6)
+
+    def _bucket_of(self, result: CachedResult) -> int:
+        return int(result.created_at.timestamp() // self._bucket_width)
+
+    def _purge_expired(self) -> None:
+        """Drop every bucket whose newest possible entry has expired."""
+        if not self._bucket_heap:
+            return
+        width = self._bucket_width
+        # Bucket b holds entries created before (b + 1) * width
+        horizon = datetime.now(UTC).timestamp() - self.max_age.total_seconds()
+        while self._bucket_heap and (self._bucket_heap[0] + 1) * width <= horizon:
+            bucket = heapq.heappop(self._bucket_heap)
+            for key in self._buckets.pop(bucket, ()):
+                result = self.cache.pop(key)
+                self._bytes -= self._entry_size(key, result)
+                self._stats(result.role).expirations += 1
+
+    # ------------------------------------------------------------------
+    # Bookkeeping
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _entry_size(key: str, result: CachedResult) -> int:
+        return len(key) + len(result.output_json) + len(result.input_hash) + ENTRY_OVERHEAD_BYTES
+
+    @staticmethod
+    def _role_of(fingerprint: ContentFingerprint) -> str:
+        return fingerprint.kind.removeprefix("llm_")
+
+    def _stats(self, role: str) -> CacheStats:
+        stats = self.stats_by_role.get(role)
+        if stats is None:
+            stats = self.stats_by_role[role] = CacheStats()
+        return stats
+
+    def _insert(self, key: str, result: CachedResult) -> None:
+        if key in self.cache:
+            self._remove(key)
+        self.cache[key] = result
+        self._bytes += self._entry_size(key, result)
+        bucket = self._bucket_of(result)
+        members = self._buckets.get(bucket)
+        if members is None:
+            members = self._buckets[bucket] = set()
+            heapq.heappush(self._bucket_heap, bucket)
+        members.add(key)
+
+    def _remove(self, key: str) -> CachedResult:
+        result = self.cache.pop(key)
+        self._bytes -= self._entry_size(key, result)
+        bucket = self._bucket_of(result)
+        members = self._buckets.get(bucket)
+        if members is not None:
+            members.discard(key)
+            # Empty buckets stay on the heap and are popped lazily by _purge_expired
+        return result
+
+    def _over_capacity(self) -> bool:
+        if len(self.cache) > self.max_size:
+            return True
+        return self.max_bytes is not None and self._bytes > self.max_bytes
+
+    def _evict_oldest(self) -> None:
+        """Evict least-recently-used entries until within capacity."""
+        while self.cache and self._over_capacity():
+            key = next(iter(self.cache))
+            result = self._remove(key)
+            self.evictions += 1
+            self._stats(result.role).evictions += 1
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
 
     def get(self, fingerprint: ContentFingerprint) -> CachedResult | None:
         """Get cached result by fingerprint."""
+        self._purge_expired()
         key = str(fingerprint)
         result = self.cache.get(key)
+        stats = self._stats(self._role_of(fingerprint))
 
         if result is None:
             self.misses += 1
+            stats.misses += 1
             return None
 
         if result.is_expired(self.max_age):
-            del self.cache[key]
+            self._remove(key)
             self.misses += 1
+            stats.misses += 1
+            stats.expirations += 1
             return None
 
+        self.cache.move_to_end(key)
         self.hits += 1
+        stats.hits += 1
         return result
 
     def put(
@@ -86,27 +219,25 @@ class IdempotencyCache:
         input_hash: str,
     ) -> None:
         """Store result in cache."""
-        # Evict oldest entries if at capacity
-        if len(self.cache) >= self.max_size:
-            self._evict_oldest()
-
-        key = str(fingerprint)
-        self.cache[key] = CachedResult(
-            fingerprint=fingerprint,
-            output_json=output.model_dump_json(),
-            created_at=datetime.now(UTC),
-            role=role,
-            input_hash=input_hash,
+        self._store(
+            CachedResult(
+                fingerprint=fingerprint,
+                output_json=output.model_dump_json(),
+                created_at=datetime.now(UTC),
+                role=role,
+                input_hash=input_hash,
+            )
         )
 
-    def _evict_oldest(self) -> None:
-        """Evict oldest 10% of entries."""
-        if not self.cache:
-            return
-        entries = sorted(self.cache.items(), key=lambda x: x[1].created_at)
-        evict_count = max(1, len(entries) // 10)
-        for key, _ in entries[:evict_count]:
-            del self.cache[key]
+    def _store(self, result: CachedResult) -> None:
+        self._purge_expired()
+        self._insert(str(result.fingerprint), result)
+        self._evict_oldest()
+
+    @property
+    def size_bytes(self) -> int:
+        """Approximate memory held by cached entries."""
+        return self._bytes
 
     @property
     def hit_rate(self) -> float:
@@ -117,8 +248,13 @@ class IdempotencyCache:
     def clear(self) -> None:
         """Clear all cache entries."""
         self.cache.clear()
+        self._buckets.clear()
+        self._bucket_heap.clear()
+        self._bytes = 0
         self.hits = 0
         self.misses = 0
+        self.evictions = 0
+        self.stats_by_role.clear()
 
 
 def fingerprint_input(input_data: BaseModel, role: str) -> ContentFingerprint:
@@ -164,7 +300,12 @@ def fingerprint_raw_text(text: str, context: str = "raw") -> ContentFingerprint:
 class PersistentIdempotencyCache(IdempotencyCache):
     """File-backed idempotency cache for persistence across sessions.
 
-    Stores cache entries in a JSONL file for durability.
+    Every ``put`` appends one JSONL record to the cache file, so writes are
+    O(1) regardless of cache size. Loading replays the log through the
+    normal insert path (later records win, capacity limits apply). Once the
+    log holds ``compact_ratio`` times more records than live entries it is
+    rewritten in a background thread; records appended meanwhile are carried
+    over into the compacted file.
     """
 
     def __init__(
@@ -172,6 +313,9 @@ class PersistentIdempotencyCache(IdempotencyCache):
         cache_path: Path | str,
         max_age: timedelta | None = None,
         max_size: int = 10000,
+        max_bytes: int | None = None,
+        compact_ratio: float = 2.0,
+        compact_min_records: int = 1000,
     ):
         """Initialize with persistence path.
 
@@ -179,16 +323,39 @@ class PersistentIdempotencyCache(IdempotencyCache):
             cache_path: Path to cache file
             max_age: Maximum age for cache entries
             max_size: Maximum cache size
+            max_bytes: Optional approximate memory limit in bytes
+            compact_ratio: Log records per live entry that trigger compaction
+            compact_min_records: Never compact logs shorter than this
         """
         super().__init__(
             max_age=max_age or timedelta(hours=24),
             max_size=max_size,
+            max_bytes=max_bytes,
         )
         self.cache_path = Path(cache_path)
+        self.compact_ratio = compact_ratio
+        self.compact_min_records = compact_min_records
+        self._log_lock = threading.Lock()
+        self._log_records = 0
+        self._log_file: TextIO | None = None
+        self._compactor: threading.Thread | None = None
+        self._pending: list[str] | None = None  # records written during compaction
         self._load()
 
+    @staticmethod
+    def _encode(result: CachedResult) -> str:
+        entry = {
+            "kind": result.fingerprint.kind,
+            "value": result.fingerprint.value,
+            "output_json": result.output_json,
+            "created_at": result.created_at.isoformat(),
+            "role": result.role,
+            "input_hash": result.input_hash,
+        }
+        return json.dumps(entry) + "\n"
+
     def _load(self) -> None:
-        """Load cache from disk."""
+        """Replay the cache log from disk."""
         if not self.cache_path.exists():
             return
 
@@ -208,27 +375,28 @@ class PersistentIdempotencyCache(IdempotencyCache):
                             role=entry["role"],
                             input_hash=entry["input_hash"],
                         )
-                        if not result.is_expired(self.max_age):
-                            self.cache[str(fingerprint)] = result
                     except (json.JSONDecodeError, KeyError):
                         continue
+                    self._log_records += 1
+                    if not result.is_expired(self.max_age):
+                        self._insert(str(fingerprint), result)
+                        self._evict_oldest()
         except OSError:
             logger.warning(f"Could not load cache from {self.cache_path}")
-
-    def _save(self) -> None:
-        """Save cache to disk."""
-        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.cache_path, "w") as f:
-            for result in self.cache.values():
-                entry = {
-                    "kind": result.fingerprint.kind,
-                    "value": result.fingerprint.value,
-                    "output_json": result.output_json,
-                    "created_at": result.created_at.isoformat(),
-                    "role": result.role,
-                    "input_hash": result.input_hash,
-                }
-                f.write(json.dumps(entry) + "\n")
+        # Replay evictions are not user-visible
+        self.evictions = 0
+        self.stats_by_role.clear()
+
+    def _append(self, line: str) -> None:
+        with self._log_lock:
+            if self._log_file is None:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                self._log_file = open(self.cache_path, "a")  # noqa: SIM115
+            self._log_file.write(line)
+            self._log_file.flush()
+            self._log_records += 1
+            if self._pending is not None:
+                self._pending.append(line)
 
     def put(
         self,
@@ -237,15 +405,71 @@ class PersistentIdempotencyCache(IdempotencyCache):
         role: str,
         input_hash: str,
     ) -> None:
-        """Store result and persist to disk."""
-        super().put(fingerprint, output, role, input_hash)
-        # Persist every 100 entries or on cache miss
-        if len(self.cache) % 100 == 0:
-            self._save()
+        """Store result and append it to the on-disk log."""
+        result = CachedResult(
+            fingerprint=fingerprint,
+            output_json=output.model_dump_json(),
+            created_at=datetime.now(UTC),
+            role=role,
+            input_hash=input_hash,
+        )
+        self._store(result)
+        self._append(self._encode(result))
+
+        if (
+            self._log_records >= self.compact_min_records
+            and self._log_records > self.compact_ratio * max(len(self.cache), 1)
+            and (self._compactor is None or not self._compactor.is_alive())
+        ):
+            # Snapshot here: the cache must not be iterated while put() mutates it
+            snapshot = self._begin_compaction()
+            self._compactor = threading.Thread(
+                target=self._write_compacted,
+                args=(snapshot,),
+                name="idempotency-compact",
+                daemon=True,
+            )
+            self._compactor.start()
+
+    def _begin_compaction(self) -> list[CachedResult]:
+        with self._log_lock:
+            self._pending = []
+        return list(self.cache.values())
+
+    def _write_compacted(self, snapshot: list[CachedResult]) -> None:
+        """Write snapshot plus records appended since, then swap the log."""
+        tmp_path = self.cache_path.with_suffix(self.cache_path.suffix + ".compact")
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            f = open(tmp_path, "w")  # noqa: SIM115
+            try:
+                f.writelines(self._encode(result) for result in snapshot)
+                with self._log_lock:
+                    pending, self._pending = self._pending or [], None
+                    f.writelines(pending)
+                    f.close()
+                    if self._log_file is not None:
+                        self._log_file.close()
+                        self._log_file = None
+                    os.replace(tmp_path, self.cache_path)
+                    self._log_records = len(snapshot) + len(pending)
+            finally:
+                f.close()
+        except OSError as e:
+            with self._log_lock:
+                self._pending = None
+            logger.warning(f"Could not compact cache log {self.cache_path}: {e}")
+
+    def compact(self) -> None:
+        """Rewrite the log so it holds only live entries."""
+        if self._compactor is not None:
+            self._compactor.join()
+            self._compactor = None
+        self._write_compacted(self._begin_compaction())
 
     def close(self) -> None:
-        """Save and close the cache."""
-        self._save()
+        """Compact and close the cache log."""
+        self.compact()
 
 
 class LLMCache:
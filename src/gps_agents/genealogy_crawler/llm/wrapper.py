@@ -123,11 +123,15 @@ class HallucinationCheckResult:
         return code in self.violation_codes
 
 
-def _levenshtein_ratio(s1: str, s2: str) -> float:
+def _levenshtein_ratio(s1: str, s2: str, score_cutoff: float = 0.0) -> float:
     """Calculate Levenshtein similarity ratio between two strings.
 
     Returns a value between 0.0 (completely different) and 1.0 (identical).
-    Uses a sliding window approach for efficiency when s1 is shorter than s2.
+    When s1 is much shorter than s2, returns the best ratio of s1 against any
+    window of s2 with the same length as s1.
+
+    Ratios below ``score_cutoff`` are reported as 0.0, which lets the search
+    discard most windows without scoring them (same convention as rapidfuzz).
     """
     if not s1 or not s2:
         return 0.0
@@ -138,45 +142,140 @@ def _levenshtein_ratio(s1: str, s2: str) -> float:
 
     # If citation is much shorter than source, use sliding window
     if len1 < len2 / 2:
-        # Search for best match in source using window of citation length
-        best_ratio = 0.0
-        window_size = len1
-        for i in range(len2 - window_size + 1):
-            window = s2[i:i + window_size]
-            ratio = _edit_distance_ratio(s1, window)
-            best_ratio = max(best_ratio, ratio)
-            if best_ratio >= 0.95:  # Early exit if near-perfect match found
-                return best_ratio
-        return best_ratio
+        return _best_window_ratio(s1, s2, score_cutoff)
 
-    return _edit_distance_ratio(s1, s2)
+    max_len = max(len1, len2)
+    distance = _bounded_edit_distance(s1, s2, _max_distance(max_len, score_cutoff))
+    ratio = 1.0 - (distance / max_len)
+    return ratio if ratio >= score_cutoff else 0.0
+
+
+def _max_distance(length: int, score_cutoff: float) -> int:
+    """Largest edit distance whose ratio ``1 - d/length`` still meets the cutoff."""
+    k = min(length, int((1.0 - score_cutoff) * length))
+    # Float rounding can put the estimate one off in either direction
+    while k < length and 1.0 - ((k + 1) / length) >= score_cutoff:
+        k += 1
+    while k > 0 and 1.0 - (k / length) < score_cutoff:
+        k -= 1
+    return k
+
+
+def _best_window_ratio(pattern: str, text: str, score_cutoff: float) -> float:
+    """Best ratio of ``pattern`` against every ``len(pattern)`` window of ``text``.
+
+    A bit-parallel (Myers) pass gives, for each end offset, the smallest edit
+    distance of the pattern to any substring ending there. That is a lower bound
+    on the distance to the fixed-width window ending at the same offset, so only
+    windows whose bound can still beat the best score (and the cutoff) are
+    scored exactly, cheapest bound first.
+    """
+    m = len(pattern)
+    max_dist = _max_distance(m, score_cutoff)
+    lower_bounds = _semi_global_distances(pattern, text)
+
+    candidates = sorted(
+        (bound, end)
+        for end, bound in enumerate(lower_bounds)
+        if end >= m - 1 and bound <= max_dist
+    )
+    best = max_dist + 1
+    for bound, end in candidates:
+        if bound >= best:
+            break
+        distance = _bounded_edit_distance(pattern, text[end - m + 1:end + 1], best - 1)
+        best = min(best, distance)
+
+    if best > max_dist:
+        return 0.0
+    return 1.0 - (best / m)
 
 
-def _edit_distance_ratio(s1: str, s2: str) -> float:
-    """Calculate edit distance ratio between two strings of similar length."""
+def _semi_global_distances(pattern: str, text: str) -> list[int]:
+    """Myers' bit-vector algorithm for approximate substring matching.
+
+    Returns, for each offset ``j`` in ``text``, the minimum edit distance
+    between ``pattern`` and any substring of ``text`` ending at ``j``. Runs in
+    O(len(text)) big-integer operations instead of O(len(pattern) * len(text))
+    Python-level steps.
+    """
+    m = len(pattern)
+    full = (1 << m) - 1
+    high_bit = 1 << (m - 1)
+
+    peq: dict[str, int] = {}
+    for i, ch in enumerate(pattern):
+        peq[ch] = peq.get(ch, 0) | (1 << i)
+
+    pv, mv, score = full, 0, m
+    distances = []
+    for ch in text:
+        eq = peq.get(ch, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & full)
+        mh = pv & xh
+        if ph & high_bit:
+            score += 1
+        elif mh & high_bit:
+            score -= 1
+        # Text prefix is free (no carry-in), which makes the match semi-global
+        ph = (ph << 1) & full
+        mh = (mh << 1) & full
+        pv = mh | (~(xv | ph) & full)
+        mv = ph & xv
+        distances.append(score)
+    return distances
+
+
+def _bounded_edit_distance(s1: str, s2: str, max_dist: int) -> int:
+    """Levenshtein distance, or ``max_dist + 1`` once it is known to exceed it.
+
+    Only cells within ``max_dist`` of the diagonal can hold a distance within
+    the bound (Ukkonen's band), so the DP touches O(len * max_dist) cells.
+    """
     len1, len2 = len(s1), len(s2)
-    if len1 == 0 and len2 == 0:
-        return 1.0
+    if abs(len1 - len2) > max_dist:
+        return max_dist + 1
     if len1 == 0 or len2 == 0:
-        return 0.0
-
-    # Use optimized two-row DP for space efficiency
-    prev_row = list(range(len2 + 1))
-    curr_row = [0] * (len2 + 1)
+        return max(len1, len2)
 
+    over = max_dist + 1
+    prev_row = [j if j <= max_dist else over for j in range(len2 + 1)]
     for i in range(1, len1 + 1):
-        curr_row[0] = i
-        for j in range(1, len2 + 1):
-            cost = 0 if s1[i - 1] == s2[j - 1] else 1
-            curr_row[j] = min(
+        lo = max(1, i - max_dist)
+        hi = min(len2, i + max_dist)
+        curr_row = [over] * (len2 + 1)
+        if lo == 1:
+            curr_row[0] = i if i <= max_dist else over
+        row_min = curr_row[0] if lo == 1 else over
+        c1 = s1[i - 1]
+        for j in range(lo, hi + 1):
+            cost = 0 if c1 == s2[j - 1] else 1
+            value = min(
                 curr_row[j - 1] + 1,      # insertion
                 prev_row[j] + 1,          # deletion
-                prev_row[j - 1] + cost    # substitution
+                prev_row[j - 1] + cost,   # substitution
             )
-        prev_row, curr_row = curr_row, prev_row
+            curr_row[j] = value if value <= max_dist else over
+            row_min = min(row_min, curr_row[j])
+        if row_min > max_dist:
+            return over
+        prev_row = curr_row
+
+    return prev_row[len2]
+
+
+def _edit_distance_ratio(s1: str, s2: str) -> float:
+    """Calculate edit distance ratio between two strings of similar length."""
+    len1, len2 = len(s1), len(s2)
+    if len1 == 0 and len2 == 0:
+        return 1.0
+    if len1 == 0 or len2 == 0:
+        return 0.0
 
-    distance = prev_row[len2]
     max_len = max(len1, len2)
+    distance = _bounded_edit_distance(s1, s2, max_len)
     return 1.0 - (distance / max_len)
 
 
@@ -215,7 +314,7 @@ def check_citation_exists(
 
         # Use Levenshtein similarity for OCR tolerance
         # This handles common OCR errors like: "1880" vs "188O", "rn" vs "m"
-        ratio = _levenshtein_ratio(norm_citation, norm_source)
+        ratio = _levenshtein_ratio(norm_citation, norm_source, score_cutoff=fuzzy_threshold)
         return ratio >= fuzzy_threshold
 
     return False
@@ -8,12 +8,16 @@ Implements the complete data model as specified:
 from __future__ import annotations
 
 import hashlib
+import heapq
 from datetime import UTC, datetime
 from enum import Enum
-from typing import Annotated, Any
+from typing import Annotated, Any, get_args
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, computed_field, model_validator
+from pydantic import BaseModel, Field, GetCoreSchemaHandler, PrivateAttr, computed_field, model_validator
+from pydantic_core import core_schema
+
+from .novelty import QueryLSH
 
 
 # =============================================================================
@@ -481,6 +485,192 @@ class RevisitItem(QueueItem):
     previous_results_hash: str | None = None
 
 
+class PriorityQueue[QueueItemT: QueueItem]:
+    """Max-priority heap of queue items with FIFO order among equal priorities.
+
+    Pops in the same order as keeping a list sorted by ``priority``
+    (descending, stable) and popping its head, at O(log n) per push and pop.
+    Priority is read when an item is pushed. Iteration, indexing and
+    serialization see the items in pop order, so a persisted state is a
+    plain list and reloads into the same pop order.
+
+    Pushes and pops since the last ``clear_changes()`` are tracked so that
+    checkpoints can write queue deltas instead of the whole queue.
+    """
+
+    def __init__(self, items: list[QueueItemT] | None = None) -> None:
+        self._heap: list[tuple[float, int, QueueItemT]] = []
+        self._seq = 0  # push counter; a plain int so the queue can be copied
+        self._pushed: dict[UUID, QueueItemT] = {}
+        self._popped: set[UUID] = set()
+        for item in items or ():
+            self.push(item)
+
+    def push(self, item: QueueItemT) -> None:
+        """Add an item."""
+        self._seq += 1
+        heapq.heappush(self._heap, (-item.priority, self._seq, item))
+        self._pushed[item.id] = item
+        self._popped.discard(item.id)
+
+    def pop(self) -> QueueItemT | None:
+        """Remove and return the highest priority item, or None if empty."""
+        if not self._heap:
+            return None
+        item = heapq.heappop(self._heap)[2]
+        self._pushed.pop(item.id, None)
+        self._popped.add(item.id)
+        return item
+
+    def changes(self) -> tuple[list[QueueItemT], set[UUID]]:
+        """Items pushed (in push order) and ids popped since the last clear."""
+        return list(self._pushed.values()), set(self._popped)
+
+    def clear_changes(self) -> None:
+        """Mark the current contents as persisted."""
+        self._pushed.clear()
+        self._popped.clear()
+
+    def items(self) -> list[QueueItemT]:
+        """All items in pop order."""
+        return [entry[2] for entry in sorted(self._heap)]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __bool__(self) -> bool:
+        return bool(self._heap)
+
+    def __iter__(self):
+        return iter(self.items())
+
+    def __getitem__(self, index: int | slice) -> QueueItemT | list[QueueItemT]:
+        if isinstance(index, slice) and index.start in (None, 0) and index.step is None and (
+            index.stop is not None and index.stop >= 0
+        ):
+            # Head of the queue (e.g. queue[:10]) without sorting everything
+            return [entry[2] for entry in heapq.nsmallest(index.stop, self._heap)]
+        return self.items()[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PriorityQueue):
+            return self.items() == other.items()
+        if isinstance(other, list):
+            return self.items() == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"PriorityQueue({self.items()!r})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        args = get_args(source_type)
+        item_schema = handler.generate_schema(args[0]) if args else core_schema.any_schema()
+        list_schema = core_schema.list_schema(item_schema)
+        from_list = core_schema.no_info_after_validator_function(cls, list_schema)
+        return core_schema.json_or_python_schema(
+            json_schema=from_list,
+            python_schema=core_schema.union_schema([core_schema.is_instance_schema(cls), from_list]),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda queue: queue.items(), return_schema=list_schema
+            ),
+        )
+
+
+# =============================================================================
+# Change Tracking
+# =============================================================================
+
+
+class ChangeTrackingDict[V](dict[str, V]):
+    """Dict that records which keys were set or deleted since the last checkpoint.
+
+    Assigning through the dict marks a key changed. Values mutated in place
+    must be flagged with ``mark_changed``. Validates and serializes as a plain
+    dict.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._changed: set[str] = set(self)
+        self._deleted: set[str] = set()
+
+    def __setitem__(self, key: str, value: V) -> None:
+        super().__setitem__(key, value)
+        self._changed.add(key)
+        self._deleted.discard(key)
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._changed.discard(key)
+        self._deleted.add(key)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key: str, default: V) -> V:  # type: ignore[override]
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+        return super().pop(key, *default)
+
+    def popitem(self) -> tuple[str, V]:
+        key, value = super().popitem()
+        self._changed.discard(key)
+        self._deleted.add(key)
+        return key, value
+
+    def clear(self) -> None:
+        self._deleted.update(self)
+        self._changed.clear()
+        super().clear()
+
+    def __ior__(self, other: Any) -> ChangeTrackingDict[V]:
+        self.update(other)
+        return self
+
+    def mark_changed(self, key: str) -> None:
+        """Flag a value that was modified in place."""
+        if key in self:
+            self._changed.add(key)
+
+    def changes(self) -> tuple[dict[str, V], set[str]]:
+        """Current values of changed keys, and deleted keys, since the last clear."""
+        return {key: self[key] for key in self._changed}, set(self._deleted)
+
+    def clear_changes(self) -> None:
+        """Mark the current contents as persisted."""
+        self._changed.clear()
+        self._deleted.clear()
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        args = get_args(source_type)
+        value_schema = handler.generate_schema(args[0]) if args else core_schema.any_schema()
+        dict_schema = core_schema.dict_schema(core_schema.str_schema(), value_schema)
+        from_dict = core_schema.no_info_after_validator_function(cls, dict_schema)
+        return core_schema.json_or_python_schema(
+            json_schema=from_dict,
+            python_schema=core_schema.union_schema([core_schema.is_instance_schema(cls), from_dict]),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                dict, return_schema=dict_schema
+            ),
+        )
+
+
 # =============================================================================
 # Novelty Guard
 # =============================================================================
@@ -497,22 +687,57 @@ class QueryRecord(BaseModel):
 
 
 class NoveltyGuard(BaseModel):
-    """Tracks query history to prevent redundant searches."""
-    query_history: dict[str, QueryRecord] = Field(default_factory=dict)  # hash -> record
+    """Tracks query history to prevent redundant searches.
+
+    A query is not novel if the same normalized query already ran against the
+    tier, or if a MinHash/LSH index of earlier queries finds one whose
+    shingle Jaccard similarity reaches ``similarity_threshold`` ("John Smith
+    1880 Ohio" vs "Smith, John b. 1880 OH").
+    """
+    query_history: ChangeTrackingDict[QueryRecord] = Field(default_factory=ChangeTrackingDict)  # hash -> record
     similarity_threshold: float = 0.9  # For fuzzy matching
+    index_capacity: int = 1_000_000  # Most recent queries kept for fuzzy matching
+
+    _index: QueryLSH | None = PrivateAttr(default=None)
+
+    @staticmethod
+    def _key(query: str, source_tier: SourceTier) -> tuple[str, str]:
+        query_hash = hashlib.md5(query.lower().strip().encode()).hexdigest()
+        return query_hash, f"{query_hash}:{source_tier.value}"
+
+    @property
+    def index(self) -> QueryLSH:
+        """Near-duplicate index, rebuilt from the history on first use."""
+        if self._index is None:
+            records = sorted(self.query_history.values(), key=lambda r: r.executed_at)
+            self._index = QueryLSH.from_queries(
+                ((r.query_string, r.source_tier.value) for r in records),
+                threshold=self.similarity_threshold,
+                capacity=self.index_capacity,
+            )
+        return self._index
+
+    def attach_index(self, index: QueryLSH) -> None:
+        """Use a persisted index instead of rebuilding it from the history."""
+        self._index = index
+
+    def find_duplicate(self, query: str, source_tier: SourceTier) -> str | None:
+        """Return the earlier query that makes this one redundant, if any."""
+        _, key = self._key(query, source_tier)
+        record = self.query_history.get(key)
+        if record is not None:
+            return record.query_string
+        return self.index.find_similar(query, source_tier.value)
 
     def is_novel(self, query: str, source_tier: SourceTier) -> bool:
-        """Check if a query is novel (not previously executed)."""
-        normalized = query.lower().strip()
-        query_hash = hashlib.md5(normalized.encode()).hexdigest()
-        key = f"{query_hash}:{source_tier.value}"
-        return key not in self.query_history
+        """Check if a query is novel (not previously executed, even reworded)."""
+        return self.find_duplicate(query, source_tier) is None
 
     def record_query(self, query: str, source_tier: SourceTier, result_count: int = 0) -> None:
         """Record a query execution."""
-        normalized = query.lower().strip()
-        query_hash = hashlib.md5(normalized.encode()).hexdigest()
-        key = f"{query_hash}:{source_tier.value}"
+        query_hash, key = self._key(query, source_tier)
+        if key not in self.query_history:
+            self.index.add(query, source_tier.value)
         self.query_history[key] = QueryRecord(
             query_hash=query_hash,
             query_string=query,
@@ -535,19 +760,19 @@ class CrawlerState(BaseModel):
     seed_person_id: UUID | None = None
     target_generations: int = 4
 
-    # Knowledge graph
-    persons: dict[str, Person] = Field(default_factory=dict)  # UUID string -> Person
+    # Knowledge graph (persons and source records are checkpointed incrementally)
+    persons: ChangeTrackingDict[Person] = Field(default_factory=ChangeTrackingDict)  # UUID string -> Person
     events: dict[str, Event] = Field(default_factory=dict)
     relationships: dict[str, Relationship] = Field(default_factory=dict)
     assertions: dict[str, Assertion] = Field(default_factory=dict)
     evidence_claims: dict[str, EvidenceClaim] = Field(default_factory=dict)
-    source_records: dict[str, SourceRecord] = Field(default_factory=dict)
+    source_records: ChangeTrackingDict[SourceRecord] = Field(default_factory=ChangeTrackingDict)
     merge_clusters: dict[str, MergeCluster] = Field(default_factory=dict)
 
-    # Queues
-    frontier_queue: list[FrontierItem] = Field(default_factory=list)
-    clue_queue: list[ClueItem] = Field(default_factory=list)
-    revisit_queue: list[RevisitItem] = Field(default_factory=list)
+    # Queues (serialized as lists in pop order)
+    frontier_queue: PriorityQueue[FrontierItem] = Field(default_factory=PriorityQueue)
+    clue_queue: PriorityQueue[ClueItem] = Field(default_factory=PriorityQueue)
+    revisit_queue: PriorityQueue[RevisitItem] = Field(default_factory=PriorityQueue)
 
     # Novelty tracking
     novelty_guard: NoveltyGuard = Field(default_factory=NoveltyGuard)
@@ -570,6 +795,9 @@ class CrawlerState(BaseModel):
     is_terminated: bool = False
     termination_reason: str | None = None
 
+    # Audit log entries already written by the last checkpoint
+    _audit_checkpoint: int = PrivateAttr(default=0)
+
     def add_person(self, person: Person) -> None:
         """Add a person to the knowledge graph."""
         self.persons[str(person.id)] = person
@@ -584,37 +812,28 @@ class CrawlerState(BaseModel):
         for tier in item.source_tiers:
             if not self.novelty_guard.is_novel(item.query_string, tier):
                 return False
-        self.frontier_queue.append(item)
-        self.frontier_queue.sort(key=lambda x: x.priority, reverse=True)
+        self.frontier_queue.push(item)
         return True
 
     def add_clue(self, clue: ClueItem) -> None:
         """Add a clue to the queue."""
-        self.clue_queue.append(clue)
-        self.clue_queue.sort(key=lambda x: x.priority, reverse=True)
+        self.clue_queue.push(clue)
 
     def add_revisit(self, item: RevisitItem) -> None:
         """Add a revisit job."""
-        self.revisit_queue.append(item)
-        self.revisit_queue.sort(key=lambda x: x.priority, reverse=True)
+        self.revisit_queue.push(item)
 
     def pop_frontier(self) -> FrontierItem | None:
         """Pop highest priority frontier item."""
-        if not self.frontier_queue:
-            return None
-        return self.frontier_queue.pop(0)
+        return self.frontier_queue.pop()
 
     def pop_clue(self) -> ClueItem | None:
         """Pop highest priority clue."""
-        if not self.clue_queue:
-            return None
-        return self.clue_queue.pop(0)
+        return self.clue_queue.pop()
 
     def pop_revisit(self) -> RevisitItem | None:
         """Pop highest priority revisit."""
-        if not self.revisit_queue:
-            return None
-        return self.revisit_queue.pop(0)
+        return self.revisit_queue.pop()
 
     def log_audit(
         self,
@@ -636,3 +855,22 @@ class CrawlerState(BaseModel):
             after_state=after,
             rationale=rationale,
         ))
+
+    def touch_person(self, person: Person) -> None:
+        """Record an in-place update to a person for the next checkpoint."""
+        person.updated_at = datetime.now(UTC)
+        self.persons.mark_changed(str(person.id))
+
+    def unsaved_audit_log(self) -> list[AuditLog]:
+        """Audit log entries appended since the last checkpoint."""
+        return self.audit_log[self._audit_checkpoint:]
+
+    def clear_changes(self) -> None:
+        """Mark the whole state as persisted (after a checkpoint or load)."""
+        self.persons.clear_changes()
+        self.source_records.clear_changes()
+        self.frontier_queue.clear_changes()
+        self.clue_queue.clear_changes()
+        self.revisit_queue.clear_changes()
+        self.novelty_guard.query_history.clear_changes()
+        self._audit_checkpoint = len(self.audit_log)
@@ -0,0 +1,305 @@
+"""Near-duplicate query detection for the NoveltyGuard.
+
+Queries are canonicalized (lower-cased, punctuation and qualifiers such as
+"b." dropped, US state abbreviations expanded, tokens sorted), shingled into
+character 3-grams and MinHashed. A banded LSH index returns earlier queries
+that share enough bands with the new one, and a candidate only counts if the
+exact Jaccard similarity of the shingle sets reaches the threshold, so the
+LSH affects recall but never produces a false duplicate.
+
+Memory is bounded by ``capacity``: queries live in a ring buffer, and band
+entries for overwritten slots are ignored and dropped at the next merge.
+Each band is a sorted ``array('Q')`` of ``band_hash << 32 | seq`` entries
+searched with bisect, plus a small dict of recent entries merged in batches.
+"""
+from __future__ import annotations
+
+import re
+import struct
+import zlib
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from functools import lru_cache
+from heapq import merge
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Set
+
+# Dropped tokens: birth qualifiers and filler words. A bare year in a person
+# query already reads as a birth year, so "b. 1880" and "1880" match. No
+# token that could be a place is dropped unconditionally: that would make a
+# place-scoped query a duplicate of the unscoped one.
+_QUALIFIERS = frozenset({
+    "born", "abt", "about", "circa", "bef", "aft", "est",
+    "of", "the", "and", "at",
+})
+# Dropped only before a year ("b. 1880", "c. 1850")
+_YEAR_QUALIFIERS = frozenset({"b", "c"})
+# Dropped only before a place name ("born in Ohio"); at the end of a query or
+# before a year, "IN" is Indiana
+_PREPOSITIONS = frozenset({"in"})
+_YEAR = re.compile(r"\d{4}")
+
+_US_STATES = {
+    "al": "alabama", "ak": "alaska", "az": "arizona", "ar": "arkansas",
+    "calif": "california", "colo": "colorado", "ct": "connecticut", "de": "delaware",
+    "fl": "florida", "ga": "georgia", "hi": "hawaii", "id": "idaho",
+    "il": "illinois", "ind": "indiana", "ia": "iowa", "ks": "kansas", "ky": "kentucky",
+    "la": "louisiana", "md": "maryland", "ma": "massachusetts",
+    "mi": "michigan", "mn": "minnesota", "ms": "mississippi", "mo": "missouri",
+    "mt": "montana", "ne": "nebraska", "nv": "nevada", "nh": "new hampshire",
+    "nj": "new jersey", "nm": "new mexico", "ny": "new york", "nc": "north carolina",
+    "nd": "north dakota", "oh": "ohio", "ok": "oklahoma", "ore": "oregon",
+    "pa": "pennsylvania", "ri": "rhode island", "sc": "south carolina",
+    "sd": "south dakota", "tn": "tennessee", "tx": "texas", "ut": "utah",
+    "vt": "vermont", "va": "virginia", "wa": "washington", "wv": "west virginia",
+    "wi": "wisconsin", "wy": "wyoming", "dc": "district of columbia",
+}
+# Postal codes that collide with common words (IN, ME, OR) or with "ca."
+# (circa) and "co." (county) are kept as written; the older abbreviations
+# expand instead
+_ABBREVIATIONS = {
+    "d": "died", "dec": "died", "deceased": "died", "m": "married",
+    "cnty": "county", "twp": "township",
+}
+
+_TOKEN = re.compile(r"[^\W_]+")
+
+# Mersenne prime modulus for the (a * x + b) mod p hash family
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+# Permuted hashes are kept as int tuples (about 2 KiB per gram), which
+# min() reads twice as fast as arrays
+_GRAM_CACHE_SIZE = 1 << 14
+_SHINGLE_CACHE_SIZE = 1 << 16
+
+_HEADER = struct.Struct(">4sdIIIQ")
+_MAGIC = b"QLSH"
+
+
+def canonicalize_query(query: str) -> str:
+    """Order- and punctuation-insensitive form of a search query."""
+    tokens: set[str] = set()
+    words = _TOKEN.findall(query.lower())
+    for i, token in enumerate(words):
+        following = words[i + 1] if i + 1 < len(words) else ""
+        if (
+            token in _QUALIFIERS
+            or (token in _YEAR_QUALIFIERS and _YEAR.fullmatch(following))
+            or (token in _PREPOSITIONS and following.isalpha())
+        ):
+            continue
+        token = _ABBREVIATIONS.get(token, token)
+        tokens.update(_US_STATES.get(token, token).split())
+    return " ".join(sorted(tokens))
+
+
+@lru_cache(maxsize=_SHINGLE_CACHE_SIZE)
+def shingles(canonical: str, k: int = 3) -> frozenset[str]:
+    """Character k-grams of a canonical query (padded so short words count)."""
+    padded = f" {canonical} "
+    if len(padded) <= k:
+        return frozenset((padded,))
+    return frozenset(padded[i:i + k] for i in range(len(padded) - k + 1))
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    """Jaccard similarity of two sets."""
+    if not a and not b:
+        return 1.0
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
+
+
+class QueryLSH:
+    """MinHash/LSH index of recorded queries, keyed by source tier."""
+
+    def __init__(
+        self,
+        threshold: float = 0.9,
+        capacity: int = 1_000_000,
+        num_perm: int = 48,
+        bands: int = 8,
+        merge_min: int = 50_000,
+    ) -> None:
+        """Create an empty index.
+
+        Args:
+            threshold: Minimum Jaccard similarity of shingle sets for a match
+            capacity: Maximum queries kept; the oldest are forgotten first
+            num_perm: MinHash permutations (must be divisible by ``bands``)
+            bands: LSH bands; more bands raise recall below the threshold
+            merge_min: Pending queries that trigger a merge into the sorted arrays
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.threshold = threshold
+        self.capacity = capacity
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.merge_min = merge_min
+        # A candidate must share this many bands, about half the number
+        # expected at the threshold; this prunes the many loosely similar
+        # queries (same surname, same place) before the exact check
+        self.min_bands = max(1, int(bands * threshold**self.rows / 2))
+        # Deterministic hash family so persisted band hashes stay valid
+        self._perms = [
+            ((zlib.crc32(f"a{i}".encode()) << 29 | 1) % _PRIME, zlib.crc32(f"b{i}".encode()))
+            for i in range(num_perm)
+        ]
+        self._gram_hashes: dict[str, tuple[int, ...]] = {}
+        self._queries: list[str] = []
+        self._tiers = bytearray()
+        self._count = 0
+        self._sorted = [array("Q") for _ in range(bands)]
+        self._pending: list[dict[int, list[int]]] = [{} for _ in range(bands)]
+        self._pending_count = 0
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    # ------------------------------------------------------------------
+    # Hashing
+    # ------------------------------------------------------------------
+
+    def _signature(self, grams: Set[str]) -> list[int]:
+        # Shingles repeat heavily across queries (names, years, places), so
+        # each one's permuted hashes are computed once and cached
+        cache = self._gram_hashes
+        rows = []
+        for gram in grams:
+            row = cache.get(gram)
+            if row is None:
+                if len(cache) >= _GRAM_CACHE_SIZE:
+                    cache.clear()
+                h = zlib.crc32(gram.encode())
+                row = cache[gram] = tuple([(a * h + b) % _PRIME & _MAX_HASH for a, b in self._perms])
+            rows.append(row)
+        return list(map(min, zip(*rows, strict=True)))
+
+    def _band_hashes(self, grams: Set[str], tier: int) -> list[int]:
+        sig = self._signature(grams)
+        r = self.rows
+        return [
+            zlib.crc32(struct.pack(f">BB{r}I", tier, band, *sig[band * r:(band + 1) * r]))
+            for band in range(self.bands)
+        ]
+
+    # ------------------------------------------------------------------
+    # Query and insert
+    # ------------------------------------------------------------------
+
+    def find_similar(self, query: str, tier: int) -> str | None:
+        """Return a recorded canonical query within the threshold, if any."""
+        canonical = canonicalize_query(query)
+        grams = shingles(canonical)
+        votes: Counter[int] = Counter()
+        for band, band_hash in enumerate(self._band_hashes(grams, tier)):
+            votes.update(self._lookup(band, band_hash))
+        oldest = self._count - self.capacity
+        # Most-voted first: an exact repeat shares every band
+        for seq, shared in votes.most_common():
+            if shared < self.min_bands:
+                break
+            slot = seq % self.capacity
+            if seq < oldest or self._tiers[slot] != tier:
+                continue
+            other = self._queries[slot]
+            if other == canonical:
+                return other
+            # |A & B| / |A | B| <= min / max, so skip length mismatches cheaply
+            other_grams = shingles(other)
+            small, large = sorted((len(grams), len(other_grams)))
+            if small >= self.threshold * large and jaccard(grams, other_grams) >= self.threshold:
+                return other
+        return None
+
+    def add(self, query: str, tier: int) -> None:
+        """Record a query as executed against a tier."""
+        canonical = canonicalize_query(query)
+        seq = self._count
+        slot = seq % self.capacity
+        if slot < len(self._queries):
+            self._queries[slot] = canonical
+            self._tiers[slot] = tier
+        else:
+            self._queries.append(canonical)
+            self._tiers.append(tier)
+        self._count += 1
+        for band, band_hash in enumerate(self._band_hashes(shingles(canonical), tier)):
+            self._pending[band].setdefault(band_hash, []).append(seq)
+        self._pending_count += 1
+        if self._pending_count >= max(self.merge_min, len(self._sorted[0]) // 8):
+            self.merge()
+
+    def _lookup(self, band: int, band_hash: int) -> list[int]:
+        entries = self._sorted[band]
+        lo = bisect_left(entries, band_hash << 32)
+        hi = bisect_left(entries, (band_hash + 1) << 32, lo)
+        seqs = [entry & _MAX_HASH for entry in entries[lo:hi]]
+        seqs.extend(self._pending[band].get(band_hash, ()))
+        return seqs
+
+    def merge(self) -> None:
+        """Fold pending band entries into the sorted arrays, dropping stale ones."""
+        oldest = max(0, self._count - self.capacity)
+        for band in range(self.bands):
+            pending = sorted(
+                band_hash << 32 | seq
+                for band_hash, seqs in self._pending[band].items()
+                for seq in seqs
+            )
+            live = (e for e in self._sorted[band] if e & _MAX_HASH >= oldest)
+            self._sorted[band] = array("Q", merge(live, pending))
+            self._pending[band] = {}
+        self._pending_count = 0
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def to_bytes(self) -> bytes:
+        """Serialize the index (merging pending entries first)."""
+        self.merge()
+        queries = "\n".join(self._queries).encode()
+        parts = [
+            _HEADER.pack(_MAGIC, self.threshold, self.capacity, self.num_perm, self.bands, self._count),
+            struct.pack(">Q", len(queries)), queries,
+            bytes(self._tiers),
+        ]
+        for entries in self._sorted:
+            parts += [struct.pack(">Q", len(entries)), entries.tobytes()]
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> QueryLSH:
+        """Restore an index written by ``to_bytes``."""
+        magic, threshold, capacity, num_perm, bands, count = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError("Not a query LSH index")
+        index = cls(threshold=threshold, capacity=capacity, num_perm=num_perm, bands=bands)
+        index._count = count
+        pos = _HEADER.size
+        (n,) = struct.unpack_from(">Q", data, pos)
+        pos += 8
+        index._queries = data[pos:pos + n].decode().split("\n") if count else []
+        pos += n
+        index._tiers = bytearray(data[pos:pos + len(index._queries)])
+        pos += len(index._queries)
+        for band in range(bands):
+            (n,) = struct.unpack_from(">Q", data, pos)
+            pos += 8
+            index._sorted[band].frombytes(data[pos:pos + n * 8])
+            pos += n * 8
+        return index
+
+    @classmethod
+    def from_queries(cls, queries: Iterable[tuple[str, int]], **kwargs: float | int) -> QueryLSH:
+        """Build an index from ``(query, tier)`` pairs, oldest first."""
+        index = cls(**kwargs)
+        for query, tier in queries:
+            index.add(query, tier)
+        return index
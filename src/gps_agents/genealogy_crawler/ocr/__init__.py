@@ -9,6 +9,7 @@ Key components:
 - KrakenOCRAgent: General historical document OCR
 - CensusOCRAgent: Specialized census table extraction
 - PreprocessingPipeline: Image enhancement for OCR
+- iter_page_refs: Stream pages from a directory or multi-page TIFF
 """
 from .models import (
     Baseline,
@@ -21,6 +22,7 @@ from .models import (
     OCREngine,
     OCRProvenance,
     OCRResult,
+    PageRef,
     RecognitionConfidence,
     RecognizedChar,
     RecognizedLine,
@@ -34,6 +36,7 @@ from .agents import (
     KrakenOCRAgent,
     OCRAgent,
     PreprocessingPipeline,
+    iter_page_refs,
 )
 
 __all__ = [
@@ -48,6 +51,7 @@ __all__ = [
     "RecognizedPage",
     "OCRProvenance",
     "OCRResult",
+    "PageRef",
     "OCREngine",
     "DocumentType",
     "RecognitionConfidence",
@@ -61,4 +65,5 @@ __all__ = [
     "KrakenOCRAgent",
     "CensusOCRAgent",
     "PreprocessingPipeline",
+    "iter_page_refs",
 ]
@@ -13,9 +13,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import multiprocessing
 import tempfile
 import time
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from uuid import uuid4
@@ -31,6 +34,7 @@ from .models import (
     OCREngine,
     OCRProvenance,
     OCRResult,
+    PageRef,
     RecognizedLine,
     RecognizedPage,
     RecognizedRegion,
@@ -39,10 +43,82 @@ from .models import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     from PIL import Image
 
 logger = logging.getLogger(__name__)
 
+IMAGE_SUFFIXES = frozenset({
+    ".bmp", ".gif", ".jp2", ".jpeg", ".jpg", ".png", ".tif", ".tiff", ".webp",
+})
+MULTIPAGE_SUFFIXES = frozenset({".tif", ".tiff"})
+
+
+def iter_page_refs(source: Path | str) -> Iterator[PageRef]:
+    """Stream page references from a directory, multi-page TIFF or image.
+
+    Directories are walked in sorted filename order. Only TIFF headers are
+    read (to count frames); pixel data is left for whoever opens the page.
+
+    Args:
+        source: Directory of page images, multi-page TIFF, or single image
+
+    Yields:
+        PageRef for each page, in document order
+    """
+    path = Path(source)
+    if path.is_dir():
+        files = sorted(p for p in path.iterdir() if p.suffix.lower() in IMAGE_SUFFIXES)
+    elif path.exists():
+        files = [path]
+    else:
+        raise FileNotFoundError(f"Image not found: {source}")
+
+    for file in files:
+        frames = 1
+        if file.suffix.lower() in MULTIPAGE_SUFFIXES:
+            from PIL import Image as PILImage
+
+            with PILImage.open(file) as image:
+                frames = getattr(image, "n_frames", 1)
+        for frame in range(frames):
+            yield PageRef(file, frame)
+
+
+def _source_file(image: Image.Image | PageRef | Path | str) -> str | None:
+    if isinstance(image, PageRef):
+        return image.source_file
+    if isinstance(image, (str, Path)):
+        return str(image)
+    return None
+
+
+# =============================================================================
+# Process Pool Workers
+# =============================================================================
+
+# Per-process agent copy; its Kraken models are loaded on first use and then
+# reused for every page the worker handles.
+_worker_agent: KrakenOCRAgent | None = None
+
+
+def _init_worker(agent: KrakenOCRAgent) -> None:
+    global _worker_agent
+    _worker_agent = agent
+
+
+def _recognize_in_worker(
+    image: Image.Image | PageRef | Path | str,
+    document_type: DocumentType,
+) -> RecognizedPage:
+    assert _worker_agent is not None, "worker not initialized"
+    start_time = time.perf_counter()
+    page = _worker_agent.recognize_image_sync(image, document_type)
+    page.processing_time_ms = (time.perf_counter() - start_time) * 1000
+    page.source_file = page.source_file or _source_file(image)
+    return page
+
 
 class OCRAgent(ABC):
     """Abstract base class for OCR agents."""
@@ -50,7 +126,7 @@ class OCRAgent(ABC):
     @abstractmethod
     async def recognize_page(
         self,
-        image: "Image.Image | Path | str",
+        image: Image.Image | PageRef | Path | str,
         **kwargs: Any,
     ) -> OCRResult[RecognizedPage]:
         """Recognize text from a page image."""
@@ -59,7 +135,7 @@ class OCRAgent(ABC):
     @abstractmethod
     async def recognize_document(
         self,
-        images: list["Image.Image | Path | str"],
+        images: Iterable[Image.Image | PageRef | Path | str] | Path | str,
         **kwargs: Any,
     ) -> OCRResult[list[RecognizedPage]]:
         """Recognize text from multiple page images."""
@@ -73,10 +149,15 @@ class KrakenOCRAgent(OCRAgent):
     1. Baseline detection (blla.mlmodel)
     2. Text recognition (trained models for historical scripts)
 
+    With ``workers > 0``, ``recognize_document`` runs pages in a process
+    pool: each worker loads the models once, at most ``max_in_flight`` pages
+    are queued at a time, and pages come back in document order.
+
     Example:
         >>> agent = KrakenOCRAgent(model_name="en_best.mlmodel")
         >>> result = await agent.recognize_page("census_page.jpg")
         >>> print(result.data.text)
+        >>> roll = await KrakenOCRAgent(workers=4).recognize_document("roll_0412.tif")
     """
 
     def __init__(
@@ -84,6 +165,8 @@ class KrakenOCRAgent(OCRAgent):
         model_name: str = "en_best.mlmodel",
         segmentation_model: str = "blla.mlmodel",
         device: str = "cpu",
+        workers: int = 0,
+        max_in_flight: int | None = None,
     ) -> None:
         """Initialize Kraken OCR agent.
 
@@ -91,23 +174,51 @@ class KrakenOCRAgent(OCRAgent):
             model_name: Recognition model (e.g., "en_best.mlmodel")
             segmentation_model: Segmentation model (e.g., "blla.mlmodel")
             device: Processing device ("cpu", "cuda", "mps")
+            workers: Worker processes for recognize_document (0 = in-process)
+            max_in_flight: Pages queued to the pool at once (default 2 per worker)
         """
         self.model_name = model_name
         self.segmentation_model = segmentation_model
         self.device = device
+        self.workers = workers
+        self.max_in_flight = max_in_flight or 2 * max(workers, 1)
         self._model = None
         self._seg_model = None
+        self._pool: ProcessPoolExecutor | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Workers get the configuration only; models load in each process.
+        state = self.__dict__.copy()
+        state.update(_model=None, _seg_model=None, _pool=None)
+        return state
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # Spawn rather than fork: torch (under Kraken) is not fork-safe.
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self,),
+            )
+        return self._pool
+
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
 
     async def recognize_page(
         self,
-        image: "Image.Image | Path | str",
+        image: Image.Image | PageRef | Path | str,
         document_type: DocumentType = DocumentType.UNKNOWN,
         **kwargs: Any,
     ) -> OCRResult[RecognizedPage]:
         """Recognize text from a single page.
 
         Args:
-            image: PIL Image, path to image, or URL
+            image: PIL Image, path to image, or PageRef
             document_type: Type hint for document
             **kwargs: Additional recognition parameters
 
@@ -130,6 +241,9 @@ class KrakenOCRAgent(OCRAgent):
 
             elapsed = (time.time() - start_time) * 1000
             page.processing_time_ms = elapsed
+            page.source_file = page.source_file or _source_file(image)
+            provenance.processing_time_ms = elapsed
+            provenance.page_timings_ms = [elapsed]
             provenance.pages_processed = 1
             provenance.words_recognized = page.word_count
             provenance.overall_confidence = page.confidence
@@ -147,50 +261,116 @@ class KrakenOCRAgent(OCRAgent):
 
     async def recognize_document(
         self,
-        images: list["Image.Image | Path | str"],
+        images: Iterable[Image.Image | PageRef | Path | str] | Path | str,
         document_type: DocumentType = DocumentType.UNKNOWN,
         **kwargs: Any,
     ) -> OCRResult[list[RecognizedPage]]:
         """Recognize text from multiple pages.
 
+        Pages are consumed lazily, so a directory or multi-page TIFF is never
+        loaded in full; in pool mode only ``max_in_flight`` pages are pending.
+
         Args:
-            images: List of page images
+            images: Page images, or a directory / multi-page TIFF to stream
             document_type: Type hint for document
             **kwargs: Additional recognition parameters
 
         Returns:
-            OCRResult with list of RecognizedPage
+            OCRResult with list of RecognizedPage, in document order
         """
         provenance = OCRProvenance(
             ocr_engine=OCREngine.KRAKEN,
             model_name=self.model_name,
         )
+        if isinstance(images, (str, Path)):
+            images = iter_page_refs(images)
+
+        start_time = time.perf_counter()
+        if self.workers > 0:
+            results = self._recognize_in_pool(images, document_type)
+        else:
+            results = self._recognize_in_process(images, document_type, **kwargs)
 
         pages = []
+        warnings = []
         total_words = 0
         total_confidence = 0.0
 
-        for i, img in enumerate(images):
-            result = await self.recognize_page(img, document_type, **kwargs)
-            if result.success and result.data:
-                page = result.data
-                page.page_number = i + 1
-                pages.append(page)
-                total_words += page.word_count
-                total_confidence += page.confidence
-
+        async for page_number, page, error in results:
+            if page is None:
+                warnings.append(f"Page {page_number}: {error}")
+                continue
+            page.page_number = page_number
+            pages.append(page)
+            provenance.page_timings_ms.append(page.processing_time_ms)
+            total_words += page.word_count
+            total_confidence += page.confidence
+
+        provenance.processing_time_ms = (time.perf_counter() - start_time) * 1000
         provenance.pages_processed = len(pages)
         provenance.words_recognized = total_words
         provenance.overall_confidence = total_confidence / len(pages) if pages else 0.0
 
-        return OCRResult.success_result(data=pages, provenance=provenance)
+        return OCRResult.success_result(data=pages, provenance=provenance, warnings=warnings)
 
-    async def _load_image(self, image: "Image.Image | Path | str") -> "Image.Image":
-        """Load image from various sources."""
+    async def _recognize_in_process(
+        self,
+        images: Iterable[Image.Image | PageRef | Path | str],
+        document_type: DocumentType,
+        **kwargs: Any,
+    ):
+        """Yield (page_number, page, error) recognizing one page at a time."""
+        for i, img in enumerate(images, start=1):
+            result = await self.recognize_page(img, document_type, **kwargs)
+            if result.success and result.data:
+                yield i, result.data, None
+            else:
+                yield i, None, result.error
+
+    async def _recognize_in_pool(
+        self,
+        images: Iterable[Image.Image | PageRef | Path | str],
+        document_type: DocumentType,
+    ):
+        """Yield (page_number, page, error) from the worker pool, in order.
+
+        Keeps a window of at most ``max_in_flight`` submitted pages and always
+        awaits the oldest, so results are reassembled in document order while
+        later pages keep the other workers busy.
+        """
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        window: deque[tuple[int, asyncio.Future[RecognizedPage]]] = deque()
+
+        async def next_result():
+            page_number, future = window.popleft()
+            try:
+                return page_number, await future, None
+            except Exception as e:
+                logger.warning("OCR failed on page %d: %s", page_number, e)
+                return page_number, None, str(e)
+
+        try:
+            for i, img in enumerate(images, start=1):
+                if len(window) >= self.max_in_flight:
+                    yield await next_result()
+                window.append(
+                    (i, loop.run_in_executor(pool, _recognize_in_worker, img, document_type))
+                )
+            while window:
+                yield await next_result()
+        finally:
+            for _, future in window:
+                future.cancel()
+
+    def _open_image(self, image: Image.Image | PageRef | Path | str) -> Image.Image:
+        """Open an image from the supported page sources."""
         from PIL import Image as PILImage
 
         if isinstance(image, PILImage.Image):
             return image
+        elif isinstance(image, PageRef):
+            return image.open()
         elif isinstance(image, (str, Path)):
             path = Path(image)
             if path.exists():
@@ -200,24 +380,44 @@ class KrakenOCRAgent(OCRAgent):
         else:
             raise TypeError(f"Unsupported image type: {type(image)}")
 
+    async def _load_image(self, image: Image.Image | PageRef | Path | str) -> Image.Image:
+        """Load image from various sources."""
+        return self._open_image(image)
+
     async def _process_image(
         self,
-        image: "Image.Image",
+        image: Image.Image,
         document_type: DocumentType,
     ) -> RecognizedPage:
-        """Process image with Kraken.
+        """Process image with Kraken."""
+        return self._recognize_image(image, document_type)
+
+    def recognize_image_sync(
+        self,
+        image: Image.Image | PageRef | Path | str,
+        document_type: DocumentType = DocumentType.UNKNOWN,
+    ) -> RecognizedPage:
+        """Open and recognize one page synchronously; used by pool workers."""
+        return self._recognize_image(self._open_image(image), document_type)
+
+    def _recognize_image(
+        self,
+        image: Image.Image,
+        document_type: DocumentType,
+    ) -> RecognizedPage:
+        """Recognize one page synchronously (in-process or in a pool worker).
 
         Falls back to mock implementation if Kraken not available.
         """
         try:
-            return await self._process_with_kraken(image, document_type)
+            return self._recognize_with_kraken(image, document_type)
         except ImportError:
             logger.warning("Kraken not available, using mock OCR")
-            return await self._mock_process(image, document_type)
+            return self._mock_page(image, document_type)
 
-    async def _process_with_kraken(
+    def _recognize_with_kraken(
         self,
-        image: "Image.Image",
+        image: Image.Image,
         document_type: DocumentType,
     ) -> RecognizedPage:
         """Process image using Kraken OCR."""
@@ -292,9 +492,9 @@ class KrakenOCRAgent(OCRAgent):
             confidence=total_confidence / len(lines) if lines else 0.0,
         )
 
-    async def _mock_process(
+    def _mock_page(
         self,
-        image: "Image.Image",
+        image: Image.Image,
         document_type: DocumentType,
     ) -> RecognizedPage:
         """Mock OCR processing for testing."""
@@ -351,7 +551,7 @@ class CensusOCRAgent(KrakenOCRAgent):
 
     async def extract_census_table(
         self,
-        image: "Image.Image | Path | str",
+        image: Image.Image | Path | str,
         census_year: int | None = None,
     ) -> OCRResult[CensusTable]:
         """Extract structured census table from image.
@@ -613,10 +813,14 @@ class PreprocessingPipeline:
     """Image preprocessing pipeline for OCR.
 
     Applies standard preprocessing steps:
-    - Deskewing
-    - Noise removal
+    - Noise removal (median filter; speckle removal after binarization)
     - Contrast enhancement
-    - Binarization
+    - Deskewing (projection-profile skew estimation)
+    - Dark scan border removal
+    - Binarization (Sauvola for faded ink, Otsu, or fixed threshold)
+
+    Thresholding and geometry run vectorized over NumPy arrays (see
+    ``preprocessing``); ``tile_size`` bounds memory on very large scans.
     """
 
     def __init__(
@@ -625,15 +829,40 @@ class PreprocessingPipeline:
         denoise: bool = True,
         enhance_contrast: bool = True,
         binarize: bool = False,
+        remove_borders: bool = False,
+        binarize_method: str = "sauvola",
+        window_size: int = 25,
+        sauvola_k: float = 0.2,
+        max_skew: float = 5.0,
+        tile_size: int | None = 2048,
     ) -> None:
+        from .preprocessing import BINARIZE_METHODS
+
+        if binarize_method not in BINARIZE_METHODS:
+            raise ValueError(f"Unknown binarization method: {binarize_method!r}")
+
         self.deskew = deskew
         self.denoise = denoise
         self.enhance_contrast = enhance_contrast
         self.binarize = binarize
+        self.remove_borders = remove_borders
+        self.binarize_method = binarize_method
+        self.window_size = window_size
+        self.sauvola_k = sauvola_k
+        self.max_skew = max_skew
+        self.tile_size = tile_size
+        self.skew_angle: float | None = None
+
+    async def process(self, image: Image.Image) -> Image.Image:
+        """Apply preprocessing pipeline to image (off the event loop)."""
+        return await asyncio.to_thread(self.apply, image)
 
-    async def process(self, image: "Image.Image") -> "Image.Image":
-        """Apply preprocessing pipeline to image."""
-        from PIL import Image as PILImage, ImageEnhance, ImageFilter
+    def apply(self, image: Image.Image) -> Image.Image:
+        """Apply preprocessing pipeline to image synchronously."""
+        import numpy as np
+        from PIL import Image as PILImage, ImageEnhance
+
+        from . import preprocessing
 
         result = image.copy()
 
@@ -643,17 +872,46 @@ class PreprocessingPipeline:
 
         # Denoise
         if self.denoise:
-            result = result.filter(ImageFilter.MedianFilter(size=3))
+            gray = preprocessing.map_tiles(
+                np.asarray(result), self.tile_size, 1, preprocessing.median3, np.uint8
+            )
+            result = PILImage.fromarray(gray)
 
         # Enhance contrast
         if self.enhance_contrast:
             enhancer = ImageEnhance.Contrast(result)
             result = enhancer.enhance(1.5)
 
+        # Deskew
+        if self.deskew:
+            self.skew_angle = preprocessing.estimate_skew(np.asarray(result), self.max_skew)
+            if self.skew_angle:
+                result = result.rotate(
+                    -self.skew_angle, resample=PILImage.Resampling.BICUBIC, fillcolor=255
+                )
+
+        gray = np.asarray(result)
+
+        # Whiten dark scan borders
+        if self.remove_borders:
+            top, bottom, left, right = preprocessing.find_border(gray)
+            if (top, bottom, left, right) != (0, gray.shape[0], 0, gray.shape[1]):
+                page = np.full_like(gray, 255)
+                page[top:bottom, left:right] = gray[top:bottom, left:right]
+                gray = page
+                result = PILImage.fromarray(gray)
+
         # Binarize (for some OCR engines)
         if self.binarize:
-            threshold = 128
-            result = result.point(lambda x: 255 if x > threshold else 0, "1")
+            ink = preprocessing.binarize(
+                gray,
+                method=self.binarize_method,
+                window=self.window_size,
+                k=self.sauvola_k,
+                remove_speckles=self.denoise,
+                tile_size=self.tile_size,
+            )
+            result = PILImage.fromarray(~ink)
 
         return result
 
@@ -667,6 +925,8 @@ class PreprocessingPipeline:
             steps.append("denoise")
         if self.enhance_contrast:
             steps.append("contrast_enhance")
+        if self.remove_borders:
+            steps.append("border_removal")
         if self.binarize:
             steps.append("binarize")
         return steps
@@ -13,11 +13,16 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
-from typing import Any, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field, computed_field
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from PIL import Image
+
 
 class OCREngine(str, Enum):
     """Supported OCR engines."""
@@ -113,6 +118,31 @@ class BoundingBox:
         }
 
 
+@dataclass(frozen=True)
+class PageRef:
+    """Reference to one page image on disk, opened lazily.
+
+    Multi-page TIFFs (microfilm rolls) are addressed by frame index so a
+    document can be streamed page by page instead of loaded up front.
+    """
+    path: Path
+    frame: int = 0
+
+    @property
+    def source_file(self) -> str:
+        """Source file label, with the frame index for multi-page files."""
+        return f"{self.path}[{self.frame}]" if self.frame else str(self.path)
+
+    def open(self) -> Image.Image:
+        """Open the page and seek to its frame."""
+        from PIL import Image as PILImage
+
+        image = PILImage.open(self.path)
+        if self.frame:
+            image.seek(self.frame)
+        return image
+
+
 @dataclass
 class Baseline:
     """Baseline coordinates for text line detection.
@@ -286,6 +316,10 @@ class OCRProvenance(BaseModel):
     characters_recognized: int = 0
     words_recognized: int = 0
 
+    # Timing (wall clock for the whole call, per page in page order)
+    processing_time_ms: float = 0.0
+    page_timings_ms: list[float] = Field(default_factory=list)
+
 
 T = TypeVar("T")
 
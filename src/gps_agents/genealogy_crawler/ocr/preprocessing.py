@@ -0,0 +1,288 @@
+"""Array-based image preprocessing for historical OCR.
+
+Vectorized NumPy implementations of the steps PreprocessingPipeline applies:
+- 3x3 median denoising (sorting network over shifted views)
+- Projection-profile skew estimation
+- Otsu (global) and Sauvola (local, for faded ink) thresholding
+- Dark scan border detection
+- Speckle removal on binarized pages
+
+Local operations can run over tiles with an overlapping halo, so memory stays
+bounded on very large scans and the result is identical to the untiled one.
+
+Conventions: grayscale images are 2-D ``uint8`` arrays; binarized pages are
+boolean "ink" masks (True = dark foreground).
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+BINARIZE_METHODS = ("sauvola", "otsu", "fixed")
+
+
+# Devillard's 19-exchange median-of-9 network (index pairs to order min, max)
+_MEDIAN9_NETWORK = (
+    (1, 2), (4, 5), (7, 8), (0, 1), (3, 4), (6, 7), (1, 2), (4, 5), (7, 8), (0, 3),
+    (5, 8), (4, 7), (3, 6), (1, 4), (2, 5), (4, 7), (4, 2), (6, 4), (4, 2),
+)
+
+
+# =============================================================================
+# Denoising
+# =============================================================================
+
+
+def median3(gray: np.ndarray) -> np.ndarray:
+    """3x3 median filter (edges replicated).
+
+    Runs a fixed compare-exchange network over the nine shifted views of the
+    image, so every step is a whole-array ``minimum``/``maximum``.
+    """
+    padded = np.pad(gray, 1, mode="edge")
+    h, w = gray.shape
+    p = [padded[dy:dy + h, dx:dx + w] for dy in range(3) for dx in range(3)]
+    for a, b in _MEDIAN9_NETWORK:
+        p[a], p[b] = np.minimum(p[a], p[b]), np.maximum(p[a], p[b])
+    return p[4]
+
+
+# =============================================================================
+# Thresholding
+# =============================================================================
+
+
+def histogram(gray: np.ndarray, chunk: int = 1 << 20) -> np.ndarray:
+    """256-bin histogram, counted in chunks (bincount widens to intp)."""
+    flat = gray.reshape(-1)
+    hist = np.zeros(256, dtype=np.int64)
+    for start in range(0, flat.size, chunk):
+        hist += np.bincount(flat[start:start + chunk], minlength=256)
+    return hist
+
+
+def otsu_threshold(gray: np.ndarray) -> int:
+    """Global Otsu threshold; pixels ``<=`` the result are ink."""
+    hist = histogram(gray).astype(np.float64)
+    total = hist.sum()
+    if total == 0:
+        return 128
+
+    levels = np.arange(256, dtype=np.float64)
+    weight_bg = np.cumsum(hist)
+    mass_bg = np.cumsum(hist * levels)
+    weight_fg = total - weight_bg
+    mean_bg = mass_bg / np.maximum(weight_bg, 1)
+    mean_fg = (mass_bg[-1] - mass_bg) / np.maximum(weight_fg, 1)
+    between = weight_bg * weight_fg * (mean_bg - mean_fg) ** 2
+    return int(np.argmax(between))
+
+
+def _window_sums(values: np.ndarray, window: int) -> np.ndarray:
+    """Sum over a ``window`` x ``window`` box around each pixel (reflect edges)."""
+    half = window // 2
+    padded = np.pad(values, half, mode="reflect")
+    integral = np.zeros((padded.shape[0] + 1, padded.shape[1] + 1), dtype=np.float64)
+    np.cumsum(padded, axis=0, out=integral[1:, 1:])
+    np.cumsum(integral[1:, 1:], axis=1, out=integral[1:, 1:])
+    return (
+        integral[window:, window:]
+        - integral[:-window, window:]
+        - integral[window:, :-window]
+        + integral[:-window, :-window]
+    )
+
+
+def sauvola_threshold(
+    gray: np.ndarray,
+    window: int = 25,
+    k: float = 0.2,
+    dynamic_range: float = 128.0,
+) -> np.ndarray:
+    """Per-pixel Sauvola threshold ``mean * (1 + k * (std / R - 1))``.
+
+    Window means and variances come from integral images, so the cost is
+    independent of the window size.
+
+    Args:
+        gray: Grayscale image
+        window: Odd neighbourhood size in pixels
+        k: Sensitivity; higher values keep less faint ink
+        dynamic_range: Standard deviation normalizer R
+
+    Returns:
+        float64 threshold array; pixels ``<=`` it are ink
+    """
+    window |= 1
+    values = gray.astype(np.float64)
+    area = float(window * window)
+    mean = _window_sums(values, window) / area
+    variance = _window_sums(values * values, window) / area - mean * mean
+    std = np.sqrt(np.maximum(variance, 0.0))
+    return mean * (1.0 + k * (std / dynamic_range - 1.0))
+
+
+def despeckle(ink: np.ndarray, min_neighbors: int = 1) -> np.ndarray:
+    """Drop ink pixels with fewer than ``min_neighbors`` of 8 neighbours inked."""
+    padded = np.pad(ink, 1).view(np.uint8)
+    h, w = ink.shape
+    neighbors = np.zeros(ink.shape, dtype=np.uint8)
+    for dy in range(3):
+        for dx in range(3):
+            if dy != 1 or dx != 1:
+                neighbors += padded[dy:dy + h, dx:dx + w]
+    return ink & (neighbors >= min_neighbors)
+
+
+def map_tiles(
+    gray: np.ndarray,
+    tile_size: int | None,
+    halo: int,
+    func: Callable[[np.ndarray], np.ndarray],
+    dtype: type = bool,
+) -> np.ndarray:
+    """Apply a local ``func`` tile by tile, with ``halo`` pixels of context.
+
+    The halo must cover ``func``'s neighbourhood radius; the result is then
+    the same as ``func(gray)``.
+    """
+    h, w = gray.shape
+    if tile_size is None or (h <= tile_size and w <= tile_size):
+        return func(gray)
+
+    out = np.empty((h, w), dtype=dtype)
+    for y0 in range(0, h, tile_size):
+        y1 = min(y0 + tile_size, h)
+        py0, py1 = max(y0 - halo, 0), min(y1 + halo, h)
+        for x0 in range(0, w, tile_size):
+            x1 = min(x0 + tile_size, w)
+            px0, px1 = max(x0 - halo, 0), min(x1 + halo, w)
+            result = func(gray[py0:py1, px0:px1])
+            out[y0:y1, x0:x1] = result[y0 - py0:y1 - py0, x0 - px0:x1 - px0]
+    return out
+
+
+def binarize(
+    gray: np.ndarray,
+    method: str = "sauvola",
+    window: int = 25,
+    k: float = 0.2,
+    remove_speckles: bool = False,
+    tile_size: int | None = None,
+) -> np.ndarray:
+    """Binarize a grayscale page into an ink mask.
+
+    Args:
+        gray: Grayscale image
+        method: "sauvola" (local), "otsu" (global) or "fixed" (threshold 128)
+        window: Sauvola window size
+        k: Sauvola sensitivity
+        remove_speckles: Drop isolated single ink pixels
+        tile_size: Process in tiles of this size to bound memory
+
+    Returns:
+        Boolean ink mask
+    """
+    if method not in BINARIZE_METHODS:
+        raise ValueError(f"Unknown binarization method: {method!r}")
+
+    if method == "sauvola":
+        def local(tile: np.ndarray) -> np.ndarray:
+            return tile <= sauvola_threshold(tile, window, k)
+        halo = (window | 1) // 2
+    else:
+        threshold = otsu_threshold(gray) if method == "otsu" else 128
+        def local(tile: np.ndarray) -> np.ndarray:
+            return tile <= threshold
+        halo = 0
+
+    if remove_speckles:
+        threshold_tile = local
+
+        def local(tile: np.ndarray) -> np.ndarray:
+            return despeckle(threshold_tile(tile))
+        halo += 1
+
+    return map_tiles(gray, tile_size, halo, local)
+
+
+# =============================================================================
+# Geometry
+# =============================================================================
+
+
+def estimate_skew(
+    gray: np.ndarray,
+    max_angle: float = 5.0,
+    resolution: float = 0.1,
+    sample_size: int = 1024,
+) -> float:
+    """Estimate page skew from horizontal projection profiles.
+
+    Ink pixels of a downsampled copy are projected onto the vertical axis for
+    every candidate angle at once; text lines are aligned when the profile is
+    sharpest (largest sum of squared bin counts). A coarse 0.5 degree sweep is
+    refined to ``resolution`` around the best angle, never beyond ``max_angle``.
+
+    Returns:
+        Counter-clockwise skew in degrees (rotate by the negative to correct)
+    """
+    step = max(1, max(gray.shape) // sample_size)
+    small = gray[::step, ::step]
+    ink = small <= otsu_threshold(small)
+    ys, xs = np.nonzero(ink)
+    if ys.size < 64 or ys.size > ink.size // 2:
+        return 0.0
+
+    ys = ys.astype(np.float64)
+    xs = xs.astype(np.float64) - xs.mean()
+
+    def sharpest(angles: np.ndarray) -> float:
+        offsets = np.rint(ys[None, :] + np.outer(np.tan(np.radians(angles)), xs)).astype(np.int64)
+        offsets -= offsets.min()
+        span = int(offsets.max()) + 1
+        offsets += (np.arange(len(angles)) * span)[:, None]
+        counts = np.bincount(offsets.ravel(), minlength=len(angles) * span)
+        scores = (counts.reshape(len(angles), span).astype(np.float64) ** 2).sum(axis=1)
+        return float(angles[int(np.argmax(scores))])
+
+    coarse = sharpest(np.arange(-max_angle, max_angle + 0.25, 0.5))
+    fine_angles = np.arange(coarse - 0.5, coarse + 0.5 + resolution / 2, resolution)
+    # Refine within the allowed range only; coarse itself always qualifies
+    fine = sharpest(fine_angles[np.abs(fine_angles) <= max_angle + 1e-9])
+    return round(fine, 3) + 0.0  # no negative zero
+
+
+def find_border(
+    gray: np.ndarray,
+    max_fraction: float = 0.15,
+    ink_fraction: float = 0.6,
+) -> tuple[int, int, int, int]:
+    """Find dark scan/microfilm borders along the page edges.
+
+    Rows and columns at the edges that are mostly ink are treated as border,
+    up to ``max_fraction`` of the page on each side.
+
+    Returns:
+        (top, bottom, left, right) bounds of the page content
+    """
+    h, w = gray.shape
+    ink = gray <= otsu_threshold(gray)
+    dark_rows = ink.mean(axis=1) > ink_fraction
+    dark_cols = ink.mean(axis=0) > ink_fraction
+
+    def edge_run(flags: np.ndarray, limit: int) -> int:
+        flags = flags[:limit]
+        return len(flags) if flags.all() else int(np.argmin(flags))
+
+    max_rows, max_cols = int(h * max_fraction), int(w * max_fraction)
+    return (
+        edge_run(dark_rows, max_rows),
+        h - edge_run(dark_rows[::-1], max_rows),
+        edge_run(dark_cols, max_cols),
+        w - edge_run(dark_cols[::-1], max_cols),
+    )
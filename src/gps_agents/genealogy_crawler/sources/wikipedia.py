@@ -9,8 +9,7 @@ import logging
 import re
 from typing import Any
 
-import httpx
-
+from ...net import shared_client
 from ..models import SourceTier
 from .plugin import (
     ComplianceConfig,
@@ -104,7 +103,7 @@ class WikipediaPlugin(SourcePlugin):
             config = create_wikipedia_config()
         super().__init__(config)
         self._extractor = RegexExtractor()
-        self._client = httpx.AsyncClient(
+        self._client = shared_client(
             headers=config.default_headers,
             timeout=30.0,
         )
@@ -37,6 +37,7 @@ from .models import (
     SourceRecord,
     SourceTier,
 )
+from .novelty import QueryLSH
 
 
 # =============================================================================
@@ -271,6 +272,13 @@ CREATE TABLE IF NOT EXISTS query_history (
 );
 CREATE INDEX IF NOT EXISTS idx_query_history_hash ON query_history(query_hash);
 
+-- Novelty guard near-duplicate index (serialized QueryLSH)
+CREATE TABLE IF NOT EXISTS query_index (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    query_count INTEGER NOT NULL,  -- query_history rows the index covers
+    data BLOB NOT NULL
+);
+
 -- Crawler sessions table
 CREATE TABLE IF NOT EXISTS crawler_sessions (
     session_id TEXT PRIMARY KEY,
@@ -289,6 +297,33 @@ CREATE TABLE IF NOT EXISTS crawler_sessions (
 );
 """
 
+# Upsert statement for each queue table, used by incremental checkpoints
+QUEUE_INSERT_SQL = {
+    "frontier_queue": """
+        INSERT OR REPLACE INTO frontier_queue (
+            id, priority, created_at, status, retry_count, max_retries, error_message,
+            target_entity_id, target_entity_type, query_string, query_hash,
+            source_tiers, context, discovered_from
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """,
+    "clue_queue": """
+        INSERT OR REPLACE INTO clue_queue (
+            id, priority, created_at, status, retry_count, max_retries, error_message,
+            hypothesis_type, hypothesis_text, is_fact, related_person_id,
+            related_source_id, suggested_queries, suggested_sources,
+            evidence_hint, triggering_snippet
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """,
+    "revisit_queue": """
+        INSERT OR REPLACE INTO revisit_queue (
+            id, priority, created_at, status, retry_count, max_retries, error_message,
+            original_source_id, original_query, improved_query, query_improvements,
+            revisit_reason, triggering_clue_id, triggering_discovery,
+            last_visited_at, previous_results_hash
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """,
+}
+
 
 # =============================================================================
 # Storage Class
@@ -382,44 +417,47 @@ class CrawlerStorage:
     # Person CRUD
     # =========================================================================
 
+    _PERSON_SQL = """
+        INSERT OR REPLACE INTO persons (
+            id, canonical_name, given_name, surname, name_variants,
+            birth_date_earliest, birth_date_latest, birth_date_display,
+            death_date_earliest, death_date_latest, death_date_display,
+            birth_place, birth_place_normalized, death_place, death_place_normalized,
+            is_living, privacy_redacted, confidence, merge_cluster_id,
+            created_at, updated_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
     def save_person(self, person: Person) -> None:
         """Save a person to the database."""
         with self.transaction() as cursor:
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO persons (
-                    id, canonical_name, given_name, surname, name_variants,
-                    birth_date_earliest, birth_date_latest, birth_date_display,
-                    death_date_earliest, death_date_latest, death_date_display,
-                    birth_place, birth_place_normalized, death_place, death_place_normalized,
-                    is_living, privacy_redacted, confidence, merge_cluster_id,
-                    created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    str(person.id),
-                    person.canonical_name,
-                    person.given_name,
-                    person.surname,
-                    self._serialize_json(person.name_variants),
-                    self._serialize_datetime(person.birth_date_earliest),
-                    self._serialize_datetime(person.birth_date_latest),
-                    person.birth_date_display,
-                    self._serialize_datetime(person.death_date_earliest),
-                    self._serialize_datetime(person.death_date_latest),
-                    person.death_date_display,
-                    person.birth_place,
-                    person.birth_place_normalized,
-                    person.death_place,
-                    person.death_place_normalized,
-                    int(person.is_living),
-                    int(person.privacy_redacted),
-                    person.confidence,
-                    str(person.merge_cluster_id) if person.merge_cluster_id else None,
-                    self._serialize_datetime(person.created_at),
-                    self._serialize_datetime(person.updated_at),
-                ),
-            )
+            cursor.execute(self._PERSON_SQL, self._person_row(person))
+
+    def _person_row(self, person: Person) -> tuple:
+        """Convert Person model to a persons row."""
+        return (
+            str(person.id),
+            person.canonical_name,
+            person.given_name,
+            person.surname,
+            self._serialize_json(person.name_variants),
+            self._serialize_datetime(person.birth_date_earliest),
+            self._serialize_datetime(person.birth_date_latest),
+            person.birth_date_display,
+            self._serialize_datetime(person.death_date_earliest),
+            self._serialize_datetime(person.death_date_latest),
+            person.death_date_display,
+            person.birth_place,
+            person.birth_place_normalized,
+            person.death_place,
+            person.death_place_normalized,
+            int(person.is_living),
+            int(person.privacy_redacted),
+            person.confidence,
+            str(person.merge_cluster_id) if person.merge_cluster_id else None,
+            self._serialize_datetime(person.created_at),
+            self._serialize_datetime(person.updated_at),
+        )
 
     def get_person(self, person_id: UUID | str) -> Person | None:
         """Get a person by ID."""
@@ -469,32 +507,35 @@ class CrawlerStorage:
     # Source Record CRUD
     # =========================================================================
 
+    _SOURCE_RECORD_SQL = """
+        INSERT OR REPLACE INTO source_records (
+            id, url, source_name, source_tier, accessed_at,
+            content_hash, raw_text, raw_extracted, metadata,
+            robots_respected, cache_hit, rate_limited
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
     def save_source_record(self, record: SourceRecord) -> None:
         """Save a source record."""
         with self.transaction() as cursor:
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO source_records (
-                    id, url, source_name, source_tier, accessed_at,
-                    content_hash, raw_text, raw_extracted, metadata,
-                    robots_respected, cache_hit, rate_limited
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    str(record.id),
-                    record.url,
-                    record.source_name,
-                    record.source_tier.value,
-                    self._serialize_datetime(record.accessed_at),
-                    record.content_hash,
-                    record.raw_text,
-                    self._serialize_json(record.raw_extracted),
-                    self._serialize_json(record.metadata),
-                    int(record.robots_respected),
-                    int(record.cache_hit),
-                    int(record.rate_limited),
-                ),
-            )
+            cursor.execute(self._SOURCE_RECORD_SQL, self._source_record_row(record))
+
+    def _source_record_row(self, record: SourceRecord) -> tuple:
+        """Convert SourceRecord model to a source_records row."""
+        return (
+            str(record.id),
+            record.url,
+            record.source_name,
+            record.source_tier.value,
+            self._serialize_datetime(record.accessed_at),
+            record.content_hash,
+            record.raw_text,
+            self._serialize_json(record.raw_extracted),
+            self._serialize_json(record.metadata),
+            int(record.robots_respected),
+            int(record.cache_hit),
+            int(record.rate_limited),
+        )
 
     def get_source_record(self, record_id: UUID | str) -> SourceRecord | None:
         """Get a source record by ID."""
@@ -526,28 +567,31 @@ class CrawlerStorage:
     # Audit Log
     # =========================================================================
 
+    _AUDIT_LOG_SQL = """
+        INSERT OR REPLACE INTO audit_log (
+            id, action_type, entity_id, entity_type,
+            before_state, after_state, agent_name, rationale, timestamp
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
     def save_audit_log(self, log: AuditLog) -> None:
         """Save an audit log entry."""
         with self.transaction() as cursor:
-            cursor.execute(
-                """
-                INSERT INTO audit_log (
-                    id, action_type, entity_id, entity_type,
-                    before_state, after_state, agent_name, rationale, timestamp
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    str(log.id),
-                    log.action_type.value,
-                    str(log.entity_id),
-                    log.entity_type,
-                    self._serialize_json(log.before_state),
-                    self._serialize_json(log.after_state),
-                    log.agent_name,
-                    log.rationale,
-                    self._serialize_datetime(log.timestamp),
-                ),
-            )
+            cursor.execute(self._AUDIT_LOG_SQL, self._audit_log_row(log))
+
+    def _audit_log_row(self, log: AuditLog) -> tuple:
+        """Convert AuditLog model to an audit_log row."""
+        return (
+            str(log.id),
+            log.action_type.value,
+            str(log.entity_id),
+            log.entity_type,
+            self._serialize_json(log.before_state),
+            self._serialize_json(log.after_state),
+            log.agent_name,
+            log.rationale,
+            self._serialize_datetime(log.timestamp),
+        )
 
     def get_audit_log(
         self,
@@ -582,13 +626,197 @@ class CrawlerStorage:
             timestamp=self._deserialize_datetime(row["timestamp"]) or datetime.now(UTC),
         )
 
+    # =========================================================================
+    # Queues
+    # =========================================================================
+
+    def _queue_item_row(self, item: FrontierItem | ClueItem | RevisitItem) -> tuple:
+        """Convert a queue item to a row of its queue table."""
+        base = (
+            str(item.id),
+            item.priority,
+            self._serialize_datetime(item.created_at),
+            item.status.value,
+            item.retry_count,
+            item.max_retries,
+            item.error_message,
+        )
+        if isinstance(item, FrontierItem):
+            return (*base,
+                str(item.target_entity_id) if item.target_entity_id else None,
+                item.target_entity_type,
+                item.query_string,
+                item.query_hash,
+                self._serialize_json([tier.value for tier in item.source_tiers]),
+                self._serialize_json(item.context),
+                str(item.discovered_from) if item.discovered_from else None,
+            )
+        if isinstance(item, ClueItem):
+            return (*base,
+                item.hypothesis_type.value,
+                item.hypothesis_text,
+                int(item.is_fact),
+                str(item.related_person_id) if item.related_person_id else None,
+                str(item.related_source_id) if item.related_source_id else None,
+                self._serialize_json(item.suggested_queries),
+                self._serialize_json(item.suggested_sources),
+                item.evidence_hint,
+                item.triggering_snippet,
+            )
+        return (*base,
+            str(item.original_source_id),
+            item.original_query,
+            item.improved_query,
+            self._serialize_json(item.query_improvements),
+            item.revisit_reason,
+            str(item.triggering_clue_id) if item.triggering_clue_id else None,
+            item.triggering_discovery,
+            self._serialize_datetime(item.last_visited_at),
+            item.previous_results_hash,
+        )
+
+    def _row_to_queue_item(self, table: str, row: sqlite3.Row) -> FrontierItem | ClueItem | RevisitItem:
+        """Convert a queue table row to its queue item model."""
+        base = {
+            "id": UUID(row["id"]),
+            "priority": row["priority"],
+            "created_at": self._deserialize_datetime(row["created_at"]) or datetime.now(UTC),
+            "status": QueueItemStatus(row["status"]),
+            "retry_count": row["retry_count"],
+            "max_retries": row["max_retries"],
+            "error_message": row["error_message"],
+        }
+        if table == "frontier_queue":
+            return FrontierItem(
+                **base,
+                target_entity_id=UUID(row["target_entity_id"]) if row["target_entity_id"] else None,
+                target_entity_type=row["target_entity_type"],
+                query_string=row["query_string"],
+                query_hash=row["query_hash"],
+                source_tiers=[SourceTier(t) for t in self._deserialize_json(row["source_tiers"]) or []],
+                context=self._deserialize_json(row["context"]) or {},
+                discovered_from=UUID(row["discovered_from"]) if row["discovered_from"] else None,
+            )
+        if table == "clue_queue":
+            return ClueItem(
+                **base,
+                hypothesis_type=HypothesisType(row["hypothesis_type"]),
+                hypothesis_text=row["hypothesis_text"],
+                related_person_id=UUID(row["related_person_id"]) if row["related_person_id"] else None,
+                related_source_id=UUID(row["related_source_id"]) if row["related_source_id"] else None,
+                suggested_queries=self._deserialize_json(row["suggested_queries"]) or [],
+                suggested_sources=self._deserialize_json(row["suggested_sources"]) or [],
+                evidence_hint=row["evidence_hint"],
+                triggering_snippet=row["triggering_snippet"],
+            )
+        return RevisitItem(
+            **base,
+            original_source_id=UUID(row["original_source_id"]),
+            original_query=row["original_query"],
+            improved_query=row["improved_query"],
+            query_improvements=self._deserialize_json(row["query_improvements"]) or [],
+            revisit_reason=row["revisit_reason"],
+            triggering_clue_id=UUID(row["triggering_clue_id"]) if row["triggering_clue_id"] else None,
+            triggering_discovery=row["triggering_discovery"],
+            last_visited_at=self._deserialize_datetime(row["last_visited_at"]),
+            previous_results_hash=row["previous_results_hash"],
+        )
+
+    # =========================================================================
+    # Novelty Guard
+    # =========================================================================
+
+    _QUERY_HISTORY_SQL = """
+        INSERT OR REPLACE INTO query_history (
+            query_hash, source_tier, query_string, executed_at,
+            result_count, result_hash
+        ) VALUES (?, ?, ?, ?, ?, ?)
+    """
+
+    def save_novelty_guard(self, guard: NoveltyGuard) -> None:
+        """Save query history changed since the last save, and the index."""
+        with self.transaction() as cursor:
+            self._write_novelty_guard(cursor, guard)
+        guard.query_history.clear_changes()
+
+    def _write_novelty_guard(self, cursor: sqlite3.Cursor, guard: NoveltyGuard) -> None:
+        """Write query history deltas, and the index once enough is unindexed."""
+        changed, deleted = guard.query_history.changes()
+        cursor.executemany(
+            self._QUERY_HISTORY_SQL,
+            [
+                (
+                    record.query_hash,
+                    record.source_tier.value,
+                    record.query_string,
+                    self._serialize_datetime(record.executed_at),
+                    record.result_count,
+                    record.result_hash,
+                )
+                for record in changed.values()
+            ],
+        )
+        cursor.executemany(
+            "DELETE FROM query_history WHERE query_hash = ? AND source_tier = ?",
+            [tuple(key.rsplit(":", 1)) for key in deleted],
+        )
+        if not guard.query_history:
+            return
+        # The index is rewritten whole, so only once the queries it does not
+        # cover reach 1/8 of the history; loading adds the rest
+        cursor.execute("SELECT query_count FROM query_index WHERE id = 1")
+        row = cursor.fetchone()
+        unindexed = len(guard.query_history) - (row["query_count"] if row else 0)
+        if row is None or unindexed * 8 >= len(guard.query_history):
+            cursor.execute(
+                "INSERT OR REPLACE INTO query_index (id, query_count, data) VALUES (1, ?, ?)",
+                (len(guard.query_history), guard.index.to_bytes()),
+            )
+
+    def load_novelty_guard(self, guard: NoveltyGuard | None = None) -> NoveltyGuard:
+        """Load query history into a guard, reusing the saved index."""
+        guard = guard or NoveltyGuard()
+        history = guard.query_history
+        with self.transaction() as cursor:
+            cursor.execute("SELECT * FROM query_history ORDER BY executed_at")
+            for row in cursor:
+                record = QueryRecord(
+                    query_hash=row["query_hash"],
+                    query_string=row["query_string"],
+                    source_tier=SourceTier(row["source_tier"]),
+                    executed_at=self._deserialize_datetime(row["executed_at"]) or datetime.now(UTC),
+                    result_count=row["result_count"],
+                    result_hash=row["result_hash"],
+                )
+                history[f"{record.query_hash}:{record.source_tier.value}"] = record
+            cursor.execute("SELECT query_count, data FROM query_index WHERE id = 1")
+            row = cursor.fetchone()
+        history.clear_changes()
+        # Without a usable index the guard rebuilds it from the history on
+        # first use
+        if row is not None:
+            index = QueryLSH.from_bytes(row["data"])
+            if index.threshold == guard.similarity_threshold:
+                # History is in execution order; the index covers its head
+                for record in list(history.values())[row["query_count"]:]:
+                    index.add(record.query_string, record.source_tier.value)
+                guard.attach_index(index)
+        return guard
+
     # =========================================================================
     # State Persistence
     # =========================================================================
 
     def save_state(self, state: CrawlerState) -> None:
-        """Save complete crawler state to database."""
-        # Save session
+        """Checkpoint crawler state to the database.
+
+        Writes the session row plus only what changed since the last
+        checkpoint or load: changed and deleted persons and source records,
+        new audit log entries, queue pushes and pops, and new query history,
+        all in one transaction.
+        """
+        persons, deleted_persons = state.persons.changes()
+        records, deleted_records = state.source_records.changes()
         with self.transaction() as cursor:
             cursor.execute(
                 """
@@ -615,21 +843,31 @@ class CrawlerStorage:
                     state.termination_reason,
                 ),
             )
-
-        # Save all persons
-        for person in state.persons.values():
-            self.save_person(person)
-
-        # Save all source records
-        for record in state.source_records.values():
-            self.save_source_record(record)
-
-        # Save all audit logs
-        for log in state.audit_log:
-            self.save_audit_log(log)
+            cursor.executemany(self._PERSON_SQL, map(self._person_row, persons.values()))
+            cursor.executemany("DELETE FROM persons WHERE id = ?", [(key,) for key in deleted_persons])
+            cursor.executemany(self._SOURCE_RECORD_SQL, map(self._source_record_row, records.values()))
+            cursor.executemany("DELETE FROM source_records WHERE id = ?", [(key,) for key in deleted_records])
+            cursor.executemany(self._AUDIT_LOG_SQL, map(self._audit_log_row, state.unsaved_audit_log()))
+
+            for table, queue in (
+                ("frontier_queue", state.frontier_queue),
+                ("clue_queue", state.clue_queue),
+                ("revisit_queue", state.revisit_queue),
+            ):
+                pushed, popped = queue.changes()
+                cursor.executemany(f"DELETE FROM {table} WHERE id = ?", [(str(i),) for i in popped])
+                cursor.executemany(QUEUE_INSERT_SQL[table], map(self._queue_item_row, pushed))
+
+            self._write_novelty_guard(cursor, state.novelty_guard)
+        state.clear_changes()
 
     def load_state(self, session_id: UUID | str) -> CrawlerState | None:
-        """Load crawler state from database."""
+        """Load crawler state from database.
+
+        Streams every person, source record, audit log entry, pending queue
+        item and query history row, and returns a state with no unsaved
+        changes.
+        """
         with self.transaction() as cursor:
             cursor.execute(
                 "SELECT * FROM crawler_sessions WHERE session_id = ?",
@@ -655,8 +893,28 @@ class CrawlerStorage:
                 termination_reason=row["termination_reason"],
             )
 
-            # Load persons
-            for person in self.list_persons(limit=10000):
-                state.persons[str(person.id)] = person
-
-            return state
+            cursor.execute("SELECT * FROM persons")
+            for row in cursor:
+                state.persons[row["id"]] = self._row_to_person(row)
+
+            cursor.execute("SELECT * FROM source_records")
+            for row in cursor:
+                state.source_records[row["id"]] = self._row_to_source_record(row)
+
+            cursor.execute("SELECT * FROM audit_log ORDER BY timestamp, rowid")
+            state.audit_log.extend(self._row_to_audit_log(row) for row in cursor)
+
+            # Rows are in push order, so pushing them again restores the
+            # pop order, including FIFO among equal priorities
+            for table, queue in (
+                ("frontier_queue", state.frontier_queue),
+                ("clue_queue", state.clue_queue),
+                ("revisit_queue", state.revisit_queue),
+            ):
+                cursor.execute(f"SELECT * FROM {table} ORDER BY rowid")
+                for row in cursor:
+                    queue.push(self._row_to_queue_item(table, row))
+
+        self.load_novelty_guard(state.novelty_guard)
+        state.clear_changes()
+        return state
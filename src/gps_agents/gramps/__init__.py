@@ -5,6 +5,7 @@ match-merge logic to prevent duplicate records.
 """
 from __future__ import annotations
 
+from gps_agents.gramps.bulk import GrampsBulkWriter
 from gps_agents.gramps.client import GrampsClient
 from gps_agents.gramps.merge import (
     GrampsMerger,
@@ -36,6 +37,7 @@ __all__ = [
     "EventType",
     "Family",
     # Client
+    "GrampsBulkWriter",
     "GrampsClient",
     "GrampsDate",
     # Match-Merge
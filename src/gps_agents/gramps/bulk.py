@@ -0,0 +1,197 @@
+"""Bulk writes to a Gramps database.
+
+``GrampsClient.add_person`` and the ``upsert_*`` helpers insert one row per
+call: each allocates its Gramps ID with a ``MAX(...)`` scan of the table and
+commits on its own, so loading a large GEDCOM or crawl result is quadratic.
+``GrampsBulkWriter`` (obtained from ``GrampsClient.bulk_writer``) reads each
+table's highest ID once and hands out the following ones in memory, builds
+handles from a per-writer prefix and counter, and buffers rows so that
+blobs are serialized and inserted with ``executemany``, persons, families,
+events, sources and citations alike. The person index is updated with the
+same flush, and everything commits in one transaction.
+
+Example:
+    with client.bulk_writer(projection=projection) as writer:
+        father = writer.add_person(Person(names=[Name(given="John", surname="Smith")]))
+        writer.add_family(Family(husband_id=father))
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any
+
+from uuid_utils import uuid7
+
+from gps_agents.gramps.person_index import name_keys
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from gps_agents.gramps.client import GrampsClient
+    from gps_agents.gramps.models import Citation, Event, Family, Person, Source
+    from gps_agents.projections.sqlite_projection import SQLiteProjection
+
+# Gramps ID prefix per table, as used by the single-row add_* methods
+ID_PREFIXES = {
+    "person": "I",
+    "family": "F",
+    "event": "E",
+    "source": "S",
+    "citation": "C",
+}
+
+# _get_next_id reads CAST(SUBSTR(gramps_id, 2) AS INTEGER): the leading digits
+# after the first character, whatever that character is
+_ID_NUMBER = re.compile(r"\d+")
+
+# Tables whose records have a fingerprint in gps_agents.idempotency.fingerprint
+_FINGERPRINTED = frozenset({"person", "event", "source", "citation"})
+
+
+class GrampsBulkWriter:
+    """Buffers Gramps records and inserts them with ``executemany``.
+
+    Use through ``GrampsClient.bulk_writer``, which owns the transaction.
+    Each ``add_*`` method returns the new record's handle at once, so
+    families can reference persons (and persons families, by passing a
+    handle from ``new_handle``) before anything is written.
+    """
+
+    def __init__(
+        self,
+        client: GrampsClient,
+        *,
+        batch_size: int = 5000,
+        projection: SQLiteProjection | None = None,
+    ) -> None:
+        self.client = client
+        self.batch_size = max(1, batch_size)
+        self.projection = projection
+        self.counts: dict[str, int] = dict.fromkeys(ID_PREFIXES, 0)
+        self._next_ids: dict[str, int] = {}
+        self._handle_prefix = uuid7().hex[-12:]
+        self._handle_seq = 0
+        self._pending: dict[str, list[tuple[str, str, dict[str, Any], Any]]] = {t: [] for t in ID_PREFIXES}
+        self._buffered = 0
+        # (entity_type, record, handle) awaiting record_fingerprints
+        self._written: list[tuple[str, Any, str]] = []
+
+    def new_handle(self) -> str:
+        """Reserve a handle, e.g. for a family its members must point at."""
+        self._handle_seq += 1
+        return f"{self._handle_prefix}{self._handle_seq:08x}"
+
+    def _gramps_id(self, table: str, explicit: str | None) -> str:
+        """Next free Gramps ID for ``table``; only the first call queries."""
+        next_id = self._next_ids.get(table)
+        if next_id is None:
+            next_id = self.client._get_next_id(table)  # noqa: SLF001
+        if explicit:
+            match = _ID_NUMBER.match(explicit, 1)
+            if match:
+                next_id = max(next_id, int(match.group()) + 1)
+            self._next_ids[table] = next_id
+            return explicit
+        self._next_ids[table] = next_id + 1
+        return f"{ID_PREFIXES[table]}{next_id}"
+
+    def _add(
+        self,
+        table: str,
+        record: Any,
+        handle: str | None,
+        build: Callable[[Any, str, str], dict[str, Any]],
+    ) -> str:
+        handle = handle or self.new_handle()
+        gramps_id = self._gramps_id(table, record.gramps_id)
+        self._pending[table].append((handle, gramps_id, build(record, handle, gramps_id), record))
+        if self.projection is not None and table in _FINGERPRINTED:
+            self._written.append((table, record, handle))
+        self.counts[table] += 1
+        self._buffered += 1
+        if self._buffered >= self.batch_size:
+            self.flush()
+        return handle
+
+    # =========================================
+    # Records
+    # =========================================
+
+    def add_person(self, person: Person, handle: str | None = None) -> str:
+        """Queue a person; returns its handle."""
+        return self._add("person", person, handle, self.client._person_data)  # noqa: SLF001
+
+    def add_family(self, family: Family, handle: str | None = None) -> str:
+        """Queue a family; returns its handle."""
+        return self._add("family", family, handle, self.client._family_data)  # noqa: SLF001
+
+    def add_event(self, event: Event, handle: str | None = None) -> str:
+        """Queue an event; returns its handle."""
+        return self._add("event", event, handle, self.client._event_data)  # noqa: SLF001
+
+    def add_source(self, source: Source, handle: str | None = None) -> str:
+        """Queue a source; returns its handle."""
+        return self._add("source", source, handle, self.client._source_data)  # noqa: SLF001
+
+    def add_citation(self, citation: Citation, handle: str | None = None) -> str:
+        """Queue a citation; returns its handle."""
+        return self._add("citation", citation, handle, self.client._citation_data)  # noqa: SLF001
+
+    # =========================================
+    # Writing
+    # =========================================
+
+    def flush(self) -> None:
+        """Insert buffered rows; commits with the enclosing ``bulk_writer``."""
+        if not self._buffered:
+            return
+        conn = self.client._conn  # noqa: SLF001
+        if conn is None:
+            raise RuntimeError("Not connected to database")
+        serialize = self.client._serialize_blob  # noqa: SLF001
+        index = self.client._person_index  # noqa: SLF001
+
+        for table, pending in self._pending.items():
+            if not pending:
+                continue
+            rows = [(handle, gramps_id, serialize(data)) for handle, gramps_id, data, _ in pending]
+            # Table names come from ID_PREFIXES, not from callers
+            conn.executemany(
+                f"INSERT INTO {table} (handle, gramps_id, blob_data) VALUES (?, ?, ?)",
+                rows,
+            )
+            if table == "person" and index is not None:
+                index.add_many(
+                    name_keys(person, handle, len(blob))
+                    for (handle, _, blob), (*_, person) in zip(rows, pending, strict=True)
+                )
+            pending.clear()
+        self._buffered = 0
+
+    def record_fingerprints(self) -> None:
+        """Save fingerprints of the written records in the projection.
+
+        Called by ``bulk_writer`` once the Gramps transaction has committed,
+        so later ``upsert_*`` calls reuse these handles.
+        """
+        if self.projection is None or not self._written:
+            return
+        from gps_agents.idempotency.fingerprint import (
+            fingerprint_citation,
+            fingerprint_event,
+            fingerprint_person,
+            fingerprint_source,
+        )
+
+        fingerprint = {
+            "person": fingerprint_person,
+            "event": fingerprint_event,
+            "source": fingerprint_source,
+            "citation": fingerprint_citation,
+        }
+        self.projection.save_fingerprints(
+            (entity_type, fingerprint[entity_type](record).value, handle)
+            for entity_type, record, handle in self._written
+        )
+        self._written.clear()
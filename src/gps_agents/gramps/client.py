@@ -14,6 +14,7 @@ data in its SQLite database. Only use this with your own trusted Gramps database
 from __future__ import annotations
 
 import json
+import logging
 import sqlite3
 from contextlib import contextmanager
 from datetime import UTC, datetime
@@ -22,7 +23,9 @@ from typing import TYPE_CHECKING, Any, ClassVar
 
 from uuid_utils import uuid7
 
+from gps_agents.gramps.bulk import GrampsBulkWriter
 from gps_agents.gramps.models import (
+    Citation,
     Event,
     EventType,
     Family,
@@ -32,10 +35,15 @@ from gps_agents.gramps.models import (
     Source,
     SourceLevel,
 )
+from gps_agents.gramps.person_index import PersonIndex, index_path_for, name_keys
 
 if TYPE_CHECKING:
     from collections.abc import Generator
 
+    from gps_agents.projections.sqlite_projection import SQLiteProjection
+
+logger = logging.getLogger(__name__)
+
 
 class GrampsClient:
     """
@@ -62,16 +70,20 @@ class GrampsClient:
         "tag": "tag",
     }
 
-    def __init__(self, db_path: str | Path | None = None) -> None:
+    def __init__(self, db_path: str | Path | None = None, person_index: bool = True) -> None:
         """
         Initialize Gramps client.
 
         Args:
             db_path: Path to Gramps database directory or .gramps file
+            person_index: Keep a sidecar name index (see person_index.py)
+                for surname, given-name and phonetic lookups
         """
         self.db_path = Path(db_path) if db_path else None
         self._conn: sqlite3.Connection | None = None
         self._db_file: Path | None = None
+        self._use_person_index = person_index
+        self._person_index: PersonIndex | None = None
 
     def connect(self, db_path: str | Path | None = None) -> None:
         """
@@ -100,14 +112,33 @@ class GrampsClient:
         if not self._db_file.exists():
             raise FileNotFoundError(f"Database not found: {self._db_file}")
 
+        self._open()
+
+    def _open(self) -> None:
+        """Open the connection to ``_db_file`` and attach the person index."""
         self._conn = sqlite3.connect(str(self._db_file))
         self._conn.row_factory = sqlite3.Row
+        self._person_index = None
+        if not self._use_person_index:
+            return
+        try:
+            index = PersonIndex(self._conn, index_path_for(self._db_file))
+            indexed = index.sync(
+                lambda handle, blob: self._person_from_gramps(handle, self._deserialize_blob(blob))
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Person index unavailable for {self._db_file}, using table scans: {e}")
+            return
+        if indexed:
+            logger.info(f"Indexed {indexed} persons in {index.path}")
+        self._person_index = index
 
     def close(self) -> None:
         """Close database connection."""
         if self._conn:
             self._conn.close()
             self._conn = None
+            self._person_index = None
 
     @contextmanager
     def session(self) -> Generator[sqlite3.Connection]:
@@ -286,6 +317,9 @@ class GrampsClient:
         """
         Search for persons matching criteria.
 
+        With the person index, filtering happens in SQL and only matching
+        blobs are deserialized.
+
         Args:
             surname: Surname to search for (case-insensitive partial match)
             given: Given name to search for (case-insensitive partial match)
@@ -297,6 +331,9 @@ class GrampsClient:
         if not self._conn:
             raise RuntimeError("Not connected to database")
 
+        if self._person_index and (surname or given):
+            return self._persons_from_rows(self._person_index.search(surname, given, limit))
+
         results = []
         cursor = self._conn.execute("SELECT handle, blob_data FROM person")
 
@@ -321,6 +358,62 @@ class GrampsClient:
 
         return results
 
+    def find_match_candidates(
+        self,
+        surname: str,
+        given: str = "",
+        birth_year: int | None = None,
+        limit: int = 500,
+    ) -> list[Person]:
+        """
+        Find persons that could be duplicates of a name.
+
+        Candidates have a surname starting with ``surname`` or sharing its
+        Soundex or Metaphone code (if ``surname`` is empty: no surname and
+        a given name with the same Soundex). Those born nearest
+        ``birth_year`` come first.
+
+        Args:
+            surname: Surname of the person being matched
+            given: Given name, used only when surname is empty
+            birth_year: Birth year used to rank candidates
+            limit: Maximum number of candidates
+
+        Returns:
+            Candidate Person objects
+        """
+        if not self._conn:
+            raise RuntimeError("Not connected to database")
+
+        if self._person_index:
+            return self._persons_from_rows(
+                self._person_index.candidates(surname, given, birth_year, limit)
+            )
+
+        # No index: same criteria over a full table scan
+        probe = name_keys(Person(names=[Name(given=given, surname=surname)]))
+        found = []
+        for position, row in enumerate(self._conn.execute("SELECT handle, blob_data FROM person")):
+            person = self._person_from_gramps(row["handle"], self._deserialize_blob(row["blob_data"]))
+            keys = name_keys(person)
+            if not keys.is_candidate_for(probe):
+                continue
+            year = keys.birth_year
+            if birth_year is None:
+                rank: tuple = (position,)
+            else:
+                rank = (year is None, abs(year - birth_year) if year is not None else 0, position)
+            found.append((rank, person))
+        found.sort(key=lambda item: item[0])
+        return [person for _, person in found[:limit]]
+
+    def _persons_from_rows(self, rows: list[sqlite3.Row]) -> list[Person]:
+        """Deserialize (handle, blob_data) rows into Person objects."""
+        return [
+            self._person_from_gramps(row["handle"], self._deserialize_blob(row["blob_data"]))
+            for row in rows
+        ]
+
     def add_person(self, person: Person) -> str:
         """
         Add a person to the Gramps database.
@@ -332,17 +425,30 @@ class GrampsClient:
 
         handle = str(uuid7()).replace("-", "")[:20]
         gramps_id = person.gramps_id or f"I{self._get_next_id('person')}"
+        data = self._person_data(person, handle, gramps_id)
+        blob_data = self._serialize_blob(data)
 
-        # Build Gramps data structure
-        data = {
+        with self.session():
+            self._conn.execute(
+                "INSERT INTO person (handle, gramps_id, blob_data) VALUES (?, ?, ?)",
+                (handle, gramps_id, blob_data)
+            )
+            if self._person_index:
+                self._person_index.add(handle, len(blob_data), self._person_from_gramps(handle, data))
+
+        return handle
+
+    def _person_data(self, person: Person, handle: str, gramps_id: str) -> dict[str, Any]:
+        """Build the Gramps data structure stored for a person."""
+        data: dict[str, Any] = {
             "handle": handle,
             "gramps_id": gramps_id,
             "gender": {"M": 1, "F": 0}.get(person.sex, 2),
             "primary_name": {},
             "alternate_names": [],
             "event_ref_list": [],
-            "family_list": [],
-            "parent_family_list": [],
+            "family_list": list(person.family_ids),
+            "parent_family_list": list(person.parent_family_ids),
             "citation_list": [],
             "note_list": [],
             "media_list": [],
@@ -357,15 +463,97 @@ class GrampsClient:
                 "nick": person.primary_name.nickname or "",
             }
 
-        blob_data = self._serialize_blob(data)
+        # Read back by _person_from_gramps, so birth years survive a round trip
+        for key, event in (("birth", person.birth), ("death", person.death)):
+            if event and (event.date or event.place):
+                data[key] = {
+                    "date": event.date.model_dump() if event.date else None,
+                    "place": event.place.model_dump() if event.place else None,
+                }
 
-        with self.session():
-            self._conn.execute(
-                "INSERT INTO person (handle, gramps_id, blob_data) VALUES (?, ?, ?)",
-                (handle, gramps_id, blob_data)
-            )
+        return data
 
-        return handle
+    def _family_data(self, family: Family, handle: str, gramps_id: str) -> dict[str, Any]:
+        """Build the Gramps data structure stored for a family."""
+        return {
+            "handle": handle,
+            "gramps_id": gramps_id,
+            "father_handle": family.husband_id,
+            "mother_handle": family.wife_id,
+            "child_ref_list": list(family.child_ids),
+            "event_ref_list": [],
+            "note_list": [],
+            "private": False,
+        }
+
+    def _event_data(self, event: Event, handle: str, gramps_id: str) -> dict[str, Any]:
+        """Build the Gramps data structure stored for an event."""
+        return {
+            "handle": handle,
+            "gramps_id": gramps_id,
+            "type": event.event_type.value if isinstance(event.event_type, EventType) else str(event.event_type),
+            "date": event.date.model_dump() if event.date else None,
+            "place": event.place.model_dump() if event.place else None,
+            "description": event.description or "",
+        }
+
+    def _citation_data(self, citation: Citation, handle: str, gramps_id: str) -> dict[str, Any]:
+        """Build the Gramps data structure stored for a citation."""
+        return {
+            "handle": handle,
+            "gramps_id": gramps_id,
+            "source_id": citation.source_id,
+            "page": citation.page or "",
+            "date": citation.date.model_dump() if citation.date else None,
+            "confidence": citation.confidence,
+            "note": citation.note or "",
+        }
+
+    def _source_data(self, source: Source, handle: str, gramps_id: str) -> dict[str, Any]:
+        """Build the Gramps data structure stored for a source."""
+        return {
+            "handle": handle,
+            "gramps_id": gramps_id,
+            "title": source.title,
+            "author": source.author or "",
+            "pubinfo": source.publisher or "",
+            "note_list": [],
+            "media_list": [],
+            "citation_list": [],
+            "reporef_list": [],
+        }
+
+    @contextmanager
+    def bulk_writer(
+        self,
+        *,
+        batch_size: int = 5000,
+        projection: SQLiteProjection | None = None,
+    ) -> Generator[GrampsBulkWriter]:
+        """
+        Write many records in a single transaction.
+
+        Gramps IDs are allocated in memory, rows are inserted with
+        ``executemany`` every ``batch_size`` records and the person index
+        is updated in the same transaction. Nothing is committed if the
+        block raises.
+
+        Args:
+            batch_size: Records buffered before each ``executemany`` flush
+            projection: If given, fingerprints of the written persons,
+                events, sources and citations are recorded in it after commit
+
+        Yields:
+            A GrampsBulkWriter
+        """
+        if not self._conn:
+            raise RuntimeError("Not connected to database")
+
+        writer = GrampsBulkWriter(self, batch_size=batch_size, projection=projection)
+        with self.session():
+            yield writer
+            writer.flush()
+        writer.record_fingerprints()
 
     def _get_next_id(self, table: str) -> int:
         """Get next available ID number for a table.
@@ -492,19 +680,7 @@ class GrampsClient:
 
         handle = str(uuid7()).replace("-", "")[:20]
         gramps_id = source.gramps_id or f"S{self._get_next_id('source')}"
-
-        data = {
-            "handle": handle,
-            "gramps_id": gramps_id,
-            "title": source.title,
-            "author": source.author or "",
-            "pubinfo": source.publisher or "",
-            "note_list": [],
-            "media_list": [],
-            "citation_list": [],
-            "reporef_list": [],
-        }
-
+        data = self._source_data(source, handle, gramps_id)
         blob_data = self._serialize_blob(data)
 
         with self.session():
@@ -581,8 +757,7 @@ class GrampsClient:
             shutil.copy2(self._db_file, backup_file)
         finally:
             # Always reconnect, even if copy fails
-            self._conn = sqlite3.connect(str(self._db_file))
-            self._conn.row_factory = sqlite3.Row
+            self._open()
 
         return backup_file
 
@@ -0,0 +1,416 @@
+"""Vectorized duplicate matching for many persons at once.
+
+``PersonMatcher.find_matches`` looks up and deserializes candidates, then
+scores them one pair at a time, for every person it is asked about.
+Planning a batch that way repeats the Gramps lookups per entity.
+``PersonMatchPool`` loads the Gramps persons once, encodes each of the
+fields ``PersonMatcher._score_match`` reads as integer arrays (names,
+Soundex codes, nickname group, sex, birth/death year and place), looks
+up the candidate set once per group of probes sharing it, and scores all
+(probe, candidate) pairs as flat numpy arrays.
+
+The pool reproduces the matcher exactly: the same candidate filter
+(surname prefix, Soundex or Metaphone; given-name Soundex when the surname
+is empty), the same ``MAX_CANDIDATES`` cut nearest the probe's birth year,
+the same weights, and on equal scores the same first-ranked candidate.
+``best_matches`` therefore returns the top result that
+``find_matches(person, threshold, limit=1)`` would.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import defaultdict
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+from gps_agents.gramps.merge import PersonMatcher
+from gps_agents.gramps.person_index import SCHEMA, NameKeys, name_keys
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from gps_agents.gramps.client import GrampsClient
+    from gps_agents.gramps.models import Event, Person
+
+# Same upper bound as PersonIndex.candidates uses for surname prefix scans
+_MAX_CHAR = "\U0010ffff"
+
+# (probe, candidate) pairs scored per chunk
+_CHUNK_PAIRS = 1 << 21
+
+# Rank key bits: (no birth year, |year difference|, position), low to high
+_POSITION_BITS = 40
+_YEAR_BITS = 21
+
+_EMPTY = np.empty(0, dtype=np.int64)
+
+
+class PoolMatch(NamedTuple):
+    """Best candidate for one probe."""
+    score: float
+    gramps_id: str | None
+
+
+class _Fields:
+    """Integer-coded scoring fields for a list of persons."""
+
+    def __init__(
+        self, persons: Sequence[Person], keys: Sequence[NameKeys], codes: dict[str, int], grow: bool
+    ) -> None:
+        """
+        Encode ``persons``.
+
+        Args:
+            persons: Persons to encode
+            keys: ``name_keys`` of each person
+            codes: Shared string -> code table
+            grow: Add unseen strings to ``codes`` (pool), or code them -2
+                so they equal nothing (probes)
+        """
+        variant_group = _variant_groups()
+
+        def code(value: str) -> int:
+            found = codes.get(value)
+            if found is None:
+                if not grow:
+                    return -2
+                found = codes[value] = len(codes)
+            return found
+
+        n = len(persons)
+        self.has_name = np.zeros(n, dtype=bool)
+        self.surname = np.full(n, -1, dtype=np.int64)
+        self.surname_soundex = np.full(n, -1, dtype=np.int64)
+        self.given = np.full(n, -1, dtype=np.int64)
+        self.given_soundex = np.full(n, -1, dtype=np.int64)
+        self.variant = np.full(n, -1, dtype=np.int64)
+        self.sex = np.full(n, -1, dtype=np.int64)
+        self.sex_present = np.zeros(n, dtype=bool)
+        self.sex_known = np.zeros(n, dtype=bool)
+        # Birth year as name_keys reads it, for candidate ranking
+        self.birth_year = np.zeros(n, dtype=np.int64)
+        self.has_birth_year = np.zeros(n, dtype=bool)
+        events = {kind: _EventFields(n) for kind in ("birth", "death")}
+
+        for i, (person, k) in enumerate(zip(persons, keys, strict=True)):
+            if person.primary_name:
+                self.has_name[i] = True
+                self.surname[i] = code(k.surname)
+                self.surname_soundex[i] = code(k.surname_soundex)
+                self.given[i] = code(k.given)
+                self.given_soundex[i] = code(k.given_soundex)
+                self.variant[i] = variant_group.get(k.given, -1)
+            if k.birth_year is not None:
+                self.birth_year[i] = k.birth_year
+                self.has_birth_year[i] = True
+            if person.sex:
+                self.sex[i] = code(person.sex)
+                self.sex_present[i] = True
+                self.sex_known[i] = person.sex != "U"
+            events["birth"].set(i, person.birth, code)
+            events["death"].set(i, person.death, code)
+
+        self.birth = events["birth"]
+        self.death = events["death"]
+
+
+class _EventFields:
+    """Year and place arrays for one event kind."""
+
+    def __init__(self, n: int) -> None:
+        self.present = np.zeros(n, dtype=bool)
+        self.year = np.zeros(n, dtype=np.int64)  # 0: no date or no year
+        self.place = np.full(n, -1, dtype=np.int64)  # -1: no place
+
+    def set(self, i: int, event: Event | None, code) -> None:
+        if event is None:
+            return
+        self.present[i] = True
+        if event.date and event.date.year:
+            self.year[i] = event.date.year
+        if event.place:
+            self.place[i] = code(str(event.place).lower())
+
+
+def _variant_groups() -> dict[str, int]:
+    """Lower-cased given name -> index of its PersonMatcher.NAME_VARIANTS group."""
+    groups: dict[str, int] = {}
+    for group, (base, variants) in enumerate(PersonMatcher.NAME_VARIANTS.items()):
+        for name in (base, *variants):
+            groups.setdefault(name, group)
+    return groups
+
+
+def _candidate_key(keys: NameKeys) -> tuple[str, ...] | None:
+    """Probes with equal keys share one candidate set."""
+    if keys.surname:
+        return (keys.surname, keys.surname_soundex, keys.surname_metaphone)
+    if keys.given:
+        return ("", keys.given_soundex)
+    return None
+
+
+class PersonMatchPool:
+    """Gramps persons encoded for batch scoring against many probes."""
+
+    def __init__(
+        self,
+        persons: Sequence[Person],
+        positions: Sequence[int] | None = None,
+        keys: Sequence[NameKeys] | None = None,
+    ) -> None:
+        """
+        Build the pool.
+
+        Args:
+            persons: Candidate persons
+            positions: Ranking order used to break ties and to pick the
+                ``MAX_CANDIDATES`` nearest a birth year (default: list order)
+            keys: ``name_keys`` of each person, if already known (e.g. read
+                from the person index)
+        """
+        keys = list(keys) if keys is not None else [name_keys(p) for p in persons]
+        if positions is not None:
+            order = sorted(range(len(persons)), key=positions.__getitem__)
+            persons = [persons[i] for i in order]
+            keys = [keys[i] for i in order]
+            positions = [positions[i] for i in order]
+        self.persons = list(persons)
+        self.gramps_ids = [p.gramps_id for p in self.persons]
+        self.positions = np.asarray(positions if positions is not None else range(len(persons)), dtype=np.int64)
+        self._codes: dict[str, int] = {}
+        self.fields = _Fields(self.persons, keys, self._codes, grow=True)
+
+
+        by_surname = sorted(range(len(keys)), key=lambda i: keys[i].surname)
+        self._sorted_surnames = [keys[i].surname for i in by_surname]
+        self._surname_order = np.asarray(by_surname, dtype=np.int64)
+        soundex_groups: dict[str, list[int]] = defaultdict(list)
+        metaphone_groups: dict[str, list[int]] = defaultdict(list)
+        given_groups: dict[str, list[int]] = defaultdict(list)
+        for i, k in enumerate(keys):
+            soundex_groups[k.surname_soundex].append(i)
+            metaphone_groups[k.surname_metaphone].append(i)
+            if not k.surname:
+                given_groups[k.given_soundex].append(i)
+        self._by_soundex = {c: np.asarray(v, dtype=np.int64) for c, v in soundex_groups.items()}
+        self._by_metaphone = {c: np.asarray(v, dtype=np.int64) for c, v in metaphone_groups.items()}
+        self._by_given_soundex = {c: np.asarray(v, dtype=np.int64) for c, v in given_groups.items()}
+
+    @classmethod
+    def from_client(cls, client: GrampsClient) -> PersonMatchPool:
+        """
+        Load every person from a connected client in one scan.
+
+        Candidates are ranked the way ``find_match_candidates`` ranks them:
+        by person index row when the index is attached, else by table order.
+        With the index, name keys are read from it rather than recomputed.
+        """
+        conn = client._conn  # noqa: SLF001
+        if not conn:
+            raise RuntimeError("Not connected to database")
+        persons, positions, keys = [], [], []
+        if client._person_index:  # noqa: SLF001
+            rows = conn.execute(
+                f"SELECT p.blob_data, i.rowid, i.* FROM {SCHEMA}.person_names i"
+                " JOIN person p ON p.handle = i.handle"
+            )
+            for blob, position, *index_row in rows:
+                keys.append(NameKeys(*index_row))
+                persons.append(client._person_from_gramps(index_row[0], client._deserialize_blob(blob)))  # noqa: SLF001
+                positions.append(position)
+            return cls(persons, positions, keys)
+        for position, (handle, blob) in enumerate(conn.execute("SELECT handle, blob_data FROM person")):
+            persons.append(client._person_from_gramps(handle, client._deserialize_blob(blob)))  # noqa: SLF001
+            positions.append(position)
+        return cls(persons, positions)
+
+    def __len__(self) -> int:
+        return len(self.persons)
+
+    def _candidates(self, keys: NameKeys) -> np.ndarray:
+        """Pool indices passing ``NameKeys.is_candidate_for`` (unordered)."""
+        if keys.surname:
+            lo = bisect_left(self._sorted_surnames, keys.surname)
+            hi = bisect_left(self._sorted_surnames, keys.surname + _MAX_CHAR, lo)
+            parts = [self._surname_order[lo:hi]]
+            if keys.surname_soundex:
+                parts.append(self._by_soundex.get(keys.surname_soundex, _EMPTY))
+            if keys.surname_metaphone:
+                parts.append(self._by_metaphone.get(keys.surname_metaphone, _EMPTY))
+            parts = [p for p in parts if len(p)]
+            if len(parts) == 1:
+                return parts[0]
+            return np.unique(np.concatenate(parts)) if parts else _EMPTY
+        if keys.given:
+            return self._by_given_soundex.get(keys.given_soundex, _EMPTY)
+        return _EMPTY
+
+    def best_matches(
+        self,
+        persons: Sequence[Person],
+        threshold: float = 50.0,
+        max_candidates: int = PersonMatcher.MAX_CANDIDATES,
+    ) -> list[PoolMatch | None]:
+        """
+        Best-scoring candidate for each person.
+
+        Probes sharing a candidate set and a birth year rank their
+        candidates identically, so each such group is looked up, cut to
+        ``max_candidates`` and sorted once. Every remaining (probe,
+        candidate) pair is then scored as flat arrays, a chunk at a time.
+
+        Args:
+            persons: Probes
+            threshold: Minimum score, as for ``find_matches``
+            max_candidates: Candidates scored per probe
+
+        Returns:
+            One PoolMatch per person, or None where nothing reaches
+            ``threshold``
+        """
+        results: list[PoolMatch | None] = [None] * len(persons)
+        probe_keys = [name_keys(p) for p in persons]
+        probes = _Fields(persons, probe_keys, self._codes, grow=False)
+        groups: dict[tuple[tuple[str, ...], int | None], list[int]] = defaultdict(list)
+        for i, (person, keys) in enumerate(zip(persons, probe_keys, strict=True)):
+            if person.primary_name:
+                key = _candidate_key(keys)
+                if key is not None:
+                    groups[key, keys.birth_year].append(i)
+
+        lookups: dict[tuple[str, ...], np.ndarray] = {}
+        pending_rows: list[np.ndarray] = []
+        pending_candidates: list[np.ndarray] = []
+        pending = 0
+        for (key, birth_year), rows in groups.items():
+            candidates = lookups.get(key)
+            if candidates is None:
+                candidates = lookups[key] = self._candidates(probe_keys[rows[0]])
+            if not len(candidates):
+                continue
+            candidates = self._ranked(candidates, birth_year, max_candidates)
+            pending_rows.append(np.repeat(np.asarray(rows, dtype=np.int64), len(candidates)))
+            pending_candidates.append(np.tile(candidates, len(rows)))
+            pending += len(rows) * len(candidates)
+            if pending >= _CHUNK_PAIRS:
+                self._pick(probes, pending_rows, pending_candidates, threshold, results)
+                pending_rows, pending_candidates, pending = [], [], 0
+        if pending:
+            self._pick(probes, pending_rows, pending_candidates, threshold, results)
+        return results
+
+    def _ranked(self, candidates: np.ndarray, birth_year: int | None, limit: int) -> np.ndarray:
+        """
+        The first ``limit`` candidates in ``find_match_candidates`` order.
+
+        With a birth year: candidates with a year before those without,
+        nearest year first; then index position, which is the only order
+        without a birth year.
+        """
+        positions = self.positions[candidates]
+        if birth_year is None:
+            rank = positions
+        else:
+            no_year = ~self.fields.has_birth_year[candidates]
+            diff = np.minimum(np.abs(self.fields.birth_year[candidates] - birth_year), (1 << _YEAR_BITS) - 1)
+            rank = (
+                (no_year.astype(np.int64) << (_POSITION_BITS + _YEAR_BITS))
+                | (np.where(no_year, 0, diff) << _POSITION_BITS)
+                | positions
+            )
+        if len(candidates) > limit:
+            top = np.argpartition(rank, limit - 1)[:limit]
+            candidates, rank = candidates[top], rank[top]
+        return candidates[np.argsort(rank)]
+
+    def _pick(
+        self,
+        probes: _Fields,
+        rows: list[np.ndarray],
+        candidates: list[np.ndarray],
+        threshold: float,
+        results: list[PoolMatch | None],
+    ) -> None:
+        """
+        Score a chunk of pairs and record each probe's best candidate.
+
+        Each probe's pairs are contiguous and in rank order, so the first
+        pair reaching the best score is the matcher's pick on a tie.
+        """
+        row = np.concatenate(rows)
+        cand = np.concatenate(candidates)
+        score = self._score(probes, row, cand)
+        starts = np.flatnonzero(np.r_[True, row[1:] != row[:-1]])
+        best = np.maximum.reduceat(score, starts)
+        segment = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, len(row)]))
+        first = np.minimum.reduceat(np.where(score == best[segment], np.arange(len(row)), len(row)), starts)
+        for r, s, j in zip(row[starts].tolist(), best.tolist(), cand[first].tolist(), strict=True):
+            if s >= threshold:
+                results[r] = PoolMatch(s, self.gramps_ids[j])
+
+    def _score(self, probes: _Fields, rows: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+        """``PersonMatcher._score_match`` score of each (probe, candidate) pair."""
+        weights = PersonMatcher.WEIGHTS
+        pool = self.fields
+
+        def pair(probe_values: np.ndarray, pool_values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+            return probe_values[rows], pool_values[candidates]
+
+        a, b = pair(probes.surname, pool.surname)
+        surname_exact = a == b
+        a, b = pair(probes.surname_soundex, pool.surname_soundex)
+        surname_score = np.where(
+            surname_exact, weights["exact_name"] * 0.6,
+            np.where(a == b, weights["soundex_match"] * 0.6, 0.0),
+        )
+        a, b = pair(probes.given, pool.given)
+        given_exact = a == b
+        a, b = pair(probes.given_soundex, pool.given_soundex)
+        given_soundex = a == b
+        a, b = pair(probes.variant, pool.variant)
+        given_variant = (a == b) & (a >= 0)
+        given_score = np.where(
+            given_exact, weights["exact_name"] * 0.4,
+            np.where(given_soundex, weights["soundex_match"] * 0.4,
+                     np.where(given_variant, float(weights["similar_name"]), 0.0)),
+        )
+        a, b = pair(probes.has_name, pool.has_name)
+        score = np.where(a & b, surname_score + given_score, 0.0)
+
+        a, b = pair(probes.sex, pool.sex)
+        present_a, present_b = pair(probes.sex_present, pool.sex_present)
+        known_a, known_b = pair(probes.sex_known, pool.sex_known)
+        score += np.where(
+            present_a & present_b,
+            np.where(a == b, float(weights["sex_match"]),
+                     np.where(known_a & known_b, float(PersonMatcher.CONFLICTS["sex_mismatch"]), 0.0)),
+            0.0,
+        )
+
+        score += self._score_event(probes.birth, pool.birth, rows, candidates, "birth")
+        score += self._score_event(probes.death, pool.death, rows, candidates, "death")
+        return score
+
+    @staticmethod
+    def _score_event(
+        probe: _EventFields, pool: _EventFields, rows: np.ndarray, candidates: np.ndarray, kind: str
+    ) -> np.ndarray:
+        """``PersonMatcher._score_events`` score of each (probe, candidate) pair."""
+        weights = PersonMatcher.WEIGHTS
+        far = float(PersonMatcher.CONFLICTS["birth_year_far"]) if kind == "birth" else 0.0
+        present = probe.present[rows] & pool.present[candidates]
+        year_a, year_b = probe.year[rows], pool.year[candidates]
+        diff = np.abs(year_a - year_b)
+        year_score = np.where(
+            (year_a != 0) & (year_b != 0),
+            np.where(diff == 0, float(weights[f"{kind}_year_exact"]),
+                     np.where(diff <= 2, float(weights[f"{kind}_year_close"]),
+                              np.where(diff > 10, far, 0.0))),
+            0.0,
+        )
+        place_a, place_b = probe.place[rows], pool.place[candidates]
+        place_score = np.where((place_a >= 0) & (place_a == place_b), float(weights.get(f"{kind}_place", 10)), 0.0)
+        return np.where(present, year_score + place_score, 0.0)
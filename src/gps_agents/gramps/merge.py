@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING, ClassVar
 from pydantic import BaseModel, Field
 
 from gps_agents.gramps.models import Event, Name, Person
+from gps_agents.gramps.person_index import soundex
 from gps_agents.idempotency.exceptions import IdempotencyBlock
 from gps_agents.projections.sqlite_projection import SQLiteProjection
 
@@ -94,6 +95,26 @@ class PersonMatcher:
         "different_parents": -40,
     }
 
+    # Candidates scored per lookup, nearest birth year first
+    MAX_CANDIDATES: ClassVar[int] = 500
+
+    # Given-name variant groups for _is_name_variant
+    NAME_VARIANTS: ClassVar[dict[str, list[str]]] = {
+        "william": ["bill", "will", "willy", "billy", "liam"],
+        "elizabeth": ["beth", "liz", "lizzy", "betty", "eliza", "bessie"],
+        "robert": ["bob", "rob", "robbie", "bobby", "bert"],
+        "james": ["jim", "jimmy", "jamie"],
+        "john": ["jack", "johnny", "jon"],
+        "margaret": ["peggy", "maggie", "meg", "marge", "margie"],
+        "catherine": ["kate", "katie", "cathy", "kitty", "kathy"],
+        "thomas": ["tom", "tommy", "thom"],
+        "richard": ["rick", "dick", "rich", "ricky"],
+        "joseph": ["joe", "joey", "jo"],
+        "mary": ["marie", "maria", "molly", "polly"],
+        "anne": ["ann", "anna", "annie", "nan", "nancy"],
+        "jean": ["jan", "jane", "jeanne", "joan"],
+    }
+
     def __init__(self, client: GrampsClient) -> None:
         """Initialize matcher with Gramps client."""
         self.client = client
@@ -118,22 +139,15 @@ class PersonMatcher:
         if not person.primary_name:
             return []
 
-        # Search by surname
-        candidates = self.client.find_persons(
-            surname=person.primary_name.surname,
-            limit=100,
+        # Indexed candidate generation: surname prefix, Soundex or Metaphone
+        birth = person.birth
+        candidates = self.client.find_match_candidates(
+            person.primary_name.surname,
+            given=person.primary_name.given,
+            birth_year=birth.date.year if birth and birth.date else None,
+            limit=self.MAX_CANDIDATES,
         )
 
-        # Also search by Soundex variants
-        soundex = self._soundex(person.primary_name.surname)
-        for candidate in self.client.find_persons(limit=100):
-            if (
-                candidate.primary_name
-                and self._soundex(candidate.primary_name.surname) == soundex
-                and candidate not in candidates
-            ):
-                candidates.append(candidate)
-
         # Score each candidate
         results = []
         for candidate in candidates:
@@ -275,56 +289,14 @@ class PersonMatcher:
 
     def _soundex(self, name: str) -> str:
         """Generate Soundex code for a name."""
-        if not name:
-            return ""
-
-        name = name.upper()
-        soundex = name[0]
-
-        # Soundex mapping
-        mapping = {
-            "B": "1", "F": "1", "P": "1", "V": "1",
-            "C": "2", "G": "2", "J": "2", "K": "2", "Q": "2", "S": "2", "X": "2", "Z": "2",
-            "D": "3", "T": "3",
-            "L": "4",
-            "M": "5", "N": "5",
-            "R": "6",
-        }
-
-        prev_code = mapping.get(name[0], "0")
-
-        for char in name[1:]:
-            code = mapping.get(char, "0")
-            if code != "0" and code != prev_code:
-                soundex += code
-                prev_code = code
-            if len(soundex) == 4:
-                break
-
-        return soundex.ljust(4, "0")
+        return soundex(name)
 
     def _is_name_variant(self, name1: str, name2: str) -> bool:
         """Check if names are common variants of each other."""
-        variants = {
-            "william": ["bill", "will", "willy", "billy", "liam"],
-            "elizabeth": ["beth", "liz", "lizzy", "betty", "eliza", "bessie"],
-            "robert": ["bob", "rob", "robbie", "bobby", "bert"],
-            "james": ["jim", "jimmy", "jamie"],
-            "john": ["jack", "johnny", "jon"],
-            "margaret": ["peggy", "maggie", "meg", "marge", "margie"],
-            "catherine": ["kate", "katie", "cathy", "kitty", "kathy"],
-            "thomas": ["tom", "tommy", "thom"],
-            "richard": ["rick", "dick", "rich", "ricky"],
-            "joseph": ["joe", "joey", "jo"],
-            "mary": ["marie", "maria", "molly", "polly"],
-            "anne": ["ann", "anna", "annie", "nan", "nancy"],
-            "jean": ["jan", "jane", "jeanne", "joan"],
-        }
-
         n1 = name1.lower()
         n2 = name2.lower()
 
-        for base, var_list in variants.items():
+        for base, var_list in self.NAME_VARIANTS.items():
             all_names = [base, *var_list]
             if n1 in all_names and n2 in all_names:
                 return True
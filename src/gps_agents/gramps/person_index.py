@@ -0,0 +1,266 @@
+"""Sidecar name index for Gramps person lookups.
+
+Gramps stores each person as a serialized blob, so filtering by name
+otherwise means deserializing the whole ``person`` table. This module keeps
+a narrow SQLite table in a file next to the Gramps database, one row per
+person, with lower-cased primary surname and given name, Soundex and
+Metaphone codes and birth year. The file is ATTACHed to the client's
+connection, so lookups join straight back to ``person`` and only matching
+blobs are read, and ``add_person`` (or a ``bulk_writer`` flush) updates
+both in one transaction.
+
+Rows are keyed by handle and carry the blob length. ``sync`` re-indexes
+persons that are missing or whose blob length changed and drops rows for
+deleted persons; it runs on connect to pick up edits made in Gramps itself.
+An edit that leaves a blob's length unchanged is not detected; delete the
+sidecar file to force a rebuild.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, NamedTuple
+
+from gps_agents.utils.name_variants import metaphone
+
+if TYPE_CHECKING:
+    import sqlite3
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+
+    from gps_agents.gramps.models import Person
+
+SCHEMA = "person_index"
+
+_SOUNDEX_CODES = {
+    "B": "1", "F": "1", "P": "1", "V": "1",
+    "C": "2", "G": "2", "J": "2", "K": "2", "Q": "2", "S": "2", "X": "2", "Z": "2",
+    "D": "3", "T": "3",
+    "L": "4",
+    "M": "5", "N": "5",
+    "R": "6",
+}
+
+_INDEX_DDL = [
+    f"""
+    CREATE TABLE IF NOT EXISTS {SCHEMA}.person_names (
+        handle TEXT PRIMARY KEY,
+        blob_len INTEGER NOT NULL,
+        surname TEXT NOT NULL,
+        given TEXT NOT NULL,
+        surname_soundex TEXT NOT NULL,
+        surname_metaphone TEXT NOT NULL,
+        given_soundex TEXT NOT NULL,
+        birth_year INTEGER
+    )
+    """,
+    f"CREATE INDEX IF NOT EXISTS {SCHEMA}.idx_names_surname ON person_names(surname)",
+    f"CREATE INDEX IF NOT EXISTS {SCHEMA}.idx_names_soundex ON person_names(surname_soundex)",
+    f"CREATE INDEX IF NOT EXISTS {SCHEMA}.idx_names_metaphone ON person_names(surname_metaphone)",
+    f"CREATE INDEX IF NOT EXISTS {SCHEMA}.idx_names_given_soundex ON person_names(given_soundex)",
+]
+
+_UPSERT_SQL = f"INSERT OR REPLACE INTO {SCHEMA}.person_names VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+
+# Distinct surnames memoized by _surname_codes; bulk imports repeat them a lot
+_CODE_CACHE_SIZE = 1 << 16
+
+# Prefix scans compare against surname + this sentinel as the upper bound
+_MAX_CHAR = "\U0010ffff"
+
+
+def soundex(name: str) -> str:
+    """Soundex code as used by ``PersonMatcher`` when scoring names."""
+    if not name:
+        return ""
+
+    name = name.upper()
+    code = name[0]
+    prev_code = _SOUNDEX_CODES.get(name[0], "0")
+
+    for char in name[1:]:
+        digit = _SOUNDEX_CODES.get(char, "0")
+        if digit != "0" and digit != prev_code:
+            code += digit
+            prev_code = digit
+        if len(code) == 4:
+            break
+
+    return code.ljust(4, "0")
+
+
+@lru_cache(maxsize=_CODE_CACHE_SIZE)
+def _surname_codes(surname: str) -> tuple[str, str]:
+    """(Soundex, Metaphone) of a surname."""
+    return soundex(surname), metaphone(surname)
+
+
+class NameKeys(NamedTuple):
+    """One ``person_names`` row."""
+    handle: str
+    blob_len: int
+    surname: str
+    given: str
+    surname_soundex: str
+    surname_metaphone: str
+    given_soundex: str
+    birth_year: int | None
+
+    def is_candidate_for(self, probe: NameKeys) -> bool:
+        """Python equivalent of the ``PersonIndex.candidates`` filter."""
+        if probe.surname:
+            return (
+                self.surname.startswith(probe.surname)
+                or (bool(probe.surname_soundex) and self.surname_soundex == probe.surname_soundex)
+                or (bool(probe.surname_metaphone) and self.surname_metaphone == probe.surname_metaphone)
+            )
+        return bool(probe.given) and not self.surname and self.given_soundex == probe.given_soundex
+
+
+def name_keys(person: Person, handle: str = "", blob_len: int = 0) -> NameKeys:
+    """Index keys for a person's primary name and birth year."""
+    name = person.primary_name
+    surname = name.surname if name else ""
+    given = name.given if name else ""
+    surname_soundex, surname_metaphone = _surname_codes(surname)
+    return NameKeys(
+        handle=handle,
+        blob_len=blob_len,
+        surname=surname.lower(),
+        given=given.lower(),
+        surname_soundex=surname_soundex,
+        surname_metaphone=surname_metaphone,
+        given_soundex=soundex(given),
+        birth_year=person.birth.date.year if person.birth and person.birth.date else None,
+    )
+
+
+def index_path_for(db_file: Path) -> Path:
+    """Location of the sidecar index for a Gramps database file."""
+    return db_file.with_name(f"{db_file.stem}.person_index.sqlite")
+
+
+class PersonIndex:
+    """Name index ATTACHed to a Gramps SQLite connection."""
+
+    def __init__(self, conn: sqlite3.Connection, path: Path) -> None:
+        """
+        Attach (creating if needed) the sidecar index.
+
+        Args:
+            conn: Open connection to the Gramps database
+            path: Sidecar index file
+
+        Raises:
+            sqlite3.Error: If the file cannot be attached or created
+        """
+        self._conn = conn
+        self.path = path
+        conn.execute(f"ATTACH DATABASE ? AS {SCHEMA}", (str(path),))
+        for ddl in _INDEX_DDL:
+            conn.execute(ddl)
+        conn.commit()
+
+    def add(self, handle: str, blob_len: int, person: Person) -> None:
+        """Index one person; commits with the caller's transaction."""
+        self._conn.execute(_UPSERT_SQL, name_keys(person, handle, blob_len))
+
+    def add_many(self, rows: Iterable[NameKeys]) -> None:
+        """Index many persons; commits with the caller's transaction."""
+        self._conn.executemany(_UPSERT_SQL, rows)
+
+    def sync(self, load: Callable[[str, bytes], Person]) -> int:
+        """
+        Bring the index in line with the ``person`` table.
+
+        Args:
+            load: Converts a (handle, blob) pair into a Person
+
+        Returns:
+            Number of persons (re)indexed
+        """
+        # Cheap aggregate check first; the per-row comparison joins every row
+        person_totals = self._conn.execute(
+            "SELECT count(*), total(length(blob_data)) FROM person"
+        ).fetchone()
+        index_totals = self._conn.execute(
+            f"SELECT count(*), total(blob_len) FROM {SCHEMA}.person_names"
+        ).fetchone()
+        if tuple(person_totals) == tuple(index_totals):
+            return 0
+
+        stale = self._conn.execute(
+            f"""
+            SELECT p.handle, p.blob_data FROM person p
+            LEFT JOIN {SCHEMA}.person_names i ON i.handle = p.handle
+            WHERE i.handle IS NULL OR i.blob_len != length(p.blob_data)
+            """
+        ).fetchall()
+        rows = [name_keys(load(h, blob or b""), h, len(blob or b"")) for h, blob in stale]
+        with self._conn:
+            self._conn.executemany(_UPSERT_SQL, rows)
+            self._conn.execute(
+                f"DELETE FROM {SCHEMA}.person_names WHERE handle NOT IN (SELECT handle FROM person)"
+            )
+        return len(rows)
+
+    def search(
+        self, surname: str | None, given: str | None, limit: int
+    ) -> list[sqlite3.Row]:
+        """Persons whose surname and given name contain the search terms."""
+        return self._conn.execute(
+            f"""
+            SELECT p.handle, p.blob_data FROM {SCHEMA}.person_names i
+            JOIN person p ON p.handle = i.handle
+            WHERE (?1 = '' OR instr(i.surname, ?1) > 0)
+              AND (?2 = '' OR instr(i.given, ?2) > 0)
+            LIMIT ?3
+            """,
+            ((surname or "").lower(), (given or "").lower(), limit),
+        ).fetchall()
+
+    def candidates(
+        self,
+        surname: str,
+        given: str = "",
+        birth_year: int | None = None,
+        limit: int = 500,
+    ) -> list[sqlite3.Row]:
+        """
+        Duplicate-detection candidates for a name.
+
+        Matches surnames that start with ``surname`` or share its Soundex or
+        Metaphone code; with no surname, given names sharing a Soundex code.
+        Rows nearest ``birth_year`` come first.
+        """
+        if surname:
+            key = surname.lower()
+            where = (
+                "(i.surname >= ?1 AND i.surname < ?1 || ?2)"
+                " OR i.surname_soundex = ?3 OR i.surname_metaphone = ?4"
+            )
+            params: list = [key, _MAX_CHAR, soundex(surname) or None, metaphone(surname) or None]
+        elif given:
+            where = "i.surname = '' AND i.given_soundex = ?1"
+            params = [soundex(given)]
+        else:
+            return []
+        n = len(params)
+        order = (
+            f"ORDER BY i.birth_year IS NULL, abs(i.birth_year - ?{n + 1}), i.rowid"
+            if birth_year is not None
+            else "ORDER BY i.rowid"
+        )
+        if birth_year is not None:
+            params.append(birth_year)
+        params.append(limit)
+        return self._conn.execute(
+            f"""
+            SELECT p.handle, p.blob_data FROM {SCHEMA}.person_names i
+            JOIN person p ON p.handle = i.handle
+            WHERE {where}
+            {order}
+            LIMIT ?{len(params)}
+            """,
+            params,
+        ).fetchall()
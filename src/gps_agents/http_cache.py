@@ -0,0 +1,479 @@
+"""Content-addressed HTTP response cache shared by all sources.
+
+Responses are stored in one SQLite database:
+- ``bodies`` holds each distinct body once, keyed by its SHA-256 digest and
+  compressed with zstd (zlib when the zstandard package is missing)
+- ``entries`` maps a request key to a body plus status, headers, ETag /
+  Last-Modified validators, expiry and last access time
+
+Fresh entries are served without touching the network. Stale entries with
+validators are revalidated with a conditional GET, and a 304 reply refreshes
+the entry instead of downloading the page again. The total compressed size
+is bounded; least recently used entries are evicted first.
+
+All SQLite and compression work runs in a worker thread, never on the event
+loop.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+logger = logging.getLogger(__name__)
+
+CODEC_ZLIB = 0
+CODEC_ZSTD = 1
+
+# Request headers that change the response, so they are part of the key
+_VARY_HEADERS = ("accept", "accept-language", "authorization", "cookie")
+# Connection-level headers that must not be replayed from the cache, plus the
+# ones describing the wire encoding: bodies are stored already decoded
+_HOP_BY_HOP = frozenset(
+    {"connection", "keep-alive", "transfer-encoding", "content-length", "content-encoding"}
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS bodies (
+    digest TEXT PRIMARY KEY,
+    codec INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_lru ON entries(accessed_at);
+CREATE INDEX IF NOT EXISTS entries_digest ON entries(digest);
+"""
+
+
+def _env_name(source: str) -> str:
+    return re.sub(r"\W", "_", source).upper()
+
+
+@dataclass
+class CacheConfig:
+    path: Path = field(default_factory=lambda: Path("data/http_cache/responses.db"))
+    max_bytes: int = 512 * 2**20
+    default_ttl: float = 86400.0
+    enabled: bool = True
+
+    @classmethod
+    def from_env(cls) -> CacheConfig:
+        return cls(
+            path=Path(os.getenv("HTTP_CACHE_DIR", "data/http_cache")) / "responses.db",
+            max_bytes=int(float(os.getenv("HTTP_CACHE_MAX_MB", "512")) * 2**20),
+            default_ttl=float(os.getenv("CACHE_DEFAULT_TTL", "86400")),
+            enabled=os.getenv("HTTP_CACHE", "1").lower() not in ("0", "false", "no"),
+        )
+
+    def ttl_for(self, source: str) -> float:
+        """Per-source TTL in seconds (``CACHE_<SOURCE>_TTL``, else the default)."""
+        value = os.getenv(f"CACHE_{_env_name(source)}_TTL")
+        return float(value) if value is not None else self.default_ttl
+
+
+@dataclass
+class CacheStats:
+    """Per-source cache counters."""
+
+    hits: int = 0  # served fresh from the cache
+    revalidated: int = 0  # stale, server answered 304
+    misses: int = 0  # fetched from the network
+    stored: int = 0
+    bytes_saved: int = 0  # body bytes not downloaded thanks to the cache
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.revalidated + self.misses
+        if not lookups:
+            return 0.0
+        return (self.hits + self.revalidated) / lookups
+
+
+@dataclass
+class CachedResponse:
+    status: int
+    headers: list[tuple[str, str]]
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+    stored_at: float
+    expires_at: float
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        return self.expires_at > (time.time() if now is None else now)
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            self.status,
+            headers=_replayable(self.headers),
+            content=self.body,
+            request=request,
+            extensions={"from_cache": True},
+        )
+
+
+class ResponseStore:
+    """SQLite-backed, content-addressed response store with LRU eviction.
+
+    The database is opened lazily on first use. Methods are synchronous and
+    thread-safe; the ``a``-prefixed variants run them in a worker thread.
+    """
+
+    def __init__(self, config: CacheConfig | None = None) -> None:
+        self.config = config or CacheConfig.from_env()
+        self.stats: dict[str, CacheStats] = {}
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._total_bytes: int | None = None
+        self._compressor = zstandard.ZstdCompressor(level=3) if ZSTD_AVAILABLE else None
+        self._decompressor = zstandard.ZstdDecompressor() if ZSTD_AVAILABLE else None
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.enabled
+
+    def stats_for(self, source: str) -> CacheStats:
+        return self.stats.setdefault(source, CacheStats())
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.config.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.config.path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    # -------------------------------------------------------------------------
+    # Compression
+    # -------------------------------------------------------------------------
+
+    def _compress(self, body: bytes) -> tuple[int, bytes]:
+        if self._compressor is not None:
+            return CODEC_ZSTD, self._compressor.compress(body)
+        return CODEC_ZLIB, zlib.compress(body, 6)
+
+    def _decompress(self, codec: int, data: bytes) -> bytes | None:
+        if codec == CODEC_ZSTD:
+            if self._decompressor is None:
+                return None  # written by an install that had zstandard
+            return self._decompressor.decompress(data)
+        return zlib.decompress(data)
+
+    # -------------------------------------------------------------------------
+    # Synchronous API
+    # -------------------------------------------------------------------------
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the entry for ``key`` (fresh or stale) and mark it used."""
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT e.status, e.headers, e.etag, e.last_modified, e.stored_at, e.expires_at,"
+                " b.codec, b.data FROM entries e JOIN bodies b ON b.digest = e.digest"
+                " WHERE e.key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            status, headers, etag, last_modified, stored_at, expires_at, codec, data = row
+            body = self._decompress(codec, data)
+            if body is None:
+                return None
+            conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        return CachedResponse(
+            status=status,
+            headers=[tuple(h) for h in json.loads(headers)],
+            body=body,
+            etag=etag,
+            last_modified=last_modified,
+            stored_at=stored_at,
+            expires_at=expires_at,
+        )
+
+    def put(
+        self,
+        key: str,
+        body: bytes,
+        *,
+        source: str = "",
+        url: str = "",
+        status: int = 200,
+        headers: list[tuple[str, str]] | None = None,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        ttl: float | None = None,
+    ) -> None:
+        """Store a response body under ``key``; identical bodies are kept once."""
+        now = time.time()
+        ttl = self.config.ttl_for(source) if ttl is None else ttl
+        digest = hashlib.sha256(body).hexdigest()
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                old = conn.execute("SELECT digest FROM entries WHERE key = ?", (key,)).fetchone()
+                if conn.execute("SELECT 1 FROM bodies WHERE digest = ?", (digest,)).fetchone() is None:
+                    codec, data = self._compress(body)
+                    conn.execute(
+                        "INSERT INTO bodies VALUES (?, ?, ?, ?, ?)",
+                        (digest, codec, data, len(body), len(data)),
+                    )
+                    if self._total_bytes is not None:
+                        self._total_bytes += len(data)
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key, source, url, status, json.dumps(headers or []), digest,
+                        etag, last_modified, now, now + ttl, now,
+                    ),
+                )
+                if old is not None and old[0] != digest:
+                    self._drop_orphans(conn, [old[0]])
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                self._total_bytes = None
+                raise
+            self._evict(conn)
+
+    def refresh(self, key: str, ttl: float) -> None:
+        """Extend a revalidated entry's lifetime."""
+        now = time.time()
+        with self._lock:
+            self._connect().execute(
+                "UPDATE entries SET expires_at = ?, accessed_at = ? WHERE key = ?",
+                (now + ttl, now, key),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT digest FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._drop_orphans(conn, [row[0]])
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM entries")
+            conn.execute("DELETE FROM bodies")
+            self._total_bytes = 0
+
+    def total_bytes(self) -> int:
+        """Compressed size of all stored bodies."""
+        with self._lock:
+            return self._stored_bytes(self._connect())
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _stored_bytes(self, conn: sqlite3.Connection) -> int:
+        if self._total_bytes is None:
+            self._total_bytes = conn.execute("SELECT COALESCE(SUM(stored_size), 0) FROM bodies").fetchone()[0]
+        return self._total_bytes
+
+    def _drop_orphans(self, conn: sqlite3.Connection, digests: list[str]) -> None:
+        for digest in set(digests):
+            if conn.execute("SELECT 1 FROM entries WHERE digest = ? LIMIT 1", (digest,)).fetchone():
+                continue
+            row = conn.execute("SELECT stored_size FROM bodies WHERE digest = ?", (digest,)).fetchone()
+            if row is not None:
+                conn.execute("DELETE FROM bodies WHERE digest = ?", (digest,))
+                if self._total_bytes is not None:
+                    self._total_bytes -= row[0]
+
+    def _evict(self, conn: sqlite3.Connection, batch: int = 64) -> None:
+        """Drop least recently used entries until the store fits ``max_bytes``."""
+        while self._stored_bytes(conn) > self.config.max_bytes:
+            rows = conn.execute(
+                "SELECT key, digest FROM entries ORDER BY accessed_at LIMIT ?", (batch,)
+            ).fetchall()
+            if not rows:
+                break
+            conn.execute("BEGIN IMMEDIATE")
+            for key, digest in rows:
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._drop_orphans(conn, [digest])
+                if self._total_bytes <= self.config.max_bytes:
+                    break
+            conn.execute("COMMIT")
+
+    # -------------------------------------------------------------------------
+    # Async wrappers (disk I/O off the event loop)
+    # -------------------------------------------------------------------------
+
+    async def aget(self, key: str) -> CachedResponse | None:
+        return await asyncio.to_thread(self.get, key)
+
+    async def aput(self, key: str, body: bytes, **kwargs: Any) -> None:
+        await asyncio.to_thread(self.put, key, body, **kwargs)
+
+    async def arefresh(self, key: str, ttl: float) -> None:
+        await asyncio.to_thread(self.refresh, key, ttl)
+
+
+def _replayable(headers: Iterable[tuple[str, str]]) -> list[tuple[str, str]]:
+    """Headers that still describe a body held decoded in memory."""
+    return [(k, v) for k, v in headers if k.lower() not in _HOP_BY_HOP]
+
+
+def cache_key(request: httpx.Request) -> str:
+    """Key a GET by URL plus the request headers that select a representation."""
+    h = hashlib.sha256(str(request.url).encode())
+    for name in _VARY_HEADERS:
+        h.update(b"\0" + request.headers.get(name, "").encode())
+    return h.hexdigest()
+
+
+class CachingTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that serves GETs for one source from a ResponseStore.
+
+    Only 200 responses are stored, and never when either side sends
+    ``Cache-Control: no-store``. Pass ``extensions={"cache": False}`` on a
+    request to bypass the cache for it. Cache errors are logged and the
+    request goes to the network as if uncached.
+    """
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, store: ResponseStore, source: str) -> None:
+        self.inner = inner
+        self.store = store
+        self.source = source
+        self.ttl = store.config.ttl_for(source)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if (
+            request.method != "GET"
+            or not request.extensions.get("cache", True)
+            or "no-store" in request.headers.get("cache-control", "")
+        ):
+            return await self.inner.handle_async_request(request)
+
+        stats = self.store.stats_for(self.source)
+        key = cache_key(request)
+        try:
+            entry = await self.store.aget(key)
+        except (sqlite3.Error, OSError, zlib.error) as e:
+            logger.warning("Response cache unavailable for %s: %s", self.source, e)
+            return await self.inner.handle_async_request(request)
+
+        if entry is not None and entry.is_fresh():
+            stats.hits += 1
+            stats.bytes_saved += len(entry.body)
+            return entry.to_response(request)
+
+        if entry is not None:
+            if entry.etag:
+                request.headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                request.headers["If-Modified-Since"] = entry.last_modified
+
+        response = await self.inner.handle_async_request(request)
+
+        if entry is not None and response.status_code == 304:
+            await response.aclose()
+            stats.revalidated += 1
+            stats.bytes_saved += len(entry.body)
+            await self._guard(self.store.arefresh(key, self.ttl))
+            return entry.to_response(request)
+
+        stats.misses += 1
+        if response.status_code != 200 or "no-store" in response.headers.get("cache-control", ""):
+            return response
+
+        body = await response.aread()
+        await response.aclose()
+        headers = _replayable(response.headers.items())
+        stored = await self._guard(
+            self.store.aput(
+                key,
+                body,
+                source=self.source,
+                url=str(request.url),
+                status=response.status_code,
+                headers=headers,
+                etag=response.headers.get("etag"),
+                last_modified=response.headers.get("last-modified"),
+                ttl=self.ttl,
+            )
+        )
+        if stored:
+            stats.stored += 1
+        return httpx.Response(
+            response.status_code,
+            headers=headers,
+            content=body,
+            request=request,
+            extensions=response.extensions,
+        )
+
+    async def _guard(self, op: Any) -> bool:
+        try:
+            await op
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Response cache write failed for %s: %s", self.source, e)
+            return False
+        return True
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+# Global response cache
+CACHE = ResponseStore()
+
+
+def report_cache_status() -> dict:
+    """Return per-source cache hit rate and bytes saved for debugging."""
+    out = {}
+    for source, st in CACHE.stats.items():
+        out[source] = {
+            "hits": st.hits,
+            "revalidated": st.revalidated,
+            "misses": st.misses,
+            "stored": st.stored,
+            "hit_rate": round(st.hit_rate, 3),
+            "bytes_saved": st.bytes_saved,
+        }
+    return out
@@ -1,18 +1,23 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from gps_agents.gramps.merge import PersonMatcher
 from gps_agents.gramps.models import Person, Event, Source, Place, Citation
 from gps_agents.idempotency.config import CONFIG
 from gps_agents.idempotency.fingerprint import (
+    fingerprint_citation,
     fingerprint_person,
     fingerprint_event,
+    fingerprint_relationship,
     fingerprint_source,
     fingerprint_place,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 
 @dataclass
 class UpsertDecision:
@@ -39,7 +44,12 @@ def decide_upsert_person(client, projection, person: Person) -> UpsertDecision:
         return UpsertDecision(action="create", score=0.0, fingerprint=fp.value)
 
     m = matches[0]
-    score = m.match_score / 100.0
+    return _person_match_decision(person, fp.value, m.match_score, m.matched_handle)
+
+
+def _person_match_decision(person: Person, fingerprint: str, match_score: float, matched_handle: str | None) -> UpsertDecision:
+    """Decision for a person whose best matcher candidate scored ``match_score`` (0-100)."""
+    score = match_score / 100.0
 
     # Weak evidence handling similar to upsert_person
     def _year_only(ev):
@@ -49,10 +59,10 @@ def decide_upsert_person(client, projection, person: Person) -> UpsertDecision:
     threshold = CONFIG.merge_threshold + (CONFIG.weak_evidence_margin if weak else 0.0)
 
     if score >= threshold:
-        return UpsertDecision(action="merge", score=score, fingerprint=fp.value, existing_handle=m.matched_handle)
+        return UpsertDecision(action="merge", score=score, fingerprint=fingerprint, existing_handle=matched_handle)
     if CONFIG.review_low <= score < CONFIG.review_high:
-        return UpsertDecision(action="review", score=score, fingerprint=fp.value, existing_handle=m.matched_handle, reason="Probable duplicate")
-    return UpsertDecision(action="create", score=score, fingerprint=fp.value)
+        return UpsertDecision(action="review", score=score, fingerprint=fingerprint, existing_handle=matched_handle, reason="Probable duplicate")
+    return UpsertDecision(action="create", score=score, fingerprint=fingerprint)
 
 
 def decide_upsert_event(client, projection, event: Event) -> UpsertDecision:
@@ -95,3 +105,59 @@ def decide_upsert_place(client, projection, place: Place) -> UpsertDecision:
     if existing:
         return UpsertDecision(action="reuse", score=1.0, fingerprint=fp.value, existing_handle=existing)
     return UpsertDecision(action="create", score=0.0, fingerprint=fp.value)
+
+
+# ---------------------------- Batch ----------------------------
+
+_FINGERPRINTERS = {
+    "person": fingerprint_person,
+    "event": fingerprint_event,
+    "source": fingerprint_source,
+    "place": fingerprint_place,
+    "citation": fingerprint_citation,
+    "relationship": lambda rel: fingerprint_relationship(*rel),
+}
+
+
+def decide_upsert_batch(client, projection, items: Sequence[tuple[str, Any]]) -> list[UpsertDecision]:
+    """Decisions for many entities at once, equal to the per-entity decide_upsert_* calls.
+
+    ``items`` are (entity, value) pairs: "person", "event", "source", "place"
+    and "citation" take the model; "relationship" takes a
+    (kind, a_handle, b_handle, context) tuple.
+
+    All fingerprints are resolved with one projection query. Persons without
+    a fingerprint mapping are then matched together against a single
+    PersonMatchPool, which loads Gramps once and scores all candidate pairs
+    as numpy arrays, instead of one PersonMatcher lookup per person.
+    """
+    fingerprints = []
+    for entity, value in items:
+        if entity not in _FINGERPRINTERS:
+            raise ValueError(f"Unknown entity type: {entity}")
+        fingerprints.append(_FINGERPRINTERS[entity](value).value)
+    existing = projection.get_gramps_handles_by_fingerprints(fingerprints)
+
+    decisions: list[UpsertDecision | None] = []
+    unmatched: list[int] = []
+    for i, ((entity, _), fp) in enumerate(zip(items, fingerprints, strict=True)):
+        handle = existing.get(fp)
+        if handle:
+            decisions.append(UpsertDecision(action="reuse", score=1.0, fingerprint=fp, existing_handle=handle))
+        elif entity == "person":
+            decisions.append(None)
+            unmatched.append(i)
+        else:
+            decisions.append(UpsertDecision(action="create", score=0.0, fingerprint=fp))
+
+    if unmatched:
+        from gps_agents.gramps.match_pool import PersonMatchPool
+
+        pool = PersonMatchPool.from_client(client)
+        persons = [items[i][1] for i in unmatched]
+        for i, person, match in zip(unmatched, persons, pool.best_matches(persons, threshold=50.0), strict=True):
+            if match is None:
+                decisions[i] = UpsertDecision(action="create", score=0.0, fingerprint=fingerprints[i])
+            else:
+                decisions[i] = _person_match_decision(person, fingerprints[i], match.score, match.gramps_id)
+    return decisions  # type: ignore[return-value]
@@ -4,7 +4,9 @@ from __future__ import annotations
 import json
 import logging
 import os
-from dataclasses import dataclass
+import re
+import threading
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
@@ -18,9 +20,10 @@ except ImportError:
 
 from ..models.fact import Fact, FactStatus
 from .privacy import PrivacyCheckResult, PrivacyEngine, PrivacyStatus, get_privacy_engine
+from .segment_store import SegmentStore
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -50,8 +53,22 @@ class LedgerEvent:
     metadata: dict | None = None
 
 
-# Type alias for event handlers
+# Type aliases for event handlers
 EventHandler = Callable[[LedgerEvent], None]
+BatchEventHandler = Callable[[list[LedgerEvent]], None]
+
+# Four-digit year in a birth/death statement
+_YEAR_PATTERN = re.compile(r"\b(1[6-9]\d{2}|20[0-2]\d)\b")
+
+
+@dataclass
+class _CommitTicket:
+    """One caller's facts waiting in the group-commit queue."""
+    facts: list[Fact]
+    skip_privacy_check: bool
+    keys: list[str] = field(default_factory=list)
+    error: BaseException | None = None
+    done: bool = False
 
 
 # =============================================================================
@@ -69,6 +86,8 @@ class FactLedger:
     - Privacy Engine: Enforces 100-year rule for living person protection
     - CQRS Events: Emits events for Neo4j graph projection
     - Idempotency: Content fingerprinting prevents duplicate writes
+    - Batching: ``append_many`` writes a list of facts as one batch; with
+      ``group_commit=True`` concurrent ``append`` callers share a batch
     """
 
     def __init__(
@@ -76,6 +95,9 @@ class FactLedger:
         db_path: str | Path,
         privacy_engine: PrivacyEngine | None = None,
         enforce_privacy: bool = True,
+        segment_max_bytes: int | None = None,
+        group_commit: bool = False,
+        sync: bool = False,
     ) -> None:
         """Initialize the ledger.
 
@@ -83,6 +105,10 @@ class FactLedger:
             db_path: Path to RocksDB database directory
             privacy_engine: Privacy engine for 100-year rule (uses default if None)
             enforce_privacy: If True, check privacy before appending
+            segment_max_bytes: Segment rotation size for the file fallback
+            group_commit: If True, appends from concurrent threads are queued
+                and written together by whichever caller is first to write
+            sync: If True, fsync (or sync the RocksDB WAL) once per batch
         """
         self.db_path = Path(db_path)
         self.db_path.mkdir(parents=True, exist_ok=True)
@@ -93,6 +119,14 @@ class FactLedger:
 
         # CQRS event handlers for projection
         self._event_handlers: list[EventHandler] = []
+        self._batch_event_handlers: list[BatchEventHandler] = []
+
+        # Group commit: one leader writes the queued batches of all waiters
+        self._group_commit = group_commit
+        self._sync = sync
+        self._commit_cond = threading.Condition()
+        self._commit_queue: list[_CommitTicket] = []
+        self._commit_leader = False
 
         # Person date cache for efficient privacy checks
         self._person_dates: dict[str, dict[str, int | None]] = {}
@@ -110,9 +144,9 @@ class FactLedger:
                     "Install with: pip install python-rocksdb"
                 )
             self._use_fallback = True
-            self._fallback_path = self.db_path / "facts.jsonl"
-            self._index_path = self.db_path / "index.json"
-            self._load_fallback_index()
+            store_kwargs = {"segment_max_bytes": segment_max_bytes} if segment_max_bytes else {}
+            self._store = SegmentStore(self.db_path, sync=sync, **store_kwargs)
+            self._migrate_jsonl_fallback()
         else:
             self._use_fallback = False
             opts = rocksdb.Options()
@@ -123,65 +157,33 @@ class FactLedger:
             # Lazy-loaded on first access, maintained during append
             self._version_index: dict[str, int] | None = None
 
-    def _load_fallback_index(self) -> None:
-        """Load index for fallback file-based storage.
+    def _migrate_jsonl_fallback(self) -> None:
+        """Import a ledger written by the old single-file fallback.
 
-        Initializes _index as empty dict if file doesn't exist or is corrupted.
-        Index structure: fact_id -> {version: byte_offset} for O(1) retrieval.
-        """
-        self._index: dict[str, dict[int, int]] = {}  # fact_id -> {version: byte_offset}
-        if self._index_path.exists():
-            try:
-                raw_index = json.loads(self._index_path.read_text())
-                # Validate structure - values must be dicts, not lists
-                if raw_index and isinstance(next(iter(raw_index.values()), {}), list):
-                    # Old/corrupted format with lists - rebuild
-                    self._rebuild_index_from_facts()
-                    return
-                # Convert nested dicts to int keys (JSON stores keys as strings)
-                self._index = {
-                    fact_id: {int(v): offset for v, offset in versions.items()}
-                    for fact_id, versions in raw_index.items()
-                }
-            except (json.JSONDecodeError, OSError, AttributeError, TypeError):
-                # Index corrupted or unreadable - rebuild from facts file
-                self._rebuild_index_from_facts()
-
-    def _save_fallback_index(self) -> None:
-        """Save index for fallback file-based storage."""
-        self._index_path.write_text(json.dumps(self._index))
-
-    def _rebuild_index_from_facts(self) -> None:
-        """Rebuild index by scanning facts file with byte offsets.
-
-        Used when index is corrupted or missing.
-        Stores byte offset for each fact version to enable O(1) retrieval.
+        The old layout was ``facts.jsonl`` (one ``{"key", "value"}`` object
+        per line) plus a JSON offset index. Records are copied into the
+        segment store once and the old files renamed with ``.migrated``.
         """
-        self._index = {}
-        if not self._fallback_path.exists():
+        legacy_path = self.db_path / "facts.jsonl"
+        if not legacy_path.exists():
             return
-
-        try:
-            with open(self._fallback_path) as f:
-                while True:
-                    byte_offset = f.tell()
-                    line = f.readline()
-                    if not line:
-                        break
-                    try:
-                        entry = json.loads(line)
-                        key = entry.get("key", "")
-                        if ":" in key:
-                            fact_id_str, version_str = key.split(":", 1)
-                            version = int(version_str)
-                            if fact_id_str not in self._index:
-                                self._index[fact_id_str] = {}
-                            self._index[fact_id_str][version] = byte_offset
-                    except (json.JSONDecodeError, ValueError):
-                        continue  # Skip malformed entries
-            self._save_fallback_index()
-        except OSError:
-            pass  # Can't read file, leave index empty
+        records = []
+        with open(legacy_path) as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    fact_id_str, version_str = entry["key"].split(":", 1)
+                    records.append(
+                        (UUID(fact_id_str), int(version_str), json.dumps(entry["value"]).encode())
+                    )
+                except (json.JSONDecodeError, KeyError, ValueError):
+                    continue  # Skip malformed entries
+        self._store.append_many(records)
+        self._store.merge_index()
+        for path in (legacy_path, self.db_path / "index.json"):
+            if path.exists():
+                path.rename(path.with_name(path.name + ".migrated"))
+        logger.info(f"Migrated {len(records)} ledger records from {legacy_path} to segment files")
 
     def _ensure_version_index(self) -> dict[str, int]:
         """Lazy-load version index for RocksDB mode (O(N) scan once, O(1) thereafter)."""
@@ -217,18 +219,41 @@ class FactLedger:
         self._event_handlers.append(handler)
         logger.debug(f"Registered event handler: {handler.__name__ if hasattr(handler, '__name__') else handler}")
 
-    def unregister_event_handler(self, handler: EventHandler) -> None:
+    def register_batch_event_handler(self, handler: BatchEventHandler) -> None:
+        """Register a handler that receives each written batch as one list.
+
+        A single ``append`` arrives as a one-element list.
+
+        Args:
+            handler: Callable that receives a list of LedgerEvent instances
+        """
+        self._batch_event_handlers.append(handler)
+        logger.debug(f"Registered batch event handler: {handler.__name__ if hasattr(handler, '__name__') else handler}")
+
+    def unregister_event_handler(self, handler: EventHandler | BatchEventHandler) -> None:
         """Unregister an event handler."""
         if handler in self._event_handlers:
             self._event_handlers.remove(handler)
+        if handler in self._batch_event_handlers:
+            self._batch_event_handlers.remove(handler)
 
     def _emit_event(self, event: LedgerEvent) -> None:
         """Emit an event to all registered handlers."""
+        self._emit_events([event])
+
+    def _emit_events(self, events: list[LedgerEvent]) -> None:
+        """Emit events to per-event handlers, then once to batch handlers."""
         for handler in self._event_handlers:
+            for event in events:
+                try:
+                    handler(event)
+                except Exception as e:
+                    logger.error(f"Event handler error: {e}", exc_info=True)
+        for batch_handler in self._batch_event_handlers:
             try:
-                handler(event)
+                batch_handler(events)
             except Exception as e:
-                logger.error(f"Event handler error: {e}", exc_info=True)
+                logger.error(f"Batch event handler error: {e}", exc_info=True)
 
     # =========================================================================
     # Person Date Cache (for privacy checks)
@@ -277,94 +302,184 @@ class FactLedger:
         Raises:
             PrivacyViolationError: If fact violates privacy rules (when enforced)
         """
-        # Privacy check (100-year rule)
-        privacy_result: PrivacyCheckResult | None = None
-        if self._enforce_privacy and not skip_privacy_check:
-            person_dates = self.get_person_dates(fact.person_id or "")
-            privacy_result = self._privacy_engine.check_fact(
-                fact,
-                context={
-                    "birth_year": person_dates.get("birth_year"),
-                    "death_year": person_dates.get("death_year"),
-                },
-            )
+        return self.append_many([fact], skip_privacy_check=skip_privacy_check)[0]
 
-            # Log privacy status
-            if privacy_result.is_restricted:
-                logger.info(
-                    f"Fact {fact.fact_id} flagged as RESTRICTED "
-                    f"(status={privacy_result.status.value}): {privacy_result.recommendations}"
-                )
+    def append_many(
+        self,
+        facts: Iterable[Fact],
+        skip_privacy_check: bool = False,
+    ) -> list[str]:
+        """Append facts as one batch.
 
-            # If there are violations, log them (in strict mode, could raise)
-            if privacy_result.violations:
-                for violation in privacy_result.violations:
-                    logger.warning(f"Privacy violation: {violation}")
+        Privacy checks run in order, so a birth or death fact earlier in the
+        batch informs the checks of later facts about the same person. The
+        batch is written with a single RocksDB ``WriteBatch`` (or one segment
+        write in fallback mode) and handlers see it after the write.
 
-        # Perform the append
-        key = fact.ledger_key()
-        value = fact.model_dump_json()
+        Args:
+            facts: The facts to append
+            skip_privacy_check: If True, bypass privacy check (use with caution)
+
+        Returns:
+            The ledger keys, in input order
+        """
+        facts = list(facts)
+        if not facts:
+            return []
+        if self._group_commit:
+            return self._append_grouped(_CommitTicket(facts, skip_privacy_check))
+        return self._commit([_CommitTicket(facts, skip_privacy_check)])
+
+    def _append_grouped(self, ticket: _CommitTicket) -> list[str]:
+        """Queue a batch and either wait for the current leader or lead.
+
+        The first caller to find no write in progress takes every queued
+        ticket and commits them together; callers arriving meanwhile queue up
+        for the next round.
+        """
+        with self._commit_cond:
+            self._commit_queue.append(ticket)
+            while self._commit_leader and not ticket.done:
+                self._commit_cond.wait()
+            if not ticket.done:
+                self._commit_leader = True
+                group, self._commit_queue = self._commit_queue, []
+            else:
+                group = None
+
+        if group is not None:
+            try:
+                self._commit(group)
+            except BaseException as e:
+                for t in group:
+                    t.error = e
+            finally:
+                with self._commit_cond:
+                    for t in group:
+                        t.done = True
+                    self._commit_leader = False
+                    self._commit_cond.notify_all()
+
+        if ticket.error is not None:
+            raise ticket.error
+        return ticket.keys
+
+    def _commit(self, tickets: list[_CommitTicket]) -> list[str]:
+        """Check, write and announce the facts of one or more tickets.
+
+        Returns:
+            Keys of the last ticket (the only one for direct calls)
+        """
+        facts: list[Fact] = []
+        results: list[PrivacyCheckResult | None] = []
+        for ticket in tickets:
+            facts.extend(ticket.facts)
+            results.extend(self._check_privacy_many(ticket.facts, ticket.skip_privacy_check))
+
+        keys = [fact.ledger_key() for fact in facts]
+        values = [fact.model_dump_json().encode() for fact in facts]
 
         if self._use_fallback:
-            with open(self._fallback_path, "a") as f:
-                # Record byte offset before writing for O(1) retrieval
-                byte_offset = f.tell()
-                f.write(json.dumps({"key": key, "value": json.loads(value)}) + "\n")
-
-            fact_id_str = str(fact.fact_id)
-            if fact_id_str not in self._index:
-                self._index[fact_id_str] = {}
-            self._index[fact_id_str][fact.version] = byte_offset
-            self._save_fallback_index()
+            self._store.append_many(
+                (fact.fact_id, fact.version, value) for fact, value in zip(facts, values, strict=True)
+            )
         else:
-            self.db.put(key.encode(), value.encode())
+            batch = rocksdb.WriteBatch()
+            for key, value in zip(keys, values, strict=True):
+                batch.put(key.encode(), value)
+            self.db.write(batch, sync=self._sync)
             # Maintain version index for O(1) latest version lookup
             if self._version_index is not None:
-                fact_id_str = str(fact.fact_id)
-                current = self._version_index.get(fact_id_str, 0)
-                if fact.version > current:
-                    self._version_index[fact_id_str] = fact.version
-
-        # Update person date cache if this is a birth/death fact
-        if fact.person_id and fact.fact_type in ("birth", "death"):
-            self._update_person_dates_from_fact(fact)
-
-        # Emit CQRS event for projection
-        if self._event_handlers:
-            event_type = (
-                LedgerEventType.FACT_UPDATED
-                if fact.version > 1
-                else LedgerEventType.FACT_APPENDED
-            )
-            event = LedgerEvent(
-                event_type=event_type,
-                fact_id=fact.fact_id,
-                version=fact.version,
-                timestamp=datetime.now(UTC),
-                fact=fact,
-                privacy_status=(
-                    privacy_result.status if privacy_result
-                    else PrivacyStatus.UNKNOWN
-                ),
-                is_restricted=(
-                    privacy_result.is_restricted if privacy_result
-                    else True  # Default to restricted if not checked
-                ),
-                metadata={"key": key},
-            )
-            self._emit_event(event)
+                version_index = self._version_index
+                for fact in facts:
+                    fact_id_str = str(fact.fact_id)
+                    if fact.version > version_index.get(fact_id_str, 0):
+                        version_index[fact_id_str] = fact.version
+
+        offset = 0
+        for ticket in tickets:
+            ticket.keys = keys[offset:offset + len(ticket.facts)]
+            offset += len(ticket.facts)
+
+        # Emit CQRS events for projection
+        if self._event_handlers or self._batch_event_handlers:
+            timestamp = datetime.now(UTC)
+            self._emit_events([
+                LedgerEvent(
+                    event_type=(
+                        LedgerEventType.FACT_UPDATED
+                        if fact.version > 1
+                        else LedgerEventType.FACT_APPENDED
+                    ),
+                    fact_id=fact.fact_id,
+                    version=fact.version,
+                    timestamp=timestamp,
+                    fact=fact,
+                    privacy_status=(
+                        result.status if result
+                        else PrivacyStatus.UNKNOWN
+                    ),
+                    is_restricted=(
+                        result.is_restricted if result
+                        else True  # Default to restricted if not checked
+                    ),
+                    metadata={"key": key},
+                )
+                for fact, result, key in zip(facts, results, keys, strict=True)
+            ])
+
+        return tickets[-1].keys
+
+    def _check_privacy_many(
+        self, facts: list[Fact], skip_privacy_check: bool
+    ) -> list[PrivacyCheckResult | None]:
+        """Run the 100-year rule over facts in order.
+
+        Birth/death facts update the person date cache as they are reached,
+        matching the result of appending the facts one at a time.
+        """
+        check = self._enforce_privacy and not skip_privacy_check
+        results: list[PrivacyCheckResult | None] = []
+        restricted = 0
+        for fact in facts:
+            privacy_result: PrivacyCheckResult | None = None
+            if check:
+                person_dates = self.get_person_dates(fact.person_id or "")
+                privacy_result = self._privacy_engine.check_fact(
+                    fact,
+                    context={
+                        "birth_year": person_dates.get("birth_year"),
+                        "death_year": person_dates.get("death_year"),
+                    },
+                )
+                if privacy_result.is_restricted:
+                    restricted += 1
+                    if len(facts) == 1:
+                        logger.info(
+                            f"Fact {fact.fact_id} flagged as RESTRICTED "
+                            f"(status={privacy_result.status.value}): {privacy_result.recommendations}"
+                        )
+
+                # If there are violations, log them (in strict mode, could raise)
+                for violation in privacy_result.violations:
+                    logger.warning(f"Privacy violation: {violation}")
+            results.append(privacy_result)
+
+            # Update person date cache if this is a birth/death fact
+            if fact.person_id and fact.fact_type in ("birth", "death"):
+                self._update_person_dates_from_fact(fact)
 
-        return key
+        if restricted and len(facts) > 1:
+            logger.info(f"{restricted} of {len(facts)} facts in batch flagged as RESTRICTED")
+        return results
 
     def _update_person_dates_from_fact(self, fact: Fact) -> None:
         """Extract and cache birth/death year from fact."""
-        import re
-
         if not fact.person_id:
             return
 
         # Extract year from statement
-        match = re.search(r"\b(1[6-9]\d{2}|20[0-2]\d)\b", fact.statement)
+        match = _YEAR_PATTERN.search(fact.statement)
         if match:
             year = int(match.group(1))
             if fact.fact_type == "birth":
@@ -375,7 +490,8 @@ class FactLedger:
     def get(self, fact_id: UUID, version: int | None = None) -> Fact | None:
         """Retrieve a fact by ID and optional version.
 
-        Uses byte offset index for O(1) retrieval in fallback mode.
+        In fallback mode this is a binary search of the mmap'd offset index
+        and a single slice of the mmap'd segment.
 
         Args:
             fact_id: The fact's UUID
@@ -392,22 +508,8 @@ class FactLedger:
         key = f"{fact_id}:{version}"
 
         if self._use_fallback:
-            if not self._fallback_path.exists():
-                return None
-            fact_id_str = str(fact_id)
-            # O(1) lookup using byte offset index
-            versions_dict = self._index.get(fact_id_str)
-            if not versions_dict or version not in versions_dict:
-                return None
-            byte_offset = versions_dict[version]
-            with open(self._fallback_path) as f:
-                f.seek(byte_offset)
-                line = f.readline()
-                if line:
-                    entry = json.loads(line)
-                    if entry["key"] == key:
-                        return Fact.model_validate(entry["value"])
-            return None
+            payload = self._store.get(fact_id, version)
+            return None if payload is None else Fact.model_validate_json(payload)
         value = self.db.get(key.encode())
         if value is None:
             return None
@@ -425,8 +527,7 @@ class FactLedger:
             Latest version number or None if fact doesn't exist
         """
         if self._use_fallback:
-            versions_dict = self._index.get(str(fact_id), {})
-            return max(versions_dict.keys()) if versions_dict else None
+            return self._store.latest_version(fact_id)
         # O(1) lookup via version index (lazy-loaded on first access)
         version_index = self._ensure_version_index()
         return version_index.get(str(fact_id))
@@ -441,9 +542,8 @@ class FactLedger:
             List of all versions, sorted by version number
         """
         if self._use_fallback:
-            versions_dict = self._index.get(str(fact_id), {})
             facts = []
-            for v in sorted(versions_dict.keys()):
+            for v in self._store.versions(fact_id):
                 fact = self.get(fact_id, v)
                 if fact:
                     facts.append(fact)
@@ -472,15 +572,10 @@ class FactLedger:
             complexity from calling get_latest_version for each key.
         """
         if self._use_fallback:
-            if not self._fallback_path.exists():
-                return
-            # Get latest version of each fact - uses pre-built index with O(1) retrieval
-            for fact_id_str, versions_dict in self._index.items():
-                if not versions_dict:
-                    continue
-                latest_version = max(versions_dict.keys())
-                fact = self.get(UUID(fact_id_str), latest_version)
-                if fact and (status is None or fact.status == status):
+            # Sequential pass over the sorted offset index (fact_id order)
+            for _fact_id, _version, location in self._store.iter_latest():
+                fact = Fact.model_validate_json(self._store.read(*location))
+                if status is None or fact.status == status:
                     yield fact
         else:
             # Use version index for streaming iteration (no full cache needed)
@@ -507,5 +602,7 @@ class FactLedger:
 
     def close(self) -> None:
         """Close the database connection."""
-        if not self._use_fallback:
+        if self._use_fallback:
+            self._store.close()
+        else:
             del self.db
@@ -0,0 +1,448 @@
+"""Segmented record store with an mmap'd binary offset index.
+
+Backs the FactLedger file fallback when RocksDB is unavailable. Layout under
+the ledger directory::
+
+    segments/00000000.seg   fact JSON, one record per line, append-only,
+                            rotated once a segment reaches segment_max_bytes
+    index.sorted            fixed-width index records sorted by key, mmap'd
+                            and binary-searched in place
+    index.tail              fixed-width index records appended since the
+                            last merge, loaded into a dict on open
+
+Each index record is 36 bytes: fact UUID (16), version (4), segment (4),
+offset (8), length (4), all big-endian so that byte order equals
+(fact_id, version) order. Appends write one data record and one index
+record. The tail is merged into ``index.sorted`` once it exceeds
+``merge_ratio`` of the sorted index (and on close), so a cleanly closed
+store opens by mapping files, independent of its size. With ``sync=True``
+each ``append_many`` call fsyncs the segment and the tail once, so batching
+writes amortizes the fsync cost.
+"""
+from __future__ import annotations
+
+import bisect
+import heapq
+import logging
+import mmap
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+INDEX_RECORD = struct.Struct(">16sIIQI")
+KEY_SIZE = 20  # fact UUID + version
+SEGMENT_SUFFIX = ".seg"
+_MAX_VERSION = b"\xff\xff\xff\xff"
+_MIN_VERSION = b"\x00\x00\x00\x00"
+
+
+class _SortedKeys:
+    """Sequence view over the keys of a sorted index mapping (for bisect)."""
+
+    def __init__(self, buf: mmap.mmap | bytes, count: int) -> None:
+        self._buf = buf
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i: int) -> bytes:
+        start = i * INDEX_RECORD.size
+        return self._buf[start:start + KEY_SIZE]
+
+
+class SegmentStore:
+    """Append-only (fact_id, version) -> JSON bytes store.
+
+    Not safe for concurrent use from multiple processes; calls within one
+    process are serialized by an internal lock.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        segment_max_bytes: int = 64 * 1024 * 1024,
+        merge_ratio: float = 0.1,
+        merge_min_records: int = 50_000,
+        sync: bool = False,
+    ) -> None:
+        self.root = Path(root)
+        self.segment_dir = self.root / "segments"
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
+        self.segment_max_bytes = segment_max_bytes
+        self.merge_ratio = merge_ratio
+        self.merge_min_records = merge_min_records
+        self.sync = sync
+        self._sorted_path = self.root / "index.sorted"
+        self._tail_path = self.root / "index.tail"
+        self._lock = threading.RLock()
+
+        # Sorted index (mmap'd) and unsorted tail (in memory + on disk)
+        self._sorted_map: mmap.mmap | None = None
+        self._sorted_count = 0
+        self._tail: dict[bytes, dict[int, tuple[int, int, int]]] = {}
+        self._tail_count = 0
+
+        # Segment readers and the active writer
+        self._segment_maps: dict[int, mmap.mmap] = {}
+        segments = self._segment_ids()
+        self._active_id = segments[-1] if segments else 0
+        self._active_file = open(self._segment_path(self._active_id), "ab")  # noqa: SIM115
+        self._active_size = self._active_file.tell()
+
+        self._open_sorted()
+        self._load_tail()
+        if self._index_missing(segments):
+            self._rebuild_index(segments)
+        self._trim_active()
+        self._tail_file = open(self._tail_path, "ab")  # noqa: SIM115
+
+    # ------------------------------------------------------------------
+    # Files
+    # ------------------------------------------------------------------
+
+    def _segment_path(self, segment_id: int) -> Path:
+        return self.segment_dir / f"{segment_id:08d}{SEGMENT_SUFFIX}"
+
+    def _segment_ids(self) -> list[int]:
+        return sorted(
+            int(p.stem) for p in self.segment_dir.glob(f"*{SEGMENT_SUFFIX}") if p.stem.isdigit()
+        )
+
+    def _open_sorted(self) -> None:
+        # The previous mapping is dropped, not closed: an iter_latest() in
+        # progress may still hold it, and the replaced file stays readable.
+        self._sorted_map = None
+        self._sorted_count = 0
+        if not self._sorted_path.exists():
+            return
+        size = self._sorted_path.stat().st_size
+        if size < INDEX_RECORD.size:
+            return
+        with open(self._sorted_path, "rb") as f:
+            self._sorted_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._sorted_count = size // INDEX_RECORD.size
+
+    def _load_tail(self) -> None:
+        self._tail = {}
+        self._tail_count = 0
+        if not self._tail_path.exists():
+            return
+        data = self._tail_path.read_bytes()
+        # A torn final record (crash mid-write) is cut off, so that records
+        # appended from now on start on a record boundary
+        usable = len(data) - len(data) % INDEX_RECORD.size
+        if usable < len(data):
+            logger.warning(f"Truncating torn record at the end of {self._tail_path}")
+            os.truncate(self._tail_path, usable)
+        for record in INDEX_RECORD.iter_unpack(data[:usable]):
+            self._add_tail(*record)
+
+    def _add_tail(self, fact_id: bytes, version: int, segment: int, offset: int, length: int) -> None:
+        if segment == self._active_id and offset + length > self._active_size:
+            return  # index written but data lost
+        self._tail.setdefault(fact_id, {})[version] = (segment, offset, length)
+        self._tail_count += 1
+
+    def _trim_active(self) -> None:
+        """Cut the active segment back to the end of its last indexed record.
+
+        Data is written before its index record, so anything past that point
+        is a write that crashed (possibly a torn payload); new records must
+        not follow it.
+        """
+        if not self._active_size:
+            return
+        end = self._indexed_end(self._active_id, self._active_size)
+        if end >= self._active_size:
+            return
+        logger.warning(
+            f"Truncating {self._active_size - end} unindexed bytes from {self._segment_path(self._active_id)}"
+        )
+        self._active_file.truncate(end)
+        self._active_size = end
+
+    def _indexed_end(self, segment: int, size: int) -> int:
+        """Offset just past the last indexed record of ``segment`` (0 if none)."""
+        ends = [
+            offset + length + 1
+            for versions in self._tail.values()
+            for seg, offset, length in versions.values()
+            if seg == segment
+        ]
+        if ends:
+            return max(ends)
+        if self._last_line_indexed(segment, size):
+            return size
+        # After a crash only: find the segment's records in the sorted index
+        end = 0
+        if self._sorted_map is not None:
+            data = self._sorted_map[:self._sorted_count * INDEX_RECORD.size]
+            for _, _, seg, offset, length in INDEX_RECORD.iter_unpack(data):
+                if seg == segment:
+                    end = max(end, offset + length + 1)
+        return end
+
+    def _last_line_indexed(self, segment: int, size: int) -> bool:
+        """True if the segment ends with a whole record the index points at."""
+        import json
+
+        with open(self._segment_path(segment), "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            if view[size - 1:size] != b"\n":
+                return False
+            start = view.rfind(b"\n", 0, size - 1) + 1
+            line = view[start:size - 1]
+        try:
+            entry = json.loads(line)
+            fact_id = UUID(entry["fact_id"]).bytes
+            version = int(entry["version"])
+        except (ValueError, KeyError, TypeError):
+            return False
+        return self._locate(fact_id, version) == (segment, start, len(line))
+
+    def _index_missing(self, segments: list[int]) -> bool:
+        """True if segment data exists that the index files cannot cover."""
+        if self._sorted_count or not any(self._segment_path(i).stat().st_size for i in segments):
+            return False
+        # Without a sorted index, the tail must start at the very first record
+        first = (segments[0], 0)
+        return not any(
+            location[:2] == first for versions in self._tail.values() for location in versions.values()
+        )
+
+    def _rebuild_index(self, segments: list[int]) -> None:
+        """Recreate the index by scanning segment files (index files lost)."""
+        import json
+
+        logger.warning(f"Rebuilding ledger index from segments in {self.segment_dir}")
+        with open(self._tail_path, "wb") as tail:
+            for segment in segments:
+                with open(self._segment_path(segment), "rb") as f:
+                    offset = 0
+                    for line in f:
+                        length = len(line) - 1 if line.endswith(b"\n") else len(line)
+                        try:
+                            entry = json.loads(line)
+                            fact_id = UUID(entry["fact_id"]).bytes
+                            version = int(entry["version"])
+                        except (ValueError, KeyError, TypeError):
+                            offset += len(line)
+                            continue
+                        record = (fact_id, version, segment, offset, length)
+                        tail.write(INDEX_RECORD.pack(*record))
+                        self._add_tail(*record)
+                        offset += len(line)
+
+    def _segment_view(self, segment: int, end: int) -> mmap.mmap:
+        view = self._segment_maps.get(segment)
+        if view is None or len(view) < end:
+            if segment == self._active_id:
+                self._active_file.flush()
+            if view is not None:
+                view.close()
+            with open(self._segment_path(segment), "rb") as f:
+                view = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._segment_maps[segment] = view
+        return view
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def append(self, fact_id: UUID, version: int, payload: bytes) -> None:
+        """Append one record: a data line plus a fixed-width index entry."""
+        self.append_many([(fact_id, version, payload)])
+
+    def append_many(self, records: Iterable[tuple[UUID, int, bytes]]) -> None:
+        """Append records with one data write and one index write."""
+        with self._lock:
+            data = bytearray()
+            index = bytearray()
+            entries = []
+            for fact_id, version, payload in records:
+                if self._active_size + len(data) + len(payload) + 1 > self.segment_max_bytes and (
+                    self._active_size or data
+                ):
+                    self._flush(data, index)
+                    self._rotate()
+                    data, index = bytearray(), bytearray()
+                offset = self._active_size + len(data)
+                data += payload
+                data += b"\n"
+                entry = (fact_id.bytes, version, self._active_id, offset, len(payload))
+                index += INDEX_RECORD.pack(*entry)
+                entries.append(entry)
+            self._flush(data, index)
+            for entry in entries:
+                self._tail.setdefault(entry[0], {})[entry[1]] = entry[2:]
+                self._tail_count += 1
+            if self._tail_count >= max(self.merge_min_records, self.merge_ratio * self._sorted_count):
+                self.merge_index()
+
+    def _flush(self, data: bytearray, index: bytearray) -> None:
+        if not data:
+            return
+        # Data before index, so an index record never points past the data
+        self._active_file.write(data)
+        self._active_file.flush()
+        if self.sync:
+            os.fsync(self._active_file.fileno())
+        self._active_size += len(data)
+        self._tail_file.write(index)
+        self._tail_file.flush()
+        if self.sync:
+            os.fsync(self._tail_file.fileno())
+
+    def _rotate(self) -> None:
+        self._active_file.close()
+        self._active_id += 1
+        self._active_file = open(self._segment_path(self._active_id), "ab")  # noqa: SIM115
+        self._active_size = 0
+
+    def merge_index(self) -> None:
+        """Fold the tail into the sorted index file."""
+        with self._lock:
+            if not self._tail_count:
+                return
+            tail_records = sorted(
+                INDEX_RECORD.pack(fact_id, version, *location)
+                for fact_id, versions in self._tail.items()
+                for version, location in versions.items()
+            )
+            tmp_path = self._sorted_path.with_suffix(".tmp")
+            size = INDEX_RECORD.size
+            with open(tmp_path, "wb") as out:
+                pending: bytes | None = None
+                buf = bytearray()
+                for record in heapq.merge(self._iter_sorted_records(), tail_records):
+                    # Same key twice: the later (tail) record supersedes
+                    if pending is not None and pending[:KEY_SIZE] != record[:KEY_SIZE]:
+                        buf += pending
+                        if len(buf) >= size * 65536:
+                            out.write(buf)
+                            buf.clear()
+                    pending = record
+                if pending is not None:
+                    buf += pending
+                out.write(buf)
+                out.flush()
+                os.fsync(out.fileno())
+            os.replace(tmp_path, self._sorted_path)
+            self._tail_file.close()
+            self._tail_file = open(self._tail_path, "wb")  # noqa: SIM115
+            self._tail = {}
+            self._tail_count = 0
+            self._open_sorted()
+
+    def _iter_sorted_records(self) -> Iterator[bytes]:
+        buf = self._sorted_map
+        if buf is None:
+            return
+        size = INDEX_RECORD.size
+        for start in range(0, self._sorted_count * size, size):
+            yield buf[start:start + size]
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def _sorted_keys(self) -> _SortedKeys:
+        return _SortedKeys(self._sorted_map or b"", self._sorted_count)
+
+    def _sorted_record(self, i: int) -> tuple[bytes, int, int, int, int]:
+        return INDEX_RECORD.unpack_from(self._sorted_map, i * INDEX_RECORD.size)  # type: ignore[arg-type]
+
+    def _locate(self, fact_id: bytes, version: int) -> tuple[int, int, int] | None:
+        location = self._tail.get(fact_id, {}).get(version)
+        if location is not None:
+            return location
+        key = fact_id + version.to_bytes(4, "big")
+        keys = self._sorted_keys()
+        i = bisect.bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            return self._sorted_record(i)[2:]
+        return None
+
+    def read(self, segment: int, offset: int, length: int) -> bytes:
+        """Read a record's bytes as a single slice of the mmap'd segment."""
+        with self._lock:
+            return self._segment_view(segment, offset + length)[offset:offset + length]
+
+    def get(self, fact_id: UUID, version: int) -> bytes | None:
+        """Get the payload stored for a fact version."""
+        with self._lock:
+            location = self._locate(fact_id.bytes, version)
+            return None if location is None else self.read(*location)
+
+    def versions(self, fact_id: UUID) -> list[int]:
+        """All stored versions of a fact, ascending."""
+        raw = fact_id.bytes
+        with self._lock:
+            found = set(self._tail.get(raw, {}))
+            keys = self._sorted_keys()
+            i = bisect.bisect_left(keys, raw + _MIN_VERSION)
+            while i < len(keys) and keys[i][:16] == raw:
+                found.add(int.from_bytes(keys[i][16:], "big"))
+                i += 1
+        return sorted(found)
+
+    def latest_version(self, fact_id: UUID) -> int | None:
+        """Highest stored version of a fact."""
+        raw = fact_id.bytes
+        with self._lock:
+            tail = self._tail.get(raw)
+            best = max(tail) if tail else None
+            keys = self._sorted_keys()
+            j = bisect.bisect_right(keys, raw + _MAX_VERSION) - 1
+            if j >= 0 and keys[j][:16] == raw:
+                version = int.from_bytes(keys[j][16:], "big")
+                best = version if best is None else max(best, version)
+        return best
+
+    def iter_latest(self) -> Iterator[tuple[UUID, int, tuple[int, int, int]]]:
+        """Yield (fact_id, latest version, location) for every fact, in key order."""
+        with self._lock:
+            tail_records = sorted(
+                INDEX_RECORD.pack(fact_id, version, *location)
+                for fact_id, versions in self._tail.items()
+                for version, location in versions.items()
+            )
+            sorted_map, sorted_count = self._sorted_map, self._sorted_count
+        size = INDEX_RECORD.size
+        pending: bytes | None = None
+        merged = heapq.merge(
+            (sorted_map[i * size:(i + 1) * size] for i in range(sorted_count)) if sorted_map else iter(()),
+            tail_records,
+        )
+        for record in merged:
+            if pending is not None and pending[:16] != record[:16]:
+                yield self._decode(pending)
+            pending = record
+        if pending is not None:
+            yield self._decode(pending)
+
+    @staticmethod
+    def _decode(record: bytes) -> tuple[UUID, int, tuple[int, int, int]]:
+        fact_id, version, segment, offset, length = INDEX_RECORD.unpack(record)
+        return UUID(bytes=fact_id), version, (segment, offset, length)
+
+    def close(self) -> None:
+        """Merge the tail and release files and mappings."""
+        with self._lock:
+            self.merge_index()
+            self._active_file.close()
+            self._tail_file.close()
+            for view in self._segment_maps.values():
+                view.close()
+            self._segment_maps.clear()
+            if self._sorted_map is not None:
+                self._sorted_map.close()
+                self._sorted_map = None
@@ -7,6 +7,8 @@ from dataclasses import dataclass
 
 import httpx
 
+from ...net import shared_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,7 +32,7 @@ class CommonsDuplicateChecker:
 
     async def _get_client(self) -> httpx.AsyncClient:
         if self._client is None:
-            self._client = httpx.AsyncClient(
+            self._client = shared_client(
                 timeout=30.0,
                 headers={
                     # Wikimedia requires proper User-Agent with contact info
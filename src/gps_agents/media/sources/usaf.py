@@ -9,6 +9,7 @@ from pathlib import Path
 import httpx
 from bs4 import BeautifulSoup
 
+from ...net import shared_client
 from .base import DownloadedPhoto, PhotoResult, compute_sha256
 
 logger = logging.getLogger(__name__)
@@ -26,7 +27,7 @@ class USAFPhotoSource:
 
     async def _get_client(self) -> httpx.AsyncClient:
         if self._client is None:
-            self._client = httpx.AsyncClient(
+            self._client = shared_client(
                 timeout=30.0,
                 follow_redirects=True,
                 headers={
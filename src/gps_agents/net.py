@@ -1,9 +1,28 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
+import contextlib
+import math
+import os
 import time
+import weakref
+from collections import deque
 from dataclasses import dataclass
-from typing import Dict
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict
+
+import httpx
+
+from .http_cache import CACHE, CachingTransport
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 
 @dataclass
@@ -11,39 +30,244 @@ class RateLimitConfig:
     max_calls: int = 1
     window_seconds: float = 1.0
     min_interval: float = 0.0  # enforce spacing between calls
+    burst: int | None = None  # bucket capacity; default max_calls (1 with min_interval)
+
+    @property
+    def rate(self) -> float:
+        """Sustained calls per second allowed by the window and spacing."""
+        rate = self.max_calls / self.window_seconds if self.window_seconds > 0 else math.inf
+        if self.min_interval > 0:
+            rate = min(rate, 1.0 / self.min_interval)
+        return rate
+
+    @property
+    def capacity(self) -> int:
+        if self.burst is not None:
+            return max(1, self.burst)
+        return 1 if self.min_interval > 0 else max(1, self.max_calls)
+
+
+# Upper bounds (ms) of the queueing-delay histogram buckets; 0 = no wait
+DELAY_BUCKETS_MS = (0, 1, 5, 10, 50, 100, 500, 1000, 5000, 30000)
+
+
+class DelayHistogram:
+    """Fixed-bucket histogram of how long callers waited for a token."""
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(DELAY_BUCKETS_MS) + 1)
+        self.total = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
 
+    def record(self, ms: float) -> None:
+        self.counts[bisect.bisect_left(DELAY_BUCKETS_MS, ms)] += 1
+        self.total += 1
+        self.sum_ms += ms
+        self.max_ms = max(self.max_ms, ms)
 
-class AsyncRateLimiter:
-    """Simple sliding-window rate limiter with min-interval spacing."""
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the ``q`` quantile."""
+        if not self.total:
+            return 0.0
+        rank = q * self.total
+        seen = 0
+        for bound, count in zip(DELAY_BUCKETS_MS, self.counts, strict=False):
+            seen += count
+            if seen >= rank:
+                return min(float(bound), self.max_ms)
+        return self.max_ms
+
+    def snapshot(self) -> dict:
+        labels = [f"<={b}" for b in DELAY_BUCKETS_MS] + [f">{DELAY_BUCKETS_MS[-1]}"]
+        return {
+            "count": self.total,
+            "mean": round(self.sum_ms / self.total, 2) if self.total else 0.0,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "max": round(self.max_ms, 2),
+            "buckets": dict(zip(labels, self.counts, strict=True)),
+        }
+
+
+class TokenBucketLimiter:
+    """Token bucket with a FIFO wait queue and adaptive backoff.
+
+    Tokens refill at ``cfg.rate`` up to ``cfg.capacity``. A caller takes a
+    token straight away when one is free and nobody is queued; otherwise it
+    parks a future at the back of the queue. One timer on the event loop
+    hands tokens to the head of the queue as they accrue, so waiters are
+    served in arrival order and nothing holds a lock while they sleep.
+
+    ``penalize()`` (a 429, optionally with Retry-After) pauses the bucket and
+    halves the refill rate; ``record_success()`` restores it step by step.
+    """
+
+    BACKOFF_BASE = 1.0
+    MAX_BACKOFF = 300.0
 
     def __init__(self, cfg: RateLimitConfig) -> None:
         self.cfg = cfg
-        self._lock = asyncio.Lock()
-        self._calls: list[float] = []  # timestamps
-        self._last_call: float = 0.0
+        self.rate = cfg.rate
+        self.queue_delay = DelayHistogram()
+        self.penalties = 0
+        self._tokens = float(cfg.capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._strikes = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
 
     async def acquire(self) -> None:
-        async with self._lock:
-            now = time.monotonic()
-            # Enforce min interval
-            sleep_needed = max(0.0, self.cfg.min_interval - (now - self._last_call))
-            if sleep_needed > 0:
-                await asyncio.sleep(sleep_needed)
-                now = time.monotonic()
-            # Evict old calls
-            cutoff = now - self.cfg.window_seconds
-            self._calls = [t for t in self._calls if t >= cutoff]
-            # If at capacity, wait until earliest drops out
-            if len(self._calls) >= self.cfg.max_calls:
-                wait_for = self._calls[0] + self.cfg.window_seconds - now
-                if wait_for > 0:
-                    await asyncio.sleep(wait_for)
-                    now = time.monotonic()
-                    cutoff = now - self.cfg.window_seconds
-                    self._calls = [t for t in self._calls if t >= cutoff]
-            # Record call
-            self._calls.append(time.monotonic())
-            self._last_call = time.monotonic()
+        start = time.monotonic()
+        if not self._waiters and self._take(start):
+            self.queue_delay.record(0.0)
+            return
+
+        fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(fut)
+        self._schedule()
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.cancelled():
+                with contextlib.suppress(ValueError):
+                    self._waiters.remove(fut)
+            else:
+                self._tokens += 1  # granted as we were cancelled; hand it back
+            self._schedule()
+            raise
+        self.queue_delay.record((time.monotonic() - start) * 1000)
+
+    def penalize(self, retry_after: float | None = None) -> None:
+        """Back off after the server pushed back (429 / Retry-After)."""
+        self._strikes += 1
+        self.penalties += 1
+        if retry_after is None:
+            retry_after = self.BACKOFF_BASE * 2 ** (self._strikes - 1)
+        now = time.monotonic()
+        self._paused_until = max(self._paused_until, now + min(retry_after, self.MAX_BACKOFF))
+        self._tokens = min(self._tokens, 0.0)
+        self._updated = self._paused_until
+        if math.isfinite(self.cfg.rate):
+            self.rate = max(self.rate / 2, self.cfg.rate / 16)
+        self._schedule()
+
+    def record_success(self) -> None:
+        self._strikes = 0
+        if self.rate < self.cfg.rate:
+            self.rate = min(self.cfg.rate, self.rate + self.cfg.rate / 8)
+
+    def _refill(self, now: float) -> None:
+        if math.isinf(self.rate):
+            self._tokens = float(self.cfg.capacity)
+        else:
+            elapsed = max(0.0, now - self._updated)
+            self._tokens = min(float(self.cfg.capacity), self._tokens + elapsed * self.rate)
+        self._updated = max(now, self._updated)
+
+    def _take(self, now: float) -> bool:
+        if now < self._paused_until:
+            return False
+        self._refill(now)
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+    def _schedule(self) -> None:
+        """(Re)arm the timer for when the head of the queue can be served."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._waiters:
+            return
+        now = time.monotonic()
+        if now >= self._paused_until:
+            self._refill(now)
+        delay = self._paused_until - now
+        if self._tokens < 1:
+            delay = max(delay, (1 - self._tokens) / self.rate + max(0.0, self._updated - now))
+        self._timer = self._waiters[0].get_loop().call_later(max(delay, 0.0), self._release)
+
+    def _release(self) -> None:
+        self._timer = None
+        now = time.monotonic()
+        while self._waiters and self._take(now):
+            fut = self._waiters.popleft()
+            if fut.done():
+                self._tokens += 1  # cancelled while queued
+                continue
+            fut.set_result(None)
+        self._schedule()
+
+
+# Previous name, kept for callers importing it
+AsyncRateLimiter = TokenBucketLimiter
+
+
+class InFlightBudget:
+    """Process-wide cap on concurrent requests across all sources.
+
+    Slots are handed over in FIFO order when a request finishes.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.in_flight = 0
+        self.peak = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    async def acquire(self) -> None:
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            return
+        fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(fut)
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.cancelled():
+                with contextlib.suppress(ValueError):
+                    self._waiters.remove(fut)
+            else:
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            fut = self._waiters.popleft()
+            if not fut.done():
+                fut.set_result(None)  # the slot passes straight to the next waiter
+                return
+        self.in_flight -= 1
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *exc: object) -> None:
+        self.release()
+
+
+def retry_after_seconds(response: httpx.Response) -> float | None:
+    """Parse a Retry-After header (delta seconds or HTTP date)."""
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
 
 
 class CircuitBreaker:
@@ -86,13 +310,14 @@ class NetGuards:
     """Registry for per-source rate limiters and circuit breakers."""
 
     def __init__(self) -> None:
-        self._limiters: Dict[str, AsyncRateLimiter] = {}
+        self._limiters: Dict[str, TokenBucketLimiter] = {}
         self._breakers: Dict[str, CircuitBreaker] = {}
+        self.in_flight = InFlightBudget(int(os.getenv("NET_MAX_IN_FLIGHT", "16")))
 
-    def get_limiter(self, key: str, default: RateLimitConfig) -> AsyncRateLimiter:
+    def get_limiter(self, key: str, default: RateLimitConfig) -> TokenBucketLimiter:
         key = key.lower()
         if key not in self._limiters:
-            self._limiters[key] = AsyncRateLimiter(default)
+            self._limiters[key] = TokenBucketLimiter(default)
         return self._limiters[key]
 
     def get_breaker(self, key: str, max_failures: int = 5, window_seconds: float = 60.0, cooldown_seconds: float = 300.0) -> CircuitBreaker:
@@ -112,9 +337,226 @@ def report_status() -> dict:
     for key, br in GUARDS._breakers.items():  # noqa: SLF001
         out.setdefault(key, {})["circuit_open"] = br._opened_at is not None  # noqa: SLF001
     for key, lim in GUARDS._limiters.items():  # noqa: SLF001
-        out.setdefault(key, {})["rate"] = {
+        entry = out.setdefault(key, {})
+        entry["rate"] = {
             "max_calls": lim.cfg.max_calls,
             "window_seconds": lim.cfg.window_seconds,
             "min_interval": lim.cfg.min_interval,
+            "burst": lim.cfg.capacity,
+            "calls_per_sec": round(lim.rate, 4),
+            "penalties": lim.penalties,
+        }
+        entry["queued"] = lim.queued
+        entry["queue_delay_ms"] = lim.queue_delay.snapshot()
+    return out
+
+
+# =============================================================================
+# Shared HTTP transport
+# =============================================================================
+
+
+@dataclass
+class PoolConfig:
+    max_connections_per_host: int = 10
+    max_keepalive_per_host: int = 10
+    keepalive_expiry: float = 30.0
+    http2: bool = True  # used when the h2 package is installed
+
+    @classmethod
+    def from_env(cls) -> PoolConfig:
+        return cls(
+            max_connections_per_host=int(os.getenv("NET_MAX_CONNECTIONS_PER_HOST", "10")),
+            max_keepalive_per_host=int(os.getenv("NET_MAX_KEEPALIVE_PER_HOST", "10")),
+            keepalive_expiry=float(os.getenv("NET_KEEPALIVE_EXPIRY", "30")),
+            http2=os.getenv("NET_HTTP2", "1").lower() not in ("0", "false", "no"),
+        )
+
+
+@dataclass
+class PoolStats:
+    """Per-origin counters collected from httpcore trace events."""
+
+    requests: int = 0
+    connections_opened: int = 0
+    tls_handshakes: int = 0
+    connect_seconds: float = 0.0  # TCP connect + TLS handshake
+    http2_responses: int = 0
+
+    @property
+    def reuse_rate(self) -> float:
+        """Share of requests served on an already-open connection."""
+        if not self.requests:
+            return 0.0
+        return max(0.0, 1.0 - self.connections_opened / self.requests)
+
+    @property
+    def avg_handshake_ms(self) -> float:
+        if not self.connections_opened:
+            return 0.0
+        return self.connect_seconds / self.connections_opened * 1000
+
+
+_HANDSHAKE_STEPS = ("connection.connect_tcp", "connection.start_tls")
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response body stream that runs ``release`` once when closed."""
+
+    def __init__(self, stream: Any, release: Any) -> None:
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self) -> Any:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+
+class SharedTransport(httpx.AsyncBaseTransport):
+    """Process-wide transport with one keep-alive pool per origin.
+
+    Every client from ``shared_client()`` routes through this transport, so
+    sources talking to the same host share warm connections (and HTTP/2
+    multiplexing when available) instead of each paying for its own TCP/TLS
+    handshakes. Connections belong to the event loop that opened them, so
+    pools are kept per running loop.
+
+    A request may carry a ``rate_limiter`` extension (a limiter from
+    ``GUARDS``); a token is acquired from it just before the request is sent.
+
+    Closing a client does not close the shared pools; use ``aclose_pools()``
+    at the end of a run.
+    """
+
+    def __init__(self, config: PoolConfig | None = None) -> None:
+        self.config = config or PoolConfig.from_env()
+        self.stats: dict[str, PoolStats] = {}
+        self._ssl_context = None
+        self._pools: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, httpx.AsyncHTTPTransport]
+        ] = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def origin(url: httpx.URL) -> str:
+        port = url.port or (443 if url.scheme == "https" else 80)
+        return f"{url.scheme}://{url.host}:{port}"
+
+    def _pool(self, origin: str) -> httpx.AsyncHTTPTransport:
+        pools = self._pools.setdefault(asyncio.get_running_loop(), {})
+        pool = pools.get(origin)
+        if pool is None:
+            if self._ssl_context is None:
+                self._ssl_context = httpx.create_ssl_context()
+            cfg = self.config
+            pool = pools[origin] = httpx.AsyncHTTPTransport(
+                verify=self._ssl_context,
+                http2=cfg.http2 and HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=cfg.max_connections_per_host,
+                    max_keepalive_connections=cfg.max_keepalive_per_host,
+                    keepalive_expiry=cfg.keepalive_expiry,
+                ),
+            )
+        return pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        origin = self.origin(request.url)
+        stats = self.stats.setdefault(origin, PoolStats())
+        stats.requests += 1
+
+        outer_trace = request.extensions.get("trace")
+        started: dict[str, float] = {}
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            if outer_trace is not None:
+                await outer_trace(event_name, info)
+            step, _, phase = event_name.rpartition(".")
+            if step not in _HANDSHAKE_STEPS:
+                return
+            if phase == "started":
+                started[step] = time.perf_counter()
+            elif phase == "complete":
+                stats.connect_seconds += time.perf_counter() - started.pop(step, time.perf_counter())
+                if step == "connection.connect_tcp":
+                    stats.connections_opened += 1
+                else:
+                    stats.tls_handshakes += 1
+
+        request.extensions = {**request.extensions, "trace": trace}
+        # A source's rate-limit token is only spent on requests that reach the
+        # network; the response cache sits in front of this transport
+        limiter = request.extensions.get("rate_limiter")
+        if limiter is not None:
+            await limiter.acquire()
+        await GUARDS.in_flight.acquire()
+        try:
+            response = await self._pool(origin).handle_async_request(request)
+        except BaseException:
+            GUARDS.in_flight.release()
+            raise
+        # The in-flight slot is held until the body has been read
+        response.stream = _ReleasingStream(response.stream, GUARDS.in_flight.release)
+        if response.extensions.get("http_version") == b"HTTP/2":
+            stats.http2_responses += 1
+        return response
+
+    async def aclose(self) -> None:
+        """Clients close their transport on exit; the shared pools stay open."""
+
+    async def aclose_pools(self) -> None:
+        """Close every pool opened on the running event loop."""
+        pools = self._pools.pop(asyncio.get_running_loop(), {})
+        for pool in pools.values():
+            await pool.aclose()
+
+    def open_connections(self) -> dict[str, int]:
+        """Open sockets per origin, across event loops."""
+        out: dict[str, int] = {}
+        for pools in list(self._pools.values()):
+            for origin, pool in pools.items():
+                out[origin] = out.get(origin, 0) + len(pool._pool.connections)  # noqa: SLF001
+        return out
+
+
+# Global transport instance
+TRANSPORT = SharedTransport()
+
+
+def shared_client(source: str | None = None, **kwargs: Any) -> httpx.AsyncClient:
+    """Create an ``httpx.AsyncClient`` backed by the shared connection pools.
+
+    Accepts the usual client options (timeout, headers, follow_redirects...).
+    Clients are cheap: no SSL context or pool is created per client.
+
+    When ``source`` is given, GETs also go through the shared response cache
+    (see ``gps_agents.http_cache``) with that source's TTL and statistics.
+    """
+    transport: httpx.AsyncBaseTransport = TRANSPORT
+    if source is not None and CACHE.enabled:
+        transport = CachingTransport(TRANSPORT, CACHE, source)
+    return httpx.AsyncClient(transport=transport, **kwargs)
+
+
+def report_pool_status() -> dict:
+    """Return per-origin connection pool metrics for debugging."""
+    open_connections = TRANSPORT.open_connections()
+    out = {}
+    for origin, st in TRANSPORT.stats.items():
+        out[origin] = {
+            "requests": st.requests,
+            "connections_opened": st.connections_opened,
+            "reuse_rate": round(st.reuse_rate, 3),
+            "open_connections": open_connections.get(origin, 0),
+            "avg_handshake_ms": round(st.avg_handshake_ms, 2),
+            "tls_handshakes": st.tls_handshakes,
+            "http2_responses": st.http2_responses,
         }
     return out
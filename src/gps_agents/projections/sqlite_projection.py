@@ -1,8 +1,14 @@
 """SQLite read projection + durable idempotency mapping store."""
 from __future__ import annotations
 
+import contextlib
+import json
 import logging
+import os
+import queue
+import re
 import sqlite3
+import threading
 import time
 from contextlib import contextmanager
 from pathlib import Path
@@ -11,12 +17,165 @@ from typing import TYPE_CHECKING, Any
 from ..models.fact import Fact, FactStatus
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
     from uuid import UUID
 
     from ..ledger.fact_ledger import LedgerEvent
 
 logger = logging.getLogger(__name__)
 
+_UPSERT_FACT_SQL = """
+    INSERT INTO facts (
+        fact_id, version, statement, status, confidence_score,
+        fact_type, person_id, created_at, updated_at,
+        sources_json, gps_evaluation_json, full_json
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(fact_id) DO UPDATE SET
+        version = excluded.version,
+        statement = excluded.statement,
+        status = excluded.status,
+        confidence_score = excluded.confidence_score,
+        fact_type = excluded.fact_type,
+        person_id = excluded.person_id,
+        updated_at = excluded.updated_at,
+        sources_json = excluded.sources_json,
+        gps_evaluation_json = excluded.gps_evaluation_json,
+        full_json = excluded.full_json
+"""
+
+_INSERT_SOURCE_SQL = """
+    INSERT INTO fact_sources (fact_id, repository, record_id, evidence_type)
+    VALUES (?, ?, ?, ?)
+"""
+
+_UPSERT_STATEMENT_GUID_SQL = """
+    INSERT INTO wikidata_statement_cache (fingerprint, guid, entity_id, property_id)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(fingerprint) DO UPDATE SET
+      guid = excluded.guid,
+      entity_id = COALESCE(excluded.entity_id, wikidata_statement_cache.entity_id),
+      property_id = COALESCE(excluded.property_id, wikidata_statement_cache.property_id)
+"""
+
+_SAVE_FINGERPRINT_SQL = """
+    INSERT INTO fingerprint_index (fingerprint, entity_type, gramps_handle)
+    VALUES (?, ?, ?)
+    ON CONFLICT(fingerprint) DO UPDATE SET
+        entity_type = excluded.entity_type,
+        gramps_handle = COALESCE(excluded.gramps_handle, fingerprint_index.gramps_handle)
+"""
+
+# Stays under SQLITE_MAX_VARIABLE_NUMBER (999 before SQLite 3.32)
+_MAX_SQL_PARAMS = 900
+
+# Secondary indexes dropped during bulk rebuild and recreated afterwards.
+# idx_sources_fact is kept: it backs the per-fact DELETE of stale sources.
+_REBUILD_INDEXES = {
+    "idx_facts_status": "CREATE INDEX IF NOT EXISTS idx_facts_status ON facts(status)",
+    "idx_facts_person": "CREATE INDEX IF NOT EXISTS idx_facts_person ON facts(person_id)",
+    "idx_facts_type": "CREATE INDEX IF NOT EXISTS idx_facts_type ON facts(fact_type)",
+    "idx_facts_confidence": "CREATE INDEX IF NOT EXISTS idx_facts_confidence ON facts(confidence_score)",
+    "idx_sources_repo": "CREATE INDEX IF NOT EXISTS idx_sources_repo ON fact_sources(repository)",
+}
+
+# Full-text indexes over facts.statement (external content, kept in sync by
+# triggers). The trigram table is optional and serves OCR-tolerant search.
+_FTS_TOKENIZERS = {
+    "facts_fts": "unicode61 remove_diacritics 2",
+    "facts_fts_trigram": "trigram",
+}
+
+
+def _fts_triggers(table: str) -> dict[str, str]:
+    return {
+        f"{table}_ai": f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_ai AFTER INSERT ON facts BEGIN
+                INSERT INTO {table}(rowid, statement) VALUES (new.rowid, new.statement);
+            END""",
+        f"{table}_ad": f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_ad AFTER DELETE ON facts BEGIN
+                INSERT INTO {table}({table}, rowid, statement) VALUES ('delete', old.rowid, old.statement);
+            END""",
+        f"{table}_au": f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_au AFTER UPDATE OF statement ON facts BEGIN
+                INSERT INTO {table}({table}, rowid, statement) VALUES ('delete', old.rowid, old.statement);
+                INSERT INTO {table}(rowid, statement) VALUES (new.rowid, new.statement);
+            END""",
+    }
+
+
+def _fts_quote(text: str) -> str:
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _fts_query(search_term: str, *, trigram: bool = False) -> str:
+    """Translate a user search term into an FTS5 MATCH expression.
+
+    ``"quoted text"`` is a phrase and ``word*`` a prefix; other words must
+    all match. In trigram mode every 3-character window of every word is
+    OR-ed, so bm25 ranks statements by how many trigrams they share with
+    the term, which tolerates OCR substitutions such as ``rn`` for ``m``.
+    """
+    tokens = re.findall(r'"([^"]*)"|(\S+)', search_term)
+    if trigram:
+        words = [(phrase or word).strip("*").lower() for phrase, word in tokens]
+        grams = {w[i:i + 3] for w in words for i in range(len(w) - 2)}
+        return " OR ".join(_fts_quote(g) for g in sorted(grams))
+    terms = []
+    for phrase, word in tokens:
+        if phrase.strip():
+            terms.append(_fts_quote(phrase))
+        elif word.endswith("*") and word.rstrip("*"):
+            terms.append(_fts_quote(word.rstrip("*")) + "*")
+        elif word.strip("*"):
+            terms.append(_fts_quote(word))
+    return " ".join(terms)
+
+
+def _fact_row(fact: Fact) -> tuple:
+    return (
+        str(fact.fact_id),
+        fact.version,
+        fact.statement,
+        fact.status.value,
+        fact.confidence_score,
+        fact.fact_type,
+        fact.person_id,
+        fact.created_at.isoformat(),
+        fact.updated_at.isoformat(),
+        fact.model_dump_json(include={"sources"}),
+        fact.gps_evaluation.model_dump_json() if fact.gps_evaluation else None,
+        fact.model_dump_json(),
+    )
+
+
+def _source_rows(fact: Fact) -> list[tuple]:
+    fact_id = str(fact.fact_id)
+    return [
+        (fact_id, source.repository, source.record_id, source.evidence_type.value)
+        for source in fact.sources
+    ]
+
+
+class _NestedConnection:
+    """Connection handle for calls made inside an open ``transaction()``.
+
+    Statements join the enclosing transaction; commit and rollback are left
+    to the ``transaction()`` block that owns it.
+    """
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
+
 
 class SQLiteProjection:
     """SQLite-based read model and durable idempotency mapping.
@@ -26,25 +185,156 @@ class SQLiteProjection:
     - Durable mapping store for idempotency:
       * external_ids(fingerprint -> gramps_handle, wikidata_qid, wikitree_id, familysearch_id, last_synced_at)
       * fingerprint_index(fingerprint -> entity_type, gramps_handle)
+
+    Connections are pooled: by default each thread reuses one connection
+    (PRAGMAs run once, and sqlite3's per-connection statement cache keeps
+    prepared statements across calls). With ``reader_pool_size > 0`` all
+    writes go through a single shared writer connection and read-only
+    queries borrow from a pool of ``mode=ro`` reader connections.
+    ``pooled=False`` restores a fresh connection per call.
+
+    With ``event_batch_size > 1``, ``handle_ledger_event`` buffers facts and
+    projects them in micro-batches; reads and ``close()`` flush the buffer.
     """
 
-    def __init__(self, db_path: str | Path) -> None:
+    STATEMENT_CACHE_SIZE = 256
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        *,
+        pooled: bool = True,
+        reader_pool_size: int = 0,
+        event_batch_size: int = 1,
+        fts_trigram: bool = False,
+    ) -> None:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.pooled = pooled
+        self.reader_pool_size = reader_pool_size if pooled else 0
+        self.event_batch_size = event_batch_size
+        self._local = threading.local()
+        self._conns: list[sqlite3.Connection] = []
+        self._conns_lock = threading.Lock()
+        self._writer: sqlite3.Connection | None = None
+        self._writer_lock = threading.RLock()
+        self._readers: queue.Queue[sqlite3.Connection] = queue.Queue()
+        self._readers_created = 0
+        self._pending_facts: dict[str, Fact] = {}
+        self._pending_lock = threading.Lock()
+        self.fts_trigram = fts_trigram
+        self._fts_tables: list[str] = []
         self._init_schema()
 
-    @contextmanager
-    def _get_conn(self):
-        conn = sqlite3.connect(self.db_path)
+    def _connect(self, *, read_only: bool = False, shared: bool = False) -> sqlite3.Connection:
+        if read_only:
+            conn = sqlite3.connect(
+                f"file:{self.db_path}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+                cached_statements=self.STATEMENT_CACHE_SIZE,
+            )
+        else:
+            conn = sqlite3.connect(
+                self.db_path,
+                check_same_thread=not shared,
+                cached_statements=self.STATEMENT_CACHE_SIZE,
+            )
         conn.row_factory = sqlite3.Row
         # Enforce PRAGMAs per-connection
         conn.execute("PRAGMA foreign_keys=ON;")
-        conn.execute("PRAGMA journal_mode=WAL;")
+        if not read_only:
+            conn.execute("PRAGMA journal_mode=WAL;")
         conn.execute("PRAGMA busy_timeout=5000;")
+        if self.pooled:
+            with self._conns_lock:
+                self._conns.append(conn)
+        return conn
+
+    @staticmethod
+    def _release(conn: sqlite3.Connection) -> None:
+        # Pooled connections outlive the call: discard anything left
+        # uncommitted, as closing a per-call connection used to.
+        if conn.in_transaction:
+            conn.rollback()
+
+    @contextmanager
+    def _get_conn(self):
+        if not self.pooled:
+            conn = self._connect()
+            try:
+                yield conn
+            finally:
+                conn.close()
+            return
+
+        outer = getattr(self._local, "txn_conn", None)
+        if outer is not None:
+            yield _NestedConnection(outer)
+            return
+
+        if self.reader_pool_size:
+            with self._writer_lock:
+                if self._writer is None:
+                    self._writer = self._connect(shared=True)
+                try:
+                    yield self._writer
+                finally:
+                    self._release(self._writer)
+            return
+
+        conn = getattr(self._local, "conn", None)
+        # A forked child must not reuse the parent's connection
+        if conn is None or self._local.pid != os.getpid():
+            conn = self._local.conn = self._connect()
+            self._local.pid = os.getpid()
+        try:
+            yield conn
+        finally:
+            self._release(conn)
+
+    @contextmanager
+    def _read_conn(self):
+        """Connection for read-only queries (a pooled reader when configured)."""
+        if getattr(self._local, "txn_conn", None) is not None:
+            # Inside transaction(): read through it to see its own writes
+            with self._get_conn() as conn:
+                yield conn
+            return
+
+        self.flush()
+        if not self.reader_pool_size:
+            with self._get_conn() as conn:
+                yield conn
+            return
+
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            with self._conns_lock:
+                create = self._readers_created < self.reader_pool_size
+                if create:
+                    self._readers_created += 1
+            conn = self._connect(read_only=True) if create else self._readers.get()
         try:
             yield conn
         finally:
-            conn.close()
+            self._release(conn)
+            self._readers.put(conn)
+
+    def close(self) -> None:
+        """Flush buffered events and close all pooled connections."""
+        self.flush()
+        with self._conns_lock:
+            conns, self._conns = self._conns, []
+        for conn in conns:
+            # Per-thread connections can only be closed by their own thread
+            with contextlib.suppress(sqlite3.ProgrammingError):
+                conn.close()
+        self._writer = None
+        self._readers = queue.Queue()
+        self._readers_created = 0
+        self._local = threading.local()
 
     def _init_schema(self) -> None:
         # Retry with exponential backoff for concurrent access (e.g., parallel tests)
@@ -141,6 +431,7 @@ class SQLiteProjection:
                 """
                     )
                     conn.commit()
+                    self._init_fts(conn)
                     return  # Success, exit retry loop
             except sqlite3.OperationalError as e:
                 if "database is locked" in str(e) and attempt < max_retries - 1:
@@ -148,66 +439,44 @@ class SQLiteProjection:
                     continue
                 raise
 
+    def _init_fts(self, conn: sqlite3.Connection) -> None:
+        """Create the FTS5 tables and sync triggers, backfilling new tables."""
+        existing = {
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE 'facts_fts%'"
+            )
+        }
+        wanted = ["facts_fts"]
+        if self.fts_trigram or "facts_fts_trigram" in existing:
+            wanted.append("facts_fts_trigram")
+        for table in wanted:
+            conn.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {table} USING fts5("
+                f"statement, content='facts', content_rowid='rowid', "
+                f"tokenize='{_FTS_TOKENIZERS[table]}')"
+            )
+            for ddl in _fts_triggers(table).values():
+                conn.execute(ddl)
+            if table not in existing:
+                # Index facts projected before the FTS table existed
+                conn.execute(f"INSERT INTO {table}({table}) VALUES ('rebuild')")
+        conn.commit()
+        self._fts_tables = wanted
+
     # --------------------------- Facts API ---------------------------
 
     def upsert_fact(self, fact: Fact) -> None:
         with self._get_conn() as conn:
-            conn.execute(
-                """
-                INSERT INTO facts (
-                    fact_id, version, statement, status, confidence_score,
-                    fact_type, person_id, created_at, updated_at,
-                    sources_json, gps_evaluation_json, full_json
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(fact_id) DO UPDATE SET
-                    version = excluded.version,
-                    statement = excluded.statement,
-                    status = excluded.status,
-                    confidence_score = excluded.confidence_score,
-                    fact_type = excluded.fact_type,
-                    person_id = excluded.person_id,
-                    updated_at = excluded.updated_at,
-                    sources_json = excluded.sources_json,
-                    gps_evaluation_json = excluded.gps_evaluation_json,
-                    full_json = excluded.full_json
-                """,
-                (
-                    str(fact.fact_id),
-                    fact.version,
-                    fact.statement,
-                    fact.status.value,
-                    fact.confidence_score,
-                    fact.fact_type,
-                    fact.person_id,
-                    fact.created_at.isoformat(),
-                    fact.updated_at.isoformat(),
-                    fact.model_dump_json(include={"sources"}),
-                    fact.gps_evaluation.model_dump_json() if fact.gps_evaluation else None,
-                    fact.model_dump_json(),
-                ),
-            )
-
+            conn.execute(_UPSERT_FACT_SQL, _fact_row(fact))
             conn.execute("DELETE FROM fact_sources WHERE fact_id = ?", (str(fact.fact_id),))
-            for source in fact.sources:
-                conn.execute(
-                    """
-                    INSERT INTO fact_sources (fact_id, repository, record_id, evidence_type)
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    (
-                        str(fact.fact_id),
-                        source.repository,
-                        source.record_id,
-                        source.evidence_type.value,
-                    ),
-                )
-
+            conn.executemany(_INSERT_SOURCE_SQL, _source_rows(fact))
             conn.commit()
 
     # ------------------------ Idempotency mapping --------------------
 
     def get_external_ids(self, fingerprint: str) -> dict | None:
-        with self._get_conn() as conn:
+        with self._read_conn() as conn:
             row = conn.execute(
                 "SELECT * FROM external_ids WHERE fingerprint = ?",
                 (fingerprint,),
@@ -243,30 +512,46 @@ class SQLiteProjection:
 
     def save_fingerprint(self, entity_type: str, fingerprint: str, gramps_handle: str | None) -> None:
         with self._get_conn() as conn:
-            conn.execute(
-                """
-                INSERT INTO fingerprint_index (fingerprint, entity_type, gramps_handle)
-                VALUES (?, ?, ?)
-                ON CONFLICT(fingerprint) DO UPDATE SET
-                    entity_type = excluded.entity_type,
-                    gramps_handle = COALESCE(excluded.gramps_handle, fingerprint_index.gramps_handle)
-                """,
-                (fingerprint, entity_type, gramps_handle),
+            conn.execute(_SAVE_FINGERPRINT_SQL, (fingerprint, entity_type, gramps_handle))
+            conn.commit()
+
+    def save_fingerprints(self, rows: Iterable[tuple[str, str, str | None]]) -> None:
+        """Save (entity_type, fingerprint, gramps_handle) rows in one commit."""
+        with self._get_conn() as conn:
+            conn.executemany(
+                _SAVE_FINGERPRINT_SQL,
+                ((fingerprint, entity_type, handle) for entity_type, fingerprint, handle in rows),
             )
             conn.commit()
 
     def get_gramps_handle_by_fingerprint(self, fingerprint: str) -> str | None:
-        with self._get_conn() as conn:
+        with self._read_conn() as conn:
             row = conn.execute(
                 "SELECT gramps_handle FROM fingerprint_index WHERE fingerprint = ?",
                 (fingerprint,),
             ).fetchone()
             return row["gramps_handle"] if row and row["gramps_handle"] else None
 
+    def get_gramps_handles_by_fingerprints(self, fingerprints: Iterable[str]) -> dict[str, str]:
+        """Look up many fingerprints in one query; unmapped ones are left out.
+
+        The fingerprints are bound as a single JSON array, so there is no
+        SQLite parameter limit to chunk around.
+        """
+        with self._read_conn() as conn:
+            rows = conn.execute(
+                """
+                SELECT fingerprint, gramps_handle FROM fingerprint_index
+                WHERE fingerprint IN (SELECT value FROM json_each(?))
+                """,
+                (json.dumps(list(dict.fromkeys(fingerprints))),),
+            ).fetchall()
+        return {row["fingerprint"]: row["gramps_handle"] for row in rows if row["gramps_handle"]}
+
     # --------------------------- Queries -----------------------------
 
     def get_fact(self, fact_id: UUID) -> Fact | None:
-        with self._get_conn() as conn:
+        with self._read_conn() as conn:
             row = conn.execute(
                 "SELECT full_json FROM facts WHERE fact_id = ?", (str(fact_id),)
             ).fetchone()
@@ -321,15 +606,61 @@ class SQLiteProjection:
             """
             params.extend([limit, offset])
 
-        with self._get_conn() as conn:
+        with self._read_conn() as conn:
             rows = conn.execute(query, params).fetchall()
             return [Fact.model_validate_json(row["full_json"]) for row in rows]
 
-    def search_statements(self, search_term: str, limit: int = 50) -> list[Fact]:
+    def search_statements(
+        self,
+        search_term: str,
+        limit: int = 50,
+        *,
+        raw_query: bool = False,
+        trigram: bool = False,
+        confidence_weight: float = 1.0,
+    ) -> list[Fact]:
+        """Full-text search over fact statements.
+
+        Results are ranked by bm25 relevance scaled by
+        ``1 + confidence_weight * confidence_score``.
+
+        Args:
+            search_term: Words to match (all required); ``"a phrase"`` and
+                ``prefix*`` are supported
+            limit: Maximum results
+            raw_query: Pass ``search_term`` to FTS5 MATCH unchanged
+            trigram: Use the trigram index for OCR-tolerant matching
+                (requires ``fts_trigram=True``)
+            confidence_weight: How strongly confidence boosts relevance
+
+        Returns:
+            Matching facts, best first
+        """
+        table = "facts_fts_trigram" if trigram else "facts_fts"
+        if table not in self._fts_tables:
+            raise ValueError("Trigram search requires SQLiteProjection(..., fts_trigram=True)")
+        query = search_term if raw_query else _fts_query(search_term, trigram=trigram)
+        if not query:
+            return self._search_statements_like(search_term, limit)
+        with self._read_conn() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT f.full_json FROM {table}
+                JOIN facts f ON f.rowid = {table}.rowid
+                WHERE {table} MATCH ?
+                ORDER BY bm25({table}) * (1.0 + ? * f.confidence_score)
+                LIMIT ?
+                """,
+                (query, confidence_weight, limit),
+            ).fetchall()
+            return [Fact.model_validate_json(row["full_json"]) for row in rows]
+
+    def _search_statements_like(self, search_term: str, limit: int) -> list[Fact]:
+        """Substring scan, used when the term has nothing to full-text match."""
         escaped_term = (
             search_term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
         )
-        with self._get_conn() as conn:
+        with self._read_conn() as conn:
             rows = conn.execute(
                 """
                 SELECT full_json FROM facts
@@ -342,7 +673,7 @@ class SQLiteProjection:
             return [Fact.model_validate_json(row["full_json"]) for row in rows]
 
     def get_statistics(self) -> dict:
-        with self._get_conn() as conn:
+        with self._read_conn() as conn:
             stats = {}
             for status in FactStatus:
                 count = conn.execute(
@@ -365,20 +696,95 @@ class SQLiteProjection:
             stats["sources"] = {row["repository"]: row["cnt"] for row in repos}
             return stats
 
-    def rebuild_from_ledger(self, ledger) -> int:
+    def rebuild_from_ledger(
+        self,
+        ledger,
+        *,
+        batch_size: int = 5000,
+        drop_indexes: bool = True,
+        synchronous_off: bool = False,
+        progress: Callable[[int], None] | None = None,
+    ) -> int:
         """Rebuild the projection from a ledger's facts.
 
+        Facts are written over a single connection with ``executemany``, one
+        transaction per batch, instead of one connection and commit per fact.
+
         Args:
             ledger: A FactLedger instance to iterate over
+            batch_size: Facts written per transaction
+            drop_indexes: Drop secondary indexes and full-text sync triggers
+                during the load and rebuild them afterwards (one pass
+                instead of per-row index updates)
+            synchronous_off: Run with ``PRAGMA synchronous=OFF`` for the
+                duration of the rebuild. Faster, but a power loss mid-rebuild
+                can corrupt the database; rerun the rebuild in that case.
+            progress: Called with the running fact count after each batch
 
         Returns:
             Number of facts upserted
         """
         count = 0
-        for fact in ledger.iter_all_facts():
-            self.upsert_fact(fact)
-            count += 1
-        return count  # Fixed: return outside loop to process all facts
+        start = time.perf_counter()
+        with self._get_conn() as conn:
+            if synchronous_off:
+                conn.execute("PRAGMA synchronous=OFF;")
+            if drop_indexes:
+                for name in _REBUILD_INDEXES:
+                    conn.execute(f"DROP INDEX IF EXISTS {name}")
+                # Full-text indexes are rebuilt in one pass after the load
+                for table in self._fts_tables:
+                    for name in _fts_triggers(table):
+                        conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+                conn.commit()
+            try:
+                batch: list[Fact] = []
+                for fact in ledger.iter_all_facts():
+                    batch.append(fact)
+                    if len(batch) >= batch_size:
+                        count += self._write_batch(conn, batch)
+                        batch = []
+                        if progress is not None:
+                            progress(count)
+                        logger.debug(f"Rebuilt {count} facts ({count / (time.perf_counter() - start):.0f}/s)")
+                if batch:
+                    count += self._write_batch(conn, batch)
+                    if progress is not None:
+                        progress(count)
+            finally:
+                if drop_indexes:
+                    for ddl in _REBUILD_INDEXES.values():
+                        conn.execute(ddl)
+                    for table in self._fts_tables:
+                        conn.execute(f"INSERT INTO {table}({table}) VALUES ('rebuild')")
+                        for ddl in _fts_triggers(table).values():
+                            conn.execute(ddl)
+                    conn.commit()
+                if synchronous_off:
+                    conn.execute("PRAGMA synchronous=FULL;")
+        logger.info(f"Rebuilt projection with {count} facts in {time.perf_counter() - start:.1f}s")
+        return count
+
+    @staticmethod
+    def _write_batch(conn: sqlite3.Connection, facts: list[Fact]) -> int:
+        """Upsert a batch of facts and their sources in one transaction."""
+        try:
+            if not conn.in_transaction:
+                conn.execute("BEGIN")
+            conn.executemany(_UPSERT_FACT_SQL, [_fact_row(fact) for fact in facts])
+            conn.executemany(
+                "DELETE FROM fact_sources WHERE fact_id = ?",
+                [(str(fact.fact_id),) for fact in facts],
+            )
+            conn.executemany(
+                _INSERT_SOURCE_SQL,
+                [row for fact in facts for row in _source_rows(fact)],
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        return len(facts)
 
     # ------------------- Transaction API ----------------------------
 
@@ -478,26 +884,35 @@ class SQLiteProjection:
     # --------------------- Wikidata Statement Cache ------------------
 
     def get_statement_guid(self, fingerprint: str) -> str | None:
-        with self._get_conn() as conn:
+        with self._read_conn() as conn:
             row = conn.execute(
                 "SELECT guid FROM wikidata_statement_cache WHERE fingerprint = ?",
                 (fingerprint,),
             ).fetchone()
             return row["guid"] if row else None
 
+    def get_statement_guids(self, fingerprints: Iterable[str]) -> dict[str, str]:
+        """Look up many statement fingerprints; missing ones are left out."""
+        fingerprints = list(dict.fromkeys(fingerprints))
+        found: dict[str, str] = {}
+        with self._read_conn() as conn:
+            for i in range(0, len(fingerprints), _MAX_SQL_PARAMS):
+                chunk = fingerprints[i:i + _MAX_SQL_PARAMS]
+                rows = conn.execute(
+                    "SELECT fingerprint, guid FROM wikidata_statement_cache"
+                    f" WHERE fingerprint IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                found.update((row["fingerprint"], row["guid"]) for row in rows)
+        return found
+
     def set_statement_guid(self, fingerprint: str, guid: str, *, entity_id: str | None = None, property_id: str | None = None) -> None:
+        self.set_statement_guids([(fingerprint, guid, entity_id, property_id)])
+
+    def set_statement_guids(self, rows: Iterable[tuple[str, str, str | None, str | None]]) -> None:
+        """Upsert (fingerprint, guid, entity_id, property_id) rows in one commit."""
         with self._get_conn() as conn:
-            conn.execute(
-                """
-                INSERT INTO wikidata_statement_cache (fingerprint, guid, entity_id, property_id)
-                VALUES (?, ?, ?, ?)
-                ON CONFLICT(fingerprint) DO UPDATE SET
-                  guid = excluded.guid,
-                  entity_id = COALESCE(excluded.entity_id, wikidata_statement_cache.entity_id),
-                  property_id = COALESCE(excluded.property_id, wikidata_statement_cache.property_id)
-                """,
-                (fingerprint, guid, entity_id, property_id),
-            )
+            conn.executemany(_UPSERT_STATEMENT_GUID_SQL, list(rows))
             conn.commit()
 
     # --------------------- Revisit History API ----------------------
@@ -528,7 +943,7 @@ class SQLiteProjection:
         Returns:
             List of ISO-8601 timestamps, sorted ascending
         """
-        with self._get_conn() as conn:
+        with self._read_conn() as conn:
             rows = conn.execute(
                 "SELECT visit_timestamp FROM revisit_history WHERE source_id = ? ORDER BY visit_timestamp",
                 (source_id,),
@@ -544,7 +959,7 @@ class SQLiteProjection:
         Returns:
             Number of recorded revisits
         """
-        with self._get_conn() as conn:
+        with self._read_conn() as conn:
             row = conn.execute(
                 "SELECT COUNT(*) FROM revisit_history WHERE source_id = ?",
                 (source_id,),
@@ -557,7 +972,7 @@ class SQLiteProjection:
         Returns:
             Dict mapping source_id to list of ISO-8601 timestamps
         """
-        with self._get_conn() as conn:
+        with self._read_conn() as conn:
             rows = conn.execute(
                 "SELECT source_id, visit_timestamp FROM revisit_history ORDER BY source_id, visit_timestamp"
             ).fetchall()
@@ -573,13 +988,27 @@ class SQLiteProjection:
 
     @contextmanager
     def transaction(self, max_retries: int = 5):
-        """Transaction context manager with retry logic for lock contention."""
+        """Transaction context manager with retry logic for lock contention.
+
+        With pooled connections, projection calls made on the same thread
+        inside the block run in this transaction.
+        """
+        if getattr(self._local, "txn_conn", None) is not None:
+            with self._get_conn() as conn:
+                yield conn
+            return
+
         last_error: Exception | None = None
         for attempt in range(max_retries):
             with self._get_conn() as conn:
                 try:
                     conn.execute("BEGIN IMMEDIATE")
-                    yield conn
+                    if self.pooled:
+                        self._local.txn_conn = conn
+                    try:
+                        yield conn
+                    finally:
+                        self._local.txn_conn = None
                     conn.commit()
                     return
                 except sqlite3.OperationalError as e:
@@ -608,6 +1037,19 @@ class SQLiteProjection:
         """
         from ..ledger.fact_ledger import LedgerEventType
 
+        if self.event_batch_size > 1 and event.event_type in (
+            LedgerEventType.FACT_APPENDED,
+            LedgerEventType.FACT_UPDATED,
+            LedgerEventType.FACT_STATUS_CHANGED,
+        ):
+            with self._pending_lock:
+                # Later versions of the same fact supersede buffered ones
+                self._pending_facts[str(event.fact.fact_id)] = event.fact
+                full = len(self._pending_facts) >= self.event_batch_size
+            if full:
+                self.flush()
+            return
+
         try:
             if event.event_type in (LedgerEventType.FACT_APPENDED, LedgerEventType.FACT_UPDATED):
                 self.upsert_fact(event.fact)
@@ -624,6 +1066,60 @@ class SQLiteProjection:
             logger.error(f"Failed to project ledger event {event.event_type}: {e}")
             raise
 
+    def handle_ledger_events(self, events: list[LedgerEvent]) -> None:
+        """Project a batch of LedgerEvents in one transaction.
+
+        Registered with ``FactLedger.register_batch_event_handler`` so that
+        ``FactLedger.append_many`` costs one projection write per batch. With
+        ``event_batch_size > 1`` the facts join the buffer and are written
+        once it is full, as in ``handle_ledger_event``.
+
+        Args:
+            events: The events emitted by one FactLedger write
+        """
+        from ..ledger.fact_ledger import LedgerEventType
+
+        projected = (
+            LedgerEventType.FACT_APPENDED,
+            LedgerEventType.FACT_UPDATED,
+            LedgerEventType.FACT_STATUS_CHANGED,
+        )
+        with self._pending_lock:
+            for event in events:
+                if event.event_type in projected:
+                    self._pending_facts[str(event.fact.fact_id)] = event.fact
+            full = len(self._pending_facts) >= self.event_batch_size
+        if full:
+            self.flush()
+
+    def flush(self) -> int:
+        """Project any facts buffered by ``handle_ledger_event``.
+
+        If the write fails the facts stay buffered and the error is raised.
+
+        Returns:
+            Number of facts written
+        """
+        if not self._pending_facts:
+            return 0
+        with self._pending_lock:
+            facts = list(self._pending_facts.values())
+            self._pending_facts.clear()
+        if not facts:
+            return 0
+        try:
+            with self._get_conn() as conn:
+                self._write_batch(conn, facts)
+        except Exception:
+            logger.exception(f"Failed to project batch of {len(facts)} ledger events")
+            # Keep them for the next flush; versions buffered meanwhile are newer
+            with self._pending_lock:
+                for fact in facts:
+                    self._pending_facts.setdefault(str(fact.fact_id), fact)
+            raise
+        logger.debug(f"Projected batch of {len(facts)} ledger events")
+        return len(facts)
+
 
 def wire_ledger_to_projection(ledger: Any, projection: "SQLiteProjection") -> None:
     """Wire a FactLedger to auto-sync writes to a SQLiteProjection.
@@ -642,7 +1138,8 @@ def wire_ledger_to_projection(ledger: Any, projection: "SQLiteProjection") -> No
 
         # Now writes to ledger auto-sync to projection:
         ledger.append(fact)  # Also updates projection
+        ledger.append_many(facts)  # One projection transaction
     """
-    ledger.register_event_handler(projection.handle_ledger_event)
+    ledger.register_batch_event_handler(projection.handle_ledger_events)
     logger.info("Wired FactLedger to SQLiteProjection for CQRS sync")
 
@@ -551,6 +551,10 @@ class RelevanceEvaluator:
         else:
             return MatchConfidence.NOT_MATCH
 
+    def evaluate_many(self, records: list[RawRecord]) -> list[MatchScore]:
+        """Evaluate records in order; one MatchScore per record."""
+        return [self.evaluate(record) for record in records]
+
     def evaluate_batch(
         self, records: list[RawRecord], min_confidence: MatchConfidence = MatchConfidence.POSSIBLE
     ) -> list[tuple[RawRecord, MatchScore]]:
@@ -573,8 +577,7 @@ class RelevanceEvaluator:
         ]
         min_index = confidence_order.index(min_confidence)
 
-        for record in records:
-            score = self.evaluate(record)
+        for record, score in zip(records, self.evaluate_many(records), strict=True):
             score_index = confidence_order.index(score.confidence)
             if score_index <= min_index:
                 results.append((record, score))
@@ -15,10 +15,11 @@ import hashlib
 import json
 import logging
 import os
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field
 
@@ -29,6 +30,9 @@ from gps_agents.research.evaluator import (
     PersonProfile,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 logger = logging.getLogger(__name__)
 
 # Optional imports with fallbacks
@@ -94,6 +98,28 @@ except ImportError:
     logger.debug("usaddress not available")
 
 
+# spaCy entity labels _extract_entities keeps, and the entities key for each
+_NER_LABELS = {"PERSON": "names", "DATE": "dates", "GPE": "locations", "LOC": "locations"}
+
+# Components that set doc.ents; the rest of the pipeline (tagger, parser,
+# lemmatizer, ...) is disabled unless one of these listens to it
+_ENTITY_PIPES = frozenset({"ner", "entity_ruler"})
+
+# spaCy entities of one text: (entities key, entity text) in document order
+_NerEntities = tuple[tuple[str, str], ...]
+
+
+def _disable_unused_pipes(nlp: Any) -> None:
+    """Keep only the components needed for doc.ents."""
+    keep = {name for name in nlp.pipe_names if name in _ENTITY_PIPES}
+    if not keep:
+        return
+    for name, pipe in nlp.pipeline:
+        if keep & set(getattr(pipe, "listening_components", ())):
+            keep.add(name)
+    nlp.select_pipes(enable=[name for name in nlp.pipe_names if name in keep])
+
+
 class LLMMatchResult(BaseModel):
     """Structured result from LLM evaluation."""
 
@@ -125,8 +151,18 @@ class LLMRelevanceEvaluator:
 
     The LLM is only called when rule-based scoring is uncertain (0.4-0.6).
     GPTCache reduces costs by caching similar queries.
+
+    spaCy runs with only its NER components enabled, and entities are
+    cached by text hash. ``evaluate_many`` streams a whole result set
+    through ``nlp.pipe``, in worker processes when it is large.
     """
 
+    # nlp.pipe defaults for evaluate_many
+    NER_BATCH_SIZE = 256
+    # Uncached texts from which evaluate_many uses worker processes
+    PARALLEL_NER_MIN_TEXTS = 2_000
+    MAX_NER_PROCESSES = 4
+
     # LLM evaluation prompt
     EVALUATION_PROMPT = """You are a genealogy expert determining if a historical record is about a specific person.
 
@@ -165,6 +201,8 @@ Respond with JSON:
         model: str = "claude-3-haiku-20240307",
         llm_threshold_low: float = 0.4,
         llm_threshold_high: float = 0.6,
+        spacy_model: str | Path = "en_core_web_sm",
+        ner_cache_size: int = 10_000,
     ) -> None:
         """Initialize the LLM-enhanced evaluator.
 
@@ -176,6 +214,8 @@ Respond with JSON:
             model: Anthropic model to use
             llm_threshold_low: Below this, don't bother with LLM (clearly not a match)
             llm_threshold_high: Above this, don't need LLM (clearly a match)
+            spacy_model: spaCy package name or path used for NER
+            ner_cache_size: Texts whose spaCy entities are kept in memory
         """
         self.profile = profile
         self.use_llm = use_llm and LANGCHAIN_AVAILABLE
@@ -188,6 +228,8 @@ Respond with JSON:
         self._llm = None
         self._cache = None
         self._nlp = None
+        self._ner_cache: OrderedDict[str, _NerEntities] = OrderedDict()
+        self._ner_cache_size = ner_cache_size
         self._name_variants = self._build_name_variants()
 
         # Setup cache directory
@@ -204,7 +246,8 @@ Respond with JSON:
         # Initialize spaCy if available
         if SPACY_AVAILABLE:
             try:
-                self._nlp = spacy.load("en_core_web_sm")
+                self._nlp = spacy.load(spacy_model)
+                _disable_unused_pipes(self._nlp)
             except OSError:
                 logger.warning("spaCy model not found, NER disabled")
 
@@ -271,7 +314,39 @@ Respond with JSON:
         """
         # 1. Extract entities from record
         entities = self._extract_entities(record)
+        return self._score_record(record, entities)
 
+    def evaluate_many(
+        self,
+        records: Sequence[RawRecord],
+        batch_size: int | None = None,
+        n_process: int | None = None,
+    ) -> list[EnhancedMatchScore]:
+        """Evaluate records together; same scores as ``evaluate`` on each.
+
+        Uncached record texts are run through spaCy once each, in
+        ``nlp.pipe`` batches rather than one document at a time.
+
+        Args:
+            records: Records to evaluate
+            batch_size: Texts per ``nlp.pipe`` batch (default NER_BATCH_SIZE)
+            n_process: spaCy worker processes; by default one per CPU (up
+                to MAX_NER_PROCESSES) from PARALLEL_NER_MIN_TEXTS uncached
+                texts, else none
+
+        Returns:
+            One EnhancedMatchScore per record, in order
+        """
+        ner: list[_NerEntities | None] = [None] * len(records)
+        if self._nlp:
+            ner = self._ner([self._record_text(r) for r in records], batch_size, n_process)
+        return [
+            self._score_record(record, self._extract_entities(record, found))
+            for record, found in zip(records, ner, strict=True)
+        ]
+
+    def _score_record(self, record: RawRecord, entities: dict[str, list[str]]) -> EnhancedMatchScore:
+        """Score a record from its extracted entities, asking the LLM if unsure."""
         # 2. Rule-based scoring (fast)
         rule_score = self._rule_based_score(record, entities)
 
@@ -323,8 +398,68 @@ Respond with JSON:
             extracted_entities=entities,
         )
 
-    def _extract_entities(self, record: RawRecord) -> dict[str, list[str]]:
-        """Extract named entities from record using spaCy and other tools."""
+    def _record_text(self, record: RawRecord) -> str:
+        """Combine all text from record, as read by spaCy."""
+        text_parts = []
+        for key in ["name", "full_name", "text", "content", "snippet"]:
+            val = record.extracted_fields.get(key) or record.raw_data.get(key)
+            if val:
+                text_parts.append(str(val))
+        return " ".join(text_parts)
+
+    def _ner(
+        self,
+        texts: Sequence[str],
+        batch_size: int | None = None,
+        n_process: int | None = None,
+    ) -> list[_NerEntities]:
+        """spaCy entities for each text, from the cache or ``nlp.pipe``.
+
+        Each distinct uncached text is processed once, however often it
+        occurs in ``texts``.
+        """
+        keys = [hashlib.sha256(text.encode()).hexdigest() for text in texts]
+        found: dict[str, _NerEntities] = {}
+        missing: dict[str, str] = {}
+        for key, text in zip(keys, texts, strict=True):
+            if key in found or key in missing:
+                continue
+            cached = self._ner_cache.get(key)
+            if cached is not None:
+                self._ner_cache.move_to_end(key)
+                found[key] = cached
+            elif text:
+                missing[key] = text
+
+        if missing:
+            if n_process is None:
+                n_process = 1
+                if len(missing) >= self.PARALLEL_NER_MIN_TEXTS:
+                    n_process = min(os.cpu_count() or 1, self.MAX_NER_PROCESSES)
+            docs = self._nlp.pipe(
+                missing.values(),
+                batch_size=batch_size or self.NER_BATCH_SIZE,
+                n_process=n_process,
+            )
+            for key, doc in zip(missing, docs, strict=True):
+                found[key] = tuple(
+                    (_NER_LABELS[ent.label_], ent.text) for ent in doc.ents if ent.label_ in _NER_LABELS
+                )
+                self._ner_cache[key] = found[key]
+                if len(self._ner_cache) > self._ner_cache_size:
+                    self._ner_cache.popitem(last=False)
+
+        return [found.get(key, ()) for key in keys]
+
+    def _extract_entities(
+        self, record: RawRecord, ner: _NerEntities | None = None
+    ) -> dict[str, list[str]]:
+        """Extract named entities from record using spaCy and other tools.
+
+        Args:
+            record: Record to read
+            ner: spaCy entities of the record's text, if already known
+        """
         entities: dict[str, list[str]] = {
             "names": [],
             "dates": [],
@@ -332,27 +467,16 @@ Respond with JSON:
             "addresses": [],
         }
 
-        # Combine all text from record
-        text_parts = []
-        for key in ["name", "full_name", "text", "content", "snippet"]:
-            val = record.extracted_fields.get(key) or record.raw_data.get(key)
-            if val:
-                text_parts.append(str(val))
-
-        text = " ".join(text_parts)
+        text = self._record_text(record)
         if not text:
             return entities
 
         # spaCy NER
         if self._nlp:
-            doc = self._nlp(text)
-            for ent in doc.ents:
-                if ent.label_ == "PERSON":
-                    entities["names"].append(ent.text)
-                elif ent.label_ == "DATE":
-                    entities["dates"].append(ent.text)
-                elif ent.label_ in ("GPE", "LOC"):
-                    entities["locations"].append(ent.text)
+            if ner is None:
+                ner = self._ner([text])[0]
+            for key, value in ner:
+                entities[key].append(value)
 
         # nameparser for better name parsing
         if NAMEPARSER_AVAILABLE:
@@ -256,8 +256,8 @@ class ResearchOrchestrator:
             # 5. Evaluate relevance of results
             if evaluator:
                 relevant_records = []
-                for record in result.results:
-                    score = evaluator.evaluate(record)
+                scores = evaluator.evaluate_many(result.results)
+                for record, score in zip(result.results, scores, strict=True):
                     if score.confidence.value in [
                         MatchConfidence.DEFINITE.value,
                         MatchConfidence.LIKELY.value,
@@ -15,6 +15,7 @@ from typing import Any
 from bs4 import BeautifulSoup
 
 from ..models.search import RawRecord, SearchQuery
+from ..net import shared_client
 from .base import BaseSource
 
 logger = logging.getLogger(__name__)
@@ -77,8 +78,6 @@ class AccessGenealogySource(BaseSource):
         Returns:
             List of matching records
         """
-        import httpx
-
         records: list[RawRecord] = []
 
         # Build base search terms
@@ -109,7 +108,7 @@ class AccessGenealogySource(BaseSource):
         state_slug = self._normalize_state(query_state) if query_state else None
 
         try:
-            async with httpx.AsyncClient(timeout=45.0) as client:
+            async with shared_client(self.name, timeout=45.0) as client:
                 # 1) Site-wide search
                 urls: list[str] = [f"{self.base_url}/?s={search_query}"]
 
@@ -280,12 +279,10 @@ class AccessGenealogySource(BaseSource):
         Returns:
             The record or None
         """
-        import httpx
-
         url = record_id if record_id.startswith("http") else f"{self.base_url}/{record_id}"
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with shared_client(self.name, timeout=30.0) as client:
                 response = await client.get(url)
                 response.raise_for_status()
 
@@ -432,8 +429,6 @@ class AccessGenealogySource(BaseSource):
         Returns:
             List of census records with household members extracted
         """
-        import httpx
-
         records: list[RawRecord] = []
         state_slug = self._normalize_state(state) if state else None
 
@@ -461,7 +456,7 @@ class AccessGenealogySource(BaseSource):
                 urls.append(f"{self.base_url}/{state_slug}/{year}-census/?s={search_query}")
 
         try:
-            async with httpx.AsyncClient(timeout=45.0) as client:
+            async with shared_client(self.name, timeout=45.0) as client:
                 for url in urls:
                     try:
                         response = await client.get(url)
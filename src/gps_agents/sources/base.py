@@ -1,16 +1,16 @@
 """Base interface for genealogy data sources."""
 from __future__ import annotations
 
-import asyncio
 import logging
 import os
-import random
 from tenacity import retry, stop_after_attempt, wait_exponential_jitter, retry_if_exception_type
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 import httpx
 
+from ..net import shared_client
+
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
@@ -361,17 +361,19 @@ class BaseSource(ABC):
     ) -> dict[str, Any]:
         """Make a polite HTTP request to the source API with rate limiting and circuit breaking."""
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=30.0)
+            self._client = shared_client(self.name, timeout=30.0)
 
         # Resolve per-source guard configs (env overrides or safe defaults)
-        from gps_agents.net import GUARDS, RateLimitConfig
+        from gps_agents.net import GUARDS, RateLimitConfig, retry_after_seconds
 
         key = getattr(self, "name", "source").lower()
         # Defaults: 1 req / 1.5s; window 5s
+        burst = os.getenv(f"RATE_{key.upper()}_BURST", os.getenv("RATE_DEFAULT_BURST"))
         rl_default = RateLimitConfig(
             max_calls=int(os.getenv(f"RATE_{key.upper()}_MAX", os.getenv("RATE_DEFAULT_MAX", "1"))),
             window_seconds=float(os.getenv(f"RATE_{key.upper()}_WINDOW", os.getenv("RATE_DEFAULT_WINDOW", "5"))),
             min_interval=float(os.getenv(f"RATE_{key.upper()}_MIN_INTERVAL", os.getenv("RATE_DEFAULT_MIN_INTERVAL", "1.5"))),
+            burst=int(burst) if burst else None,
         )
         limiter = GUARDS.get_limiter(key, rl_default)
         breaker = GUARDS.get_breaker(
@@ -384,8 +386,6 @@ class BaseSource(ABC):
         if not breaker.allow_call():
             raise httpx.HTTPError(f"circuit_open:{key}")
 
-        await limiter.acquire()
-
         headers: dict[str, str] = {}
         if self.api_key:
             headers["Authorization"] = f"Bearer {self.api_key}"
@@ -397,10 +397,15 @@ class BaseSource(ABC):
             retry=retry_if_exception_type((httpx.TimeoutException, httpx.HTTPStatusError, httpx.TransportError)),
         )
         async def _do() -> dict[str, Any]:
-            # Small jitter to avoid herding
-            await asyncio.sleep(random.uniform(0.05, 0.2))
-            resp = await self._client.get(url, params=params, headers=headers)
+            # Every attempt that reaches the network, retries included, waits its
+            # turn in the source's queue; fresh cache hits do not take a token
+            resp = await self._client.get(
+                url, params=params, headers=headers, extensions={"rate_limiter": limiter}
+            )
+            if resp.status_code == 429:
+                limiter.penalize(retry_after_seconds(resp))
             resp.raise_for_status()
+            limiter.record_success()
             return resp.json()
 
         try:
@@ -11,6 +11,7 @@ import httpx
 from bs4 import BeautifulSoup
 
 from ..models.search import RawRecord
+from ..net import shared_client
 from .base import BaseSource
 
 logger = logging.getLogger(__name__)
@@ -90,7 +91,8 @@ class BaseHTMLSourceAdapter(BaseSource):
         """
         for attempt in range(max_retries):
             try:
-                async with httpx.AsyncClient(
+                async with shared_client(
+                    self.name,
                     timeout=30.0,
                     follow_redirects=True,
                     headers={"User-Agent": f"{self.name}/1.0 (Genealogy Research)"},
@@ -134,7 +136,8 @@ class BaseHTMLSourceAdapter(BaseSource):
         records: list[RawRecord] = []
 
         try:
-            async with httpx.AsyncClient(
+            async with shared_client(
+                self.name,
                 timeout=30.0,
                 follow_redirects=True,
                 headers={"User-Agent": f"{self.name}/1.0 (Genealogy Research)"},
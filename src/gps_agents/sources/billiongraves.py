@@ -18,6 +18,7 @@ import httpx
 from bs4 import BeautifulSoup
 
 from ..models.search import RawRecord, SearchQuery
+from ..net import shared_client
 from .base import BaseSource
 
 logger = logging.getLogger(__name__)
@@ -81,7 +82,8 @@ class BillionGravesSource(BaseSource):
         search_url = f"{self.base_url}/search"
 
         try:
-            async with httpx.AsyncClient(
+            async with shared_client(
+                self.name,
                 timeout=30.0,
                 headers={
                     "User-Agent": "GPS-Genealogy-Agents/0.2.0 (genealogy research)",
@@ -245,7 +247,8 @@ class BillionGravesSource(BaseSource):
             url = f"{self.base_url}/grave/{record_id}"
 
         try:
-            async with httpx.AsyncClient(
+            async with shared_client(
+                self.name,
                 timeout=30.0,
                 follow_redirects=True,
             ) as client:
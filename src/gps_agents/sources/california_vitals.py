@@ -23,6 +23,7 @@ import httpx
 from bs4 import BeautifulSoup
 
 from ..models.search import RawRecord, SearchQuery
+from ..net import shared_client
 from .base import BaseSource
 
 logger = logging.getLogger(__name__)
@@ -194,7 +195,8 @@ class CaliforniaVitalsSource(BaseSource):
         url = f"{self.base_url}/search/collection/{collection_id}"
 
         try:
-            async with httpx.AsyncClient(
+            async with shared_client(
+                self.name,
                 timeout=30.0,
                 headers={
                     "User-Agent": "GPS-Genealogy-Agents/0.2.0 (genealogy research)",
@@ -359,7 +361,7 @@ class CaliforniaVitalsSource(BaseSource):
             return []  # Birth index not on RootsWeb
 
         try:
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+            async with shared_client(self.name, timeout=30.0, follow_redirects=True) as client:
                 resp = await client.get(url)
                 if resp.status_code != 200:
                     return []
@@ -405,7 +407,8 @@ class CaliforniaVitalsSource(BaseSource):
             url = f"{self.base_url}/ark:/61903/1:1:{record_id}"
 
         try:
-            async with httpx.AsyncClient(
+            async with shared_client(
+                self.name,
                 timeout=30.0,
                 follow_redirects=True,
             ) as client:
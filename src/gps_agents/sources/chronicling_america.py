@@ -19,6 +19,7 @@ from typing import Any
 import httpx
 
 from ..models.search import RawRecord, SearchQuery
+from ..net import shared_client
 from .base import BaseSource
 
 logger = logging.getLogger(__name__)
@@ -83,7 +84,8 @@ class ChroniclingAmericaSource(BaseSource):
                 params["fa"] = f"location:{state_name}"
 
         try:
-            async with httpx.AsyncClient(
+            async with shared_client(
+                self.name,
                 timeout=30.0,
                 headers={
                     "User-Agent": "GPS-Genealogy-Agents/0.2.0 (genealogy research)",
@@ -200,7 +202,8 @@ class ChroniclingAmericaSource(BaseSource):
             url = f"{self.base_url}{record_id}.json"
 
         try:
-            async with httpx.AsyncClient(
+            async with shared_client(
+                self.name,
                 timeout=30.0,
                 headers={
                     "User-Agent": "GPS-Genealogy-Agents/0.2.0 (genealogy research)",
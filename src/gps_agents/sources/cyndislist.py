@@ -19,6 +19,7 @@ import httpx
 from bs4 import BeautifulSoup
 
 from ..models.search import RawRecord, SearchQuery
+from ..net import shared_client
 from .base import BaseSource
 
 logger = logging.getLogger(__name__)
@@ -181,7 +182,8 @@ class CyndisListSource(BaseSource):
         records: list[RawRecord] = []
 
         try:
-            async with httpx.AsyncClient(
+            async with shared_client(
+                self.name,
                 timeout=30.0,
                 headers={
                     "User-Agent": "GPS-Genealogy-Agents/0.2.0 (genealogy research)",
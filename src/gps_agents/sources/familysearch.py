@@ -23,6 +23,7 @@ import httpx
 from bs4 import BeautifulSoup
 
 from ..models.search import RawRecord, SearchQuery
+from ..net import shared_client
 from .base import BaseSource
 from .familysearch_client import (
     ClientConfig as FSClientConfig,
@@ -266,7 +267,8 @@ class FamilySearchNoLoginSource(BaseSource):
         records: list[RawRecord] = []
 
         try:
-            async with httpx.AsyncClient(
+            async with shared_client(
+                self.name,
                 timeout=30.0,
                 headers={
                     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
@@ -666,8 +668,7 @@ class FamilySearchSource(BaseSource):
             url = f"{self.base_url}/platform/tree/search"
             # Use BaseSource client to add token header
             if self._client is None:
-                import httpx
-                self._client = httpx.AsyncClient(timeout=30.0)
+                self._client = shared_client(self.name, timeout=30.0)
             headers = {"Authorization": f"Bearer {self._access_token}", "Accept": "application/json"}
             response = await self._client.get(url, params=params, headers=headers)
             response.raise_for_status()
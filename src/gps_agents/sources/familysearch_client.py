@@ -18,11 +18,9 @@ not derived from any existing SDK code.
 from __future__ import annotations
 
 import asyncio
-import hashlib
 import json
 import logging
 import os
-import time
 import webbrowser
 from html import escape as html_escape
 from abc import ABC, abstractmethod
@@ -38,6 +36,9 @@ from urllib.parse import parse_qs, urlencode, urlparse
 import httpx
 from pydantic import BaseModel, Field, field_validator
 
+from ..http_cache import CacheConfig, ResponseStore
+from ..net import GUARDS, RateLimitConfig, TokenBucketLimiter, retry_after_seconds, shared_client
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
@@ -736,7 +737,7 @@ class Authenticator:
         self.config = config
         self.storage = token_storage or FileTokenStorage(config.token_file)
         self._token: TokenResponse | None = None
-        self._http = httpx.AsyncClient(timeout=config.timeout)
+        self._http = shared_client(timeout=config.timeout)
         self._browser_auth = None  # Lazy load to avoid import if not needed
 
     async def close(self) -> None:
@@ -922,60 +923,55 @@ class Authenticator:
 # =============================================================================
 
 
-@dataclass
-class RateLimiter:
-    """Simple rate limiter."""
-
-    requests_per_second: float = 5.0
-    _last_request: float = 0.0
+class RateLimiter(TokenBucketLimiter):
+    """Token-bucket limiter at a fixed request rate."""
 
-    async def acquire(self) -> None:
-        now = time.monotonic()
-        elapsed = now - self._last_request
-        min_interval = 1.0 / self.requests_per_second
-        if elapsed < min_interval:
-            await asyncio.sleep(min_interval - elapsed)
-        self._last_request = time.monotonic()
+    def __init__(self, requests_per_second: float = 5.0, burst: int = 1) -> None:
+        self.requests_per_second = requests_per_second
+        super().__init__(RateLimitConfig(max_calls=1, window_seconds=1.0 / requests_per_second, burst=burst))
 
 
 class ResponseCache:
-    """Simple disk-based response cache."""
+    """Disk-based JSON response cache on the shared response store.
+
+    Entries live in a size-bounded SQLite database (``responses.db`` in
+    ``cache_dir``), compressed and evicted least recently used first. Use
+    ``aget``/``aset`` from async code so disk I/O stays off the event loop.
+    """
+
+    source = "familysearch_api"
 
     def __init__(self, cache_dir: Path, ttl_seconds: int = 3600) -> None:
         self.cache_dir = cache_dir
         self.ttl = ttl_seconds
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-
-    def _key_to_path(self, key: str) -> Path:
-        hash_key = hashlib.md5(key.encode()).hexdigest()
-        return self.cache_dir / f"{hash_key}.json"
+        base = CacheConfig.from_env()
+        self.store = ResponseStore(
+            CacheConfig(path=cache_dir / "responses.db", max_bytes=base.max_bytes, default_ttl=ttl_seconds)
+        )
 
     def get(self, key: str) -> dict | None:
-        path = self._key_to_path(key)
-        if not path.exists():
-            return None
-
         try:
-            data = json.loads(path.read_text())
-            cached_at = datetime.fromisoformat(data["cached_at"])
-            if datetime.now(UTC) - cached_at > timedelta(seconds=self.ttl):
-                path.unlink()
+            entry = self.store.get(key)
+            if entry is None or not entry.is_fresh():
                 return None
-            return data["response"]
+            stats = self.store.stats_for(self.source)
+            stats.hits += 1
+            stats.bytes_saved += len(entry.body)
+            return json.loads(entry.body)
         except Exception:
             return None
 
     def set(self, key: str, value: dict) -> None:
-        path = self._key_to_path(key)
-        data = {
-            "cached_at": datetime.now(UTC).isoformat(),
-            "response": value,
-        }
-        path.write_text(json.dumps(data))
+        self.store.put(key, json.dumps(value).encode(), source=self.source, ttl=self.ttl)
+
+    async def aget(self, key: str) -> dict | None:
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: dict) -> None:
+        await asyncio.to_thread(self.set, key, value)
 
     def clear(self) -> None:
-        for path in self.cache_dir.glob("*.json"):
-            path.unlink()
+        self.store.clear()
 
 
 # =============================================================================
@@ -1031,13 +1027,15 @@ class FamilySearchClient:
 
         self.config = config
         self.auth = Authenticator(config, token_storage)
-        self.rate_limiter = RateLimiter()
+        self.rate_limiter = GUARDS.get_limiter(
+            "familysearch_api", RateLimitConfig(max_calls=1, window_seconds=0.2, burst=1)
+        )
         self.cache = ResponseCache(config.cache_dir)
 
         self._http: httpx.AsyncClient | None = None
 
     async def __aenter__(self) -> FamilySearchClient:
-        self._http = httpx.AsyncClient(
+        self._http = shared_client(
             timeout=self.config.timeout,
             headers={
                 "User-Agent": self.config.user_agent,
@@ -1105,13 +1103,9 @@ class FamilySearchClient:
         self.auth.logout()
 
     def _make_cache_key(self, method: str, path: str, params: dict[str, str] | None) -> str:
-        """Build cache key using tuple hashing (faster than json.dumps)."""
-        if params:
-            # Sorted tuple of items is faster to hash than JSON serialization
-            param_key = tuple(sorted(params.items()))
-        else:
-            param_key = ()
-        return f"{method}:{path}:{hash(param_key)}"
+        """Build a cache key that is stable across processes (unlike ``hash()``)."""
+        param_key = urlencode(sorted(params.items())) if params else ""
+        return f"{method}:{path}:{param_key}"
 
     async def _request(
         self,
@@ -1131,18 +1125,17 @@ class FamilySearchClient:
         # Check cache for GET requests (using fast hash-based key)
         cache_key = self._make_cache_key(method, path, params)
         if method == "GET" and use_cache:
-            cached = self.cache.get(cache_key)
+            cached = await self.cache.aget(cache_key)
             if cached:
                 return cached
 
-        # Apply rate limiting
-        await self.rate_limiter.acquire()
-
         url = f"{self.config.base_url}{path}"
         # Build headers once outside retry loop
         headers = {"Authorization": f"Bearer {self.auth.access_token}"}
 
         for attempt in range(self.config.max_retries):
+            # Apply rate limiting (retries queue up again behind other requests)
+            await self.rate_limiter.acquire()
             try:
                 response = await self._http.request(
                     method,
@@ -1162,17 +1155,17 @@ class FamilySearchClient:
                     raise FamilySearchAPIError("Unauthorized", 401)
 
                 if response.status_code == 429:
-                    # Rate limited
-                    retry_after = int(response.headers.get("Retry-After", "5"))
-                    await asyncio.sleep(retry_after)
+                    # Rate limited: pause the shared limiter before the next attempt
+                    self.rate_limiter.penalize(retry_after_seconds(response) or 5.0)
                     continue
 
                 response.raise_for_status()
+                self.rate_limiter.record_success()
                 result = response.json()
 
                 # Cache successful GET responses
                 if method == "GET" and use_cache:
-                    self.cache.set(cache_key, result)
+                    await self.cache.aset(cache_key, result)
 
                 return result
 
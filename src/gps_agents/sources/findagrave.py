@@ -4,10 +4,10 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from typing import Any, List
 
-import httpx
 from bs4 import BeautifulSoup
 
 from ..models.search import RawRecord, SearchQuery
+from ..net import shared_client
 from .base import BaseSource
 
 
@@ -30,7 +30,7 @@ class FindAGraveSource(BaseSource):
         params["size"] = "20"
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with shared_client(self.name, timeout=30.0) as client:
                 resp = await client.get(self.base_url, params=params)
                 resp.raise_for_status()
                 soup = BeautifulSoup(resp.text, "html.parser")
@@ -41,7 +41,7 @@ class FindAGraveSource(BaseSource):
     async def get_record(self, record_id: str) -> RawRecord | None:
         url = record_id if record_id.startswith("http") else f"https://www.findagrave.com/memorial/{record_id}"
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with shared_client(self.name, timeout=30.0) as client:
                 resp = await client.get(url)
                 resp.raise_for_status()
                 soup = BeautifulSoup(resp.text, "html.parser")
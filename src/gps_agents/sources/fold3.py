@@ -12,6 +12,7 @@ from datetime import UTC, datetime
 from bs4 import BeautifulSoup
 
 from ..models.search import RawRecord, SearchQuery
+from ..net import shared_client
 from .base import BaseSource
 
 logger = logging.getLogger(__name__)
@@ -105,8 +106,6 @@ class Fold3Source(BaseSource):
         Returns:
             List of records found
         """
-        import httpx
-
         records: list[RawRecord] = []
 
         # Build search URL
@@ -124,7 +123,7 @@ class Fold3Source(BaseSource):
         elif self.api_key:
             headers["Authorization"] = f"Bearer {self.api_key}"
 
-        async with httpx.AsyncClient(timeout=45.0, follow_redirects=True) as client:
+        async with shared_client(self.name, timeout=45.0, follow_redirects=True) as client:
             # Authenticate if credentials available and no session
             if self.username and self.password and not self._session_cookie:
                 await self._authenticate(client)
@@ -381,8 +380,6 @@ class Fold3Source(BaseSource):
         Returns:
             The record or None
         """
-        import httpx
-
         url = record_id if record_id.startswith("http") else f"{self.base_url}/record/{record_id}"
 
         headers = {
@@ -393,7 +390,7 @@ class Fold3Source(BaseSource):
             headers["Cookie"] = self._session_cookie
 
         try:
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+            async with shared_client(self.name, timeout=30.0, follow_redirects=True) as client:
                 response = await client.get(url, headers=headers)
                 response.raise_for_status()
 
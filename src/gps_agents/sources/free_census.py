@@ -17,10 +17,10 @@ from datetime import UTC, datetime
 from typing import Any
 from urllib.parse import quote_plus, urljoin
 
-import httpx
 from bs4 import BeautifulSoup
 
 from ..models.search import RawRecord, SearchQuery
+from ..net import shared_client
 from .base import BaseSource
 
 logger = logging.getLogger(__name__)
@@ -95,7 +95,7 @@ class CensusFinderSource(BaseSource):
         state_url = f"{self.base_url}/{state.lower().replace(' ', '-')}.htm"
 
         try:
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+            async with shared_client(self.name, timeout=30.0, follow_redirects=True) as client:
                 resp = await client.get(state_url)
                 if resp.status_code != 200:
                     # Try alternate URL patterns
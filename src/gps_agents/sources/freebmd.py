@@ -4,10 +4,10 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from typing import Any, List
 
-import httpx
 from bs4 import BeautifulSoup
 
 from ..models.search import RawRecord, SearchQuery
+from ..net import shared_client
 from .base import BaseSource
 
 
@@ -28,7 +28,7 @@ class FreeBMDSource(BaseSource):
             "end": str((query.birth_year or 0) + query.birth_year_range) if query.birth_year else "",
         }
         try:
-            async with httpx.AsyncClient(timeout=45.0) as client:
+            async with shared_client(self.name, timeout=45.0) as client:
                 resp = await client.get(self.base_url, params=params)
                 resp.raise_for_status()
                 soup = BeautifulSoup(resp.text, "html.parser")
@@ -40,7 +40,7 @@ class FreeBMDSource(BaseSource):
         # For FreeBMD, record_id may be a link back to the search result row anchor
         url = record_id if record_id.startswith("http") else record_id
         try:
-            async with httpx.AsyncClient(timeout=45.0) as client:
+            async with shared_client(self.name, timeout=45.0) as client:
                 resp = await client.get(url)
                 resp.raise_for_status()
                 soup = BeautifulSoup(resp.text, "html.parser")
@@ -23,6 +23,7 @@ import httpx
 from bs4 import BeautifulSoup
 
 from ..models.search import RawRecord, SearchQuery
+from ..net import shared_client
 from .base import BaseSource
 
 logger = logging.getLogger(__name__)
@@ -85,7 +86,8 @@ class IrishGenealogySource(BaseSource):
             search_url = f"{self.base_url}/{event_type}/search"
 
             try:
-                async with httpx.AsyncClient(
+                async with shared_client(
+                    self.name,
                     timeout=30.0,
                     headers={
                         "User-Agent": "GPS-Genealogy-Agents/0.2.0 (genealogy research)",
@@ -197,7 +199,7 @@ class IrishGenealogySource(BaseSource):
             return None
 
         try:
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+            async with shared_client(self.name, timeout=30.0, follow_redirects=True) as client:
                 resp = await client.get(url)
                 if resp.status_code != 200:
                     return None
@@ -253,7 +255,8 @@ class RootsIrelandSource(BaseSource):
         search_url = f"{self.base_url}/search"
 
         try:
-            async with httpx.AsyncClient(
+            async with shared_client(
+                self.name,
                 timeout=30.0,
                 headers={
                     "User-Agent": "GPS-Genealogy-Agents/0.2.0",
@@ -7,6 +7,7 @@ from datetime import UTC, datetime
 from bs4 import BeautifulSoup
 
 from ..models.search import RawRecord, SearchQuery
+from ..net import shared_client
 from .base import BaseSource
 
 logger = logging.getLogger(__name__)
@@ -34,8 +35,6 @@ class JerripediaSource(BaseSource):
         Returns:
             List of matching records
         """
-        import httpx
-
         records = []
 
         # Build search query
@@ -51,7 +50,7 @@ class JerripediaSource(BaseSource):
         search_query = " ".join(search_terms)
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with shared_client(self.name, timeout=30.0) as client:
                 # MediaWiki search API
                 params = {
                     "action": "query",
@@ -82,13 +81,11 @@ class JerripediaSource(BaseSource):
         Returns:
             The record or None
         """
-        import httpx
-
         # Handle both titles and full URLs
         page_title = record_id.split("/wiki/")[-1] if record_id.startswith("http") else record_id
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with shared_client(self.name, timeout=30.0) as client:
                 # Get page content via API
                 params = {
                     "action": "query",
@@ -18,6 +18,7 @@ import httpx
 from bs4 import BeautifulSoup
 
 from ..models.search import RawRecord, SearchQuery
+from ..net import shared_client
 from .base import BaseSource
 
 logger = logging.getLogger(__name__)
@@ -84,7 +85,8 @@ class LegacyObituariesSource(BaseSource):
         search_url = f"{self.base_url}/us/obituaries/name"
 
         try:
-            async with httpx.AsyncClient(
+            async with shared_client(
+                self.name,
                 timeout=30.0,
                 headers={
                     "User-Agent": "GPS-Genealogy-Agents/0.2.0 (genealogy research)",
@@ -246,7 +248,8 @@ class LegacyObituariesSource(BaseSource):
             return None
 
         try:
-            async with httpx.AsyncClient(
+            async with shared_client(
+                self.name,
                 timeout=30.0,
                 follow_redirects=True,
             ) as client:
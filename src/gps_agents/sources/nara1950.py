@@ -8,9 +8,8 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from typing import Any
 
-import httpx
-
 from ..models.search import RawRecord, SearchQuery
+from ..net import shared_client
 from .base import BaseSource
 
 
@@ -36,7 +35,7 @@ class Nara1950Source(BaseSource):
             "rows": 50,
         }
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with shared_client(self.name, timeout=30.0) as client:
                 resp = await client.get(self.base_url, params=params)
                 resp.raise_for_status()
                 data: dict[str, Any] = resp.json()
@@ -48,7 +47,7 @@ class Nara1950Source(BaseSource):
         """Fetch a single catalog item by NAID."""
         try:
             na_id = record_id
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with shared_client(self.name, timeout=30.0) as client:
                 resp = await client.get(self.base_url, params={"naIds": na_id})
                 resp.raise_for_status()
                 data: dict[str, Any] = resp.json()
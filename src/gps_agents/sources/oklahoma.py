@@ -24,6 +24,7 @@ import httpx
 from bs4 import BeautifulSoup
 
 from ..models.search import RawRecord, SearchQuery
+from ..net import shared_client
 from ..utils.name_variants import generate_surname_variants, get_all_search_names
 from .base import BaseSource
 
@@ -529,7 +530,8 @@ class OHSDawesRollsSource(BaseSource):
         search_url = f"{self.base_url}?{urlencode(params)}"
 
         try:
-            async with httpx.AsyncClient(
+            async with shared_client(
+                self.name,
                 timeout=30.0,
                 headers={
                     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -16,6 +16,7 @@ from urllib.parse import quote_plus, urljoin
 from bs4 import BeautifulSoup
 
 from ..models.search import RawRecord, SearchQuery
+from ..net import shared_client
 from .base import BaseSource
 
 logger = logging.getLogger(__name__)
@@ -50,8 +51,6 @@ class RootsWebSource(BaseSource):
         Returns:
             List of matching records
         """
-        import httpx
-
         records: list[RawRecord] = []
 
         # Need at least a surname for meaningful search
@@ -62,7 +61,7 @@ class RootsWebSource(BaseSource):
         given_name = query.given_name or ""
 
         try:
-            async with httpx.AsyncClient(timeout=45.0, follow_redirects=True) as client:
+            async with shared_client(self.name, timeout=45.0, follow_redirects=True) as client:
                 # 1. Search message boards
                 board_records = await self._search_boards(client, surname, given_name)
                 records.extend(board_records)
@@ -459,12 +458,10 @@ class RootsWebSource(BaseSource):
         Returns:
             The record or None
         """
-        import httpx
-
         url = record_id if record_id.startswith("http") else f"{self.base_url}/{record_id}"
 
         try:
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+            async with shared_client(self.name, timeout=30.0, follow_redirects=True) as client:
                 response = await client.get(url)
                 response.raise_for_status()
 
@@ -20,9 +20,8 @@ import os
 from datetime import UTC, datetime
 from typing import Any, Dict, Optional
 
-import httpx
-
 from ..models.search import RawRecord, SearchQuery
+from ..net import shared_client
 from .base import BaseSource
 
 
@@ -61,7 +60,7 @@ class StateVitalsSource(BaseSource):
             params["types"] = ",".join(query.record_types)
 
         try:
-            async with httpx.AsyncClient(timeout=45.0) as client:
+            async with shared_client(self.name, timeout=45.0) as client:
                 resp = await client.get(self.endpoint_url, params=params)
                 resp.raise_for_status()
                 data = resp.json()
@@ -22,6 +22,7 @@ import httpx
 from bs4 import BeautifulSoup
 
 from ..models.search import RawRecord, SearchQuery
+from ..net import shared_client
 from .base import BaseSource
 
 logger = logging.getLogger(__name__)
@@ -448,7 +449,8 @@ class PleasantonWeeklySource(BaseSource):
         search_url = f"{self.base_url}/obituaries/search.php?{urlencode(search_params)}"
 
         try:
-            async with httpx.AsyncClient(
+            async with shared_client(
+                self.name,
                 timeout=30.0,
                 headers={
                     "User-Agent": "GPS-Genealogy-Agents/0.3.0 (genealogy research)",
@@ -662,7 +664,7 @@ class CalisphereSource(BaseSource):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with shared_client(self.name, timeout=30.0) as client:
                 resp = await client.get(self.api_url, params=params)
 
                 if resp.status_code == 200:
@@ -13,6 +13,7 @@ from typing import Any
 from bs4 import BeautifulSoup
 
 from ..models.search import RawRecord, SearchQuery
+from ..net import shared_client
 from .base import BaseSource
 
 logger = logging.getLogger(__name__)
@@ -64,8 +65,6 @@ class USGenWebSource(BaseSource):
         Returns:
             List of matching records
         """
-        import httpx
-
         records: list[RawRecord] = []
 
         # Build search terms
@@ -86,7 +85,7 @@ class USGenWebSource(BaseSource):
         state_slug = self._normalize_state(query_state) if query_state else None
 
         try:
-            async with httpx.AsyncClient(timeout=45.0, follow_redirects=True) as client:
+            async with shared_client(self.name, timeout=45.0, follow_redirects=True) as client:
                 urls: list[str] = []
 
                 # State-specific search if state provided
@@ -140,12 +139,10 @@ class USGenWebSource(BaseSource):
         Returns:
             The record or None
         """
-        import httpx
-
         url = record_id if record_id.startswith("http") else f"{self.base_url}/{record_id}"
 
         try:
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+            async with shared_client(self.name, timeout=30.0, follow_redirects=True) as client:
                 response = await client.get(url)
                 response.raise_for_status()
 
@@ -439,13 +436,11 @@ class USGenWebSource(BaseSource):
         Returns:
             List of census records with household members extracted
         """
-        import httpx
-
         records: list[RawRecord] = []
         state_slug = self._normalize_state(state) if state else None
 
         try:
-            async with httpx.AsyncClient(timeout=45.0, follow_redirects=True) as client:
+            async with shared_client(self.name, timeout=45.0, follow_redirects=True) as client:
                 urls: list[str] = []
 
                 # State-specific census URLs
@@ -14,7 +14,7 @@ from typing import Any, TypedDict
 import httpx
 
 from ..models.search import RawRecord, SearchQuery
-from ..net import GUARDS, RateLimitConfig
+from ..net import GUARDS, RateLimitConfig, retry_after_seconds, shared_client
 from .base import BaseSource
 
 logger = logging.getLogger(__name__)
@@ -300,7 +300,7 @@ class WikiTreeSource(BaseSource):
 
         # Ensure client exists
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=30.0)
+            self._client = shared_client(self.name, timeout=30.0)
 
         for attempt in range(self.MAX_RATE_LIMIT_RETRIES):
             # Acquire rate limit token
@@ -309,6 +309,8 @@ class WikiTreeSource(BaseSource):
             try:
                 # Make HTTP request directly (bypassing BaseSource._make_request)
                 resp = await self._client.get(self.base_url, params=params)
+                if resp.status_code == 429:
+                    limiter.penalize(retry_after_seconds(resp))
                 resp.raise_for_status()
                 data = resp.json()
 
@@ -316,6 +318,7 @@ class WikiTreeSource(BaseSource):
                 if self._is_rate_limited(data):
                     raise RateLimitError("WikiTree API rate limit exceeded")
 
+                limiter.record_success()
                 return data
 
             except RateLimitError:
@@ -325,7 +328,8 @@ class WikiTreeSource(BaseSource):
                         "WikiTree rate limit hit, backing off %.1fs (attempt %d/%d)",
                         backoff, attempt + 1, self.MAX_RATE_LIMIT_RETRIES
                     )
-                    await asyncio.sleep(backoff)
+                    # Pauses every queued WikiTree request, not just this one
+                    limiter.penalize(backoff)
                 else:
                     logger.error(
                         "WikiTree rate limit exceeded after %d retries",
@@ -75,6 +75,42 @@ def soundex(name: str) -> str:
     return code
 
 
+_NON_LETTERS = re.compile(r'[^A-Z]')
+_REPEATS = re.compile(r'(.)\1+')
+
+# Metaphone transformations, applied in order after the first letter
+_METAPHONE_TRANSFORMS = [(re.compile(pattern), replacement) for pattern, replacement in [
+    (r'^KN', 'N'),
+    (r'^GN', 'N'),
+    (r'^PN', 'N'),
+    (r'^AE', 'E'),
+    (r'^WR', 'R'),
+    (r'^WH', 'W'),
+    (r'MB$', 'M'),
+    (r'GH', ''),
+    (r'PH', 'F'),
+    (r'SCH', 'SK'),
+    (r'SH', 'X'),
+    (r'TH', '0'),  # 0 represents 'th' sound
+    (r'TCH', 'X'),
+    (r'CH', 'X'),
+    (r'CK', 'K'),
+    (r'C([IEY])', r'S\1'),
+    (r'C', 'K'),
+    (r'DG([IEY])', r'J\1'),
+    (r'D', 'T'),
+    (r'G([IEY])', r'J\1'),
+    (r'GN', 'N'),
+    (r'G', 'K'),
+    (r'Q', 'K'),
+    (r'X', 'KS'),
+    (r'Z', 'S'),
+    (r'V', 'F'),
+    (r'[AEIOU]', ''),  # Remove vowels (except initial)
+    (r'[HWY]', ''),  # Remove H, W, Y
+]]
+
+
 def metaphone(name: str) -> str:
     """Generate Metaphone code for a name.
 
@@ -93,7 +129,7 @@ def metaphone(name: str) -> str:
         return ""
 
     name = name.upper()
-    name = re.sub(r'[^A-Z]', '', name)
+    name = _NON_LETTERS.sub('', name)
     if not name:
         return ""
 
@@ -105,48 +141,16 @@ def metaphone(name: str) -> str:
             result += char
     name = result
 
-    # Transformations
-    transforms = [
-        (r'^KN', 'N'),
-        (r'^GN', 'N'),
-        (r'^PN', 'N'),
-        (r'^AE', 'E'),
-        (r'^WR', 'R'),
-        (r'^WH', 'W'),
-        (r'MB$', 'M'),
-        (r'GH', ''),
-        (r'PH', 'F'),
-        (r'SCH', 'SK'),
-        (r'SH', 'X'),
-        (r'TH', '0'),  # 0 represents 'th' sound
-        (r'TCH', 'X'),
-        (r'CH', 'X'),
-        (r'CK', 'K'),
-        (r'C([IEY])', r'S\1'),
-        (r'C', 'K'),
-        (r'DG([IEY])', r'J\1'),
-        (r'D', 'T'),
-        (r'G([IEY])', r'J\1'),
-        (r'GN', 'N'),
-        (r'G', 'K'),
-        (r'Q', 'K'),
-        (r'X', 'KS'),
-        (r'Z', 'S'),
-        (r'V', 'F'),
-        (r'[AEIOU]', ''),  # Remove vowels (except initial)
-        (r'[HWY]', ''),  # Remove H, W, Y
-    ]
-
     # Keep first letter if it's a vowel
     first = name[0]
     rest = name[1:] if len(name) > 1 else ""
 
-    for pattern, replacement in transforms:
-        rest = re.sub(pattern, replacement, rest)
+    for pattern, replacement in _METAPHONE_TRANSFORMS:
+        rest = pattern.sub(replacement, rest)
 
     # Combine and clean up
     result = first + rest
-    result = re.sub(r'(.)\1+', r'\1', result)  # Remove duplicates
+    result = _REPEATS.sub(r'\1', result)  # Remove duplicates
 
     return result[:6]  # Limit length
 
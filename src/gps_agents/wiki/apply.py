@@ -11,7 +11,7 @@ import structlog
 
 from gps_agents.git_utils import safe_commit
 from gps_agents.projections.sqlite_projection import SQLiteProjection
-from gps_agents.wikidata.idempotency import ensure_statement
+from gps_agents.wikidata.idempotency import ensure_statement, ensure_statements
 
 logger = structlog.get_logger(__name__)
 
@@ -51,6 +51,9 @@ class _DryRunWD:
     def get_claims(self, entity_id: str, property_id: str) -> list[dict]:
         return []
 
+    def get_entity_claims(self, _entity_id: str) -> list[dict]:
+        return []
+
     def add_claim(self, entity_id: str, property_id: str, value, qualifiers, references) -> str:
         # Return a pseudo GUID without writing
         return f"{entity_id}$DRYRUN"
@@ -89,6 +92,16 @@ def _get_wikidata_client() -> Any:
             def get_claims(self, entity_id: str, property_id: str) -> list[dict]:
                 item = ItemPage(self.repo, entity_id)
                 item.get()
+                return self._claims_of(item, property_id)
+
+            def get_entity_claims(self, entity_id: str) -> list[dict]:
+                # One item fetch covers every property
+                item = ItemPage(self.repo, entity_id)
+                item.get()
+                return [claim for property_id in item.claims for claim in self._claims_of(item, property_id)]
+
+            @staticmethod
+            def _claims_of(item, property_id: str) -> list[dict]:
                 claims = []
                 for cl in item.claims.get(property_id, []):
                     val = cl.getTarget()
@@ -107,6 +120,18 @@ def _get_wikidata_client() -> Any:
             def add_claim(self, entity_id: str, property_id: str, value, qualifiers, references) -> str:
                 item = ItemPage(self.repo, entity_id)
                 item.get()
+                return self._add(item, entity_id, property_id, value)
+
+            def add_claims(self, entity_id: str, claims: list[dict], created: list[str]) -> list[str]:
+                item = ItemPage(self.repo, entity_id)
+                item.get()
+                # Appended one by one: if a later edit fails, the caller
+                # still records the claims already written
+                for c in claims:
+                    created.append(self._add(item, entity_id, c.get("property"), c.get("value")))
+                return created
+
+            def _add(self, item, entity_id: str, property_id: str, value) -> str:
                 claim = Claim(self.repo, property_id)
                 claim.setTarget(_to_pwb_value(self.repo, value))
                 item.addClaim(claim)
@@ -150,6 +175,26 @@ def apply_wikidata_from_bundle(bundle_dir: Path, *, projection: SQLiteProjection
     client = _get_wikidata_client()
 
     claims: list[dict] = payload.get("claims") or []
+    # One claim fetch and one cache write for the whole entity; if the batch
+    # fails, fall back to per-claim calls so each failure is logged on its own.
+    try:
+        guids = ensure_statements(client, entity, claims, projection=projection)
+    except Exception as e:
+        logger.warning("wikidata.bulk_apply_failed", entity=entity, error=str(e))
+    else:
+        log_entries.extend(
+            {
+                "run_id": run_id,
+                "platform": "wikidata",
+                "entity": entity,
+                "property": c.get("property"),
+                "guid": guid,
+                "action": "ensured",
+            }
+            for c, guid in zip(claims, guids, strict=True)
+        )
+        return log_entries
+
     for c in claims:
         try:
             prop = c.get("property")
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import hashlib
 import json
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 logger = structlog.get_logger(__name__)
 
 
@@ -106,6 +109,12 @@ def _equivalent(a: dict, b: dict) -> bool:
     return json.dumps(a, sort_keys=True) == json.dumps(b, sort_keys=True)
 
 
+def _canon_fingerprint(property_id: str, value, qualifiers: dict | None, references: list | None) -> str:
+    """Fingerprint of the canonical claim; equal fingerprints are ``_equivalent``."""
+    canon = _canon_claim(property_id, value, qualifiers, references)
+    return hashlib.sha256(json.dumps(canon, sort_keys=True).encode("utf-8")).hexdigest()
+
+
 def ensure_statement(
     client,
     entity_id: str,
@@ -157,3 +166,124 @@ def ensure_statement(
         cache[fp] = guid
     logger.info("ensure_statement.created", property=property_id, guid=guid)
     return guid
+
+
+def _fetch_entity_claims(client, entity_id: str, property_ids: Iterable[str]) -> list[dict]:
+    """All existing claims of an entity for the given properties.
+
+    Uses the client's ``get_entity_claims`` (one round trip) when available,
+    otherwise one ``get_claims`` call per distinct property.
+    """
+    get_entity_claims = getattr(client, "get_entity_claims", None)
+    if get_entity_claims is not None:
+        return list(get_entity_claims(entity_id))
+    claims: list[dict] = []
+    for property_id in dict.fromkeys(property_ids):
+        claims.extend(client.get_claims(entity_id, property_id))
+    return claims
+
+
+def ensure_statements(
+    client,
+    entity_id: str,
+    claims: Iterable[dict],
+    *,
+    cache: dict | None = None,
+    projection=None,
+) -> list[str | None]:
+    """Bulk ``ensure_statement`` for many claims on one entity.
+
+    Claims already in the durable cache are resolved with one lookup. The
+    entity's existing claims are then fetched once and canonicalized once
+    into a fingerprint -> GUID map, and every remaining payload claim is
+    resolved against it in memory. Missing claims are added (duplicates
+    within ``claims`` only once) and all new cache rows are written in a
+    single batch.
+
+    Args:
+        client: As for ``ensure_statement``; may additionally expose
+            ``get_entity_claims(entity_id) -> list[dict]`` and
+            ``add_claims(entity_id, claims, created) -> list[str]`` for
+            batched I/O. ``add_claims`` appends each GUID to ``created`` as
+            soon as that claim is written, so a failure part way through
+            still leaves the earlier GUIDs to record.
+        entity_id: Existing entity (QID)
+        claims: Dicts with ``property``, ``value`` and optional
+            ``qualifiers``/``references``, as in a Wikidata bundle payload
+        cache: Optional in-memory fingerprint -> GUID cache
+        projection: Optional SQLiteProjection holding the durable cache
+
+    Returns:
+        Statement GUIDs in the order of ``claims``
+    """
+    claims = list(claims)
+    fps = [
+        _statement_fingerprint(c.get("property"), c.get("value"), c.get("qualifiers"), c.get("references"))
+        for c in claims
+    ]
+    guids: list[str | None] = [None] * len(claims)
+
+    if projection is not None:
+        known = projection.get_statement_guids(fps)
+    else:
+        known = {fp: cache[fp] for fp in fps if cache is not None and fp in cache}
+    pending: list[int] = []
+    for i, fp in enumerate(fps):
+        if fp in known:
+            guids[i] = known[fp]
+        else:
+            pending.append(i)
+    if not pending:
+        logger.info("ensure_statements.cache_hit", entity=entity_id, claims=len(claims))
+        return guids
+
+    index: dict[str, str] = {}
+    for claim in _fetch_entity_claims(client, entity_id, (claims[i].get("property") for i in pending)):
+        cfp = _canon_fingerprint(claim.get("property"), claim.get("value"), claim.get("qualifiers"), claim.get("references"))
+        index.setdefault(cfp, claim.get("id") or claim.get("guid"))
+
+    resolved: list[tuple[int, str]] = []  # (claim index, GUID) to record in the cache
+    to_add: dict[str, list[int]] = {}  # canonical fingerprint -> claim indexes
+    existing = 0
+    for i in pending:
+        c = claims[i]
+        cfp = _canon_fingerprint(c.get("property"), c.get("value"), c.get("qualifiers"), c.get("references"))
+        if cfp in index:
+            resolved.append((i, index[cfp]))
+            existing += 1
+        else:
+            to_add.setdefault(cfp, []).append(i)
+
+    new = [claims[idxs[0]] for idxs in to_add.values()]
+    created: list[str] = []
+    try:
+        add_claims = getattr(client, "add_claims", None)
+        if add_claims is not None and new:
+            add_claims(entity_id, new, created)
+        else:
+            for c in new:
+                created.append(client.add_claim(
+                    entity_id, c.get("property"), c.get("value"), c.get("qualifiers") or {}, c.get("references") or [],
+                ))
+    finally:
+        # Record whatever was written, even if a later add failed, so a
+        # retry finds those claims in the cache instead of adding them again.
+        for idxs, guid in zip(to_add.values(), created, strict=False):
+            resolved.extend((i, guid) for i in idxs)
+        rows = [(fps[i], guid, entity_id, claims[i].get("property")) for i, guid in resolved]
+        if projection is not None:
+            if rows:
+                projection.set_statement_guids(rows)
+        elif cache is not None:
+            cache.update((fp, guid) for fp, guid, _, _ in rows)
+
+    for i, guid in resolved:
+        guids[i] = guid
+    logger.info(
+        "ensure_statements.done",
+        entity=entity_id,
+        cached=len(claims) - len(pending),
+        exists=existing,
+        created=len(to_add),
+    )
+    return guids
@@ -0,0 +1,109 @@
+"""Tests for the person crawl engine (crawl/engine.py)."""
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+import pytest
+
+from gps_agents.crawl import engine
+from gps_agents.crawl.engine import CrawlConfig, SeedPerson
+from gps_agents.models.search import RawRecord
+from gps_agents.sources.router import UnifiedSearchResult
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Census stubs carry household lists in extracted_fields, as the real adapters do
+pytestmark = pytest.mark.filterwarnings("ignore:Pydantic serializer warnings")
+
+ACCESSED_AT = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+class StubRouter:
+    """Router stub whose latency varies per person to scramble completion order."""
+
+    def __init__(self) -> None:
+        self.searched: list[str] = []
+
+    async def search(self, query, region=None):
+        self.searched.append(query.given_name)
+        await asyncio.sleep(0.001 * (hash(query.given_name) % 5))
+        rec = RawRecord(
+            source="nara1950",
+            record_id=f"{query.given_name}-{query.surname}",
+            record_type="census",
+            accessed_at=ACCESSED_AT,
+        )
+        return UnifiedSearchResult(query=query, results=[rec], sources_searched=["nara1950"])
+
+
+class StubCensusSource:
+    """Census stub returning both parents of each person as household members."""
+
+    async def search_census(self, surname, given_name, state=None, county=None, year=None):
+        members = [
+            {"name": f"{given_name}f {surname}", "age": "40", "relationship": "father"},
+            {"name": f"{given_name}m {surname}", "age": "38", "relationship": "mother"},
+        ]
+        return [
+            RawRecord.model_construct(
+                source="accessgenealogy",
+                record_id=f"{given_name}-{year}",
+                record_type="census",
+                url=None,
+                raw_data={},
+                extracted_fields={"household_members": members},
+                accessed_at=ACCESSED_AT,
+                confidence_hint=None,
+                needs_translation=False,
+                language="en",
+            )
+        ]
+
+
+@pytest.fixture
+def stub_sources(monkeypatch, tmp_path: Path):
+    monkeypatch.chdir(tmp_path)
+    router = StubRouter()
+    monkeypatch.setattr(
+        engine, "_build_router", lambda cfg: (router, StubCensusSource(), StubCensusSource())
+    )
+    return router
+
+
+def _config(tree_out: Path, workers: int) -> CrawlConfig:
+    return CrawlConfig(
+        tree_out=str(tree_out),
+        max_generations=3,
+        use_existing_profile=False,
+        use_census_tree_builder=False,
+        workers=workers,
+    )
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_visits_whole_tree(stub_sources, tmp_path: Path):
+    """Test that concurrent workers drain the frontier including late enqueues."""
+    seed = SeedPerson(given="P", surname="Smith")
+    summary = await engine.run_crawl_person(seed, _config(tmp_path / "tree.json", workers=4))
+
+    # Seed plus 2 + 4 + 8 ancestors over three generations
+    assert summary["iterations"] == 15
+    assert len(stub_sources.searched) == 15
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_independent_of_worker_count(stub_sources, tmp_path: Path):
+    """Test that the tree file is identical regardless of scheduling."""
+    seed = SeedPerson(given="P", surname="Smith")
+    outputs = []
+    for workers in (2, 5):
+        out = tmp_path / f"tree-{workers}.json"
+        await engine.run_crawl_person(seed, _config(out, workers=workers))
+        outputs.append(json.loads(out.read_text()))
+
+    assert outputs[0] == outputs[1]
+    assert outputs[0]["coverage"]["records"] == len(outputs[0]["records"])
@@ -0,0 +1,169 @@
+"""Tests for DNA match clustering and CSV ingestion."""
+
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING
+
+import pytest
+
+from gps_agents.dna import DNAMatch, DNATestProvider, cluster_dna_matches
+from gps_agents.dna.clustering import (
+    MatchMatrix,
+    iter_match_csv,
+    iter_shared_match_csv,
+    load_match_csv,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _match(name: str, cm: float, shared: list[str] | None = None) -> DNAMatch:
+    return DNAMatch(match_name=name, shared_cm=cm, shared_matches=shared or [])
+
+
+# =============================================================================
+# cluster_dna_matches
+# =============================================================================
+
+
+class TestClusterDnaMatches:
+    """Tests for union-find cluster_dna_matches."""
+
+    def test_groups_connected_matches(self) -> None:
+        """Test that matches linked through shared lists form one cluster."""
+        matches = [
+            _match("A", 120, ["B"]),
+            _match("C", 95, ["D"]),
+            _match("B", 80, ["E"]),
+            _match("E", 200),
+            _match("D", 60),
+            _match("F", 40),
+        ]
+
+        clusters = cluster_dna_matches(matches)
+
+        assert [[m.match_name for m in c] for c in clusters] == [["E", "A", "B"], ["C", "D"], ["F"]]
+
+    def test_bridges_through_unlisted_names(self) -> None:
+        """Test that a shared match below the threshold still links clusters."""
+        matches = [_match("A", 100, ["low"]), _match("B", 90, ["low"]), _match("low", 10)]
+
+        clusters = cluster_dna_matches(matches)
+
+        assert [[m.match_name for m in c] for c in clusters] == [["A", "B"]]
+
+    def test_below_threshold_is_empty(self) -> None:
+        """Test that nothing clusters when every match is below the threshold."""
+        assert cluster_dna_matches([_match("A", 10, ["B"])]) == []
+
+
+# =============================================================================
+# MatchMatrix
+# =============================================================================
+
+
+class TestMatchMatrix:
+    """Tests for MatchMatrix vectors, union-find and Leeds clusters."""
+
+    def test_vectors_and_adjacency(self) -> None:
+        """Test cM vectors and the de-duplicated, symmetric adjacency."""
+        matrix = MatchMatrix.from_matches([_match("A", 100, ["B", "B"]), _match("B", 50, ["A"])])
+
+        assert matrix.shared_cm.tolist() == [100, 50]
+        assert matrix.neighbors(0).tolist() == [1]
+        assert matrix.neighbors(1).tolist() == [0]
+        assert matrix.to_match(1).shared_matches == ["A"]
+
+    def test_union_find_long_chain(self) -> None:
+        """Test that a long chain of links collapses into one component."""
+        n = 2_000
+        matches = [_match(f"m{i}", 50, [f"m{i + 1}"]) for i in range(n - 1, -1, -1)]
+        roots = MatchMatrix.from_matches(matches).components()
+        assert len(set(roots.tolist())) == 1
+
+    def test_leeds_colours(self) -> None:
+        """Test Leeds colours, including a match that shares with two lines."""
+        matrix = MatchMatrix.from_matches([
+            _match("P1", 300, ["P2", "X"]),
+            _match("M1", 250, ["M2", "X"]),
+            _match("P2", 200, ["P1"]),
+            _match("M2", 150, ["M1"]),
+            _match("X", 100, ["P1", "M1"]),
+            _match("far", 30, ["P1"]),
+            _match("close", 1500, ["P1"]),
+        ])
+
+        leeds = matrix.leeds_clusters()
+
+        assert leeds.names == ["P1", "P2", "X", "M1", "M2"]
+        assert leeds.colors.tolist() == [
+            [True, False],
+            [True, False],
+            [True, True],
+            [False, True],
+            [False, True],
+        ]
+
+    def test_leeds_csv_export(self, tmp_path: Path) -> None:
+        """Test the Leeds matrix CSV layout."""
+        matrix = MatchMatrix.from_matches([_match("A", 150, ["B"]), _match("B", 120, ["A"])])
+        path = tmp_path / "leeds.csv"
+
+        matrix.leeds_clusters().write_csv(path)
+
+        assert path.read_text().splitlines() == ["match_name,shared_cm,cluster_1", "A,150.0,X", "B,120.0,X"]
+
+
+# =============================================================================
+# CSV ingestion
+# =============================================================================
+
+
+class TestMatchCsv:
+    """Tests for streaming provider CSV ingestion."""
+
+    def test_myheritage_style(self) -> None:
+        """Test MyHeritage-style headers with thousands separators."""
+        data = io.StringIO(
+            "Name,Total cM shared,Shared segments,Largest segment (cM),Estimated relationship\n"
+            'Jane Doe,"1,234.5",40,120.2,1st cousin\n'
+            ",10,1,10,\n"
+        )
+
+        [match] = list(iter_match_csv(data, DNATestProvider.MYHERITAGE))
+
+        assert match.match_name == "Jane Doe"
+        assert match.shared_cm == 1234.5
+        assert match.shared_segments == 40
+        assert match.largest_segment_cm == 120.2
+        assert match.predicted_relationship == "1st cousin"
+        assert match.provider == DNATestProvider.MYHERITAGE
+
+    def test_twentythree_percent(self) -> None:
+        """Test that 23andMe percent shared converts to cM."""
+        data = io.StringIO("Display Name,Percent DNA Shared,# Segments Shared\nSam,1.5%,6\n")
+
+        [match] = list(iter_match_csv(data))
+
+        assert match.shared_cm == pytest.approx(111.6)
+        assert match.shared_segments == 6
+
+    def test_unknown_header(self) -> None:
+        """Test that an unrecognized header raises ValueError."""
+        with pytest.raises(ValueError, match="Unrecognized"):
+            list(iter_match_csv(io.StringIO("foo,bar\n1,2\n")))
+
+    def test_load_with_shared_matches(self, tmp_path: Path) -> None:
+        """Test loading a match list plus an in-common-with file."""
+        (tmp_path / "matches.csv").write_text("matchname,sharedCentimorgans\nA,100\nB,90\nC,40\n")
+        (tmp_path / "icw.csv").write_text("matchname,icwname\nA,B\nB,Z\n")
+
+        assert list(iter_shared_match_csv(tmp_path / "icw.csv")) == [("A", "B"), ("B", "Z")]
+        matrix = load_match_csv(tmp_path / "matches.csv", tmp_path / "icw.csv")
+
+        assert matrix.names == ["A", "B", "C", "Z"]
+        assert matrix.is_match.tolist() == [True, True, True, False]
+        roots = matrix.components()
+        assert roots[0] == roots[1] == roots[3] != roots[2]
@@ -0,0 +1,165 @@
+"""Tests for the single-pass export engine."""
+
+from __future__ import annotations
+
+import json
+import xml.etree.ElementTree as ET
+from typing import TYPE_CHECKING
+
+import pytest
+
+from gps_agents.export import export_by_format, export_many
+from gps_agents.export.engine import FamilyModel
+from gps_agents.ledger.fact_ledger import FactLedger
+from gps_agents.models.fact import Fact, FactStatus
+from gps_agents.models.provenance import Provenance, ProvenanceSource
+from gps_agents.models.source import SourceCitation
+from gps_agents.projections.sqlite_projection import SQLiteProjection
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+GRAPHML = "{http://graphml.graphdrawing.org/xmlns}"
+
+
+def _fact(statement: str, status: FactStatus = FactStatus.ACCEPTED, **kwargs) -> Fact:
+    return Fact(
+        statement=statement,
+        status=status,
+        provenance=Provenance(created_by=ProvenanceSource.RESEARCH_AGENT),
+        **kwargs,
+    )
+
+
+def _facts() -> list[Fact]:
+    census = SourceCitation(repository="FamilySearch", record_id="MX1-2", url="https://example.org/MX1-2")
+    return [
+        _fact("Birth on 1 Jan 1900 in Boston", person_id="John Smith|1900|MA", fact_type="birth", sources=[census]),
+        _fact("Occupation: carpenter", person_id="John Smith|1900|MA", fact_type="occupation"),
+        _fact("Birth on 1902", person_id="Jane Doe|1902|MA", fact_type="birth"),
+        _fact(
+            "John married Jane", fact_type="relationship", relation_kind="spouse_of",
+            relation_subject="John Smith|1900|MA", relation_object="Jane Doe|1902|MA",
+            confidence_score=0.9, sources=[census],
+        ),
+        _fact(
+            "John is parent of Mary", fact_type="relationship", relation_kind="parent_of",
+            relation_subject="John Smith|1900|MA", relation_object="Mary Smith|1925|MA",
+        ),
+        _fact("Birth on 1930", status=FactStatus.REJECTED, person_id="Ghost Smith|1930|MA", fact_type="birth"),
+        _fact("Boston directory lists a Smith household"),
+    ]
+
+
+@pytest.fixture
+def ledger_dir(tmp_path: Path) -> Path:
+    """Ledger with people, relationships, a cited fact and a rejected fact."""
+    ledger_dir = tmp_path / "ledger"
+    ledger = FactLedger(str(ledger_dir), enforce_privacy=False)
+    for fact in _facts():
+        ledger.append(fact, skip_privacy_check=True)
+    return ledger_dir
+
+
+class TestExportMany:
+    """Tests for export_many and the streaming writers."""
+
+    def test_one_ledger_pass_for_all_formats(self, ledger_dir: Path, tmp_path: Path, monkeypatch):
+        """Test that several formats are produced from a single scan."""
+        calls = []
+        original = FactLedger.iter_all_facts
+
+        def counting(self, status=None):
+            calls.append(status)
+            return original(self, status)
+
+        monkeypatch.setattr(FactLedger, "iter_all_facts", counting)
+        names = ["tree.ged", "tree.json", "tree.md", "tree.graphml", "tree.mmd"]
+        paths = export_many(ledger_dir, [tmp_path / "out" / n for n in names])
+
+        assert len(calls) == 1
+        assert [p.name for p in paths] == names
+        gedcom = paths[0].read_text()
+        assert "1 NAME John /Smith/" in gedcom
+        assert "1 CHIL" in gedcom
+        assert gedcom.endswith("0 TRLR\n")
+        assert "Ghost" not in gedcom
+        assert paths[4].read_text().count(" --- ") == 1
+
+    def test_json_stream_matches_json_dump(self, ledger_dir: Path, tmp_path: Path):
+        """Test that streamed JSON is identical to dumping the whole document."""
+        for pretty in (True, False):
+            out = export_many(ledger_dir, [tmp_path / f"{pretty}.json"], pretty=pretty)[0]
+            text = out.read_text()
+            data = json.loads(text)
+            assert text == json.dumps(data, indent=2 if pretty else None, ensure_ascii=False)
+
+        assert data["metadata"]["total_persons"] == 3
+        john = data["persons"][0]
+        assert (john["birth_date"], john["birth_place"], john["occupation"]) == ("1 Jan 1900", "Boston", "Occupation: carpenter")
+        assert john["sources"][0]["id"] == "MX1-2"
+        spouse = data["relationships"][0]
+        assert (spouse["type"], spouse["subject_id"], spouse["object_id"], spouse["confidence"]) == ("spouse_of", "P1", "P2", 0.9)
+        assert [f["statement"] for f in data["unlinked_facts"]] == ["Boston directory lists a Smith household"]
+
+    def test_rejected_facts_only_reach_json(self, ledger_dir: Path, tmp_path: Path):
+        """Test include_rejected applies to JSON without leaking into other formats."""
+        json_out, md_out = export_many(ledger_dir, [tmp_path / "t.json", tmp_path / "t.md"], include_rejected=True)
+
+        assert "Ghost Smith" in {p["name"] for p in json.loads(json_out.read_text())["persons"]}
+        assert "Ghost" not in md_out.read_text()
+
+    def test_graphml_is_well_formed(self, ledger_dir: Path, tmp_path: Path):
+        """Test that streamed GraphML parses and declares every data key."""
+        out = export_many(ledger_dir, [tmp_path / "t.graphml"], include_events=True)[0]
+        root = ET.parse(out).getroot()  # noqa: S314 - our own export, not untrusted input
+
+        declared = {key.get("id") for key in root.iter(f"{GRAPHML}key")}
+        used = {data.get("key") for data in root.iter(f"{GRAPHML}data")}
+        assert used <= declared
+        node_ids = {node.get("id") for node in root.iter(f"{GRAPHML}node")}
+        assert "fam_Jane_Doe_1902_MA_John_Smith_1900_MA" in node_ids
+        assert "event_John_Smith_1900_MA_birth" in node_ids
+        for edge in root.iter(f"{GRAPHML}edge"):
+            assert {edge.get("source"), edge.get("target")} <= node_ids
+
+    def test_markdown_cites_sources(self, ledger_dir: Path, tmp_path: Path):
+        """Test that Markdown lists relationships and source links."""
+        text = export_many(ledger_dir, [tmp_path / "t.md"])[0].read_text()
+
+        assert "- **Total Individuals**: 3" in text
+        assert "  - Source: [FamilySearch MX1-2](https://example.org/MX1-2)" in text
+        assert "**Children**:\n- Mary Smith|1925|MA" in text
+
+    def test_projection_source_matches_ledger(self, ledger_dir: Path, tmp_path: Path):
+        """Test that a SQLiteProjection builds the same model as the ledger."""
+        projection = SQLiteProjection(tmp_path / "projection.db")
+        for fact in FactLedger(str(ledger_dir)).iter_all_facts():
+            projection.upsert_fact(fact)
+
+        from_ledger = FamilyModel.from_ledger(ledger_dir)
+        from_projection = FamilyModel.from_projection(projection)
+        projection.close()
+
+        assert list(from_projection.persons) == list(from_ledger.persons)
+        assert from_projection.relations == from_ledger.relations
+        assert from_projection.unlinked == from_ledger.unlinked
+
+
+class TestExportByFormat:
+    """Tests for export_by_format with several outputs."""
+
+    def test_list_of_outputs(self, ledger_dir: Path, tmp_path: Path):
+        """Test that a list of paths returns a list and routes options by format."""
+        paths = export_by_format(ledger_dir, [tmp_path / "a.md", tmp_path / "a.json"], title="Smiths", pretty=False)
+
+        assert paths[0].read_text().startswith("# Smiths\n")
+        assert "\n" not in paths[1].read_text()
+
+    def test_rejects_unknown_option_and_format(self, ledger_dir: Path, tmp_path: Path):
+        """Test that bad options and suffixes fail before anything is written."""
+        with pytest.raises(TypeError, match="colour"):
+            export_by_format(ledger_dir, [tmp_path / "a.ged", tmp_path / "a.json"], colour="red")
+        with pytest.raises(ValueError, match=r"\.xyz"):
+            export_by_format(ledger_dir, [tmp_path / "a.ged", tmp_path / "a.xyz"])
+        assert not list(tmp_path.glob("a.*"))
@@ -8,7 +8,7 @@ from __future__ import annotations
 import asyncio
 import json
 import tempfile
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any, AsyncIterator
 from uuid import UUID, uuid4
@@ -316,6 +316,72 @@ class TestFrontierQueue:
         """Test that popping from empty queue returns None."""
         assert frontier_queue.pop() is None
 
+    def test_fifo_within_priority(self, frontier_queue: FrontierQueue):
+        """Test that equal-priority items pop in creation order."""
+        base = datetime(2024, 1, 1, tzinfo=UTC)
+        items = [
+            CrawlItem(url=f"https://example.com/{i}", created_at=base + timedelta(seconds=i))
+            for i in range(20)
+        ]
+        for item in reversed(items):
+            frontier_queue.push(item)
+
+        popped = [frontier_queue.pop().url for _ in range(20)]
+        assert popped == [item.url for item in items]
+
+
+class TestFrontierQueueFallbackPersistence:
+    """Tests for the heap + WAL fallback used when RocksDB is unavailable."""
+
+    @pytest.fixture(autouse=True)
+    def _require_fallback(self, temp_db_path: Path):
+        queue = FrontierQueue(temp_db_path / "probe")
+        if not queue._use_fallback:
+            pytest.skip("RocksDB installed; fallback storage not in use")
+        queue.close()
+
+    def test_wal_replay_restores_state(self, temp_db_path: Path):
+        """Test that reopening without close() recovers from the WAL."""
+        path = temp_db_path / "frontier"
+        queue = FrontierQueue(path)
+        base = datetime(2024, 1, 1, tzinfo=UTC)
+        items = [
+            CrawlItem(url=f"https://example.com/{i}", created_at=base + timedelta(seconds=i))
+            for i in range(4)
+        ]
+        queue.push_many(items)
+        first = queue.pop()
+        queue.complete(first.item_id)
+        second = queue.pop()
+        queue.fail(second.item_id, requeue=True)
+        queue._wal_file.close()  # simulate a crash: no compaction on close
+
+        reopened = FrontierQueue(path)
+        stats = reopened.stats()
+        assert stats.pending_items == 3
+        assert stats.completed_items == 1
+        assert reopened.is_duplicate(CrawlItem(url="https://example.com/0"))
+        # The requeued item was demoted, so it now pops last
+        order = [reopened.pop().url for _ in range(3)]
+        assert order == ["https://example.com/2", "https://example.com/3", "https://example.com/1"]
+        reopened.close()
+
+    def test_compaction_truncates_wal(self, temp_db_path: Path):
+        """Test that the WAL is folded into the snapshot once it grows."""
+        path = temp_db_path / "frontier"
+        queue = FrontierQueue(path, compact_min_entries=5)
+        for i in range(12):
+            queue.push(CrawlItem(url=f"https://example.com/{i}"))
+
+        assert queue._wal_entries < 12
+        assert (path / "frontier.jsonl").exists()
+        queue.close()
+        assert not (path / "frontier.wal").exists()
+
+        reopened = FrontierQueue(path)
+        assert len(reopened) == 12
+        reopened.close()
+
 
 # =============================================================================
 # Graph Storage Tests
@@ -2580,3 +2646,454 @@ class TestHallucinationFirewall:
         result = hallucination_firewall(output, source_text)
 
         assert result.passed is True  # Fuzzy matching should pass
+
+
+class TestFuzzyCitationMatcher:
+    """Tests for the windowed Levenshtein matcher behind check_citation_exists."""
+
+    @staticmethod
+    def _brute_force_ratio(pattern: str, text: str) -> float:
+        from gps_agents.genealogy_crawler.llm.wrapper import _edit_distance_ratio
+
+        m = len(pattern)
+        return max(_edit_distance_ratio(pattern, text[i:i + m]) for i in range(len(text) - m + 1))
+
+    def test_ocr_noise_within_threshold_matches(self):
+        """Test that a few OCR substitutions inside a long page still match."""
+        from gps_agents.genealogy_crawler.llm import check_citation_exists
+
+        page = " ".join(f"line {i} smith household dwelling {i * 7}" for i in range(400))
+        page += " john smith head male 1880 born ohio farmer "
+        citation = "John Srnith head male 188O born Ohio"
+
+        assert check_citation_exists(citation, page, fuzzy=True)
+        assert not check_citation_exists("Mary Jones wife female 1882 born Kentucky", page, fuzzy=True)
+
+    def test_window_ratio_matches_brute_force(self):
+        """Test that bit-parallel filtering returns the exhaustive window ratio."""
+        import random
+
+        from gps_agents.genealogy_crawler.llm.wrapper import _levenshtein_ratio
+
+        rng = random.Random(7)  # noqa: S311 - seeded test data
+        for _ in range(200):
+            text = "".join(rng.choice("abc d") for _ in range(rng.randint(20, 60)))
+            pattern = "".join(rng.choice("abc d") for _ in range(rng.randint(2, 9)))
+            expected = self._brute_force_ratio(pattern, text)
+            assert _levenshtein_ratio(pattern, text) == pytest.approx(expected)
+            cut = _levenshtein_ratio(pattern, text, score_cutoff=0.85)
+            assert cut == (pytest.approx(expected) if expected >= 0.85 else 0.0)
+
+
+# =============================================================================
+# LLM Idempotency Cache Tests
+# =============================================================================
+
+
+class TestIdempotencyCache:
+    """Tests for LRU/TTL eviction and the append-only persistent log."""
+
+    @staticmethod
+    def _fp(n: int, role: str = "planner"):
+        from gps_agents.genealogy_crawler.llm import ContentFingerprint
+
+        return ContentFingerprint(kind=f"llm_{role}", value=f"{n:016x}".ljust(64, "0"))
+
+    @staticmethod
+    def _output(n: int):
+        from pydantic import BaseModel
+
+        class Output(BaseModel):
+            given_name: str
+
+        return Output(given_name=f"p{n}")
+
+    def test_lru_evicts_least_recently_used(self):
+        """Test that a recent get protects an entry from eviction."""
+        from gps_agents.genealogy_crawler.llm import IdempotencyCache
+
+        cache = IdempotencyCache(max_size=3)
+        for n in range(3):
+            cache.put(self._fp(n), self._output(n), "planner", str(n))
+        assert cache.get(self._fp(0)) is not None
+
+        cache.put(self._fp(3), self._output(3), "planner", "3")
+
+        assert cache.get(self._fp(1)) is None
+        assert cache.get(self._fp(0)) is not None
+        assert len(cache.cache) == 3
+        assert cache.evictions == 1
+
+    def test_max_bytes_limit(self):
+        """Test that the byte budget bounds the cache independently of max_size."""
+        from gps_agents.genealogy_crawler.llm import IdempotencyCache
+        from gps_agents.genealogy_crawler.llm.idempotency import ENTRY_OVERHEAD_BYTES
+
+        cache = IdempotencyCache(max_size=1000, max_bytes=5 * (ENTRY_OVERHEAD_BYTES + 60))
+        for n in range(10, 60):
+            cache.put(self._fp(n), self._output(n), "planner", str(n))
+
+        assert list(cache.cache) == [str(self._fp(n)) for n in range(55, 60)]
+        assert cache.size_bytes <= cache.max_bytes
+
+    def test_expired_buckets_purged_without_lookup(self):
+        """Test that expired entries are dropped in bulk on the next put."""
+        from gps_agents.genealogy_crawler.llm import IdempotencyCache
+        from gps_agents.genealogy_crawler.llm.idempotency import CachedResult
+
+        cache = IdempotencyCache(max_age=timedelta(hours=1))
+        old = datetime.now(UTC) - timedelta(hours=2)
+        for n in range(10):
+            cache._store(CachedResult(self._fp(n), "{}", old, "planner", str(n)))
+        cache.put(self._fp(99), self._output(99), "planner", "99")
+
+        assert list(cache.cache) == [str(self._fp(99))]
+        assert cache.stats_by_role["planner"].expirations == 10
+
+    def test_counters_per_role(self):
+        """Test hit/miss/eviction counters are tracked per LLM role."""
+        from gps_agents.genealogy_crawler.llm import IdempotencyCache
+
+        cache = IdempotencyCache(max_size=1)
+        cache.put(self._fp(1, "verifier"), self._output(1), "verifier", "1")
+        cache.get(self._fp(1, "verifier"))
+        cache.get(self._fp(2, "planner"))
+        cache.put(self._fp(3, "planner"), self._output(3), "planner", "3")
+
+        assert cache.stats_by_role["verifier"].hits == 1
+        assert cache.stats_by_role["verifier"].evictions == 1
+        assert cache.stats_by_role["planner"].misses == 1
+        assert cache.stats_by_role["verifier"].hit_rate == 1.0
+
+    def test_persistent_log_appends_and_replays(self, tmp_path: Path):
+        """Test that puts append records and a reopened cache sees the latest value."""
+        from gps_agents.genealogy_crawler.llm import PersistentIdempotencyCache
+
+        path = tmp_path / "cache.jsonl"
+        cache = PersistentIdempotencyCache(path, compact_min_records=10_000)
+        cache.put(self._fp(1), self._output(1), "planner", "1")
+        cache.put(self._fp(1), self._output(2), "planner", "1")
+        cache.put(self._fp(2), self._output(3), "planner", "2")
+        assert len(path.read_text().splitlines()) == 3
+
+        reopened = PersistentIdempotencyCache(path)
+        assert json.loads(reopened.get(self._fp(1)).output_json)["given_name"] == "p2"
+        assert len(reopened.cache) == 2
+
+        cache.close()
+        assert len(path.read_text().splitlines()) == 2
+
+    def test_background_compaction_keeps_concurrent_puts(self, tmp_path: Path):
+        """Test that records appended while compacting survive the log swap."""
+        from gps_agents.genealogy_crawler.llm import PersistentIdempotencyCache
+
+        path = tmp_path / "cache.jsonl"
+        cache = PersistentIdempotencyCache(path, max_size=20, compact_min_records=50)
+        for n in range(500):
+            cache.put(self._fp(n), self._output(n), "planner", str(n))
+        cache.close()
+
+        reopened = PersistentIdempotencyCache(path, max_size=20)
+        assert set(reopened.cache) == {str(self._fp(n)) for n in range(480, 500)}
+        assert len(path.read_text().splitlines()) == 20
+
+
+# =============================================================================
+# CrawlerState Queue Tests
+# =============================================================================
+
+
+class TestCrawlerStateQueues:
+    """Tests for the heap-backed CrawlerState queues."""
+
+    @staticmethod
+    def _clue(i: int, priority: float):
+        from gps_agents.genealogy_crawler.models import ClueItem, HypothesisType
+
+        return ClueItem(
+            hypothesis_type=next(iter(HypothesisType)),
+            hypothesis_text=f"clue {i}",
+            priority=priority,
+        )
+
+    def test_pop_order_matches_stable_sort(self):
+        """Test that pops follow the old sort-on-insert order, FIFO on ties."""
+        import random
+
+        from gps_agents.genealogy_crawler.models import CrawlerState
+
+        rng = random.Random(3)  # noqa: S311 - seeded test data
+        state = CrawlerState()
+        reference = []
+        for i in range(300):
+            clue = self._clue(i, rng.choice([0.1, 0.5, 0.5, 0.9]))
+            state.add_clue(clue)
+            reference.append(clue)
+            reference.sort(key=lambda x: x.priority, reverse=True)
+            if i % 7 == 0:
+                assert state.pop_clue() is reference.pop(0)
+
+        assert [c.hypothesis_text for c in state.clue_queue[:5]] == [c.hypothesis_text for c in reference[:5]]
+        assert list(state.clue_queue) == reference
+        assert [state.pop_clue() for _ in reference] == reference
+        assert state.pop_clue() is None
+
+    def test_serializes_as_list_in_pop_order(self):
+        """Test that a persisted state reloads with the same pop order."""
+        from gps_agents.genealogy_crawler.models import CrawlerState, FrontierItem
+
+        state = CrawlerState()
+        for i, priority in enumerate([0.2, 0.8, 0.2, 0.8, 0.5]):
+            state.add_to_frontier(FrontierItem(query_string=f"query {i}", priority=priority))
+
+        data = json.loads(state.model_dump_json())
+        assert [f["query_string"] for f in data["frontier_queue"]] == [
+            "query 1", "query 3", "query 4", "query 0", "query 2",
+        ]
+        restored = CrawlerState.model_validate(data)
+        assert restored.frontier_queue == state.frontier_queue
+        assert [restored.pop_frontier().query_string for _ in range(5)] == [
+            f["query_string"] for f in data["frontier_queue"]
+        ]
+        assert not restored.frontier_queue
+
+    def test_deep_copy_keeps_pop_order(self):
+        """Test that a deep-copied state pops the same items without warnings."""
+        import copy
+        import warnings
+
+        from gps_agents.genealogy_crawler.models import CrawlerState
+
+        state = CrawlerState()
+        for i, priority in enumerate([0.5, 0.9, 0.5]):
+            state.add_clue(self._clue(i, priority))
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            clone = state.model_copy(deep=True)
+            copied = copy.deepcopy(state)
+        clone.add_clue(self._clue(3, 0.5))
+
+        assert [c.hypothesis_text for c in copied.clue_queue] == ["clue 1", "clue 0", "clue 2"]
+        assert [clone.pop_clue().hypothesis_text for _ in range(4)] == ["clue 1", "clue 0", "clue 2", "clue 3"]
+        assert len(state.clue_queue) == 3
+
+
+# =============================================================================
+# Novelty Guard Tests
+# =============================================================================
+
+
+class TestNoveltyGuard:
+    """Tests for near-duplicate query detection in NoveltyGuard."""
+
+    def test_rephrased_query_is_not_novel(self):
+        """Test that reordered, abbreviated queries match an earlier one."""
+        from gps_agents.genealogy_crawler.models import NoveltyGuard, SourceTier
+
+        guard = NoveltyGuard()
+        guard.record_query("John Smith 1880 Ohio", SourceTier.TIER_0)
+
+        assert not guard.is_novel("Smith, John b. 1880 OH", SourceTier.TIER_0)
+        assert guard.find_duplicate("smith john 1880 ohio", SourceTier.TIER_0) == "1880 john ohio smith"
+        assert guard.is_novel("Smith, John b. 1880 OH", SourceTier.TIER_1)
+        assert guard.is_novel("John Smith 1881 Ohio", SourceTier.TIER_0)
+        assert guard.is_novel("Mary Smith 1880 Ohio", SourceTier.TIER_0)
+
+    def test_place_scoped_query_stays_novel(self):
+        """Test that postal codes read as qualifiers or fillers are not dropped."""
+        from gps_agents.genealogy_crawler.models import NoveltyGuard, SourceTier
+        from gps_agents.genealogy_crawler.novelty import canonicalize_query
+
+        guard = NoveltyGuard()
+        guard.record_query("John Smith 1880", SourceTier.TIER_0)
+        guard.record_query("Mary Smith b. 1880", SourceTier.TIER_0)
+
+        assert guard.is_novel("John Smith 1880 CA", SourceTier.TIER_0)
+        assert guard.is_novel("John Smith 1880 CO", SourceTier.TIER_0)
+        assert guard.is_novel("Mary Smith b. 1880 IN", SourceTier.TIER_0)
+        assert not guard.is_novel("Mary Smith born 1880", SourceTier.TIER_0)
+        assert canonicalize_query("John Smith born in Ohio c. 1850") == "1850 john ohio smith"
+        assert canonicalize_query("John Smith Calif") == canonicalize_query("John Smith California")
+
+    def test_long_query_within_threshold(self):
+        """Test that a one-letter typo in a long query counts as a duplicate."""
+        from gps_agents.genealogy_crawler.novelty import QueryLSH
+
+        index = QueryLSH(threshold=0.85)
+        index.add("Elizabeth Margaret Sorrell 1852 Greene County Virginia probate", 0)
+
+        assert index.find_similar("Elizabeth Margaret Sorell 1852 Greene County Virginia probate", 0)
+        assert index.find_similar("Elizabeth Margaret Sorrell 1852 Greene County Virginia", 0) is None
+
+    def test_capacity_forgets_oldest(self):
+        """Test that queries past the capacity are forgotten oldest first."""
+        from gps_agents.genealogy_crawler.novelty import QueryLSH
+
+        index = QueryLSH(capacity=100, merge_min=10)
+        for i in range(250):
+            index.add(f"person{i} census {1800 + i}", 0)
+
+        assert len(index) == 100
+        assert index.find_similar("person10 census 1810", 0) is None
+        assert index.find_similar("census person249 2049", 0) == "2049 census person249"
+
+    def test_index_round_trips_through_storage(self, tmp_path: Path):
+        """Test that CrawlerStorage persists the history and index together."""
+        from gps_agents.genealogy_crawler.models import NoveltyGuard, SourceTier
+        from gps_agents.genealogy_crawler.storage import CrawlerStorage
+
+        storage = CrawlerStorage(tmp_path / "crawler.db")
+        guard = NoveltyGuard()
+        for i in range(50):
+            guard.record_query(f"John Smith {1800 + i} Ohio", SourceTier.TIER_0)
+        storage.save_novelty_guard(guard)
+
+        restored = storage.load_novelty_guard()
+        assert restored._index is not None  # reused, not rebuilt
+        assert len(restored.query_history) == 50
+        assert not restored.is_novel("Smith, John b. 1820 OH", SourceTier.TIER_0)
+
+        # Queries recorded after the index was last written are added to it
+        guard.record_query("Mary Jones 1850 Texas", SourceTier.TIER_1)
+        storage.save_novelty_guard(guard)
+        assert storage._get_connection().execute("SELECT query_count FROM query_index").fetchone()[0] == 50
+        reloaded = storage.load_novelty_guard()
+        assert len(reloaded.query_history) == 51
+        assert not reloaded.is_novel("Jones, Mary TX 1850", SourceTier.TIER_1)
+        storage.close()
+
+
+# =============================================================================
+# Incremental Checkpoint Tests
+# =============================================================================
+
+
+class TestIncrementalCheckpoints:
+    """Tests for dirty-tracking CrawlerStorage.save_state checkpoints."""
+
+    @staticmethod
+    def _populated_state():
+        from gps_agents.genealogy_crawler.models import (
+            AuditActionType,
+            ClueItem,
+            CrawlerState,
+            FrontierItem,
+            HypothesisType,
+            Person,
+            RevisitItem,
+            SourceRecord,
+            SourceTier,
+        )
+
+        state = CrawlerState(iteration_count=3)
+        for i in range(20):
+            person = Person(canonical_name=f"Person {i}", surname="Smith")
+            state.add_person(person)
+            state.log_audit(AuditActionType.CREATE, person.id, "person", "test")
+        record = SourceRecord(url="https://example.org/1", source_name="ex", source_tier=SourceTier.TIER_0)
+        state.source_records[str(record.id)] = record
+        for i, priority in enumerate([0.2, 0.8, 0.2, 0.8, 0.5]):
+            state.add_to_frontier(FrontierItem(
+                query_string=f"query {i}", priority=priority, source_tiers=[SourceTier.TIER_1],
+            ))
+        state.add_clue(ClueItem(
+            hypothesis_type=HypothesisType.NAME_VARIANT, hypothesis_text="Smyth", suggested_queries=["Smyth"],
+        ))
+        state.add_revisit(RevisitItem(
+            original_source_id=record.id, original_query="Smith", improved_query="Smith 1880",
+            revisit_reason="new date",
+        ))
+        state.novelty_guard.record_query("John Smith 1880 Ohio", SourceTier.TIER_0)
+        return state
+
+    def test_load_restores_everything(self, tmp_path: Path):
+        """Test that load_state restores persons, logs, queues and history in full."""
+        from gps_agents.genealogy_crawler.models import SourceTier
+        from gps_agents.genealogy_crawler.storage import CrawlerStorage
+
+        storage = CrawlerStorage(tmp_path / "crawler.db")
+        state = self._populated_state()
+        state.pop_frontier()
+        storage.save_state(state)
+
+        loaded = storage.load_state(state.session_id)
+        assert loaded.iteration_count == 3
+        assert set(loaded.persons) == set(state.persons)
+        assert set(loaded.source_records) == set(state.source_records)
+        assert [log.id for log in loaded.audit_log] == [log.id for log in state.audit_log]
+        assert [item.query_string for item in loaded.frontier_queue] == ["query 3", "query 4", "query 0", "query 2"]
+        assert loaded.frontier_queue[0].source_tiers == [SourceTier.TIER_1]
+        assert loaded.clue_queue[0].suggested_queries == ["Smyth"]
+        assert loaded.revisit_queue[0].improved_query == "Smith 1880"
+        assert not loaded.novelty_guard.is_novel("Smith, John b. 1880 OH", SourceTier.TIER_0)
+        # Nothing is dirty straight after a load
+        assert loaded.persons.changes() == ({}, set())
+        assert loaded.frontier_queue.changes() == ([], set())
+        assert loaded.unsaved_audit_log() == []
+        storage.close()
+
+    def test_checkpoint_writes_only_changes(self, tmp_path: Path):
+        """Test that a checkpoint writes only what changed since the last one."""
+        from gps_agents.genealogy_crawler.models import FrontierItem
+        from gps_agents.genealogy_crawler.storage import CrawlerStorage
+
+        storage = CrawlerStorage(tmp_path / "crawler.db")
+        state = self._populated_state()
+        storage.save_state(state)
+
+        statements: list[str] = []
+        conn = storage._get_connection()
+        conn.set_trace_callback(statements.append)
+        person = next(iter(state.persons.values()))
+        person.canonical_name = "Renamed"
+        state.touch_person(person)
+        del state.persons[str(list(state.persons)[1])]
+        popped = state.pop_frontier()
+        state.add_to_frontier(FrontierItem(query_string="new query"))
+        storage.save_state(state)
+        conn.set_trace_callback(None)
+
+        writes = [s.split()[0] for s in statements if s.split()[0] in ("INSERT", "DELETE")]
+        assert writes.count("INSERT") == 3  # session, renamed person, pushed item
+        assert writes.count("DELETE") == 2  # deleted person, popped item
+        assert sum(s.startswith("COMMIT") for s in statements) == 1
+
+        loaded = storage.load_state(state.session_id)
+        assert loaded.persons[str(person.id)].canonical_name == "Renamed"
+        assert len(loaded.persons) == 19
+        assert popped.id not in {item.id for item in loaded.frontier_queue}
+        assert [item.query_string for item in loaded.frontier_queue] == [
+            item.query_string for item in state.frontier_queue
+        ]
+        storage.close()
+
+    def test_failed_checkpoint_keeps_changes(self, tmp_path: Path):
+        """Test that changes stay pending if the checkpoint transaction fails."""
+        import sqlite3
+
+        from gps_agents.genealogy_crawler.models import CrawlerState, Person
+        from gps_agents.genealogy_crawler.storage import CrawlerStorage
+
+        storage = CrawlerStorage(tmp_path / "crawler.db")
+        state = CrawlerState()
+        state.add_person(Person(canonical_name="Kept"))
+        storage._get_connection().execute("DROP TABLE audit_log")
+        with pytest.raises(sqlite3.OperationalError):
+            storage.save_state(state)
+        assert len(state.persons.changes()[0]) == 1
+        assert storage.list_persons() == []
+        storage.close()
+
+    def test_load_is_not_capped(self, tmp_path: Path):
+        """Test that load_state returns more than the old 10,000 person cap."""
+        from gps_agents.genealogy_crawler.models import CrawlerState, Person
+        from gps_agents.genealogy_crawler.storage import CrawlerStorage
+
+        storage = CrawlerStorage(tmp_path / "crawler.db")
+        state = CrawlerState()
+        for i in range(10_050):
+            state.add_person(Person(canonical_name=f"Person {i}"))
+        storage.save_state(state)
+        assert len(storage.load_state(state.session_id).persons) == 10_050
+        storage.close()
@@ -0,0 +1,214 @@
+"""Tests for the shared HTTP response cache."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING
+
+import pytest
+
+from gps_agents.http_cache import CacheConfig, ResponseStore
+from gps_agents.net import GUARDS, report_status, shared_client
+from gps_agents.sources.base import BaseSource
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class _ETagHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    wbufsize = 1 << 16
+
+    def do_GET(self) -> None:
+        server = self.server
+        server.requests.append(dict(self.headers))
+        if self.path == "/no-store":
+            self._send(200, b"secret", {"Cache-Control": "no-store"})
+        elif self.path == "/gzip":
+            # Compressed like most real servers once Accept-Encoding allows it
+            body = gzip.compress(b'{"surname": "Smith"}')
+            self._send(200, body, {"Content-Encoding": "gzip", "Content-Type": "application/json"})
+        elif self.headers.get("If-None-Match") == '"v1"':
+            self._send(304, b"", {"ETag": '"v1"'})
+        else:
+            self._send(200, b"<html>" + b"Smith " * 500 + b"</html>", {"ETag": '"v1"'})
+
+    def _send(self, status: int, body: bytes, headers: dict[str, str]) -> None:
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+class _JSONSource(BaseSource):
+    name = "cachedsource"
+
+    async def search(self, query):
+        return []
+
+    async def get_record(self, record_id):
+        return None
+
+    def requires_auth(self) -> bool:
+        return False
+
+
+@pytest.fixture
+def etag_server():
+    """Local server that answers If-None-Match with 304."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ETagHandler)
+    server.daemon_threads = True
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def store(tmp_path: Path, monkeypatch):
+    """A fresh response store installed as the global cache."""
+    store = ResponseStore(CacheConfig(path=tmp_path / "responses.db"))
+    monkeypatch.setattr("gps_agents.net.CACHE", store)
+    yield store
+    store.close()
+
+
+def _url(server: ThreadingHTTPServer, path: str = "/search") -> str:
+    return f"http://127.0.0.1:{server.server_port}{path}"
+
+
+class TestResponseStore:
+    """Tests for the SQLite response store."""
+
+    def test_round_trip_and_dedup(self, tmp_path: Path):
+        """Test that identical bodies under different keys are stored once."""
+        store = ResponseStore(CacheConfig(path=tmp_path / "r.db"))
+        body = b"no records found " * 100
+        store.put("a", body, headers=[("content-type", "text/html")], etag='"x"', ttl=60)
+        store.put("b", body, ttl=60)
+
+        entry = store.get("a")
+        assert entry.body == body
+        assert entry.headers == [("content-type", "text/html")]
+        assert entry.etag == '"x"'
+        assert entry.is_fresh()
+        assert store._connect().execute("SELECT COUNT(*) FROM bodies").fetchone()[0] == 1
+        assert store.total_bytes() < len(body)
+
+        store.delete("a")
+        assert store.get("a") is None
+        assert store.get("b").body == body
+
+    def test_lru_eviction(self, tmp_path: Path):
+        """Test that least recently used entries go first once over budget."""
+        store = ResponseStore(CacheConfig(path=tmp_path / "r.db", max_bytes=10_000))
+        for i in range(3):
+            store.put(f"k{i}", os.urandom(3000))
+        store.get("k0")  # k1 is now the least recently used
+        store.put("k3", os.urandom(3000))
+
+        assert store.get("k1") is None
+        assert all(store.get(k) is not None for k in ("k0", "k2", "k3"))
+        assert store.total_bytes() <= 10_000
+
+    def test_per_source_ttl(self, monkeypatch):
+        """Test CACHE_<SOURCE>_TTL overrides the default."""
+        monkeypatch.setenv("CACHE_FIND_A_GRAVE_TTL", "120")
+        config = CacheConfig(default_ttl=10)
+        assert config.ttl_for("find-a-grave") == 120
+        assert config.ttl_for("wikitree") == 10
+
+
+class TestCachingTransport:
+    """Tests for cached GETs through shared_client(source=...)."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_hit_skips_network(self, etag_server, store):
+        """Test that a repeated GET is served from the cache."""
+        async with shared_client("findagrave", timeout=5) as client:
+            first = await client.get(_url(etag_server))
+            second = await client.get(_url(etag_server))
+
+        assert second.text == first.text
+        assert second.extensions.get("from_cache") is True
+        assert len(etag_server.requests) == 1
+        stats = store.stats["findagrave"]
+        assert (stats.misses, stats.hits, stats.stored) == (1, 1, 1)
+        assert stats.bytes_saved == len(first.content)
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_revalidates(self, etag_server, store, monkeypatch):
+        """Test that a stale entry is revalidated with If-None-Match."""
+        monkeypatch.setenv("CACHE_ROOTSWEB_TTL", "0")
+        async with shared_client("rootsweb", timeout=5) as client:
+            first = await client.get(_url(etag_server))
+            second = await client.get(_url(etag_server))
+
+        assert second.status_code == 200
+        assert second.text == first.text
+        assert etag_server.requests[1]["If-None-Match"] == '"v1"'
+        assert store.stats["rootsweb"].revalidated == 1
+        assert store.stats["rootsweb"].hit_rate == 0.5
+
+    @pytest.mark.asyncio
+    async def test_no_store_and_bypass(self, etag_server, store):
+        """Test that no-store responses and opted-out requests are not cached."""
+        async with shared_client("ssdi", timeout=5) as client:
+            await client.get(_url(etag_server, "/no-store"))
+            await client.get(_url(etag_server, "/no-store"))
+            await client.get(_url(etag_server), extensions={"cache": False})
+
+        assert len(etag_server.requests) == 3
+        assert store.stats["ssdi"].stored == 0
+
+    @pytest.mark.asyncio
+    async def test_broken_cache_falls_back_to_network(self, etag_server, tmp_path, monkeypatch):
+        """Test that an unusable cache location does not fail requests."""
+        (tmp_path / "file").write_text("not a directory")
+        broken = ResponseStore(CacheConfig(path=tmp_path / "file" / "responses.db"))
+        monkeypatch.setattr("gps_agents.net.CACHE", broken)
+
+        async with shared_client("usgenweb", timeout=5) as client:
+            resp = await client.get(_url(etag_server))
+
+        assert resp.status_code == 200
+        assert len(etag_server.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_gzip_response_decoded_once(self, etag_server, store):
+        """Test that a gzip-encoded page reads the same fetched and cached."""
+        async with shared_client("findagrave", timeout=5) as client:
+            first = await client.get(_url(etag_server, "/gzip"))
+            second = await client.get(_url(etag_server, "/gzip"))
+
+        assert first.json() == second.json() == {"surname": "Smith"}
+        assert second.extensions.get("from_cache") is True
+        assert "content-encoding" not in second.headers
+        assert len(etag_server.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_fresh_hit_skips_rate_limit(self, etag_server, store, monkeypatch):
+        """Test that a source request served from the cache takes no rate-limit token."""
+        monkeypatch.setattr(GUARDS, "_limiters", {})
+        monkeypatch.setenv("RATE_CACHEDSOURCE_MAX", "1")
+        monkeypatch.setenv("RATE_CACHEDSOURCE_WINDOW", "60")
+        monkeypatch.setenv("RATE_CACHEDSOURCE_MIN_INTERVAL", "60")
+
+        async with _JSONSource() as source:
+            for _ in range(3):
+                data = await asyncio.wait_for(source._make_request(_url(etag_server, "/gzip")), 5)
+                assert data == {"surname": "Smith"}
+
+        assert len(etag_server.requests) == 1
+        assert report_status()["cachedsource"]["queue_delay_ms"]["count"] == 1
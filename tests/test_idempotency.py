@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import os
 import shutil
 import sqlite3
@@ -15,7 +16,7 @@ from gps_agents.gramps.upsert import upsert_event, upsert_person, upsert_source,
 from gps_agents.idempotency.exceptions import IdempotencyBlock
 from gps_agents.media.store import save_media_bytes
 from gps_agents.projections.sqlite_projection import SQLiteProjection
-from gps_agents.wikidata.idempotency import ensure_statement
+from gps_agents.wikidata.idempotency import ensure_statement, ensure_statements
 from gps_agents.git_utils import safe_commit
 
 
@@ -284,6 +285,129 @@ def test_wikidata_equivalence_order_independent():
     assert len(wd.claims) == 1
 
 
+class CountingWD:
+    """Stub Wikidata client recording every call."""
+
+    def __init__(self, claims: list[dict] | None = None, *, entity_fetch: bool = True, fail_after: int | None = None):
+        self.claims = list(claims or [])
+        self.calls: list[str] = []
+        self.fail_after = fail_after
+        if not entity_fetch:
+            self.get_entity_claims = None
+
+    def get_claims(self, entity_id: str, property_id: str) -> list[dict[str, Any]]:
+        self.calls.append(f"get_claims:{property_id}")
+        return [c for c in self.claims if c["property"].upper() == property_id.upper()]
+
+    def get_entity_claims(self, entity_id: str) -> list[dict[str, Any]]:
+        self.calls.append("get_entity_claims")
+        return list(self.claims)
+
+    def add_claim(self, entity_id: str, property_id: str, value, qualifiers, references) -> str:
+        if self.fail_after is not None and len(self.claims) >= self.fail_after:
+            raise RuntimeError("edit rejected")
+        self.calls.append("add_claim")
+        guid = f"{entity_id}${len(self.claims) + 1}"
+        self.claims.append({"id": guid, "property": property_id, "value": value, "qualifiers": qualifiers, "references": references})
+        return guid
+
+
+def _payload_claims(n: int) -> list[dict]:
+    return [
+        {"property": f"P{1000 + i % 8}", "value": f"value-{i}", "references": [{"P248": "Q999"}, {"P854": f"https://example.org/{i}"}]}
+        for i in range(n)
+    ]
+
+
+def test_wikidata_ensure_statements_one_fetch_per_entity(env_tmp: Path):
+    existing = [
+        {"id": f"Q5$old{i}", "property": c["property"].lower(), "value": c["value"], "references": list(reversed(c["references"]))}
+        for i, c in enumerate(_payload_claims(10))
+    ]
+    wd = CountingWD(existing)
+    proj = SQLiteProjection(str(env_tmp / "proj.sqlite"))
+    claims = _payload_claims(40)
+    claims.append(dict(claims[-1]))  # duplicate in the payload is added once
+
+    guids = ensure_statements(wd, "Q5", claims, projection=proj)
+
+    assert wd.calls.count("get_entity_claims") == 1
+    assert wd.calls.count("add_claim") == 30
+    assert guids[:10] == [f"Q5$old{i}" for i in range(10)]
+    assert guids[-1] == guids[-2]
+    assert len(set(guids)) == 40
+
+    wd.calls.clear()
+    assert ensure_statements(wd, "Q5", claims, projection=proj) == guids
+    assert wd.calls == []
+
+
+def test_wikidata_ensure_statements_matches_single_path():
+    claims = _payload_claims(12)
+    single, bulk = CountingWD(), CountingWD(entity_fetch=False)
+    single_guids = [
+        ensure_statement(single, "Q7", c["property"], c["value"], references=c["references"], cache={})
+        for c in claims
+    ]
+    bulk_guids = ensure_statements(bulk, "Q7", claims, cache={})
+
+    assert bulk_guids == single_guids
+    assert single.calls.count("get_claims:P1000") == 2
+    assert [c for c in bulk.calls if c.startswith("get_claims")] == [f"get_claims:P{1000 + i}" for i in range(8)]
+
+
+def test_wikidata_ensure_statements_records_partial_writes():
+    wd = CountingWD(fail_after=3)
+    cache: dict[str, str] = {}
+    with pytest.raises(RuntimeError):
+        ensure_statements(wd, "Q9", _payload_claims(5), cache=cache)
+    assert len(cache) == 3
+
+    wd.fail_after = None
+    ensure_statements(wd, "Q9", _payload_claims(5), cache=cache)
+    assert len(wd.claims) == 5
+
+
+def test_wikidata_ensure_statements_records_partial_batch_writes(env_tmp: Path):
+    class BatchWD(CountingWD):
+        def add_claims(self, entity_id: str, claims: list[dict], created: list[str]) -> list[str]:
+            self.calls.append("add_claims")
+            for c in claims:
+                created.append(self.add_claim(entity_id, c["property"], c["value"], {}, c.get("references") or []))
+            return created
+
+    wd = BatchWD(fail_after=3)
+    proj = SQLiteProjection(str(env_tmp / "proj.sqlite"))
+    claims = _payload_claims(5)
+    with pytest.raises(RuntimeError, match="edit rejected"):
+        ensure_statements(wd, "Q9", claims, projection=proj)
+    conn = sqlite3.connect(env_tmp / "proj.sqlite")
+    assert conn.execute("SELECT COUNT(*) FROM wikidata_statement_cache").fetchone()[0] == 3
+    conn.close()
+
+    wd.fail_after = None
+    guids = ensure_statements(wd, "Q9", claims, projection=proj)
+    assert len(wd.claims) == 5
+    assert guids == [c["id"] for c in wd.claims]
+
+
+def test_apply_wikidata_from_bundle_batches_claims(env_tmp: Path, monkeypatch):
+    from gps_agents.wiki import apply as wiki_apply
+
+    wd = CountingWD()
+    monkeypatch.setattr(wiki_apply, "_get_wikidata_client", lambda: wd)
+    (env_tmp / "wikidata_payload.json").write_text(json.dumps({"entity": "Q42", "claims": _payload_claims(40)}))
+    proj = SQLiteProjection(str(env_tmp / "proj.sqlite"))
+
+    entries = wiki_apply.apply_wikidata_from_bundle(env_tmp, projection=proj)
+
+    assert [e["action"] for e in entries] == ["ensured"] * 40
+    assert wd.calls.count("get_entity_claims") == 1
+    conn = sqlite3.connect(env_tmp / "proj.sqlite")
+    assert conn.execute("SELECT COUNT(*) FROM wikidata_statement_cache").fetchone()[0] == 40
+    conn.close()
+
+
 # ---------------------- Property tests ------------------------
 
 def test_person_fingerprint_stable_under_whitespace_and_case():
@@ -360,6 +484,248 @@ def test_decide_upsert_citation_relationship(env_tmp: Path):
     dr = decide_upsert_relationship(gc, proj, "spouse", "H1", "W1")
     assert dr.action == "create"
 
+def _random_person(rng) -> Person:
+    from gps_agents.gramps.models import Place
+
+    def event(kind: EventType) -> Event | None:
+        if rng.random() < 0.3:
+            return None
+        year = rng.choice([None, *range(1845, 1856)])
+        place = rng.choice([None, Place(name="Boston"), Place(city="boston"), Place(name="Salem")])
+        return Event(event_type=kind, date=GrampsDate(year=year) if year else None, place=place)
+
+    given = rng.choice(["John", "Jon", "Jack", "Mary", "Marie", "Polly", "Bill", "Liam", ""])
+    surname = rng.choice(["Smith", "Smyth", "Smithson", "Schmidt", "Jones", "Johnson", "", "O'Neil"])
+    return Person(
+        names=[Name(given=given, surname=surname)] if rng.random() < 0.95 else [],
+        sex=rng.choice("MFU"),
+        birth=event(EventType.BIRTH),
+        death=event(EventType.DEATH),
+    )
+
+
+@pytest.mark.parametrize("person_index", [True, False])
+def test_decide_upsert_batch_matches_single_decisions(env_tmp: Path, monkeypatch, person_index: bool):
+    import random
+
+    from gps_agents.gramps.merge import PersonMatcher
+    from gps_agents.idempotency.decision import decide_upsert_batch, decide_upsert_person
+
+    rng = random.Random(11)  # noqa: S311 - seeded test data
+    db = make_gramps_db(env_tmp)
+    gc = GrampsClient(db, person_index=person_index)
+    gc.connect(db)
+    with gc.bulk_writer() as writer:
+        for _ in range(400):
+            writer.add_person(_random_person(rng))
+    proj = SQLiteProjection(env_tmp / "proj.sqlite")
+    probes = [_random_person(rng) for _ in range(120)]
+    # Small candidate cap so the nearest-birth-year cut is exercised
+    monkeypatch.setattr(PersonMatcher, "MAX_CANDIDATES", 40)
+
+    single = [decide_upsert_person(gc, proj, p) for p in probes]
+    batch = decide_upsert_batch(gc, proj, [("person", p) for p in probes])
+
+    assert batch == single
+    assert {d.action for d in single} >= {"create", "merge"}
+
+
+def test_decide_upsert_batch_resolves_fingerprints_in_one_query(env_tmp: Path, monkeypatch):
+    from gps_agents.gramps.models import Citation, Place
+    from gps_agents.idempotency.decision import decide_upsert_batch
+    from gps_agents.idempotency.fingerprint import fingerprint_person
+
+    db = make_gramps_db(env_tmp)
+    gc = GrampsClient(db)
+    gc.connect(db)
+    proj = SQLiteProjection(env_tmp / "proj.sqlite")
+    known = Person(names=[Name(given="Ann", surname="Durham")])
+    proj.save_fingerprint("person", fingerprint_person(known).value, "H1")
+
+    def single_lookup(_fp):
+        raise AssertionError("per-entity fingerprint lookup")
+
+    monkeypatch.setattr(proj, "get_gramps_handle_by_fingerprint", single_lookup)
+    decisions = decide_upsert_batch(gc, proj, [
+        ("person", known),
+        ("person", Person(names=[Name(given="Eli", surname="Vincent")])),
+        ("event", Event(event_type=EventType.BIRTH, date=GrampsDate(year=1850))),
+        ("place", Place(name="Boston")),
+        ("citation", Citation(source_id="S1", page="12")),
+        ("relationship", ("spouse", "H1", "H2", None)),
+    ])
+
+    assert [d.action for d in decisions] == ["reuse", "create", "create", "create", "create", "create"]
+    assert decisions[0].existing_handle == "H1"
+    with pytest.raises(ValueError, match="Unknown entity"):
+        decide_upsert_batch(gc, proj, [("family", None)])
+
+
+def test_cli_plan_batch_output_validates(env_tmp: Path, monkeypatch):
+    from typer.testing import CliRunner
+
+    from gps_agents.cli import app
+
+    # plan batch reads schemas/ relative to the working directory
+    monkeypatch.chdir(Path(__file__).resolve().parents[1])
+
+    entities = [
+        {"entity": "event", "type": "birth", "year": 1850},
+        {"entity": "source", "title": "1850 Census"},
+        {"entity": "relationship", "kind": "spouse", "a": "H1", "b": "H2"},
+    ]
+    (env_tmp / "in.json").write_text(json.dumps(entities))
+    result = CliRunner().invoke(
+        app, ["plan", "batch", "--input", str(env_tmp / "in.json")], env={"DATA_DIR": str(env_tmp)}
+    )
+
+    assert result.exit_code == 0, result.output
+    assert [d["action"] for d in json.loads(result.output)] == ["create"] * 3
+
+
+# ---------------------- Person index tests ----------------------
+
+def _write_person_row(db: Path, handle: str, given: str, surname: str, birth_year: int | None = None) -> None:
+    """Insert or replace a person row the way Gramps would, bypassing GrampsClient."""
+    data: dict[str, Any] = {
+        "gramps_id": handle.upper(),
+        "primary_name": {"first_name": given, "surname_list": [{"surname": surname}]},
+    }
+    if birth_year:
+        data["birth"] = {"date": {"year": birth_year}}
+    with sqlite3.connect(db) as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO person (handle, gramps_id, blob_data) VALUES (?, ?, ?)",
+            (handle, handle.upper(), json.dumps(data).encode()),
+        )
+
+
+def test_find_matches_phonetic_recall_beyond_first_rows(env_tmp: Path):
+    from gps_agents.gramps.merge import PersonMatcher
+
+    db = make_gramps_db(env_tmp)
+    for i in range(150):
+        _write_person_row(db, f"h{i:04d}", "Mary", f"Other{i}")
+    _write_person_row(db, "smyth", "John", "Smyth", 1850)
+    _write_person_row(db, "smithson", "John", "Smithson", 1850)
+    _write_person_row(db, "jones", "John", "Jones", 1850)
+    gc = GrampsClient(db)
+    gc.connect(db)
+
+    person = Person(names=[Name(given="John", surname="Smith")], birth=Event(event_type=EventType.BIRTH, date=GrampsDate(year=1850)))
+    candidates = gc.find_match_candidates("Smith", birth_year=1850)
+    matches = PersonMatcher(gc).find_matches(person, threshold=0)
+
+    assert {c.gramps_id for c in candidates} == {"SMYTH", "SMITHSON"}
+    assert matches[0].matched_person.gramps_id == "SMYTH"
+    assert (env_tmp / "gramps.person_index.sqlite").exists()
+
+
+def test_person_index_tracks_external_writes(env_tmp: Path):
+    db = make_gramps_db(env_tmp)
+    gc = GrampsClient(db)
+    gc.connect(db)
+    handle = gc.add_person(Person(names=[Name(given="Ann", surname="Tregeagle")]))
+    assert [p.primary_name.surname for p in gc.find_persons(surname="geag")] == ["Tregeagle"]
+    gc.close()
+
+    # Edited, added and deleted outside the client, e.g. in Gramps itself
+    _write_person_row(db, handle, "Ann", "Tregeagle-Vincent")
+    _write_person_row(db, "new", "Ellen", "Durham")
+    gc.connect(db)
+    assert [p.primary_name.surname for p in gc.find_persons(surname="vincent")] == ["Tregeagle-Vincent"]
+    assert len(gc.find_persons(given="ellen")) == 1
+    gc.close()
+
+    with sqlite3.connect(db) as conn:
+        conn.execute("DELETE FROM person WHERE handle = 'new'")
+    gc.connect(db)
+    assert gc.find_persons(given="ellen") == []
+
+
+def test_person_index_matches_table_scan(env_tmp: Path):
+    db = make_gramps_db(env_tmp)
+    names = [("John", "Smith", 1850), ("Jon", "Smyth", 1852), ("Mary", "Smithers", None),
+             ("Sarah", "Schmidt", 1849), ("", "Vincent", 1901), ("Liam", "", None)]
+    for i, (given, surname, year) in enumerate(names):
+        _write_person_row(db, f"h{i}", given, surname, year)
+    indexed = GrampsClient(db)
+    indexed.connect(db)
+    scan = GrampsClient(db, person_index=False)
+    scan.connect(db)
+
+    for surname, given in [("smi", None), (None, "j"), ("SMITH", "john"), ("x", None)]:
+        assert indexed.find_persons(surname, given) == scan.find_persons(surname, given)
+    for surname, given, year in [("Smith", "", 1851), ("Smith", "", None), ("", "William", None), ("Vincent", "", 1900)]:
+        assert indexed.find_match_candidates(surname, given, year) == scan.find_match_candidates(surname, given, year)
+
+
+def test_bulk_writer_allocates_ids_once_and_commits_together(env_tmp: Path):
+    from gps_agents.gramps.models import Citation, Family
+
+    db = make_gramps_db(env_tmp)
+    gc = GrampsClient(db)
+    gc.connect(db)
+    gc.add_person(Person(names=[Name(given="Ann", surname="Durham")]))
+    queries: list[str] = []
+    gc._conn.set_trace_callback(queries.append)
+
+    with gc.bulk_writer(batch_size=3) as writer:
+        father = writer.add_person(Person(names=[Name(given="John", surname="Smith")]))
+        writer.add_person(Person(gramps_id="I40", names=[Name(given="Mary", surname="Smyth")]))
+        child = writer.add_person(Person(names=[Name(given="Liam", surname="Smith")],
+                                         birth=Event(event_type=EventType.BIRTH, date=GrampsDate(year=1850))))
+        family = writer.add_family(Family(husband_id=father, child_ids=[child]))
+        source = writer.add_source(Source(title="1850 Census"))
+        writer.add_citation(Citation(source_id=source, page="p. 12"))
+        writer.add_event(Event(event_type=EventType.BIRTH, date=GrampsDate(year=1850)))
+    gc._conn.set_trace_callback(None)
+
+    with sqlite3.connect(db) as conn:
+        ids = [r[0] for r in conn.execute("SELECT gramps_id FROM person ORDER BY rowid")]
+    assert ids == ["I1", "I2", "I40", "I41"]
+    assert writer.counts == {"person": 3, "family": 1, "event": 1, "source": 1, "citation": 1}
+    assert sum("MAX(CAST" in q for q in queries) == 5
+    assert sum(q == "COMMIT" for q in queries) == 1
+    assert gc.get_family(family).child_ids == [child]
+    assert [p.gramps_id for p in gc.find_match_candidates("Smith", birth_year=1850)][:2] == ["I41", "I2"]
+
+
+def test_bulk_writer_rolls_back_on_error(env_tmp: Path):
+    db = make_gramps_db(env_tmp)
+    gc = GrampsClient(db)
+    gc.connect(db)
+
+    def load() -> None:
+        with gc.bulk_writer(batch_size=2) as writer:
+            for i in range(5):
+                writer.add_person(Person(names=[Name(given=f"P{i}", surname="Rollback")]))
+            raise ValueError("bad record")
+
+    with pytest.raises(ValueError, match="bad record"):
+        load()
+
+    assert gc.get_statistics()["person"] == 0
+    assert gc.find_persons(surname="rollback") == []
+
+
+def test_bulk_writer_fingerprints_reused_by_upsert(env_tmp: Path):
+    db = make_gramps_db(env_tmp)
+    gc = GrampsClient(db)
+    gc.connect(db)
+    proj = SQLiteProjection(env_tmp / "proj.sqlite")
+    person = Person(names=[Name(given="John", surname="Doe")])
+    event = Event(event_type=EventType.BIRTH, date=GrampsDate(year=1850))
+
+    with gc.bulk_writer(projection=proj) as writer:
+        person_handle = writer.add_person(person)
+        event_handle = writer.add_event(event)
+
+    assert upsert_person(gc, proj, person).handle == person_handle
+    assert upsert_event(gc, proj, event).handle == event_handle
+    assert gc.get_statistics()["person"] == 1
+
+
 # ---------------------- Concurrency tests ----------------------
 
 def test_upsert_person_parallel_no_duplicates(env_tmp: Path):
@@ -129,3 +129,215 @@ class TestFactLedger:
         """Test getting a fact that doesn't exist."""
         result = temp_ledger.get(uuid4())
         assert result is None
+
+
+class TestSegmentedFallback:
+    """Tests for the segmented, mmap-indexed file fallback."""
+
+    @staticmethod
+    def _fact(i: int, **updates) -> Fact:
+        fact = Fact(
+            statement=f"Fact {i}",
+            provenance=Provenance(created_by=ProvenanceSource.RESEARCH_AGENT),
+        )
+        return fact.model_copy(update=updates) if updates else fact
+
+    def test_reopen_with_tail_and_after_merge(self, tmp_path: Path):
+        """Test lookups from the unsorted tail, the sorted index and both."""
+        from gps_agents.ledger.segment_store import SegmentStore
+
+        ledger = FactLedger(tmp_path, enforce_privacy=False)
+        ledger._store.merge_min_records = 4
+        ledger._store.merge_ratio = 10.0
+        facts = [self._fact(i) for i in range(6)]
+        for fact in facts:
+            ledger.append(fact)
+        ledger.append(facts[0].model_copy(update={"version": 2, "status": FactStatus.ACCEPTED}))
+        # Simulate a crash: no close(), so the tail is still unmerged
+        ledger._store._active_file.flush()
+
+        reopened = FactLedger(tmp_path, enforce_privacy=False)
+        assert reopened._store._sorted_count == 4
+        assert reopened._store._tail_count == 3
+        assert reopened.get(facts[0].fact_id).status == FactStatus.ACCEPTED
+        assert reopened.get_latest_version(facts[0].fact_id) == 2
+        assert [f.version for f in reopened.get_all_versions(facts[0].fact_id)] == [1, 2]
+        assert {f.fact_id for f in reopened.iter_all_facts()} == {f.fact_id for f in facts}
+        reopened.close()
+
+        store = SegmentStore(tmp_path)
+        assert store._tail_count == 0
+        assert store.latest_version(facts[5].fact_id) == 1
+        store.close()
+
+    def test_segments_rotate_by_size(self, tmp_path: Path):
+        """Test that records spread over size-limited segments stay readable."""
+        ledger = FactLedger(tmp_path, enforce_privacy=False, segment_max_bytes=2048)
+        facts = [self._fact(i) for i in range(20)]
+        for fact in facts:
+            ledger.append(fact)
+
+        assert len(list((tmp_path / "segments").glob("*.seg"))) > 3
+        assert all(ledger.get(f.fact_id).statement == f.statement for f in facts)
+        ledger.close()
+
+    def test_index_rebuilt_from_segments(self, tmp_path: Path):
+        """Test recovery when index files are lost or the tail is torn."""
+        ledger = FactLedger(tmp_path, enforce_privacy=False)
+        facts = [self._fact(i) for i in range(5)]
+        for fact in facts:
+            ledger.append(fact)
+        ledger.close()
+        ledger = FactLedger(tmp_path, enforce_privacy=False)
+        ledger.append(self._fact(5))
+        ledger._store._tail_file.write(b"\x00" * 7)  # torn record
+        ledger._store._tail_file.flush()
+        (tmp_path / "index.sorted").unlink()
+
+        reopened = FactLedger(tmp_path, enforce_privacy=False)
+        assert reopened.count() == 6
+        assert reopened.get(facts[3].fact_id).statement == "Fact 3"
+
+    def test_appends_after_torn_writes_survive_reopen(self, tmp_path: Path):
+        """Test that torn index and data bytes are cut off before new appends."""
+        ledger = FactLedger(tmp_path, enforce_privacy=False)
+        facts = [self._fact(i) for i in range(3)]
+        for fact in facts:
+            ledger.append(fact)
+        # Simulate a crash mid-write: a torn index record and a torn payload
+        ledger._store._tail_file.write(b"\x00" * 10)
+        ledger._store._tail_file.flush()
+        ledger._store._active_file.write(b'{"fact_id": "')
+        ledger._store._active_file.flush()
+
+        ledger = FactLedger(tmp_path, enforce_privacy=False)
+        newer = [self._fact(i) for i in range(3, 5)]
+        for fact in newer:
+            ledger.append(fact)
+        ledger._store._active_file.flush()
+
+        reopened = FactLedger(tmp_path, enforce_privacy=False)
+        assert reopened.count() == 5
+        assert all(reopened.get(f.fact_id).statement == f.statement for f in facts + newer)
+        reopened.close()
+        (tmp_path / "index.sorted").unlink()
+        assert FactLedger(tmp_path, enforce_privacy=False).count() == 5
+
+    def test_legacy_jsonl_ledger_migrated(self, tmp_path: Path):
+        """Test that a facts.jsonl ledger from the old fallback is imported."""
+        import json
+
+        facts = [self._fact(i) for i in range(3)]
+        with open(tmp_path / "facts.jsonl", "w") as f:
+            f.writelines(
+                json.dumps({"key": fact.ledger_key(), "value": json.loads(fact.model_dump_json())}) + "\n"
+                for fact in facts
+            )
+            f.write("not json\n")
+
+        ledger = FactLedger(tmp_path, enforce_privacy=False)
+        assert ledger.count() == 3
+        assert ledger.get(facts[1].fact_id).statement == "Fact 1"
+        assert (tmp_path / "facts.jsonl.migrated").exists()
+        assert not (tmp_path / "facts.jsonl").exists()
+
+
+class TestAppendMany:
+    """Tests for batch appends and group commit."""
+
+    @staticmethod
+    def _fact(i: int, **updates) -> Fact:
+        fact = Fact(
+            statement=f"Fact {i}",
+            provenance=Provenance(created_by=ProvenanceSource.RESEARCH_AGENT),
+        )
+        return fact.model_copy(update=updates) if updates else fact
+
+    def test_single_write_and_batched_events(self, tmp_path: Path):
+        """Test one store write per batch and one list per batch handler."""
+        ledger = FactLedger(tmp_path, enforce_privacy=False)
+        writes = []
+        store_append_many = ledger._store.append_many
+        ledger._store.append_many = lambda records: writes.append(1) or store_append_many(records)
+        single, batches = [], []
+        ledger.register_event_handler(single.append)
+        ledger.register_batch_event_handler(batches.append)
+
+        facts = [self._fact(i) for i in range(5)]
+        keys = ledger.append_many(facts)
+        ledger.append(facts[0].model_copy(update={"version": 2}))
+
+        assert keys == [f.ledger_key() for f in facts]
+        assert len(writes) == 2
+        assert [len(b) for b in batches] == [5, 1]
+        assert [e.fact_id for e in single] == [f.fact_id for f in facts] + [facts[0].fact_id]
+        assert batches[1][0].event_type.value == "fact_updated"
+        assert ledger.get_latest_version(facts[0].fact_id) == 2
+        assert ledger.append_many([]) == []
+        ledger.close()
+
+    def test_privacy_checks_see_earlier_facts_in_batch(self, tmp_path: Path):
+        """Test that a birth fact informs later facts about the same person."""
+        from gps_agents.ledger.privacy import PrivacyStatus
+
+        ledger = FactLedger(tmp_path)
+        batches = []
+        ledger.register_batch_event_handler(batches.append)
+        ledger.append_many([
+            self._fact(0, person_id="p1", fact_type="occupation"),
+            self._fact(1, statement="Born 1850", person_id="p1", fact_type="birth"),
+            self._fact(2, person_id="p1", fact_type="residence"),
+        ])
+
+        statuses = [e.privacy_status for e in batches[0]]
+        assert statuses[0] == PrivacyStatus.UNKNOWN
+        assert statuses[2] == PrivacyStatus.DECEASED_PRESUMED
+        assert not batches[0][2].is_restricted
+        assert ledger.get_person_dates("p1")["birth_year"] == 1850
+        ledger.close()
+
+    def test_group_commit_shares_writes(self, tmp_path: Path):
+        """Test that concurrent appenders are committed in shared batches."""
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        ledger = FactLedger(tmp_path, enforce_privacy=False, group_commit=True)
+        writes = []
+        store_append_many = ledger._store.append_many
+
+        def slow_append_many(records):
+            records = list(records)
+            writes.append(len(records))
+            time.sleep(0.05)
+            store_append_many(records)
+
+        ledger._store.append_many = slow_append_many
+        facts = [self._fact(i) for i in range(16)]
+        start = threading.Barrier(16)
+
+        def append(fact):
+            start.wait()
+            return ledger.append(fact)
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            keys = list(pool.map(append, facts))
+
+        assert keys == [f.ledger_key() for f in facts]
+        assert sum(writes) == 16
+        assert len(writes) < 16
+        assert ledger.count() == 16
+        ledger.close()
+
+    def test_group_commit_error_reaches_every_caller(self, tmp_path: Path):
+        """Test that a failed shared write raises in each waiting caller."""
+        ledger = FactLedger(tmp_path, enforce_privacy=False, group_commit=True)
+
+        def failing_append_many(records):
+            raise OSError("disk full")
+
+        ledger._store.append_many = failing_append_many
+        with pytest.raises(OSError, match="disk full"):
+            ledger.append(self._fact(0))
+        assert ledger._commit_leader is False
+        assert ledger._commit_queue == []
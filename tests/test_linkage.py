@@ -17,6 +17,7 @@ from gps_agents.genealogy_crawler.linkage import (
     MatchCandidate,
     MatchConfidence,
     CensusComparisonConfig,
+    SplinkEntityResolver,
     VitalRecordComparisonConfig,
 )
 
@@ -423,6 +424,69 @@ class TestVitalRecordComparisonConfig:
         assert "mother_name" in field_names
 
 
+class TestBuildClusters:
+    """Tests for SplinkEntityResolver._build_clusters on Splink-shaped frames."""
+
+    @pytest.fixture
+    def frames(self):
+        pd = pytest.importorskip("pandas")
+        ids = [str(uuid4()) for _ in range(5)]
+        original = pd.DataFrame({
+            "id": ids,
+            "given_name": ["John", "Jon", "John", "Mary", "Ann"],
+            "surname": ["Durham", "Durham", "Durhem", "Smith", "Jones"],
+            "birth_year": [1850, 1850, 1851, 1860, 1870],
+        })
+        clusters = original.copy()
+        clusters.insert(0, "cluster_id", [1, 1, 1, 2, 3])
+        predictions = pd.DataFrame({
+            "id_l": [ids[0], ids[1], ids[2]],
+            "id_r": [ids[1], ids[2], ids[3]],
+            "match_probability": [0.97, 0.88, 0.6],
+        })
+        return ids, original, predictions, clusters
+
+    def test_clusters_and_decisions(self, frames):
+        """Test membership, confidence buckets and cohesion per cluster."""
+        ids, original, predictions, clusters_df = frames
+        resolver = SplinkEntityResolver(threshold=0.85, review_threshold=0.5)
+
+        clusters, needs_review = resolver._build_clusters(original, predictions, clusters_df)
+
+        assert [c.size for c in clusters] == [3, 1, 1]
+        durham = clusters[0]
+        assert durham.canonical_name == "John Durham"
+        assert [d.confidence for d in durham.linkage_decisions] == [
+            MatchConfidence.DEFINITE_MATCH,
+            MatchConfidence.PROBABLE_MATCH,
+            MatchConfidence.UNCERTAIN,
+        ]
+        assert durham.linkage_decisions[2].decision == ClusterDecision.NEEDS_REVIEW
+        assert durham.internal_cohesion == pytest.approx((0.97 + 0.88 + 0.6) / 3)
+        assert durham.has_conflicts is True
+
+        # The cross-cluster review pair is listed under both clusters it touches
+        smith = clusters[1]
+        assert [str(d.record_id_right) for d in smith.linkage_decisions] == [ids[3]]
+        assert clusters[2].linkage_decisions == []
+        assert clusters[2].internal_cohesion == 1.0
+        assert len(needs_review) == 2
+        assert needs_review[0].name_right == "Mary Smith"
+
+    def test_without_cluster_column_yields_singletons(self, frames):
+        """Test that records become singleton clusters when nothing matched."""
+        _, original, predictions, _ = frames
+        resolver = SplinkEntityResolver()
+
+        clusters, needs_review = resolver._build_clusters(
+            original, predictions.iloc[0:0], original[["id"]]
+        )
+
+        assert len(clusters) == 5
+        assert all(c.is_singleton for c in clusters)
+        assert needs_review == []
+
+
 class TestMatchConfidence:
     """Tests for MatchConfidence enum."""
 
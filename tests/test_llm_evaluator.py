@@ -510,3 +510,115 @@ class TestScoreToConfidence:
         """Score < 0.25 should be NOT_MATCH."""
         assert evaluator._score_to_confidence(0.20) == MatchConfidence.NOT_MATCH
         assert evaluator._score_to_confidence(0.0) == MatchConfidence.NOT_MATCH
+
+
+class TestBatchEntityExtraction:
+    """Tests for evaluate_many and the spaCy entity cache."""
+
+    @pytest.fixture
+    def model_path(self, tmp_path):
+        """A small rule-based spaCy pipeline with an extra, unused component."""
+        spacy = pytest.importorskip("spacy")
+
+        nlp = spacy.blank("en")
+        nlp.add_pipe("sentencizer")
+        ruler = nlp.add_pipe("entity_ruler")
+        ruler.add_patterns([
+            {"label": "PERSON", "pattern": "Archer Durham"},
+            {"label": "PERSON", "pattern": "Fannie Smith"},
+            {"label": "DATE", "pattern": "1844"},
+            {"label": "GPE", "pattern": "Tennessee"},
+            {"label": "ORG", "pattern": "Census Bureau"},
+        ])
+        path = tmp_path / "model"
+        nlp.to_disk(path)
+        return path
+
+    @pytest.fixture
+    def evaluator(self, model_path, tmp_path):
+        from gps_agents.research import LLM_EVALUATOR_AVAILABLE, LLMRelevanceEvaluator
+
+        if not LLM_EVALUATOR_AVAILABLE:
+            pytest.skip("LLM evaluator not available")
+
+        profile = PersonProfile(
+            surname="Durham",
+            given_name="Archer",
+            birth_year=1844,
+            birth_place="Tennessee",
+            spouse_names=["Fannie Smith"],
+        )
+        return LLMRelevanceEvaluator(
+            profile=profile,
+            use_llm=False,
+            use_cache=False,
+            cache_dir=tmp_path / "cache",
+            spacy_model=model_path,
+        )
+
+    @staticmethod
+    def _records() -> list[RawRecord]:
+        texts = [
+            "Archer Durham was born in 1844 in Tennessee.",
+            "Fannie Smith of Tennessee, per the Census Bureau.",
+            "Archer Durham was born in 1844 in Tennessee.",
+            "",
+        ]
+        return [
+            RawRecord(
+                source="Test",
+                record_id=f"r{i}",
+                record_type="census",
+                extracted_fields={"surname": "Durham"},
+                raw_data={"text": text} if text else {},
+            )
+            for i, text in enumerate(texts)
+        ]
+
+    def test_only_entity_components_run(self, evaluator):
+        """Components that do not set doc.ents are disabled."""
+        assert evaluator._nlp.pipe_names == ["entity_ruler"]
+
+    def test_evaluate_many_matches_evaluate(self, evaluator, model_path, tmp_path):
+        """evaluate_many scores each record as evaluate does."""
+        from gps_agents.research import LLMRelevanceEvaluator
+
+        records = self._records()
+        single = LLMRelevanceEvaluator(
+            profile=evaluator.profile,
+            use_llm=False,
+            use_cache=False,
+            cache_dir=tmp_path / "cache",
+            spacy_model=model_path,
+        )
+
+        batch = evaluator.evaluate_many(records, batch_size=2)
+
+        assert batch == [single.evaluate(record) for record in records]
+        assert batch[0].extracted_entities["names"][0] == "Archer Durham"
+        assert batch[1].extracted_entities["locations"] == ["Tennessee"]
+
+    def test_each_text_runs_through_spacy_once(self, evaluator):
+        """Repeated texts are processed once and later served from the cache."""
+        records = self._records()
+        seen: list[str] = []
+        pipe = evaluator._nlp.pipe
+
+        def counting_pipe(texts, **kwargs):
+            texts = list(texts)
+            seen.extend(texts)
+            return pipe(texts, **kwargs)
+
+        with patch.object(evaluator._nlp, "pipe", counting_pipe):
+            first = evaluator.evaluate_many(records)
+            assert len(seen) == 2
+            assert evaluator.evaluate_many(records) == first
+            evaluator.evaluate(records[1])
+            assert len(seen) == 2
+
+    def test_cache_size_is_bounded(self, evaluator):
+        """The least recently used texts are evicted beyond ner_cache_size."""
+        evaluator._ner_cache_size = 1
+        evaluator.evaluate_many(self._records())
+
+        assert len(evaluator._ner_cache) == 1
@@ -0,0 +1,282 @@
+"""Tests for the shared HTTP transport in gps_agents.net."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from gps_agents.http_cache import CacheConfig, ResponseStore
+from gps_agents.net import (
+    GUARDS,
+    TRANSPORT,
+    InFlightBudget,
+    PoolConfig,
+    RateLimitConfig,
+    SharedTransport,
+    TokenBucketLimiter,
+    report_pool_status,
+    report_status,
+    retry_after_seconds,
+    shared_client,
+)
+from gps_agents.sources.base import BaseSource
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    wbufsize = 1 << 16
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self) -> None:
+        if self.path.startswith("/busy") and not self.server.throttled:
+            self.server.throttled = True
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path.startswith("/slow"):
+            with self.server.lock:
+                self.server.in_flight += 1
+                self.server.peak = max(self.server.peak, self.server.in_flight)
+            time.sleep(0.05)
+            with self.server.lock:
+                self.server.in_flight -= 1
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    """Local keep-alive HTTP/1.1 server that counts accepted connections."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.connections = server.in_flight = server.peak = 0
+    server.throttled = False
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _url(server: ThreadingHTTPServer, path: str = "/") -> str:
+    return f"http://127.0.0.1:{server.server_port}{path}"
+
+
+class _StubSource(BaseSource):
+    name = "stubsource"
+
+    async def search(self, query):
+        return []
+
+    async def get_record(self, record_id):
+        return None
+
+    def requires_auth(self) -> bool:
+        return False
+
+
+class TestSharedTransport:
+    """Tests for SharedTransport pooling and metrics."""
+
+    @pytest.mark.asyncio
+    async def test_clients_share_keepalive_connection(self, stub_server):
+        """Test that separate clients reuse one pooled connection."""
+        import httpx
+
+        transport = SharedTransport(PoolConfig())
+        for _ in range(10):
+            async with httpx.AsyncClient(transport=transport, timeout=5) as client:
+                resp = await client.get(_url(stub_server))
+                assert resp.json() == {"ok": True}
+
+        stats = transport.stats[f"http://127.0.0.1:{stub_server.server_port}"]
+        assert stub_server.connections == 1
+        assert stats.requests == 10
+        assert stats.connections_opened == 1
+        assert stats.reuse_rate == pytest.approx(0.9)
+        assert transport.open_connections() == {f"http://127.0.0.1:{stub_server.server_port}": 1}
+
+        await transport.aclose_pools()
+        assert transport.open_connections() == {}
+
+    @pytest.mark.asyncio
+    async def test_per_host_connection_limit(self, stub_server):
+        """Test that concurrent requests are capped per host."""
+        import httpx
+
+        transport = SharedTransport(PoolConfig(max_connections_per_host=2))
+        async with httpx.AsyncClient(transport=transport, timeout=5) as client:
+            await asyncio.gather(*(client.get(_url(stub_server, "/slow")) for _ in range(8)))
+        await transport.aclose_pools()
+
+        assert stub_server.peak <= 2
+        assert stub_server.connections == 2
+
+    @pytest.mark.asyncio
+    async def test_base_source_uses_shared_pool(self, stub_server, monkeypatch):
+        """Test that BaseSource._make_request goes through the shared transport."""
+        monkeypatch.setattr("gps_agents.net.CACHE", ResponseStore(CacheConfig(enabled=False)))
+        monkeypatch.setenv("RATE_STUBSOURCE_MAX", "100")
+        monkeypatch.setenv("RATE_STUBSOURCE_MIN_INTERVAL", "0")
+        origin = f"http://127.0.0.1:{stub_server.server_port}"
+
+        for _ in range(3):
+            async with _StubSource() as source:
+                assert await source._make_request(_url(stub_server)) == {"ok": True}
+
+        assert stub_server.connections == 1
+        assert report_pool_status()[origin]["requests"] == 3
+        assert report_pool_status()[origin]["reuse_rate"] == pytest.approx(0.667)
+        await TRANSPORT.aclose_pools()
+
+    def test_shared_client_transport(self):
+        """Test that shared clients are wired to the global transport."""
+        client = shared_client(timeout=5, follow_redirects=True)
+        assert client._transport is TRANSPORT
+        assert client.follow_redirects is True
+
+
+class TestTokenBucketLimiter:
+    """Tests for the token-bucket rate limiter."""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_steady_rate(self):
+        """Test that a full bucket allows a burst, then calls are spaced."""
+        limiter = TokenBucketLimiter(RateLimitConfig(max_calls=5, window_seconds=0.5))
+        start = time.monotonic()
+        for _ in range(5):
+            await limiter.acquire()
+        burst = time.monotonic() - start
+        await limiter.acquire()
+        assert burst < 0.05
+        assert time.monotonic() - start >= 0.09
+
+    def test_min_interval_limits_burst(self):
+        """Test that min_interval keeps the old one-call spacing semantics."""
+        cfg = RateLimitConfig(max_calls=1, window_seconds=5, min_interval=1.5)
+        assert cfg.capacity == 1
+        assert cfg.rate == pytest.approx(0.2)
+        assert RateLimitConfig(max_calls=10, window_seconds=1, min_interval=0.5, burst=3).capacity == 3
+
+    @pytest.mark.asyncio
+    async def test_fifo_order_without_serializing(self):
+        """Test that queued callers are served in arrival order."""
+        limiter = TokenBucketLimiter(RateLimitConfig(max_calls=1, window_seconds=0.01))
+        order: list[int] = []
+
+        async def call(i: int) -> None:
+            await limiter.acquire()
+            order.append(i)
+
+        start = time.monotonic()
+        await asyncio.gather(*(call(i) for i in range(20)))
+
+        assert order == list(range(20))
+        assert 0.15 <= time.monotonic() - start < 1.0
+        assert limiter.queue_delay.total == 20
+        assert limiter.queue_delay.counts[0] == 1  # only the first call did not wait
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_keeps_queue_moving(self):
+        """Test that cancelling a queued caller does not stall the others."""
+        limiter = TokenBucketLimiter(RateLimitConfig(max_calls=1, window_seconds=0.02))
+        await limiter.acquire()
+        first = asyncio.create_task(limiter.acquire())
+        second = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        first.cancel()
+
+        await asyncio.wait_for(second, timeout=1)
+        assert limiter.queued == 0
+
+    @pytest.mark.asyncio
+    async def test_penalize_pauses_and_recovers(self):
+        """Test Retry-After backoff and additive rate recovery."""
+        limiter = TokenBucketLimiter(RateLimitConfig(max_calls=100, window_seconds=1))
+        limiter.penalize(0.2)
+        assert limiter.rate == pytest.approx(50)
+
+        start = time.monotonic()
+        await limiter.acquire()
+        assert time.monotonic() - start >= 0.19
+
+        for _ in range(4):
+            limiter.record_success()
+        assert limiter.rate == pytest.approx(100)
+
+    def test_retry_after_parsing(self):
+        """Test delta-seconds and HTTP-date Retry-After values."""
+        import httpx
+
+        assert retry_after_seconds(httpx.Response(429, headers={"Retry-After": "7"})) == 7
+        assert retry_after_seconds(httpx.Response(429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0
+        assert retry_after_seconds(httpx.Response(429)) is None
+
+    @pytest.mark.asyncio
+    async def test_report_status_histogram(self, monkeypatch):
+        """Test that report_status exposes queue delays per source."""
+        monkeypatch.setattr(GUARDS, "_limiters", {})
+        limiter = GUARDS.get_limiter("histo", RateLimitConfig(max_calls=1, window_seconds=0.01))
+        for _ in range(3):
+            await limiter.acquire()
+
+        delays = report_status()["histo"]["queue_delay_ms"]
+        assert delays["count"] == 3
+        assert delays["buckets"]["<=0"] == 1
+        assert 0 < delays["p95"] <= 50
+
+
+class TestInFlightBudget:
+    """Tests for the global in-flight request cap."""
+
+    @pytest.mark.asyncio
+    async def test_caps_requests_across_clients(self, stub_server, monkeypatch):
+        """Test that concurrent requests from separate clients share one budget."""
+        budget = InFlightBudget(2)
+        monkeypatch.setattr(GUARDS, "in_flight", budget)
+        transport = SharedTransport(PoolConfig())
+
+        async def get() -> None:
+            import httpx
+
+            async with httpx.AsyncClient(transport=transport, timeout=5) as client:
+                (await client.get(_url(stub_server, "/slow"))).raise_for_status()
+
+        await asyncio.gather(*(get() for _ in range(6)))
+        await transport.aclose_pools()
+
+        assert stub_server.peak == 2
+        assert budget.peak == 2
+        assert budget.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_base_source_backs_off_on_429(self, stub_server, monkeypatch):
+        """Test that a 429 penalizes the source limiter and the retry succeeds."""
+        monkeypatch.setattr("gps_agents.net.CACHE", ResponseStore(CacheConfig(enabled=False)))
+        monkeypatch.setattr(GUARDS, "_limiters", {})
+        monkeypatch.setenv("RATE_STUBSOURCE_MIN_INTERVAL", "0")
+        monkeypatch.setenv("RATE_STUBSOURCE_MAX", "100")
+
+        async with _StubSource() as source:
+            assert await source._make_request(_url(stub_server, "/busy")) == {"ok": True}
+
+        assert report_status()["stubsource"]["rate"]["penalties"] == 1
+        await TRANSPORT.aclose_pools()
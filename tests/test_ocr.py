@@ -1,6 +1,7 @@
 """Tests for Historical OCR module."""
 from __future__ import annotations
 
+import os
 from uuid import uuid4
 
 import pytest
@@ -18,6 +19,7 @@ from gps_agents.genealogy_crawler.ocr import (
     OCREngine,
     OCRProvenance,
     OCRResult,
+    PageRef,
     PreprocessingPipeline,
     RecognitionConfidence,
     RecognizedLine,
@@ -25,6 +27,7 @@ from gps_agents.genealogy_crawler.ocr import (
     RecognizedRegion,
     RecognizedWord,
     TextAlternative,
+    iter_page_refs,
 )
 
 
@@ -385,6 +388,66 @@ class TestKrakenOCRAgent:
         assert result.data is not None
         assert result.provenance.ocr_engine == OCREngine.KRAKEN
 
+    @pytest.mark.asyncio
+    async def test_recognize_document_streams_tiff(self, tmp_path):
+        """Test in-process recognition of a multi-page TIFF with per-page timings."""
+        from PIL import Image
+
+        frames = [Image.new("L", (40 + i, 30), color=255) for i in range(3)]
+        frames[0].save(tmp_path / "roll.tif", save_all=True, append_images=frames[1:])
+
+        result = await KrakenOCRAgent().recognize_document(tmp_path / "roll.tif")
+
+        assert [p.page_number for p in result.data] == [1, 2, 3]
+        assert [p.image_width for p in result.data] == [40, 41, 42]
+        assert result.data[2].source_file == f"{tmp_path / 'roll.tif'}[2]"
+        assert len(result.provenance.page_timings_ms) == 3
+        assert result.provenance.pages_processed == 3
+
+    @pytest.mark.asyncio
+    async def test_recognize_document_process_pool(self, tmp_path):
+        """Test pool mode keeps document order and reports failed pages."""
+        from PIL import Image
+
+        # Spawned workers start in the current directory, which must exist.
+        os.chdir(tmp_path)
+        images = []
+        for i in range(6):
+            Image.new("L", (50 + i, 20), color=255).save(tmp_path / f"p{i}.png")
+            images.append(tmp_path / f"p{i}.png")
+        images.insert(3, tmp_path / "missing.png")
+
+        agent = KrakenOCRAgent(workers=2, max_in_flight=3)
+        try:
+            result = await agent.recognize_document(iter(images))
+        finally:
+            agent.close()
+
+        assert [p.image_width for p in result.data] == [50, 51, 52, 53, 54, 55]
+        assert [p.page_number for p in result.data] == [1, 2, 3, 5, 6, 7]
+        assert len(result.warnings) == 1
+        assert result.warnings[0].startswith("Page 4:")
+        assert len(result.provenance.page_timings_ms) == 6
+        assert result.provenance.processing_time_ms > 0
+
+    def test_iter_page_refs_directory(self, tmp_path):
+        """Test directory streaming order and multi-page TIFF expansion."""
+        from PIL import Image
+
+        Image.new("L", (10, 10)).save(tmp_path / "b.png")
+        frames = [Image.new("L", (10, 10)) for _ in range(2)]
+        frames[0].save(tmp_path / "a.tiff", save_all=True, append_images=frames[1:])
+        (tmp_path / "notes.txt").write_text("not a page")
+
+        refs = list(iter_page_refs(tmp_path))
+
+        assert refs == [
+            PageRef(tmp_path / "a.tiff", 0),
+            PageRef(tmp_path / "a.tiff", 1),
+            PageRef(tmp_path / "b.png", 0),
+        ]
+        assert refs[1].open().size == (10, 10)
+
 
 class TestCensusOCRAgent:
     """Tests for CensusOCRAgent."""
@@ -441,6 +504,111 @@ class TestPreprocessingPipeline:
         # Should be converted to grayscale
         assert result.mode == "L"
 
+    @staticmethod
+    def _census_sheet(size=(800, 600), ink=60, paper=230):
+        """Synthetic page: rows of word-sized dark blocks."""
+        from PIL import Image, ImageDraw
+
+        img = Image.new("L", size, color=paper)
+        draw = ImageDraw.Draw(img)
+        for y in range(40, size[1] - 40, 30):
+            for x in range(40, size[0] - 80, 70):
+                draw.rectangle([x, y, x + 45, y + 9], fill=ink)
+        return img
+
+    def test_deskew_recovers_rotation(self):
+        """Test projection-profile skew estimation and correction."""
+        import numpy as np
+
+        from gps_agents.genealogy_crawler.ocr.preprocessing import estimate_skew
+
+        skewed = self._census_sheet().rotate(2.4, fillcolor=230)
+        pipeline = PreprocessingPipeline(denoise=False, enhance_contrast=False)
+
+        result = pipeline.apply(skewed)
+
+        assert pipeline.skew_angle == pytest.approx(2.4, abs=0.1)
+        assert abs(estimate_skew(np.asarray(result))) <= 0.1
+
+    def test_estimate_skew_stays_within_max_angle(self):
+        """Test that the fine sweep never reports an angle past max_angle."""
+        import numpy as np
+
+        from gps_agents.genealogy_crawler.ocr.preprocessing import estimate_skew
+
+        rng = np.random.default_rng(0)
+        noise = np.where(rng.random((2049, 10)) < 0.3, 0, 255).astype(np.uint8)
+
+        for max_angle in (5.0, 2.0, 1.3, 5.03):
+            assert abs(estimate_skew(noise, max_angle=max_angle)) <= max_angle
+
+    def test_sauvola_handles_faded_ink(self):
+        """Test that local thresholding keeps ink the fixed threshold loses."""
+        import numpy as np
+
+        from gps_agents.genealogy_crawler.ocr.preprocessing import binarize
+
+        page = np.asarray(self._census_sheet()).astype(np.int16)
+        truth = page < 128
+        # Fade the right half: ink lightens to ~150 on a ~240 background
+        faded = page.copy()
+        faded[:, 400:] = np.where(truth[:, 400:], 150, 240)
+        faded = faded.astype(np.uint8)
+
+        fixed = binarize(faded, method="fixed")
+        sauvola = binarize(faded, method="sauvola", window=31)
+
+        assert (fixed[:, 400:] & truth[:, 400:]).sum() == 0
+        assert (sauvola == truth).mean() > 0.99
+
+    def test_tiled_binarization_matches_full(self):
+        """Test that tiling with a halo gives the untiled result."""
+        import numpy as np
+
+        from gps_agents.genealogy_crawler.ocr.preprocessing import binarize
+
+        rng = np.random.default_rng(0)
+        gray = rng.integers(0, 256, size=(300, 410), dtype=np.uint8)
+
+        full = binarize(gray, remove_speckles=True)
+        tiled = binarize(gray, remove_speckles=True, tile_size=64)
+
+        assert np.array_equal(full, tiled)
+
+    def test_border_removal_and_binarize(self):
+        """Test dark border whitening and 1-bit output."""
+        import numpy as np
+        from PIL import Image
+
+        page = np.asarray(self._census_sheet()).copy()
+        page[:, :30] = 5
+        pipeline = PreprocessingPipeline(
+            deskew=False, enhance_contrast=False, remove_borders=True, binarize=True
+        )
+
+        result = pipeline.apply(Image.fromarray(page))
+
+        assert result.mode == "1"
+        assert np.asarray(result)[:, :30].all()
+        assert "border_removal" in pipeline.steps_applied
+
+    def test_median_matches_pillow(self):
+        """Test the vectorized 3x3 median against Pillow's MedianFilter."""
+        import numpy as np
+        from PIL import Image, ImageFilter
+
+        from gps_agents.genealogy_crawler.ocr.preprocessing import median3
+
+        gray = np.random.default_rng(1).integers(0, 256, size=(64, 90), dtype=np.uint8)
+        expected = np.asarray(Image.fromarray(gray).filter(ImageFilter.MedianFilter(3)))
+
+        assert np.array_equal(median3(gray), expected)
+
+    def test_unknown_binarize_method(self):
+        """Test that an unknown binarization method is rejected."""
+        with pytest.raises(ValueError, match="binarization"):
+            PreprocessingPipeline(binarize_method="niblack")
+
 
 class TestTextAlternative:
     """Tests for TextAlternative model."""
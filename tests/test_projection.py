@@ -0,0 +1,272 @@
+"""Tests for the SQLite read projection (projections/sqlite_projection.py)."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from gps_agents.ledger.fact_ledger import FactLedger
+from gps_agents.models.fact import Fact, FactStatus
+from gps_agents.models.provenance import Provenance, ProvenanceSource
+from gps_agents.models.source import SourceCitation
+from gps_agents.projections.sqlite_projection import SQLiteProjection
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def make_fact(i: int, **overrides) -> Fact:
+    fields = {
+        "statement": f"Person {i} born {1800 + i % 100} in Ohio",
+        "provenance": Provenance(created_by=ProvenanceSource.RESEARCH_AGENT),
+        "sources": [SourceCitation(repository="FamilySearch", record_id=f"R{i}")],
+        "confidence_score": (i % 10) / 10,
+        "person_id": f"P{i % 7}",
+    }
+    fields.update(overrides)
+    return Fact(**fields)
+
+
+@pytest.fixture
+def ledger(tmp_path: Path):
+    ledger = FactLedger(str(tmp_path / "ledger"), enforce_privacy=False)
+    yield ledger
+    ledger.close()
+
+
+class TestRebuildFromLedger:
+    """Tests for bulk rebuild of the projection from the ledger."""
+
+    def test_rebuild_matches_per_fact_upsert(self, ledger, tmp_path: Path):
+        """Test that batched rebuild produces the same rows as upsert_fact."""
+        facts = [make_fact(i) for i in range(23)]
+        for fact in facts:
+            ledger.append(fact)
+        ledger.append(facts[0].set_status(FactStatus.ACCEPTED))
+
+        bulk = SQLiteProjection(tmp_path / "bulk.sqlite")
+        seen: list[int] = []
+        count = bulk.rebuild_from_ledger(ledger, batch_size=5, synchronous_off=True, progress=seen.append)
+
+        single = SQLiteProjection(tmp_path / "single.sqlite")
+        for fact in ledger.iter_all_facts():
+            single.upsert_fact(fact)
+
+        assert count == 23
+        assert seen == [5, 10, 15, 20, 23]
+        assert bulk.get_statistics() == single.get_statistics()
+        assert bulk.get_fact(facts[0].fact_id).status == FactStatus.ACCEPTED
+
+    def test_rebuild_restores_indexes_and_replaces_sources(self, ledger, tmp_path: Path):
+        """Test that dropped indexes are recreated and stale sources replaced."""
+        fact = make_fact(1)
+        proj = SQLiteProjection(tmp_path / "proj.sqlite")
+        proj.upsert_fact(fact.model_copy(update={"sources": [SourceCitation(repository="Old", record_id="X")]}))
+        ledger.append(fact)
+
+        proj.rebuild_from_ledger(ledger)
+
+        with proj._get_conn() as conn:
+            indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert {"idx_facts_status", "idx_facts_confidence", "idx_sources_repo"} <= indexes
+        assert proj.get_statistics()["sources"] == {"FamilySearch": 1}
+
+
+class TestConnectionPool:
+    """Tests for pooled connections, the reader pool and event micro-batching."""
+
+    def test_thread_reuses_connection(self, tmp_path: Path):
+        """Test that calls on one thread share a connection and threads do not."""
+        import threading
+
+        proj = SQLiteProjection(tmp_path / "proj.sqlite")
+        with proj._get_conn() as first:
+            pass
+        with proj._get_conn() as second:
+            pass
+        other: list = []
+
+        def worker():
+            with proj._get_conn() as conn:
+                other.append(conn)
+
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join()
+
+        assert first is second
+        assert other[0] is not first
+        proj.close()
+
+    def test_uncommitted_writes_discarded_on_release(self, tmp_path: Path):
+        """Test that a pooled connection does not carry an open transaction."""
+        proj = SQLiteProjection(tmp_path / "proj.sqlite")
+        with proj._get_conn() as conn:
+            conn.execute("INSERT INTO fingerprint_index VALUES ('fp', 'person', 'H1')")
+
+        assert proj.get_gramps_handle_by_fingerprint("fp") is None
+
+    def test_transaction_includes_nested_calls(self, tmp_path: Path):
+        """Test that projection calls inside transaction() roll back with it."""
+        proj = SQLiteProjection(tmp_path / "proj.sqlite")
+
+        def claim_then_abort() -> None:
+            with proj.transaction():
+                proj.ensure_fingerprint_row("person", "fp")
+                proj.claim_fingerprint_handle("fp", "H1")
+                assert proj.get_gramps_handle_by_fingerprint("fp") == "H1"
+                raise RuntimeError("abort")
+
+        with pytest.raises(RuntimeError):
+            claim_then_abort()
+
+        assert proj.get_gramps_handle_by_fingerprint("fp") is None
+
+    def test_reader_pool_serves_concurrent_reads(self, tmp_path: Path):
+        """Test that read-only pooled readers see committed writer data."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        proj = SQLiteProjection(tmp_path / "proj.sqlite", reader_pool_size=2)
+        facts = [make_fact(i) for i in range(20)]
+        for fact in facts:
+            proj.upsert_fact(fact)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            found = list(pool.map(lambda f: proj.get_fact(f.fact_id), facts))
+
+        assert [f.fact_id for f in found] == [f.fact_id for f in facts]
+        assert proj._readers_created <= 2
+        with proj._read_conn() as conn, pytest.raises(Exception, match="readonly"):
+            conn.execute("DELETE FROM facts")
+        proj.close()
+
+    def test_ledger_events_coalesced_into_batches(self, ledger, tmp_path: Path):
+        """Test micro-batched projection of ledger events."""
+        from gps_agents.projections.sqlite_projection import wire_ledger_to_projection
+
+        proj = SQLiteProjection(tmp_path / "proj.sqlite", event_batch_size=4)
+        wire_ledger_to_projection(ledger, proj)
+        facts = [make_fact(i) for i in range(6)]
+        for fact in facts:
+            ledger.append(fact)
+        ledger.append(facts[5].set_status(FactStatus.ACCEPTED))
+
+        # First four were flushed as one batch; the rest wait for a read
+        assert len(proj._pending_facts) == 2
+        assert proj.get_fact(facts[5].fact_id).status == FactStatus.ACCEPTED
+        assert proj.get_statistics()["total_facts"] == 6
+
+    def test_failed_flush_keeps_buffered_facts(self, ledger, tmp_path: Path):
+        """Test that facts from a failed batch write are written by the next flush."""
+        import sqlite3
+
+        from gps_agents.projections.sqlite_projection import wire_ledger_to_projection
+
+        proj = SQLiteProjection(tmp_path / "proj.sqlite", event_batch_size=100)
+        wire_ledger_to_projection(ledger, proj)
+        facts = [make_fact(i) for i in range(3)]
+        for fact in facts:
+            ledger.append(fact)
+        write_batch = proj._write_batch
+
+        def locked_once(conn, batch):
+            proj._write_batch = write_batch
+            # A newer version arrives while the failing write is in progress
+            ledger.append(facts[0].set_status(FactStatus.ACCEPTED))
+            raise sqlite3.OperationalError("database is locked")
+
+        proj._write_batch = locked_once
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            proj.flush()
+
+        assert proj.flush() == 3
+        assert proj.get_statistics()["total_facts"] == 3
+        assert proj.get_fact(facts[0].fact_id).status == FactStatus.ACCEPTED
+
+    def test_ledger_batch_projected_in_one_write(self, ledger, tmp_path: Path):
+        """Test that append_many reaches the projection as one batch."""
+        from gps_agents.projections.sqlite_projection import wire_ledger_to_projection
+
+        proj = SQLiteProjection(tmp_path / "proj.sqlite")
+        wire_ledger_to_projection(ledger, proj)
+        batches = []
+        write_batch = proj._write_batch
+        proj._write_batch = lambda conn, facts: batches.append(len(facts)) or write_batch(conn, facts)
+
+        ledger.append_many([make_fact(i) for i in range(10)])
+        ledger.append(make_fact(10))
+
+        assert batches == [10, 1]
+        assert proj.get_statistics()["total_facts"] == 11
+
+
+class TestSearchStatements:
+    """Tests for FTS5-backed statement search."""
+
+    @pytest.fixture
+    def proj(self, tmp_path: Path) -> SQLiteProjection:
+        proj = SQLiteProjection(tmp_path / "proj.sqlite", fts_trigram=True)
+        statements = [
+            ("John Smith born 1842 in Ohio", 0.9),
+            ("John Smith born 1842 in Kentucky", 0.3),
+            ("Mary Smithson married 1865", 0.8),
+            ("Archibald Durham died 1901", 0.5),
+        ]
+        for i, (statement, confidence) in enumerate(statements):
+            proj.upsert_fact(make_fact(i, statement=statement, confidence_score=confidence))
+        return proj
+
+    def test_words_phrase_and_prefix(self, proj):
+        """Test word, phrase and prefix queries."""
+        assert {f.statement for f in proj.search_statements("smith 1842")} == {
+            "John Smith born 1842 in Ohio",
+            "John Smith born 1842 in Kentucky",
+        }
+        assert [f.statement for f in proj.search_statements('"born 1842 in Ohio"')] == [
+            "John Smith born 1842 in Ohio"
+        ]
+        assert len(proj.search_statements("smith*")) == 3
+        assert proj.search_statements("smith kentucky ohio") == []
+
+    def test_confidence_breaks_relevance_ties(self, proj):
+        """Test that equally relevant matches are ordered by confidence."""
+        results = proj.search_statements("john smith")
+        assert [f.confidence_score for f in results] == [0.9, 0.3]
+
+    def test_index_follows_updates(self, proj, tmp_path: Path):
+        """Test that upserts and rebuilds keep the FTS index in sync."""
+        fact = proj.search_statements("durham")[0]
+        proj.upsert_fact(fact.model_copy(update={"statement": "Archibald Durant died 1901"}))
+
+        assert proj.search_statements("durham") == []
+        assert len(proj.search_statements("durant")) == 1
+
+        class Ledger:
+            def iter_all_facts(self):
+                return iter([make_fact(99, statement="Eliza Tregeagle baptised 1850")])
+
+        proj.rebuild_from_ledger(Ledger())
+        assert len(proj.search_statements("tregeagle")) == 1
+        assert len(proj.search_statements("durant")) == 1
+
+    def test_trigram_tolerates_ocr_noise(self, proj):
+        """Test that trigram search ranks the intended statement first despite OCR errors."""
+        results = proj.search_statements("Archibalcl Durharn", trigram=True)
+        assert results[0].statement == "Archibald Durham died 1901"
+
+    def test_trigram_requires_index(self, tmp_path: Path):
+        """Test that trigram search without the trigram index is rejected."""
+        proj = SQLiteProjection(tmp_path / "plain.sqlite")
+        with pytest.raises(ValueError, match="fts_trigram"):
+            proj.search_statements("smith", trigram=True)
+
+    def test_existing_projection_backfilled(self, tmp_path: Path):
+        """Test that facts projected before FTS existed become searchable."""
+        path = tmp_path / "old.sqlite"
+        SQLiteProjection(path).upsert_fact(make_fact(1, statement="Hannah Vincent born 1799"))
+        with SQLiteProjection(path)._get_conn() as conn:
+            conn.execute("DROP TABLE facts_fts")
+            conn.commit()
+
+        assert len(SQLiteProjection(path).search_statements("vincent")) == 1